@@ -825,9 +825,26 @@ def configure_page():
     )
 
 
+@st.cache_resource
+def _calistirma_kaydi():
+    """Çalıştırma kaydı (kapalıysa ya da yüklenemezse None - klasörler taranır)"""
+    try:
+        from src.core.calistirma_kaydi import calistirma_kaydi
+        return calistirma_kaydi()
+    except Exception:
+        return None
+
+
 @st.cache_data(ttl=300, show_spinner=False)  # 5 dakika cache - sayfa geçişlerinde kasma önler
 def get_existing_dates():
     """Mevcut rapor tarihlerini al (eski fonksiyon - geriye dönük uyumluluk için)"""
+    kayit = _calistirma_kaydi()
+    if kayit is not None:
+        try:
+            return kayit.tarihler()
+        except Exception:
+            pass  # Kayıt okunamazsa klasörler taranır
+
     dates = []
     
     # reports dizinini kontrol et - SADECE ana dizin okuma, recursive değil
@@ -868,6 +885,24 @@ def get_existing_dates():
 @st.cache_data(ttl=300, show_spinner=False)  # 5 dakika cache - disk I/O azaltma
 def get_existing_reports():
     """Mevcut rapor klasörlerini (tarih+id) ve meta bilgisini al"""
+    kayit = _calistirma_kaydi()
+    if kayit is not None:
+        try:
+            return [
+                {
+                    "folder": Path(c["rapor_klasoru"]).name,
+                    "tarih": c["tarih"],
+                    "unique_id": c["unique_id"] or "",
+                    "pdf": None,  # Lazy loading - gerektiğinde yüklenecek
+                    "json": None,  # Lazy loading
+                    "excel": Path(c["ham_dosya"]).name if c["ham_dosya"] else "",
+                    "durum": c["durum"],
+                }
+                for c in kayit.raporlar()
+            ]
+        except Exception:
+            pass  # Kayıt okunamazsa klasörler taranır
+
     reports = []
     if DATA_REPORTS_DIR.exists():
         try:
@@ -924,9 +959,27 @@ def get_raw_files():
     return excel_files
 
 
+def _sunucuda_calistir(command, timeout=None):
+    """main.py komutunu çalışan analiz sunucusunda çalıştır (sunucu yoksa None)"""
+    if len(command) < 2 or Path(command[1]).name != "main.py":
+        return None
+    try:
+        from src.core.analiz_sunucusu import sunucuya_gonder
+    except ImportError:
+        return None
+    yanit = sunucuya_gonder(command[2:], zaman_asimi=timeout)
+    if yanit is None:
+        return None
+    return subprocess.CompletedProcess(command, yanit["returncode"], yanit["stdout"], yanit["stderr"])
+
+
 def run_command(command, timeout=300):
     """Terminal komutu çalıştır ve çıktıyı döndür - Timeout eklenmiş"""
     try:
+        # Analiz sunucusu çalışıyorsa modüller yeniden yüklenmez
+        result = _sunucuda_calistir(command, timeout=timeout)
+        if result is not None:
+            return result
         result = subprocess.run(
             command,
             capture_output=True,
@@ -935,7 +988,7 @@ def run_command(command, timeout=300):
             timeout=timeout  # 5 dakika timeout
         )
         return result
-    except subprocess.TimeoutExpired:
+    except (subprocess.TimeoutExpired, TimeoutError):
         # Timeout durumu
         class TimeoutResult:
             def __init__(self):
@@ -1142,38 +1195,20 @@ def show_pdf(file_path):
         st.markdown("---")
         
         # GÖRÜNTÜLEME SEÇENEKLERİ - Sadece çalışan modlar
+        sayfa_gorunumu = "🖼️ Sayfa Sayfa Görünüm (Önerilen)"
         gorunum_modu = st.radio(
             "PDF Görüntüleme Modu:",
-            ["️ Sayfa Sayfa Görünüm (Önerilen)", "💾 Sadece İndir"],
+            [sayfa_gorunumu, "💾 Sadece İndir"],
             horizontal=True,
             help="Tarayıcı güvenlik kısıtlamaları nedeniyle sayfa sayfa görünüm önerilir"
         )
         
-        if gorunum_modu == "🖼️ Sayfa Sayfa Görünüm (Önerilen)":
-            st.info("🔄 PDF'i görüntüye dönüştürüyor...")
+        if gorunum_modu == sayfa_gorunumu:
             try:
-                # PDF'i PIL/PyMuPDF ile görüntülere dönüştür
-                import fitz  # PyMuPDF
-                
-                pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
-                
-                st.success(f"📄 Toplam {len(pdf_document)} sayfa bulundu")
-                
-                # Sayfa seçimi
-                sayfa_no = st.slider("Sayfa Seçin:", 1, len(pdf_document), 1)
-                
-                # Seçilen sayfayı göster
-                page = pdf_document[sayfa_no - 1]
-                pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x zoom
-                img_bytes = pix.tobytes("png")
-                
-                st.image(img_bytes, caption=f"Sayfa {sayfa_no} / {len(pdf_document)}", use_container_width=True)
-                
-                pdf_document.close()
-                
+                _pdf_sayfasi_goster(file_path, pdf_bytes)
             except ImportError:
                 st.error("❌ PyMuPDF (fitz) kütüphanesi yüklü değil")
-                st.info("💡 Lütfen '� PDF Raporunu İndir' butonunu kullanın")
+                st.info("💡 Lütfen '📥 PDF Raporunu İndir' butonunu kullanın")
             except Exception as e:
                 st.error(f"❌ PDF işleme hatası: {e}")
                 st.info("💡 Lütfen '📥 PDF Raporunu İndir' butonunu kullanın")
@@ -1187,15 +1222,48 @@ def show_pdf(file_path):
         st.info("💡 PDF'i indirme butonunu kullanarak indirebilirsiniz")
 
 
+def _pdf_sayfasi_goster(file_path, pdf_bytes):
+    """
+    Seçilen PDF sayfasını gösterir
+
+    Sayfa görselleri PDF'in yanında bir kez oluşturulup saklanır; komşu
+    sayfalar arka planda önceden hazırlanır. Önbellek kapalıysa sayfa her
+    gösterimde rasterlenir.
+    """
+    from src.core.config import PDF_SAYFA_GORSEL_AYARLARI
+
+    if not PDF_SAYFA_GORSEL_AYARLARI.get("aktif", True):
+        import fitz  # PyMuPDF
+
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as pdf_document:
+            sayfa_sayisi = len(pdf_document)
+            sayfa_no = st.slider("Sayfa Seçin:", 1, sayfa_sayisi, 1) if sayfa_sayisi > 1 else 1
+            pix = pdf_document[sayfa_no - 1].get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x zoom
+            gorsel = pix.tobytes("png")
+    else:
+        from src.generators.pdf_sayfa_onbellegi import PdfSayfaOnbellegi
+
+        onbellek = PdfSayfaOnbellegi(file_path)
+        sayfa_sayisi = onbellek.sayfa_sayisi
+        sayfa_no = st.slider("Sayfa Seçin:", 1, sayfa_sayisi, 1) if sayfa_sayisi > 1 else 1
+        gorsel = str(onbellek.sayfa_gorseli(sayfa_no))
+        komsu = PDF_SAYFA_GORSEL_AYARLARI.get("komsu_sayisi", 1)
+        onbellek.on_yukle(
+            no for fark in range(1, komsu + 1) for no in (sayfa_no + fark, sayfa_no - fark)
+        )
+
+    st.caption(f"📄 Toplam {sayfa_sayisi} sayfa")
+    st.image(gorsel, caption=f"Sayfa {sayfa_no} / {sayfa_sayisi}", use_container_width=True)
+
+
 @st.cache_data(ttl=300)  # 5 dakika cache - grafik listesi
 def _get_graph_files(date_folder_path):
-    """Grafik dosyalarını al - cache'lenmiş"""
-    from pathlib import Path
-    date_folder = Path(date_folder_path)
-    return [str(f) for f in date_folder.glob("*.png")]
+    """Grafik dosyalarını al - cache'lenmiş (klasörün manifesti varsa onun üzerinden)"""
+    from src.core.cikti_deposu import dosyalari_coz
+    return [str(f) for f in dosyalari_coz(date_folder_path, "*.png")]
 
-def show_graphs(date_folder, num_graphs=50):
-    """Tarih klasöründen grafikleri göster - PERFORMANS OPTİMİZE"""
+def show_graphs(date_folder, num_graphs=None):
+    """Tarih klasöründen grafikleri sayfalı önizleme galerisi olarak göster"""
     png_files = _get_graph_files(str(date_folder))
     
     if not png_files:
@@ -1229,34 +1297,88 @@ def show_graphs(date_folder, num_graphs=50):
             filter_term = graph_categories[selected_category]
             png_files = [f for f in png_files if filter_term.lower() in f.name.lower()]
     
-    # Kaç grafik gösterileceğini seç
-    total_graphs = len(png_files)
-    if total_graphs > num_graphs:
-        show_all = st.checkbox("Tüm grafikleri göster", value=True, key=f"show_all_{folder_key}")
-        if show_all:
-            display_graphs = png_files
-        else:
-            display_graphs = png_files[:num_graphs]
-            st.caption(f"İlk {num_graphs} grafik gösteriliyor (toplam {total_graphs})")
-    else:
-        display_graphs = png_files
-    
-    # Grafikler için düzen oluştur
-    if not display_graphs:
+    if not png_files:
         st.warning("Seçilen filtre için grafik bulunamadı.")
         return
-        
-    # Grafikler için grid layout oluştur
-    cols = st.columns(2)
-    for i, graph in enumerate(display_graphs):
-        with cols[i % 2]:
-            # GÜVENLІ: Hem eski hem yeni Streamlit versiyonlarıyla uyumlu
-            try:
-                # Yeni Streamlit (1.35+) için use_container_width dene
-                st.image(str(graph), use_container_width=True)
-            except TypeError:
-                # Eski Streamlit için use_column_width kullan
-                st.image(str(graph), use_column_width=True)
+
+    _grafik_galerisi(png_files, folder_key, sayfa_boyutu=num_graphs)
+
+
+def _gorsel_goster(gorsel, **kwargs):
+    """st.image'i hem eski hem yeni Streamlit sürümleriyle tam genişlikte çağırır"""
+    try:
+        # Yeni Streamlit (1.35+) için use_container_width dene
+        st.image(gorsel, use_container_width=True, **kwargs)
+    except TypeError:
+        # Eski Streamlit için use_column_width kullan
+        st.image(gorsel, use_column_width=True, **kwargs)
+
+
+def _grafik_ac(anahtar, yol):
+    st.session_state[anahtar] = yol
+
+
+def _grafik_galerisi(png_files, folder_key, sayfa_boyutu=None):
+    """
+    Grafikleri sayfalı küçük önizlemeler olarak gösterir
+
+    Sayfada yalnızca önizlemeler gönderilir; tam çözünürlüklü PNG,
+    kullanıcı bir grafiği açtığında yüklenir. Önizlemesi olmayan (eski)
+    grafikler için önizleme ilk gösterimde oluşturulur.
+    """
+    from src.core.config import KUCUK_GORSEL_AYARLARI
+    from src.utils.figur import kucuk_gorsel_olustur
+
+    sayfa_boyutu = sayfa_boyutu or KUCUK_GORSEL_AYARLARI.get("sayfa_boyutu", 12)
+    sutun_sayisi = KUCUK_GORSEL_AYARLARI.get("sutun_sayisi", 3)
+    acik_anahtar = f"acik_grafik_{folder_key}"
+
+    # Açılan grafik tam çözünürlükte gösterilir
+    acik = st.session_state.get(acik_anahtar)
+    if acik and Path(acik) in png_files:
+        acik = Path(acik)
+        st.markdown(f"**{acik.stem.replace('_', ' ')}**")
+        _gorsel_goster(str(acik))
+        col1, col2 = st.columns(2)
+        with col1:
+            with open(acik, "rb") as f:
+                st.download_button(
+                    label="📥 İndir",
+                    data=f.read(),
+                    file_name=acik.name,
+                    mime="image/png",
+                    key=f"grafik_indir_{folder_key}",
+                )
+        with col2:
+            st.button("✖ Kapat", key=f"grafik_kapat_{folder_key}", on_click=_grafik_ac, args=(acik_anahtar, None))
+        st.markdown("---")
+
+    # Sayfalama
+    toplam_sayfa = (len(png_files) + sayfa_boyutu - 1) // sayfa_boyutu
+    sayfa = 1
+    if toplam_sayfa > 1:
+        sayfa = st.selectbox(
+            "Sayfa:",
+            range(1, toplam_sayfa + 1),
+            format_func=lambda no: f"{no} / {toplam_sayfa}",
+            key=f"grafik_sayfa_{folder_key}_{len(png_files)}",
+        )
+    bas = (sayfa - 1) * sayfa_boyutu
+    sayfadakiler = png_files[bas:bas + sayfa_boyutu]
+    st.caption(f"{bas + 1}-{bas + len(sayfadakiler)} / {len(png_files)} grafik gösteriliyor")
+
+    cols = st.columns(sutun_sayisi)
+    for i, graph in enumerate(sayfadakiler):
+        with cols[i % sutun_sayisi]:
+            onizleme = kucuk_gorsel_olustur(graph) or graph
+            baslik = graph.stem.replace("_", " ")
+            _gorsel_goster(str(onizleme), caption=baslik[:40] + ("..." if len(baslik) > 40 else ""))
+            st.button(
+                "🔍 Büyüt",
+                key=f"grafik_ac_{folder_key}_{graph.name}",
+                on_click=_grafik_ac,
+                args=(acik_anahtar, str(graph)),
+            )
 
 
 def show_statistics(date_or_folder):
@@ -1393,9 +1515,18 @@ def analiz_sayfasi():
             )
         with col2:
             if st.button("❌ İptal", use_container_width=True):
+                # Bu oturumun kuyruktaki/çalışan işi varsa durdurulur
+                kuyruk = _is_kuyrugu()
+                is_kimligi = st.session_state.get("analiz_isi")
+                if kuyruk is not None and is_kimligi:
+                    kuyruk.iptal_et(is_kimligi)
+                    st.session_state.pop("analiz_isi", None)
                 st.rerun()
         
-        if start_analysis:
+        kuyruk = _is_kuyrugu() if start_analysis else None
+        if start_analysis and kuyruk is not None:
+            _analizi_kuyruga_gonder(kuyruk, uploaded_file)
+        elif start_analysis:
             try:
                 import hashlib
                 now_str = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1547,6 +1678,119 @@ def analiz_sayfasi():
                 import traceback
                 st.code(traceback.format_exc())
 
+    _analiz_isleri_paneli()
+
+
+def _is_kuyrugu():
+    """Analiz iş kuyruğu (kapalıysa ya da başlatılamazsa None - analiz oturumda çalışır)"""
+    try:
+        from src.core.config import IS_KUYRUGU_AYARLARI
+        if not IS_KUYRUGU_AYARLARI.get("aktif", True):
+            return None
+        from src.core.is_kuyrugu import is_kuyrugu
+        return is_kuyrugu()
+    except Exception:
+        return None
+
+
+def _analizi_kuyruga_gonder(kuyruk, uploaded_file):
+    """Yüklenen dosyayı kaydedip analiz işini kuyruğa ekler"""
+    import hashlib
+    icerik = uploaded_file.getvalue()
+    icerik_ozeti = hashlib.md5(icerik).hexdigest()
+
+    # Aynı dosya zaten işleniyorsa yeni iş açılmaz, mevcut işe bağlanılır
+    mevcut = kuyruk.bul(icerik_ozeti)
+    if mevcut is not None:
+        st.session_state.analiz_isi = mevcut["kimlik"]
+        st.info(f"ℹ️ Bu dosya zaten işleniyor: **{mevcut['dosya']}** ({mevcut['asama']})")
+        return
+
+    try:
+        now_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+        unique_id = f"{now_str}_{icerik_ozeti[:8]}"
+        gun_tarihi = datetime.now().strftime("%Y-%m-%d")
+
+        save_path = DATA_RAW_DIR / f"{unique_id}_{uploaded_file.name}"
+        DATA_RAW_DIR.mkdir(parents=True, exist_ok=True)
+        with open(save_path, "wb") as f:
+            f.write(icerik)
+
+        is_ = kuyruk.gonder(str(save_path), icerik_ozeti, unique_id, gun_tarihi)
+        if is_["unique_id"] != unique_id:
+            # Kaydetme sırasında başka bir oturum aynı dosyayı göndermiş
+            save_path.unlink(missing_ok=True)
+        st.session_state.analiz_isi = is_["kimlik"]
+        st.success("⏳ Analiz işi kuyruğa eklendi. İlerlemeyi aşağıdan takip edebilirsiniz.")
+    except Exception as e:
+        st.error(f"❌ İş kuyruğa eklenemedi: {e}")
+
+
+def _analiz_isleri_paneli():
+    """Kuyruktaki ve biten analiz işlerini listeler (tüm oturumlar için ortak)"""
+    kuyruk = _is_kuyrugu()
+    if kuyruk is None or not kuyruk.isler():
+        return
+
+    st.markdown("### ⏳ Analiz İşleri")
+    from src.core.is_kuyrugu import DEVAM_EDEN_DURUMLAR
+    devam_eden_var = any(i["durum"] in DEVAM_EDEN_DURUMLAR for i in kuyruk.isler())
+
+    # Eski Streamlit sürümlerinde fragment yok; liste elle yenilenir
+    fragment = getattr(st, "fragment", None)
+    if fragment is not None:
+        fragment(run_every=2 if devam_eden_var else None)(_analiz_isleri_listesi)()
+    else:
+        _analiz_isleri_listesi()
+        if devam_eden_var:
+            st.button("🔄 Durumu Yenile", key="analiz_isleri_yenile")
+
+
+def _analiz_isleri_listesi():
+    from src.core.is_kuyrugu import DEVAM_EDEN_DURUMLAR, IS_IPTAL, IS_TAMAMLANDI
+
+    kuyruk = _is_kuyrugu()
+    if kuyruk is None:
+        return
+
+    # Bu oturumun işi bittiyse sonuç kaydedilip arşive geçilir
+    is_kimligi = st.session_state.get("analiz_isi")
+    benim = kuyruk.durum(is_kimligi) if is_kimligi else None
+    if benim is not None and benim["durum"] not in DEVAM_EDEN_DURUMLAR:
+        st.session_state.pop("analiz_isi", None)
+        if benim["durum"] != IS_IPTAL:
+            basarili = benim["durum"] == IS_TAMAMLANDI
+            st.session_state.last_analysis = {
+                "status": "success" if basarili else "error",
+                "date": benim["gun_tarihi"],
+                "unique_id": benim["unique_id"],
+                "stdout": "Analiz tamamlandı" if basarili else "",
+                "stderr": "" if basarili else (benim["hata_mesaji"] or "Analiz başarısız"),
+                "returncode": 0 if basarili else 1,
+            }
+            st.session_state.preselect_date = benim["gun_tarihi"]
+            st.session_state.preselect_folder = benim["kimlik"]
+            st.session_state.page = "rapor"
+            st.rerun()
+
+    simgeler = {"kuyrukta": "🕒", "calisiyor": "⚙️", "tamamlandi": "✅", "hata": "❌", "iptal": "⛔"}
+    for is_ in kuyruk.isler():
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            sure = f" · {is_['sure_sn']} sn" if is_["sure_sn"] is not None else ""
+            st.markdown(
+                f"{simgeler.get(is_['durum'], '•')} **{is_['dosya']}** — {is_['asama']}{sure}"
+            )
+            if is_["durum"] in DEVAM_EDEN_DURUMLAR:
+                st.progress(is_["ilerleme"])
+            elif is_["hata_mesaji"]:
+                st.caption(is_["hata_mesaji"])
+        with col2:
+            if is_["durum"] in DEVAM_EDEN_DURUMLAR:
+                if st.button("⛔ İptal", key=f"is_iptal_{is_['kimlik']}", use_container_width=True):
+                    kuyruk.iptal_et(is_["kimlik"])
+                    st.rerun()
+
 
 # Eski analiz fonksiyonu kodları kaldırıldı - yukarıdaki analiz_sayfasi() yeni versiyondur
 
@@ -1603,10 +1847,11 @@ def rapor_sayfasi():
     tab1, tab2, tab3 = st.tabs(["📈 Grafikler", "📄 PDF Raporu", "📊 JSON Verisi"])
 
     with tab1:
-        show_graphs(report_folder, num_graphs=50)  # Tüm grafikleri göstermek için yüksek sayı
+        show_graphs(report_folder)
 
     with tab2:
-        pdf_candidates = list(report_folder.glob("*.pdf"))
+        from src.core.cikti_deposu import dosyalari_coz
+        pdf_candidates = dosyalari_coz(report_folder, "*.pdf")
         if pdf_candidates:
             pdf_path = pdf_candidates[0]
             with open(pdf_path, "rb") as pdf_file:
@@ -0,0 +1,85 @@
+"""
+Kategorik sütun benchmark'ı - object ve category tiplerinin bellek/zaman karşılaştırması
+
+Kullanım: python benchmark_kategorik.py [satir_sayisi]
+"""
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.utils.veri_tipleri import kategorik_sutunlara_cevir, deger_sayimi
+
+
+def ornek_veri_olustur(n_rows: int) -> pd.DataFrame:
+    """Gerçek dağılıma benzeyen düşük kardinaliteli sentetik veri"""
+    rng = np.random.default_rng(42)
+    klinikler = [f"KLİNİK {i}" for i in range(150)] + [
+        "KORONER YOĞUN BAKIM", "GENEL YOĞUN BAKIM", "YENİDOĞAN YOĞUN BAKIM",
+    ]
+    return pd.DataFrame({
+        "durum": rng.choice(
+            ["Yer Aranıyor", "Yer Ayarlandı", "Nakil Talebi İptal Edildi", "Hasta Transfer Edildi"],
+            n_rows,
+        ),
+        "talep kaynağı": rng.choice(["İl İçi", "İl Dışı", "Bölge"], n_rows),
+        "nakledilmesi i̇stenen klinik": rng.choice(klinikler, n_rows),
+        "solunum i̇şlemi": rng.choice(["Entübe", "Non-Entübe", "SPONTAN", "NON-INVASIVE"], n_rows),
+        "i̇l": rng.choice(["İstanbul", "Ankara", "İzmir", "Bursa", "Antalya", "Adana"], n_rows),
+        "i̇ptal eden": rng.choice(["Hasta", "Hekim", "Sistem", None], n_rows),
+        "i̇ptal nedeni": rng.choice(["Hasta İsteği", "Tıbbi Endikasyon", "Kapasite", None], n_rows),
+    }).astype(object)
+
+
+def islemleri_olc(df: pd.DataFrame, tekrar: int = 20) -> float:
+    """Analiz akışındaki tipik karşılaştırmaları çalıştırıp süreyi döndürür"""
+    klinik = "nakledilmesi i̇stenen klinik"
+    baslangic = time.perf_counter()
+    for _ in range(tekrar):
+        _ = df["durum"] == "Yer Ayarlandı"
+        _ = df["talep kaynağı"] != "İl İçi"
+        _ = df[klinik].isin(["GENEL YOĞUN BAKIM", "KLİNİK 3", "KLİNİK 7"])
+        _ = df["durum"].str.contains("İptal", na=False)
+        _ = deger_sayimi(df[klinik])
+        _ = deger_sayimi(df["i̇ptal eden"].dropna())
+    return time.perf_counter() - baslangic
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    df_object = ornek_veri_olustur(n_rows)
+    df_kategorik = kategorik_sutunlara_cevir(df_object.copy())
+
+    bellek_object = df_object.memory_usage(deep=True).sum() / (1024 * 1024)
+    bellek_kategorik = df_kategorik.memory_usage(deep=True).sum() / (1024 * 1024)
+
+    sure_object = islemleri_olc(df_object)
+    sure_kategorik = islemleri_olc(df_kategorik)
+
+    with tempfile.TemporaryDirectory() as gecici:
+        yol_object = Path(gecici) / "object.parquet"
+        yol_kategorik = Path(gecici) / "kategorik.parquet"
+        df_object.to_parquet(yol_object, index=False)
+        df_kategorik.to_parquet(yol_kategorik, index=False)
+        boyut_object = yol_object.stat().st_size / 1024
+        boyut_kategorik = yol_kategorik.stat().st_size / 1024
+
+        baslangic = time.perf_counter()
+        pd.read_parquet(yol_object)
+        okuma_object = time.perf_counter() - baslangic
+        baslangic = time.perf_counter()
+        pd.read_parquet(yol_kategorik)
+        okuma_kategorik = time.perf_counter() - baslangic
+
+    print(f"📊 Satır sayısı: {n_rows:,}")
+    print(f"💾 Bellek:        object {bellek_object:8.1f} MB | category {bellek_kategorik:8.1f} MB")
+    print(f"⏱️  Karşılaştırma: object {sure_object:8.2f} s  | category {sure_kategorik:8.2f} s")
+    print(f"📦 Parquet:       object {boyut_object:8.0f} KB | dictionary {boyut_kategorik:6.0f} KB")
+    print(f"📖 Okuma:         object {okuma_object:8.3f} s  | category {okuma_kategorik:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,14 +15,27 @@ from src.core.config import (
     LOG_DOSYA,
     LOG_SEVIYE,
     ISLENMIŞ_VERI_DIZIN,
+    ANA_VERI_DATASET_DIZIN,
     RAPOR_DIZIN,
+    CIKTI_DEPOSU_AYARLARI,
     PROGRAM_AYARLARI,
     OTOMATIK_ANALIZ_AYARLARI,
-    EXCEL_TARIH_SUTUNLARI,
+    EXCEL_YAZMA_AYARLARI,
     VAKA_TIPI_ISIMLERI,
 )
+from src.core.calistirma_kaydi import DURUM_ANALIZ, calistirma_kaydi, kayda_yaz, kimlik_olustur
+
+# Çalışan analiz sunucusu varsa komut ona iletilir; ağır modüller bu süreçte yüklenmez
+if __name__ == "__main__":
+    from src.core.analiz_sunucusu import cli_sunucuda_calistir
+
+    _sunucu_kodu = cli_sunucuda_calistir(sys.argv[1:])
+    if _sunucu_kodu is not None:
+        sys.exit(_sunucu_kodu)
+
 from src.processors.veri_isleme import VeriIsleme
 from src.analyzers.nakil_analyzer import NakilAnalizcisi
+from src.utils.excel_yazici import AkisliExcelYazici, yan_dosyalari_yaz
 import pandas as pd
 
 # Logger yapılandırması
@@ -54,6 +67,10 @@ def eski_verileri_temizle() -> None:
                 if dosya.is_file():
                     dosya.unlink()
                     logger.debug(f"Silindi: {dosya}")
+            # Ay bölümlü (Hive) ana veri klasörü
+            if ANA_VERI_DATASET_DIZIN.exists():
+                shutil.rmtree(ANA_VERI_DATASET_DIZIN, ignore_errors=True)
+                logger.debug(f"Silindi: {ANA_VERI_DATASET_DIZIN}")
             logger.info(f"Processed klasörü temizlendi: {ISLENMIŞ_VERI_DIZIN}")
 
         # Reports klasörünü temizle
@@ -67,6 +84,20 @@ def eski_verileri_temizle() -> None:
                     logger.debug(f"Klasör silindi: {item}")
             logger.info(f"Reports klasörü temizlendi: {RAPOR_DIZIN}")
 
+        # Silinen klasörlerin çalıştırma kayıtlarını da sil
+        kayda_yaz("temizle")
+
+        # Artık hiçbir rapor klasörünün bağlanmadığı depo nesnelerini sil.
+        # Bağlantı sayısı yalnızca hardlink'lerde anlamlıdır; symlink ya da
+        # kopya kullanılan depoda nesneler silinmez
+        if CIKTI_DEPOSU_AYARLARI.get("aktif", True):
+            from src.core.cikti_deposu import CiktiDeposu
+            depo = CiktiDeposu()
+            if depo.hardlink_destekli(RAPOR_DIZIN):
+                depo.sahipsizleri_temizle()
+            else:
+                logger.info("Çıktı deposu hardlink kullanamıyor; sahipsiz nesne temizliği atlandı")
+
         print("🧹 Eski veriler temizlendi")
 
     except Exception as e:
@@ -103,13 +134,7 @@ def gunluk_islem_yap(excel_dosya: str, unique_id: str = None) -> None:
             rapor_klasoru = Path("data/reports") / f"{gun_tarihi}_{unique_id}"
             os.makedirs(rapor_klasoru, exist_ok=True)
             logger.info(f"Rapor klasörü önceden oluşturuldu: {rapor_klasoru}")
-            
-            # Kontrol amaçlı bir dosya oluştur
-            try:
-                with open(rapor_klasoru / "rapor_hazirlaniyor.txt", "w") as f:
-                    f.write(f"Rapor {gun_tarihi} tarihinde hazırlanıyor.\nExcel dosya: {excel_dosya}\nUnique ID: {unique_id}")
-            except Exception as e:
-                logger.warning(f"Kontrol dosyası oluşturulamadı: {e}")
+            # İşlem durumu çalıştırma kaydında tutulur (VeriIsleme.gunluk_islem)
 
         # Veri işleyici oluştur
         isleyici = VeriIsleme()
@@ -196,9 +221,8 @@ def gunluk_nakil_analizi_yap(
         logger.info(f"Günlük nakil analizi başlatılıyor: {gun_tarihi} ({gun_tipi})")
         logger.info(f"Zaman aralığı: {baslangic_tarihi} 08:00 - {gun_tarihi} 08:00")
 
-        # Rapor klasörünü oluştur ve bu analiz için gerekli bilgileri kaydet
+        # Rapor klasörünü oluştur ve analizi çalıştırma kaydına yaz
         import os
-        import json
         
         # Önce tarih klasörünü oluştur (her durumda)
         tarih_klasoru = Path("data/reports") / f"{gun_tarihi}"
@@ -210,29 +234,15 @@ def gunluk_nakil_analizi_yap(
             rapor_klasor = Path("data/reports") / f"{gun_tarihi}_{unique_id}"
             os.makedirs(rapor_klasor, exist_ok=True)
             
-            # Analiz hazırlık bilgilerini kaydet
-            hazirlik_bilgisi = {
-                "tarih": gun_tarihi,
-                "unique_id": unique_id,
-                "baslangic_zamani": datetime.now().isoformat(),
-                "gun_tipi": gun_tipi,
-                "baslangic_tarihi": baslangic_tarihi,
-                "durum": "hazirlaniyor"
-            }
-            
-            try:
-                with open(rapor_klasor / "analiz_bilgi.json", "w", encoding="utf-8") as f:
-                    json.dump(hazirlik_bilgisi, f, ensure_ascii=False, indent=2)
-                    
-                # Kontrol dosyası oluştur (grafikler olana kadar görüntülenecek)
-                with open(rapor_klasor / "rapor_hazirlaniyor.txt", "w", encoding="utf-8") as f:
-                    f.write(f"Rapor {gun_tarihi} tarihinde hazırlanıyor.\n")
-                    f.write(f"Analiz tarihi: {gun_tarihi}\n")
-                    f.write(f"Unique ID: {unique_id}\n")
-                    f.write(f"Başlangıç zamanı: {datetime.now().isoformat()}\n")
-                    f.write(f"Durum: Rapor hazırlanıyor, lütfen bekleyin...\n")
-            except Exception as e:
-                logger.warning(f"Analiz hazırlık bilgisi kaydedilemedi: {e}")
+            # Analiz durumu çalıştırma kaydına yazılır (klasördeki işaret dosyaları yerine)
+            kayda_yaz(
+                "baslat",
+                kimlik_olustur(gun_tarihi, unique_id),
+                gun_tarihi,
+                DURUM_ANALIZ,
+                unique_id=unique_id,
+                rapor_klasoru=rapor_klasor.resolve(),
+            )
         
         logger.info(f"Rapor klasörü oluşturuldu: {rapor_klasor}")
         
@@ -312,49 +322,6 @@ def gunluk_nakil_analizi_yap(
     return rapor
 
 
-def tarih_formati_uygula(workbook, sheet_name):
-    """Excel sayfasındaki tarih sütunlarına dd-mm-yyyy hh:mm formatı uygular"""
-    try:
-        from openpyxl.styles import NamedStyle
-
-        # Tarih formatı stili oluştur
-        tarih_stili = NamedStyle(name="tarih_stili")
-        tarih_stili.number_format = "DD-MM-YYYY HH:MM"
-
-        # Workbook'a stil ekle
-        if "tarih_stili" not in workbook.named_styles:
-            workbook.add_named_style(tarih_stili)
-
-        # Sayfadaki tarih sütunlarını formatla
-        worksheet = workbook[sheet_name]
-        tarih_sutunlari = ["basvuru_tarihi", "vaka_tarihi", "nakil_tarihi"]
-
-        # İlk satırdan sütun başlıklarını al
-        basliklar = []
-        for cell in worksheet[1]:
-            if cell.value:
-                basliklar.append(cell.value.lower())
-
-        # Tarih sütunlarının indekslerini bul
-        tarih_indeksleri = []
-        for i, baslik in enumerate(basliklar):
-            tarih_sut_var = any(
-                tarih_sut in str(baslik).lower() for tarih_sut in tarih_sutunlari
-            )
-            if tarih_sut_var:
-                tarih_indeksleri.append(i + 1)  # Excel 1-indexed
-
-        # Tarih formatını uygula
-        for col_idx in tarih_indeksleri:
-            for row in worksheet.iter_rows(min_row=2, min_col=col_idx, max_col=col_idx):
-                for cell in row:
-                    if cell.value:
-                        cell.style = "tarih_stili"
-
-    except Exception as e:
-        logging.warning(f"Tarih formatı uygulanırken hata: {e}")
-
-
 def excel_raporu_olustur(rapor: dict, gun_tarihi: str) -> None:
     """
     Analiz verilerini Excel formatında reports klasörüne kaydeder.
@@ -383,42 +350,51 @@ def excel_raporu_olustur(rapor: dict, gun_tarihi: str) -> None:
         tarih_klasor.mkdir(parents=True, exist_ok=True)
         excel_dosya = tarih_klasor / f"nakil_analiz_raporu_{gun_tarihi}.xlsx"
 
-        with pd.ExcelWriter(excel_dosya, engine="openpyxl") as writer:
-            # Ham veri sayfası (TÜM VERİ)
+        # Sayfa adı -> tablo (CSV/parquet ek kopyaları için)
+        sayfalar = {}
+        with AkisliExcelYazici(excel_dosya) as writer:
+            # Ham veri sayfası (TÜM VERİ) - satır sınırını aşarsa Ham_Veri_2... olarak bölünür
             if not df_tum_veri.empty:
-                df_tum_veri.to_excel(writer, sheet_name="Ham_Veri", index=False)
+                writer.sayfa_yaz(df_tum_veri, "Ham_Veri")
+                sayfalar["Ham_Veri"] = df_tum_veri
 
             # Sadece df_gunluk doluysa ve vaka_tipi sütunu varsa vaka tipi sayfalarını oluştur
             if not df_gunluk.empty and "vaka_tipi" in df_gunluk.columns:
                 # Yeni vakalar sayfası
                 yeni_vakalar = df_gunluk[df_gunluk["vaka_tipi"] == "Yeni Vaka"].copy()
                 if not yeni_vakalar.empty:
-                    yeni_vakalar.to_excel(writer, sheet_name="Yeni_Vakalar", index=False)
+                    writer.sayfa_yaz(yeni_vakalar, "Yeni_Vakalar")
+                    sayfalar["Yeni_Vakalar"] = yeni_vakalar
 
                 # Devreden vakalar sayfası
                 devreden_vakalar = df_gunluk[df_gunluk["vaka_tipi"] == "Devreden Vaka"].copy()
                 if not devreden_vakalar.empty:
-                    devreden_vakalar.to_excel(writer, sheet_name="Devreden_Vakalar", index=False)
+                    writer.sayfa_yaz(devreden_vakalar, "Devreden_Vakalar")
+                    sayfalar["Devreden_Vakalar"] = devreden_vakalar
 
                 # Filtrelenmiş vakalar (klinik analizine dahil edilen)
                 filtrelenmis_vakalar = analizci.klinik_filtrele(df_gunluk)
                 if not filtrelenmis_vakalar.empty:
-                    filtrelenmis_vakalar.to_excel(writer, sheet_name="Filtrelenmis_Vakalar", index=False)
+                    writer.sayfa_yaz(filtrelenmis_vakalar, "Filtrelenmis_Vakalar")
+                    sayfalar["Filtrelenmis_Vakalar"] = filtrelenmis_vakalar
 
                 # İl grupları için sayfalar
                 il_gruplari = analizci.il_bazinda_grupla(df_gunluk)
                 if il_gruplari.get("Il_Ici") is not None and not il_gruplari["Il_Ici"].empty:
                     il_ici_gecerli = il_gruplari["Il_Ici"][il_gruplari["Il_Ici"]["vaka_tipi"].isin(["Yeni Vaka", "Devreden Vaka"])]
                     if not il_ici_gecerli.empty:
-                        il_ici_gecerli.to_excel(writer, sheet_name="Il_Ici_Vakalar", index=False)
+                        writer.sayfa_yaz(il_ici_gecerli, "Il_Ici_Vakalar")
+                        sayfalar["Il_Ici_Vakalar"] = il_ici_gecerli
                 
                 if il_gruplari.get("Il_Disi") is not None and not il_gruplari["Il_Disi"].empty:
                     il_disi_gecerli = il_gruplari["Il_Disi"][il_gruplari["Il_Disi"]["vaka_tipi"].isin(["Yeni Vaka", "Devreden Vaka"])]
                     if not il_disi_gecerli.empty:
-                        il_disi_gecerli.to_excel(writer, sheet_name="Il_Disi_Vakalar", index=False)
+                        writer.sayfa_yaz(il_disi_gecerli, "Il_Disi_Vakalar")
+                        sayfalar["Il_Disi_Vakalar"] = il_disi_gecerli
 
                 if il_gruplari.get("Butun_Bolgeler") is not None and not il_gruplari["Butun_Bolgeler"].empty:
-                    il_gruplari["Butun_Bolgeler"].to_excel(writer, sheet_name="Butun_Bolgeler", index=False)
+                    writer.sayfa_yaz(il_gruplari["Butun_Bolgeler"], "Butun_Bolgeler")
+                    sayfalar["Butun_Bolgeler"] = il_gruplari["Butun_Bolgeler"]
 
             # Özet istatistikler
             ozet_data = []
@@ -433,10 +409,17 @@ def excel_raporu_olustur(rapor: dict, gun_tarihi: str) -> None:
                 ["Analiz Tarihi", gun_tarihi],
                 ["Analiz Zamanı", rapor.get("analiz_zamani", "")],
             ])
-            pd.DataFrame(ozet_data).to_excel(writer, sheet_name="Ozet", index=False, header=False)
+            writer.sayfa_yaz(pd.DataFrame(ozet_data), "Ozet", baslik=False)
 
         print(f"✅ Excel raporu başarıyla oluşturuldu: {excel_dosya}")
 
+        # İsteğe bağlı CSV/parquet kopyaları (Excel satır sınırı yoktur)
+        if EXCEL_YAZMA_AYARLARI.get("yan_dosyalar"):
+            yan_dizin = tarih_klasor / EXCEL_YAZMA_AYARLARI.get("yan_dosya_dizin_adi", "tablolar")
+            for sayfa_adi, tablo in sayfalar.items():
+                yan_dosyalari_yaz(tablo, yan_dizin, f"{excel_dosya.stem}_{sayfa_adi}")
+            print(f"📁 Tablo kopyaları: {yan_dizin}")
+
     except Exception as e:
         logger.error(f"Excel raporu oluşturma hatası: {e}", exc_info=True)
         print(f"❌ Excel raporu oluşturma hatası: {e}")
@@ -445,42 +428,11 @@ def excel_raporu_olustur(rapor: dict, gun_tarihi: str) -> None:
 def parquet_excel_donustur():
     """Parquet dosyalarını Excel formatına dönüştürür"""
 
-    def tarih_formati_uygula(workbook, worksheet_name: str):
-        """Excel sayfasındaki tarih sütunlarına dd-mm-yyyy hh:mm formatı uygular"""
-        from openpyxl.styles import NamedStyle
-
-        # Tarih formatı tanımla
-        tarih_stili = NamedStyle(name="tarih_formati")
-        tarih_stili.number_format = "DD-MM-YYYY HH:MM"
-
-        # Eğer stil henüz eklenmemişse workbook'a ekle
-        if "tarih_formati" not in workbook.named_styles:
-            workbook.add_named_style(tarih_stili)
-
-        worksheet = workbook[worksheet_name]
-
-        # İlk satırdaki başlık sütunlarını bul
-        if worksheet.max_row > 0:
-            header_row = list(
-                worksheet.iter_rows(min_row=1, max_row=1, values_only=True)
-            )[0]
-
-            # Tarih sütunlarının indekslerini bul
-            tarih_sutun_indeksleri = []
-            for i, header in enumerate(header_row):
-                if header in EXCEL_TARIH_SUTUNLARI:
-                    tarih_sutun_indeksleri.append(i + 1)  # Excel 1-indexed
-
-            # Tarih sütunlarına format uygula
-            for col_idx in tarih_sutun_indeksleri:
-                for row in range(2, worksheet.max_row + 1):  # Başlık hariç
-                    cell = worksheet.cell(row=row, column=col_idx)
-                    if cell.value and cell.value != "":
-                        cell.style = "tarih_formati"
-
     try:
         # İşlenmiş veri klasöründeki parquet dosyalarını listele
         parquet_dosyalar = list(ISLENMIŞ_VERI_DIZIN.glob("*.parquet"))
+        # Bölümlenmiş ana veri deposundaki aylık dosyalar
+        parquet_dosyalar += sorted(ANA_VERI_DATASET_DIZIN.glob("*=*/*.parquet"))
 
         if not parquet_dosyalar:
             print("❌ İşlenmiş veri klasöründe parquet dosyası bulunamadı!")
@@ -489,7 +441,7 @@ def parquet_excel_donustur():
         print("📁 Mevcut parquet dosyaları:")
         for i, dosya in enumerate(parquet_dosyalar, 1):
             dosya_boyut = dosya.stat().st_size / (1024 * 1024)  # MB
-            print(f"{i}. {dosya.name} ({dosya_boyut:.2f} MB)")
+            print(f"{i}. {_parquet_gorunen_ad(dosya)} ({dosya_boyut:.2f} MB)")
 
         print(f"{len(parquet_dosyalar)+1}. Tümünü dönüştür")
         print(f"{len(parquet_dosyalar)+2}. Ana menüye dön")
@@ -520,41 +472,55 @@ def parquet_excel_donustur():
         print(f"❌ Hata: {e}")
 
 
+def _parquet_gorunen_ad(parquet_dosya: Path) -> str:
+    """Bölüm dosyaları için ana_veri_2025-10 gibi okunur bir ad üretir"""
+    if "=" in parquet_dosya.parent.name:
+        return f"{parquet_dosya.parent.parent.name}_{parquet_dosya.parent.name.split('=', 1)[1]}"
+    return parquet_dosya.stem
+
+
 def _tek_parquet_donustur(parquet_dosya: Path):
     """Tek bir parquet dosyasını Excel'e dönüştürür"""
     try:
-        # Parquet dosyasını oku
-        df = pd.read_parquet(parquet_dosya)
+        import pyarrow.parquet as pq
+
+        # Parquet dosyası satır grupları halinde okunur; tamamı belleğe alınmaz
+        parquet = pq.ParquetFile(parquet_dosya)
+        satir_sayisi = parquet.metadata.num_rows
+        sutun_sayisi = len(parquet.schema_arrow.names)
+        parcalar = (
+            parca.to_pandas()
+            for parca in parquet.iter_batches(batch_size=EXCEL_YAZMA_AYARLARI.get("parca_satir", 50_000))
+        )
 
         # Excel dosya adını oluştur
-        excel_dosya = RAPOR_DIZIN / f"{parquet_dosya.stem}.xlsx"
+        excel_dosya = RAPOR_DIZIN / f"{_parquet_gorunen_ad(parquet_dosya)}.xlsx"
 
-        # Excel'e kaydet
-        with pd.ExcelWriter(excel_dosya, engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name="Data", index=False)
+        # Excel'e kaydet (tarih sütunları sütun düzeyinde formatlanır)
+        with AkisliExcelYazici(excel_dosya) as writer:
+            veri_sayfalari = writer.sayfa_yaz(parcalar, "Data")
 
             # Özet sayfa ekle
             ozet_data = [
                 ["Metric", "Value"],
-                ["Toplam Satır", len(df)],
-                ["Toplam Sütun", len(df.columns)],
+                ["Toplam Satır", satir_sayisi],
+                ["Toplam Sütun", sutun_sayisi],
                 [
                     "Dosya Boyutu (MB)",
                     f"{parquet_dosya.stat().st_size / (1024*1024):.2f}",
                 ],
                 ["Dönüştürme Tarihi", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
             ]
+            if len(veri_sayfalari) > 1:
+                ozet_data.append(["Veri Sayfaları", ", ".join(veri_sayfalari)])
 
             ozet_df = pd.DataFrame(ozet_data[1:], columns=ozet_data[0])
-            ozet_df.to_excel(writer, sheet_name="Summary", index=False)
-
-            # Tarih formatını tüm sayfalara uygula
-            workbook = writer.book
-            for sheet_name in workbook.sheetnames:
-                tarih_formati_uygula(workbook, sheet_name)
+            writer.sayfa_yaz(ozet_df, "Summary")
 
         print(f"✅ Başarılı: {excel_dosya.name}")
-        print(f"📊 Veri okundu: {len(df)} satır, {len(df.columns)} sütun")
+        print(f"📊 Veri okundu: {satir_sayisi} satır, {sutun_sayisi} sütun")
+        if len(veri_sayfalari) > 1:
+            print(f"📑 Excel satır sınırı nedeniyle {len(veri_sayfalari)} sayfaya bölündü")
         print(
             f"💾 Excel dosya boyutu: {excel_dosya.stat().st_size / (1024*1024):.2f} MB"
         )
@@ -712,8 +678,34 @@ def console_menu():
             print(f"❌ Beklenmeyen hata: {e}")
 
 
-def main():
-    """Ana fonksiyon"""
+def calistirmalari_listele(limit: int = 20) -> None:
+    """Son çalıştırmaları çalıştırma kaydından listeler"""
+    kayit = calistirma_kaydi()
+    if kayit is None:
+        print("⚠️  Çalıştırma kaydı kapalı ya da açılamadı")
+        return
+
+    calistirmalar = kayit.raporlar(limit=limit)
+    if not calistirmalar:
+        print("📭 Kayıtlı çalıştırma yok")
+        return
+
+    print(f"\n📋 Son {len(calistirmalar)} çalıştırma:")
+    for c in calistirmalar:
+        ham = Path(c["ham_dosya"]).name if c["ham_dosya"] else "-"
+        sure = f"{c['analiz_sn']:.1f} sn" if c["analiz_sn"] is not None else "-"
+        print(
+            f"  {c['tarih']}  {c['kimlik']:<40}  {c['durum']:<11}  "
+            f"vaka={c['vaka_sayisi'] if c['vaka_sayisi'] is not None else '-'}  "
+            f"grafik={c['grafik_sayisi'] if c['grafik_sayisi'] is not None else '-'}  "
+            f"analiz={sure}  ham={ham}"
+        )
+        if c["hata_mesaji"]:
+            print(f"      ❌ {c['hata_mesaji']}")
+
+
+def main(argv: Optional[list] = None):
+    """Ana fonksiyon (argv verilmezse komut satırı argümanları kullanılır)"""
     parser = argparse.ArgumentParser(
         description="Excel veri analizi ve parquet dönüştürme"
     )
@@ -734,11 +726,42 @@ def main():
     parser.add_argument(
         "--unique-id", type=str, help="Benzersiz işlem/rapor kimliği"
     )
+    parser.add_argument(
+        "--calistirmalar",
+        type=int,
+        nargs="?",
+        const=20,
+        metavar="N",
+        help="Son N çalıştırmayı (varsayılan 20) çalıştırma kaydından listele",
+    )
+    parser.add_argument(
+        "--tarih-gocu",
+        action="store_true",
+        help="Eski string tarihli parquet dosyalarını timestamp sütunlu biçime dönüştür",
+    )
+    parser.add_argument(
+        "--sunucu",
+        action="store_true",
+        help="Modülleri önceden yüklenmiş analiz sunucusunu başlat (--analiz ve "
+        "--gunluk-islem komutları çalışırken ona iletilir)",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
-        if args.gunluk_islem:
+        if args.sunucu:
+            from src.core.analiz_sunucusu import AnalizSunucusu
+
+            try:
+                AnalizSunucusu(main).baslat()
+            except KeyboardInterrupt:
+                print("👋 Analiz sunucusu kapatıldı")
+        elif args.calistirmalar is not None:
+            calistirmalari_listele(args.calistirmalar)
+        elif args.tarih_gocu:
+            donusturulen = VeriIsleme().parquet_tarih_gocu()
+            print(f"✅ {donusturulen} parquet dosyasının tarih sütunları dönüştürüldü")
+        elif args.gunluk_islem:
             gunluk_islem_yap(args.gunluk_islem, unique_id=args.unique_id)
         elif args.analiz:
             gunluk_nakil_analizi_yap(args.analiz, args.gun_tipi, unique_id=args.unique_id)
@@ -6,7 +6,10 @@ import logging
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Dict, Any, List
+
+from ..utils.gruplama import grup_deger_sayimlari, gruplu_diziler
+from .esik_analizcisi import EsikAnalizcisi
 
 # Logger yapılandırması
 logger = logging.getLogger(__name__)
@@ -15,146 +18,116 @@ logger = logging.getLogger(__name__)
 class AnalizMotoru:
     """Ana analiz mantığı ve istatistiksel hesaplamalar"""
 
-    def vaka_durumu_analizi(
-        self, df: pd.DataFrame, grup_adi: str, vaka_tipi: str
-    ) -> Dict[str, Any]:
-        """
-        Vaka durumu dağılımını analiz eder
+    def __init__(self):
+        """Analiz motoru başlatma"""
+        self.esik_analizcisi = EsikAnalizcisi()
+
+    def vaka_durumu_gruplari(
+        self,
+        df: pd.DataFrame,
+        grup_kodu: np.ndarray,
+        satir_indeksi: np.ndarray,
+        grup_sayisi: int,
+    ) -> List[Dict[str, Any]]:
         """
-        try:
-            sonuc = {}
+        Vaka durumu dağılımını her grup için analiz eder
 
-            if "durum" in df.columns and len(df) > 0:
-                durum_sayilari = df["durum"].value_counts()
-                durum_yuzdeleri = df["durum"].value_counts(normalize=True) * 100
+        Args:
+            df: Veri çerçevesi
+            grup_kodu: Uzun biçimde her satırın grup kodu
+            satir_indeksi: Uzun biçimde her satırın df içindeki konumu
+            grup_sayisi: Grup sayısı
 
-                sonuc = {
-                    "toplam_vaka": len(df),
+        Returns:
+            Grup koduna göre sıralı sonuçlar (durum sütunu yoksa boş sözlükler)
+        """
+        sonuc: List[Dict[str, Any]] = [{} for _ in range(grup_sayisi)]
+        try:
+            if "durum" not in df.columns:
+                return sonuc
+
+            toplamlar = np.bincount(grup_kodu, minlength=grup_sayisi)
+            sayimlar = grup_deger_sayimlari(df["durum"], grup_kodu, satir_indeksi)
+            for kod in range(grup_sayisi):
+                if toplamlar[kod] == 0:
+                    continue
+                durum_sayilari = sayimlar.get(kod, pd.Series(dtype="int64"))
+                durum_yuzdeleri = durum_sayilari / durum_sayilari.sum() * 100
+                sonuc[kod] = {
+                    "toplam_vaka": int(toplamlar[kod]),
                     "durum_sayilari": durum_sayilari.to_dict(),
                     "durum_yuzdeleri": durum_yuzdeleri.to_dict(),
                 }
-
             return sonuc
 
         except Exception as e:
             logger.error(f"Vaka durumu analizi hatası: {e}")
-            return {}
+            return [{} for _ in range(grup_sayisi)]
 
-    def bekleme_suresi_analizi(
+    def bekleme_suresi_gruplari(
         self,
         df: pd.DataFrame,
-        grup_adi: str,
-        vaka_tipi: str,
-        durum_filtre: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """
-        Bekleme süresi analizini yapar
+        grup_kodu: np.ndarray,
+        satir_indeksi: np.ndarray,
+        grup_adlari: List[str],
+        durum_filtre: str,
+    ) -> List[Dict[str, Any]]:
         """
-        try:
-            if durum_filtre:
-                df_filtered = df[df["durum"] == durum_filtre].copy()
-            else:
-                df_filtered = df.copy()
+        Bekleme süresi analizini her grup için yapar (saat cinsinden)
 
-            if len(df_filtered) == 0:
-                return {}
+        Sadece "Yer Ayarlandı" için threshold analizi eklenir; aralıklar
+        grubun il grubu adına göre config'den alınır.
 
-            # Bekleme süresini hesapla
-            bekleme_suresi_saat = self._bekleme_suresi_hesapla(df_filtered)
+        Args:
+            df: Veri çerçevesi
+            grup_kodu: Uzun biçimde her satırın grup kodu
+            satir_indeksi: Uzun biçimde her satırın df içindeki konumu
+            grup_adlari: Her grubun il grubu adı (threshold aralıkları için)
+            durum_filtre: Analize alınan durum
 
-            if len(bekleme_suresi_saat) == 0:
-                return {}
-
-            sonuc = {
-                "vaka_sayisi": len(df_filtered),
-                "ortalama_saat": float(np.mean(bekleme_suresi_saat)),
-                "medyan_saat": float(np.median(bekleme_suresi_saat)),
-                "min_saat": float(np.min(bekleme_suresi_saat)),
-                "max_saat": float(np.max(bekleme_suresi_saat)),
-            }
-
-            # Sadece "Yer Ayarlandı" için threshold analizi yap
+        Returns:
+            Grup koduna göre sıralı sonuçlar (geçerli süre yoksa boş sözlük)
+        """
+        grup_sayisi = len(grup_adlari)
+        sonuc: List[Dict[str, Any]] = [{} for _ in range(grup_sayisi)]
+        try:
+            if "durum" not in df.columns or len(satir_indeksi) == 0:
+                return sonuc
+            if "talep tarihi" not in df.columns or "yer bulunma tarihi" not in df.columns:
+                return sonuc
+
+            durum_uygun = (df["durum"] == durum_filtre).to_numpy()[satir_indeksi]
+            vaka_sayilari = np.bincount(grup_kodu[durum_uygun], minlength=grup_sayisi)
+
+            bekleme_saat = (
+                (df["yer bulunma tarihi"] - df["talep tarihi"]).dt.total_seconds() / 3600
+            ).to_numpy(dtype=float)[satir_indeksi]
+            # Boş ve negatif değerler hariç
+            gecerli = durum_uygun & ~np.isnan(bekleme_saat) & (bekleme_saat >= 0)
+
+            # Threshold aralıkları tüm gruplar için tek geçişte (il grubuna özel eşiklerle)
+            esik_sayimlari = None
             if durum_filtre == "Yer Ayarlandı":
-                threshold_analizi = self._threshold_analizi(bekleme_suresi_saat)
-                sonuc["threshold_analizi"] = threshold_analizi
-
+                esik_sayimlari = self.esik_analizcisi.gruplu_siniflandir(
+                    bekleme_saat[gecerli], grup_kodu[gecerli], grup_sayisi, grup_adlari
+                )
+
+            for kod, degerler in gruplu_diziler(grup_kodu, bekleme_saat, gecerli).items():
+                analiz = {
+                    "vaka_sayisi": int(vaka_sayilari[kod]),
+                    "ortalama_saat": float(np.mean(degerler)),
+                    "medyan_saat": float(np.median(degerler)),
+                    "min_saat": float(np.min(degerler)),
+                    "max_saat": float(np.max(degerler)),
+                }
+                if esik_sayimlari is not None:
+                    analiz["threshold_analizi"] = esik_sayimlari[kod]
+                sonuc[kod] = analiz
             return sonuc
 
         except Exception as e:
             logger.error(f"Bekleme süresi analizi hatası: {e}")
-            return {}
-
-    def _bekleme_suresi_hesapla(self, df: pd.DataFrame) -> np.ndarray:
-        """Bekleme süresini saat cinsinden hesaplar"""
-        try:
-            if "talep tarihi" in df.columns and "yer bulunma tarihi" in df.columns:
-                # Boş olmayan değerleri filtrele
-                mask = df["talep tarihi"].notna() & df["yer bulunma tarihi"].notna()
-                df_temiz = df[mask]
-
-                if len(df_temiz) > 0:
-                    # Saat cinsinden fark hesapla
-                    bekleme_delta = (
-                        df_temiz["yer bulunma tarihi"] - df_temiz["talep tarihi"]
-                    )
-                    bekleme_saat = bekleme_delta.dt.total_seconds() / 3600
-
-                    # Negatif değerleri filtrele
-                    return bekleme_saat[bekleme_saat >= 0].values
-
-            return np.array([])
-
-        except Exception as e:
-            logger.error(f"Bekleme süresi hesaplama hatası: {e}")
-            return np.array([])
-
-    def _threshold_analizi(self, bekleme_suresi_saat: np.ndarray) -> Dict[str, int]:
-        """Bekleme süresi threshold analizini yapar"""
-        try:
-            thresholds = {
-                "0-30 dakika": 0.5,
-                "30 dakika - 1 saat": 1,
-                "1-2 saat": 2,
-                "2-4 saat": 4,
-                "4-8 saat": 8,
-                "8-24 saat": 24,
-                "24+ saat": float("inf"),
-            }
-
-            sonuc = {}
-            for etiket, limit in thresholds.items():
-                if etiket == "0-30 dakika":
-                    count = np.sum(bekleme_suresi_saat <= limit)
-                elif etiket == "24+ saat":
-                    count = np.sum(bekleme_suresi_saat > 24)
-                elif etiket == "30 dakika - 1 saat":
-                    count = np.sum(
-                        (bekleme_suresi_saat > 0.5) & (bekleme_suresi_saat <= 1)
-                    )
-                elif etiket == "1-2 saat":
-                    count = np.sum(
-                        (bekleme_suresi_saat > 1) & (bekleme_suresi_saat <= 2)
-                    )
-                elif etiket == "2-4 saat":
-                    count = np.sum(
-                        (bekleme_suresi_saat > 2) & (bekleme_suresi_saat <= 4)
-                    )
-                elif etiket == "4-8 saat":
-                    count = np.sum(
-                        (bekleme_suresi_saat > 4) & (bekleme_suresi_saat <= 8)
-                    )
-                elif etiket == "8-24 saat":
-                    count = np.sum(
-                        (bekleme_suresi_saat > 8) & (bekleme_suresi_saat <= 24)
-                    )
-
-                sonuc[etiket] = int(count)
-
-            return sonuc
-
-        except Exception as e:
-            logger.error(f"Threshold analizi hatası: {e}")
-            return {}
+            return [{} for _ in range(grup_sayisi)]
 
     def genel_istatistik_hesapla(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -0,0 +1,134 @@
+"""
+Eşik analizcisi modülü - Bekleme sürelerini config'deki aralıklara göre sınıflandırır
+"""
+
+import logging
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..core.config import BEKLEME_ESIK_AYARLARI
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+
+class EsikAnalizcisi:
+    """
+    Bekleme süresi eşik (threshold) analizi.
+
+    Aralık sınırları BEKLEME_ESIK_AYARLARI'ndan okunur. Tek grupta değerler
+    sıralanıp sınırlar np.searchsorted ile aranır (kümülatif sayımların farkı);
+    çok sayıda grup ise tek dizi ve grup kodlarıyla, her değerin aralık
+    indeksi bulunup (grup, aralık) çiftleri tek np.bincount ile sayılarak
+    sınıflandırılır.
+    """
+
+    def __init__(self, ayarlar: Optional[Dict] = None):
+        """Eşik analizcisi başlatma"""
+        self.ayarlar = ayarlar if ayarlar is not None else BEKLEME_ESIK_AYARLARI
+
+    def esikleri_getir(self, grup_adi: Optional[str] = None) -> List[Tuple[str, float]]:
+        """Grup (il grubu ya da klinik) için aralıkları, yoksa varsayılanı döndürür"""
+        grup_esikleri = self.ayarlar.get("grup_esikleri", {})
+        if grup_adi is not None and grup_adi in grup_esikleri:
+            return list(grup_esikleri[grup_adi])
+        return list(self.ayarlar["varsayilan"])
+
+    @staticmethod
+    def _aralik_indeksleri(
+        degerler: np.ndarray, esikler: Sequence[Tuple[str, float]]
+    ) -> np.ndarray:
+        """
+        Her değerin aralık indeksini döndürür. Aralıklar sağdan kapalı
+        olduğundan side="left" kullanılır; son (sonsuz) sınır aramaya girmez,
+        son aralığı aşan değerler son indekse düşer.
+        """
+        ust_sinirlar = np.array([limit for _, limit in esikler[:-1]], dtype=float)
+        return np.searchsorted(ust_sinirlar, degerler, side="left")
+
+    def siniflandir(
+        self, bekleme_suresi_saat: np.ndarray, grup_adi: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Bekleme sürelerini aralıklara dağıtır
+
+        Returns:
+            {aralık etiketi: vaka sayısı} (config sırasıyla)
+        """
+        try:
+            esikler = self.esikleri_getir(grup_adi)
+            degerler = np.asarray(bekleme_suresi_saat, dtype=float)
+
+            # Her üst sınıra kadar (dahil) olan değer sayısı; farklar aralık
+            # sayılarıdır. NaN sıralamada sona düşer ve inf sınırı ile dışarıda kalır.
+            ust_sinirlar = np.array(
+                [limit for _, limit in esikler[:-1]] + [np.inf], dtype=float
+            )
+            kumulatif = np.searchsorted(np.sort(degerler), ust_sinirlar, side="right")
+            sayimlar = np.diff(kumulatif, prepend=0)
+            return {etiket: int(sayi) for (etiket, _), sayi in zip(esikler, sayimlar)}
+
+        except Exception as e:
+            logger.error(f"Threshold analizi hatası: {e}")
+            return {}
+
+    def gruplu_siniflandir(
+        self,
+        bekleme_suresi_saat: np.ndarray,
+        grup_kodlari: np.ndarray,
+        grup_sayisi: int,
+        grup_adlari: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[Dict[str, int]]:
+        """
+        Birden çok grubun bekleme sürelerini tek geçişte aralıklara dağıtır
+
+        Args:
+            bekleme_suresi_saat: Tüm grupların değerleri (tek dizi)
+            grup_kodlari: Her değerin grup kodu (0..grup_sayisi-1)
+            grup_sayisi: Toplam grup sayısı
+            grup_adlari: Grup koduna göre ad (özel eşik seçimi için)
+
+        Returns:
+            Grup kodu sırasıyla {aralık etiketi: vaka sayısı} listesi
+        """
+        try:
+            degerler = np.asarray(bekleme_suresi_saat, dtype=float)
+            kodlar = np.asarray(grup_kodlari)
+            gecerli = ~np.isnan(degerler)
+            degerler, kodlar = degerler[gecerli], kodlar[gecerli]
+
+            if grup_adlari is None:
+                grup_adlari = [None] * grup_sayisi
+
+            # Aynı aralıkları kullanan gruplar birlikte sayılır
+            esik_kumeleri: Dict[Tuple, List[int]] = {}
+            for kod in range(grup_sayisi):
+                esikler = tuple(self.esikleri_getir(grup_adlari[kod]))
+                esik_kumeleri.setdefault(esikler, []).append(kod)
+
+            sonuc: List[Dict[str, int]] = [{} for _ in range(grup_sayisi)]
+            for esikler, kume_kodlari in esik_kumeleri.items():
+                if len(esik_kumeleri) == 1:
+                    secili_degerler, secili_kodlar = degerler, kodlar
+                else:
+                    secili = np.isin(kodlar, kume_kodlari)
+                    secili_degerler, secili_kodlar = degerler[secili], kodlar[secili]
+
+                aralik_sayisi = len(esikler)
+                indeksler = self._aralik_indeksleri(secili_degerler, esikler)
+                sayimlar = np.bincount(
+                    secili_kodlar * aralik_sayisi + indeksler,
+                    minlength=grup_sayisi * aralik_sayisi,
+                ).reshape(grup_sayisi, aralik_sayisi)
+
+                for kod in kume_kodlari:
+                    sonuc[kod] = {
+                        etiket: int(sayi)
+                        for (etiket, _), sayi in zip(esikler, sayimlar[kod])
+                    }
+
+            return sonuc
+
+        except Exception as e:
+            logger.error(f"Gruplu threshold analizi hatası: {e}")
+            return [{} for _ in range(grup_sayisi)]
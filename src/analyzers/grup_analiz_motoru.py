@@ -0,0 +1,133 @@
+"""
+Grup analiz motoru - İl grubu × vaka tipi metriklerini tek geçişte hesaplar
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Tuple
+
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+# Rapordaki vaka tipi sırası ("Butun_Vakalar" = Yeni + Devreden)
+VAKA_TIPLERI = ["Yeni Vaka", "Devreden Vaka", "Butun_Vakalar"]
+GECERLI_VAKA_TIPLERI = ["Yeni Vaka", "Devreden Vaka"]
+
+
+class GrupAnalizMotoru:
+    """
+    İl grubu × vaka tipi kombinasyonlarının metriklerini tek veri çerçevesi
+    üzerinde hesaplar.
+
+    Her kombinasyon için ayrı DataFrame kopyası oluşturmak yerine gruplar bir
+    kez maske olarak çıkarılır. Sayımlar tek bir çok anahtarlı groupby ile,
+    ortalama/medyan gibi toplanamayan istatistikler ise sütun dizilerinin
+    grup sırasına göre sıralanmış dilimleri üzerinde hesaplanır. Metrikler
+    AnalizMotoru, VeriIsleme ve KlinikAnalizcisi'nin gruplu yöntemleriyle
+    hesaplanır; bu sınıf yalnızca grupları çıkarır ve sonuçları birleştirir.
+    """
+
+    def __init__(self, analiz_motoru, veri_isleme, klinik_analizcisi):
+        """Grup analiz motoru başlatma"""
+        self.analiz_motoru = analiz_motoru
+        self.veri_isleme = veri_isleme
+        self.klinik_analizcisi = klinik_analizcisi
+
+    def grup_maskeleri(self, df: pd.DataFrame) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        İl grubu × vaka tipi maskelerini rapor sırasıyla döndürür.
+        Boş il grupları atlanır; boş vaka tipleri boş maske olarak kalır.
+        """
+        il_maskeleri = {
+            il_grup_adi: maske
+            for il_grup_adi, maske in self.veri_isleme.il_maskeleri(df).items()
+            if maske.any()
+        }
+
+        vaka_tipi = df["vaka_tipi"].to_numpy()
+        vt_maskeleri = {
+            "Yeni Vaka": vaka_tipi == "Yeni Vaka",
+            "Devreden Vaka": vaka_tipi == "Devreden Vaka",
+        }
+        vt_maskeleri["Butun_Vakalar"] = vt_maskeleri["Yeni Vaka"] | vt_maskeleri["Devreden Vaka"]
+
+        return {
+            il_grup_adi: {vt: il_maske & vt_maske for vt, vt_maske in vt_maskeleri.items()}
+            for il_grup_adi, il_maske in il_maskeleri.items()
+        }
+
+    def grup_analizlerini_hesapla(
+        self, df: pd.DataFrame
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Tüm il grubu × vaka tipi kombinasyonları için vaka durumu, süre,
+        bekleme/threshold ve klinik analizlerini hesaplar.
+
+        Returns:
+            {il_grubu: {vaka_tipi: {"vaka_durumu", "sure_analizleri",
+            "iptal_bekleme_suresi"?, "yer_ayarlandi_bekleme_suresi"?,
+            "klinik_analizi"?}}}
+        """
+        try:
+            maskeler = self.grup_maskeleri(df)
+
+            # Boş olmayan kombinasyonlar, rapor sırasıyla
+            gruplar: List[Tuple[str, str, np.ndarray]] = [
+                (il_grup_adi, vt, maske)
+                for il_grup_adi, vt_maskeleri in maskeler.items()
+                for vt, maske in vt_maskeleri.items()
+                if maske.any()
+            ]
+            # Her satırın ait olduğu grupların satır indeksleri (uzun biçim)
+            satirlar = [np.flatnonzero(maske) for _, _, maske in gruplar]
+            grup_kodu = np.repeat(
+                np.arange(len(gruplar)), [len(s) for s in satirlar]
+            )
+            satir_indeksi = (
+                np.concatenate(satirlar) if satirlar else np.array([], dtype=int)
+            )
+
+            vaka_durumu = self.analiz_motoru.vaka_durumu_gruplari(
+                df, grup_kodu, satir_indeksi, len(gruplar)
+            )
+            sure_analizleri = self.veri_isleme.sure_istatistikleri_gruplari(
+                df, grup_kodu, satir_indeksi, len(gruplar)
+            )
+            il_grup_adlari = [il_grup_adi for il_grup_adi, _, _ in gruplar]
+            iptal_bekleme = self.analiz_motoru.bekleme_suresi_gruplari(
+                df, grup_kodu, satir_indeksi, il_grup_adlari, "İptal"
+            )
+            yer_bekleme = self.analiz_motoru.bekleme_suresi_gruplari(
+                df, grup_kodu, satir_indeksi, il_grup_adlari, "Yer Ayarlandı"
+            )
+            klinik_analizleri = self.klinik_analizcisi.klinik_dagilim_gruplari(
+                df,
+                [f"{il_grup_adi}_{vt}" for il_grup_adi, vt, _ in gruplar],
+                [maske for _, _, maske in gruplar],
+                grup_kodu,
+                satir_indeksi,
+            )
+
+            sonuc: Dict[str, Dict[str, Dict[str, Any]]] = {
+                il_grup_adi: {} for il_grup_adi in maskeler
+            }
+            for kod, (il_grup_adi, vt, _) in enumerate(gruplar):
+                metrikler = {
+                    "vaka_durumu": vaka_durumu[kod],
+                    "sure_analizleri": sure_analizleri[kod],
+                }
+                if iptal_bekleme[kod]:
+                    metrikler["iptal_bekleme_suresi"] = iptal_bekleme[kod]
+                if yer_bekleme[kod]:
+                    metrikler["yer_ayarlandi_bekleme_suresi"] = yer_bekleme[kod]
+                if klinik_analizleri[kod] and "hata" not in klinik_analizleri[kod]:
+                    metrikler["klinik_analizi"] = klinik_analizleri[kod]
+                sonuc[il_grup_adi][vt] = metrikler
+
+            return sonuc
+
+        except Exception as e:
+            logger.error(f"Grup analizi hatası: {e}", exc_info=True)
+            return {}
@@ -3,8 +3,8 @@ Klinik analizcisi modülü - Klinik analizi işlemleri
 """
 
 import logging
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 from typing import Dict, Any, List, Optional
 
 from ..core.config import (
@@ -17,6 +17,9 @@ from ..core.config import (
     PASTA_GRAFIK_RENK_PALETI,
     GRUP_ADI_CEVIRI,
 )
+from ..utils.figur import figur_kaydet, figur_olustur
+from ..utils.veri_tipleri import deger_sayimi
+from ..utils.gruplama import grup_deger_sayimlari, gruplu_diziler, sayim_sirala, tek_grup
 
 # Logger yapılandırması
 logger = logging.getLogger(__name__)
@@ -44,7 +47,7 @@ class KlinikAnalizcisi:
             ].copy()
 
             # Klinik sayımlarını al
-            klinik_sayimlari = df_temiz[KLINIK_SUTUN_ADI].value_counts()
+            klinik_sayimlari = deger_sayimi(df_temiz[KLINIK_SUTUN_ADI])
 
             # Minimum giriş barajı filtresi
             if (
@@ -82,89 +85,155 @@ class KlinikAnalizcisi:
         """
         Klinik dağılım analizi yapar
         """
-        try:
-            # Klinik verilerini filtrele
-            df_filtreli = self.klinik_filtrele(df)
+        grup_kodu, satir_indeksi = tek_grup(len(df))
+        return self.klinik_dagilim_gruplari(
+            df, [grup_adi], [np.ones(len(df), dtype=bool)], grup_kodu, satir_indeksi
+        )[0]
+
+    def klinik_dagilim_gruplari(
+        self,
+        df: pd.DataFrame,
+        grup_adlari: List[str],
+        maskeler: List[np.ndarray],
+        grup_kodu: np.ndarray,
+        satir_indeksi: np.ndarray,
+    ) -> List[Dict[str, Any]]:
+        """
+        Klinik dağılım analizini her grup için yapar
 
-            if len(df_filtreli) == 0:
-                return {"hata": "Filtrelenmiş veri yok"}
+        Klinik sayımları tüm gruplar için tek groupby ile çıkarılır; config
+        filtresi (minimum giriş barajı, en çok klinik sayısı) her grubun
+        kendi sayımlarına uygulanır.
 
-            # Klinik dağılımı
-            klinik_sayimlari = df_filtreli[KLINIK_SUTUN_ADI].value_counts()
-            klinik_yuzdeleri = (
-                df_filtreli[KLINIK_SUTUN_ADI].value_counts(normalize=True) * 100
-            )
+        Args:
+            df: Veri çerçevesi
+            grup_adlari: Grup adları (sonuçtaki grup_adi)
+            maskeler: Her grubun df satır maskesi
+            grup_kodu: Uzun biçimde her satırın grup kodu
+            satir_indeksi: Uzun biçimde her satırın df içindeki konumu
 
-            # Her klinik için vaka durumu analizi
-            vaka_durum_analizi = {}
-            if "vaka_tipi" in df_filtreli.columns:
-                for klinik in klinik_sayimlari.index:
-                    klinik_df = df_filtreli[df_filtreli[KLINIK_SUTUN_ADI] == klinik]
-                    vaka_durumlari = klinik_df["vaka_tipi"].value_counts().to_dict()
-                    vaka_durum_analizi[klinik] = vaka_durumlari
+        Returns:
+            Grup koduna göre sıralı analiz sonuçları (veri yoksa {"hata": ...})
+        """
+        grup_sayisi = len(grup_adlari)
+        try:
+            if KLINIK_SUTUN_ADI not in df.columns:
+                logger.warning(f"Klinik sütunu bulunamadı: {KLINIK_SUTUN_ADI}")
+                return [{"hata": "Filtrelenmiş veri yok"} for _ in range(grup_sayisi)]
+
+            klinik = df[KLINIK_SUTUN_ADI]
+            # Boş klinik değerleri sayılmaz
+            klinik_gecerli = (klinik.notna() & (klinik != "")).to_numpy()
+            uzun_gecerli = klinik_gecerli[satir_indeksi]
+            tum_sayimlar = grup_deger_sayimlari(
+                klinik, grup_kodu[uzun_gecerli], satir_indeksi[uzun_gecerli]
+            )
 
-            # Bekleme süresi analizi (tarih farkından hesapla)
-            bekleme_analizi = {}
-            if (
-                "talep tarihi" in df_filtreli.columns
-                and "yer bulunma tarihi" in df_filtreli.columns
-            ):
-                for klinik in klinik_sayimlari.index:
-                    klinik_df = df_filtreli[df_filtreli[KLINIK_SUTUN_ADI] == klinik]
-
-                    # Klinik için bekleme sürelerini hesapla
-                    mask = (
-                        klinik_df["talep tarihi"].notna()
-                        & klinik_df["yer bulunma tarihi"].notna()
-                    )
-                    klinik_temiz = klinik_df[mask]
-
-                    if len(klinik_temiz) > 0:
-                        # Saat cinsinden bekleme süresi hesapla
-                        bekleme_delta = (
-                            klinik_temiz["yer bulunma tarihi"]
-                            - klinik_temiz["talep tarihi"]
+            baraj_ayari = KLINIK_ANALIZ_AYARLARI["minimum_giris_baraj"]
+            en_cok_ayari = KLINIK_ANALIZ_AYARLARI["en_cok_klinik_sayisi"]
+
+            sonuc: List[Dict[str, Any]] = []
+            klinik_dizi = klinik.to_numpy()
+            tarih_var = "talep tarihi" in df.columns and "yer bulunma tarihi" in df.columns
+            if tarih_var:
+                # Saat cinsinden bekleme süresi, tüm gruplar için bir kez
+                bekleme_saat = (
+                    (df["yer bulunma tarihi"] - df["talep tarihi"]).dt.total_seconds() / 3600
+                ).to_numpy(dtype=float)
+
+            for kod, (grup_adi, maske) in enumerate(zip(grup_adlari, maskeler)):
+                # Config filtresini geçen klinikler
+                klinik_sayimlari = tum_sayimlar.get(kod, pd.Series(dtype="int64"))
+                if baraj_ayari["aktif"] and baraj_ayari["deger"] > 0:
+                    klinik_sayimlari = klinik_sayimlari[klinik_sayimlari >= baraj_ayari["deger"]]
+                if en_cok_ayari["aktif"] and en_cok_ayari["deger"] > 0:
+                    klinik_sayimlari = klinik_sayimlari.head(en_cok_ayari["deger"])
+
+                if klinik_sayimlari.empty:
+                    sonuc.append({"hata": "Filtrelenmiş veri yok"})
+                    continue
+
+                filtre_maske = (
+                    maske & klinik_gecerli & klinik.isin(klinik_sayimlari.index).to_numpy()
+                )
+                df_filtreli = df[filtre_maske]
+                klinik_yuzdeleri = klinik_sayimlari / klinik_sayimlari.sum() * 100
+
+                # Her klinik için vaka durumu analizi (klinik × vaka tipi tek groupby)
+                vaka_durum_analizi = {}
+                if "vaka_tipi" in df.columns:
+                    vt_sayimlari = df_filtreli.groupby(
+                        [klinik_dizi[filtre_maske], df_filtreli["vaka_tipi"].to_numpy()],
+                        sort=False,
+                    ).size()
+                    vt_gruplari = {
+                        k: sayim_sirala(s.droplevel(0))
+                        for k, s in vt_sayimlari.groupby(level=0, sort=False)
+                    }
+                    for klinik_adi in klinik_sayimlari.index:
+                        vaka_durum_analizi[klinik_adi] = (
+                            vt_gruplari[klinik_adi].to_dict()
+                            if klinik_adi in vt_gruplari
+                            else {}
                         )
-                        bekleme_saat = bekleme_delta.dt.total_seconds() / 3600
-
-                        # Negatif değerleri filtrele
-                        gecerli_beklemeler = bekleme_saat[bekleme_saat >= 0]
-
-                        if len(gecerli_beklemeler) > 0:
-                            bekleme_analizi[klinik] = {
-                                "ortalama": float(gecerli_beklemeler.mean()),
-                                "medyan": float(gecerli_beklemeler.median()),
-                                "min": float(gecerli_beklemeler.min()),
-                                "max": float(gecerli_beklemeler.max()),
-                                "vaka_sayisi": len(gecerli_beklemeler),
-                            }
-
-            analiz_sonucu = {
-                "grup_adi": grup_adi,
-                "toplam_vaka": len(df_filtreli),
-                "toplam_klinik": len(klinik_sayimlari),
-                "klinik_sayimlari": klinik_sayimlari.to_dict(),
-                "klinik_yuzdeleri": klinik_yuzdeleri.to_dict(),
-                "vaka_durum_analizi": vaka_durum_analizi,
-                "bekleme_analizi": bekleme_analizi,
-                "filtrelenmis_veri": df_filtreli,
-            }
 
-            return analiz_sonucu
+                # Klinik bazında bekleme süreleri (boş ve negatif değerler hariç)
+                bekleme_analizi = {}
+                if tarih_var:
+                    saatler = bekleme_saat[filtre_maske]
+                    gecerli = ~np.isnan(saatler) & (saatler >= 0)
+                    klinik_kodlari = pd.Categorical(
+                        klinik_dizi[filtre_maske], categories=list(klinik_sayimlari.index)
+                    ).codes
+                    klinik_beklemeleri = gruplu_diziler(klinik_kodlari, saatler, gecerli)
+                    for sira, klinik_adi in enumerate(klinik_sayimlari.index):
+                        if sira not in klinik_beklemeleri:
+                            continue
+                        gecerli_beklemeler = pd.Series(klinik_beklemeleri[sira])
+                        bekleme_analizi[klinik_adi] = {
+                            "ortalama": float(gecerli_beklemeler.mean()),
+                            "medyan": float(gecerli_beklemeler.median()),
+                            "min": float(gecerli_beklemeler.min()),
+                            "max": float(gecerli_beklemeler.max()),
+                            "vaka_sayisi": len(gecerli_beklemeler),
+                        }
+
+                sonuc.append(
+                    {
+                        "grup_adi": grup_adi,
+                        "toplam_vaka": int(klinik_sayimlari.sum()),
+                        "toplam_klinik": len(klinik_sayimlari),
+                        "klinik_sayimlari": klinik_sayimlari.to_dict(),
+                        "klinik_yuzdeleri": klinik_yuzdeleri.to_dict(),
+                        "vaka_durum_analizi": vaka_durum_analizi,
+                        "bekleme_analizi": bekleme_analizi,
+                        "filtrelenmis_veri": df_filtreli,
+                    }
+                )
+
+            return sonuc
 
         except Exception as e:
             logger.error(f"Klinik dağılım analizi hatası: {e}")
-            return {"hata": str(e)}
+            return [{"hata": str(e)} for _ in range(grup_sayisi)]
 
     def klinik_grafikleri_olustur(
-        self, df: pd.DataFrame, gun_tarihi: str, grup_adi: str = "Genel"
+        self,
+        df: pd.DataFrame,
+        gun_tarihi: str,
+        grup_adi: str = "Genel",
+        analiz: Optional[Dict[str, Any]] = None,
     ) -> Optional[List[str]]:
         """
         Klinik analizi için grafikler oluşturur
+
+        Daha önce hesaplanmış klinik_dagilim_analizi sonucu verilirse
+        analiz yeniden yapılmaz.
         """
         try:
             # Klinik analizini yap
-            analiz = self.klinik_dagilim_analizi(df, grup_adi)
+            if analiz is None:
+                analiz = self.klinik_dagilim_analizi(df, grup_adi)
 
             if "hata" in analiz:
                 logger.warning(f"Klinik analizi başarısız: {analiz['hata']}")
@@ -223,11 +292,8 @@ class KlinikAnalizcisi:
     ):
         """Klinik dağılım pasta grafiği"""
         try:
-            import matplotlib
-
-            matplotlib.use("Agg")
-
-            plt.figure(figsize=VARSAYILAN_GRAFIK_BOYUTU)
+            fig = figur_olustur(figsize=VARSAYILAN_GRAFIK_BOYUTU)
+            ax = fig.add_subplot()
 
             klinik_sayimlari = analiz["klinik_sayimlari"]
             klinik_yuzdeleri = analiz["klinik_yuzdeleri"]
@@ -267,7 +333,7 @@ class KlinikAnalizcisi:
             # Gelişmiş renk paleti kullan
             colors = PASTA_GRAFIK_RENK_PALETI[: len(klinik_sayimlari)]
 
-            plt.pie(
+            ax.pie(
                 list(klinik_sayimlari.values()),
                 labels=labels,
                 autopct=autopct_format,
@@ -282,25 +348,22 @@ class KlinikAnalizcisi:
             for kod, turkce in GRUP_ADI_CEVIRI.items():
                 baslik = baslik.replace(kod, turkce)
 
-            plt.title(baslik, fontsize=14, fontweight="bold")
-            plt.axis("equal")
+            ax.set_title(baslik, fontsize=14, fontweight="bold")
+            ax.axis("equal")
 
             # Tarih ekleme (config'e göre)
             if GRAFIK_GORUNUM_AYARLARI.get("tarih_goster", True):
-                self.grafik_olusturucu._grafige_tarih_ekle(plt, gun_tarihi)
+                self.grafik_olusturucu._grafige_tarih_ekle(fig, gun_tarihi)
 
             # Tarih klasörü oluştur ve dosyaya kaydet
             tarih_klasor = self.grafik_olusturucu._tarih_klasoru_olustur(gun_tarihi)
             dosya_adi = tarih_klasor / f"klinik-dagilim_{grup_adi}_{gun_tarihi}.png"
-            plt.savefig(dosya_adi, dpi=VARSAYILAN_DPI, bbox_inches="tight")
-            plt.close()
+            figur_kaydet(fig, dosya_adi, dpi=VARSAYILAN_DPI)
 
             return str(dosya_adi)
 
         except Exception as e:
             logger.error(f"Klinik pasta grafiği hatası: {e}")
-            if "plt" in locals():
-                plt.close()
             return None
 
     def _klinik_vaka_durum_grafigi(
@@ -308,10 +371,6 @@ class KlinikAnalizcisi:
     ):
         """Her klinik için vaka durumu grafiği"""
         try:
-            import matplotlib
-
-            matplotlib.use("Agg")
-
             # Analiz verisinden DataFrame'i al
             df = analiz["filtrelenmis_veri"]
 
@@ -336,7 +395,7 @@ class KlinikAnalizcisi:
             # Her klinik için durum sayılarını hesapla
             for klinik_adi in df[KLINIK_SUTUN_ADI].unique():
                 klinik_df = df[df[KLINIK_SUTUN_ADI] == klinik_adi]
-                durum_sayilari = klinik_df["durum"].value_counts().to_dict()
+                durum_sayilari = deger_sayimi(klinik_df["durum"]).to_dict()
                 klinik_durum_analizi[klinik_adi] = durum_sayilari
 
             if not klinik_durum_analizi:
@@ -359,7 +418,8 @@ class KlinikAnalizcisi:
                 veri_matrisi.append(satir)
 
             # Grafik
-            fig, ax = plt.subplots(figsize=(14, 8))
+            fig = figur_olustur(figsize=(14, 8))
+            ax = fig.subplots()
 
             x = range(len(klinikler))
             width = 0.25
@@ -410,22 +470,19 @@ class KlinikAnalizcisi:
 
             # Tarih ekleme (config'e göre)
             if GRAFIK_GORUNUM_AYARLARI.get("tarih_goster", True):
-                self.grafik_olusturucu._grafige_tarih_ekle(plt, gun_tarihi)
+                self.grafik_olusturucu._grafige_tarih_ekle(fig, gun_tarihi)
 
             # Tarih klasörü oluştur ve dosyaya kaydet
             tarih_klasor = self.grafik_olusturucu._tarih_klasoru_olustur(gun_tarihi)
             dosya_adi = tarih_klasor / f"klinik_vaka_durum_{grup_adi}_{gun_tarihi}.png"
-            plt.tight_layout()
-            plt.savefig(dosya_adi, dpi=VARSAYILAN_DPI, bbox_inches="tight")
-            plt.close()
+            fig.tight_layout()
+            figur_kaydet(fig, dosya_adi, dpi=VARSAYILAN_DPI)
 
             logger.info(f"Klinik vaka durum grafiği oluşturuldu: {grup_adi}")
             return str(dosya_adi)
 
         except Exception as e:
             logger.error(f"Klinik vaka durum grafiği hatası: {e}")
-            if "plt" in locals():
-                plt.close()
             return None
 
     def _klinik_bekleme_grafigi(
@@ -433,10 +490,6 @@ class KlinikAnalizcisi:
     ):
         """Klinik başına bekleme süreleri grafiği"""
         try:
-            import matplotlib
-
-            matplotlib.use("Agg")
-
             bekleme_analizi = analiz["bekleme_analizi"]
 
             if not bekleme_analizi:
@@ -445,18 +498,19 @@ class KlinikAnalizcisi:
             klinikler = list(bekleme_analizi.keys())
             ortalama_list = [bekleme_analizi[k]["ortalama"] for k in klinikler]
 
-            plt.figure(figsize=(12, 6))
-            bars = plt.bar(range(len(klinikler)), ortalama_list)
+            fig = figur_olustur(figsize=(12, 6))
+            ax = fig.add_subplot()
+            bars = ax.bar(range(len(klinikler)), ortalama_list)
 
-            plt.xlabel("Klinikler")
-            plt.ylabel("Ortalama Bekleme Süresi (Saat)")
+            ax.set_xlabel("Klinikler")
+            ax.set_ylabel("Ortalama Bekleme Süresi (Saat)")
             title = f"{grup_adi} - Klinik Başına Ortalama Bekleme Süreleri"
-            plt.title(title)
-            plt.xticks(range(len(klinikler)), klinikler, rotation=45, ha="right")
+            ax.set_title(title)
+            ax.set_xticks(range(len(klinikler)), klinikler, rotation=45, ha="right")
 
             # Bar üzerine değerleri yaz
             for bar, deger in zip(bars, ortalama_list):
-                plt.text(
+                ax.text(
                     bar.get_x() + bar.get_width() / 2,
                     bar.get_height() + max(ortalama_list) * 0.01,
                     f"{deger:.1f}h",
@@ -465,22 +519,19 @@ class KlinikAnalizcisi:
                     fontweight="bold",
                 )
 
-            plt.tight_layout()
+            fig.tight_layout()
 
             # Tarih ekleme (config'e göre)
             if GRAFIK_GORUNUM_AYARLARI.get("tarih_goster", True):
-                self.grafik_olusturucu._grafige_tarih_ekle(plt, gun_tarihi)
+                self.grafik_olusturucu._grafige_tarih_ekle(fig, gun_tarihi)
 
             # Tarih klasörü oluştur ve dosyaya kaydet
             tarih_klasor = self.grafik_olusturucu._tarih_klasoru_olustur(gun_tarihi)
             dosya_adi = tarih_klasor / f"klinik-bekleme_{grup_adi}_{gun_tarihi}.png"
-            plt.savefig(dosya_adi, dpi=VARSAYILAN_DPI, bbox_inches="tight")
-            plt.close()
+            figur_kaydet(fig, dosya_adi, dpi=VARSAYILAN_DPI)
 
             return str(dosya_adi)
 
         except Exception as e:
             logger.error(f"Klinik bekleme grafiği hatası: {e}")
-            if "plt" in locals():
-                plt.close()
             return None
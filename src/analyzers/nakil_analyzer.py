@@ -3,7 +3,8 @@ Ana nakil analizcisi - Modüler koordinatör sınıf
 """
 
 import logging
-import json
+import os
+import time
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
@@ -13,7 +14,27 @@ from ..processors.veri_isleme import VeriIsleme
 from .analiz_motoru import AnalizMotoru
 from ..generators.grafik_olusturucu import GrafikOlusturucu
 from .klinik_analizcisi import KlinikAnalizcisi
+from .grup_analiz_motoru import GrupAnalizMotoru
 from ..generators.pdf_olusturucu import PDFOlusturucu
+from ..generators.grafik_zamanlayici import GrafikZamanlayici
+from ..core.calistirma_kaydi import (
+    DURUM_ANALIZ,
+    DURUM_HATA,
+    calistirma_kaydi,
+    kayda_yaz,
+    kimlik_olustur,
+)
+from ..core.cikti_deposu import CiktiDeposu
+from ..core.icerik_deposu import baglanti_olustur
+from ..core.config import (
+    CIKTI_DEPOSU_AYARLARI,
+    KUCUK_GORSEL_AYARLARI,
+    PDF_SAYFA_GORSEL_AYARLARI,
+    RAPOR_DIZIN,
+    RAPOR_SATIR_VERISI_DIZIN_ADI,
+)
+from ..core.rapor_tipleri import GunlukRapor, KlinikAnaliziOzeti
+from ..utils.json_yardimci import json_yaz
 
 # Logger yapılandırması
 logger = logging.getLogger(__name__)
@@ -29,6 +50,9 @@ class NakilAnalizcisi:
         self.analiz_motoru = AnalizMotoru()
         self.grafik_olusturucu = GrafikOlusturucu()
         self.klinik_analizcisi = KlinikAnalizcisi(self.grafik_olusturucu)
+        self.grup_analiz_motoru = GrupAnalizMotoru(
+            self.analiz_motoru, self.veri_isleme, self.klinik_analizcisi
+        )
         self.pdf_olusturucu = PDFOlusturucu()
 
     def kapsamli_gunluk_analiz(
@@ -37,41 +61,42 @@ class NakilAnalizcisi:
         """
         Kapsamlı günlük analiz yapar - Modüler yaklaşım
         """
-        try:
-            if gun_tarihi is None:
-                gun_tarihi = datetime.now().strftime("%Y-%m-%d")
+        if gun_tarihi is None:
+            gun_tarihi = datetime.now().strftime("%Y-%m-%d")
+        baslangic = time.perf_counter()
+        kimlik = kimlik_olustur(gun_tarihi, unique_id)
 
+        try:
             logger.info(f"Kapsamlı günlük analiz başlatılıyor: {gun_tarihi}")
 
             # 1. Veri işleme - son işlenen günlük veriyi kullan
-            from ..core.config import ISLENMIŞ_VERI_DIZIN
-            
-            # Tarih bazlı klasörleri bul
-            tarih_format = gun_tarihi.replace('-', '')  # 20251013
-            tarih_klasorleri = [k for k in ISLENMIŞ_VERI_DIZIN.glob(f"günlük_{tarih_format}*") if k.is_dir()]
-            
-            if not tarih_klasorleri:
+            # (önce çalıştırma kaydından; kayıtta yoksa processed klasörü taranır)
+            kayit = calistirma_kaydi()
+            gunluk_dosya = kayit.son_parquet(gun_tarihi) if kayit is not None else None
+            if gunluk_dosya is None:
+                gunluk_dosya = self._son_gunluk_parquet(gun_tarihi)
+            if gunluk_dosya is None:
+                tarih_format = gun_tarihi.replace('-', '')  # 20251013
                 logger.error(f"Tarih için klasör bulunamadı: {tarih_format}")
+                kayda_yaz("baslat", kimlik, gun_tarihi, DURUM_HATA, unique_id=unique_id,
+                          hata_mesaji=f"Tarih için klasör bulunamadı: {tarih_format}")
                 return {"durum": "hata", "mesaj": f"Tarih için klasör bulunamadı: {tarih_format}"}
             
-            # En son modifiye edilen klasörü al
-            gunluk_klasor = max(tarih_klasorleri, key=lambda x: x.stat().st_mtime)
-            gunluk_dosya = gunluk_klasor / "veriler.parquet"
-            
             logger.info(f"Son işlenen günlük dosya kullanılıyor: {gunluk_dosya}")
             
             if gunluk_dosya.exists():
                 logger.info(f"Günlük dosya okunuyor: {gunluk_dosya}")
-                df_gunluk = pd.read_parquet(gunluk_dosya)
-                # KRİTİK: Tarih sütunlarını datetime'a çevir
-                logger.info("Tarih sütunları datetime'a dönüştürülüyor...")
-                df_gunluk = self.veri_isleme.ensure_datetime_columns(df_gunluk)
-                logger.info(f"Datetime dönüşümü tamamlandı. Veri boyutu: {len(df_gunluk)}")
+                # Tarihler ingest sırasında parse edilip timestamp olarak yazıldı;
+                # eski (string tarihli) dosyalar okunurken dönüştürülür
+                df_gunluk = self.veri_isleme.parquet_oku(gunluk_dosya)
+                logger.info(f"Günlük veri okundu. Veri boyutu: {len(df_gunluk)}")
                 
                 # Bu dosya zaten günlük filtreli, vaka tipi belirleme yap
                 df_gunluk = self.veri_isleme.vaka_tipi_belirle(df_gunluk, gun_tarihi)
             else:
                 logger.error(f"Günlük dosya bulunamadı: {gunluk_dosya}")
+                kayda_yaz("baslat", kimlik, gun_tarihi, DURUM_HATA, unique_id=unique_id,
+                          hata_mesaji=f"Günlük dosya bulunamadı: {gunluk_dosya}")
                 return {"durum": "hata", "mesaj": f"Günlük dosya bulunamadı: {gunluk_dosya}"}
             
             # Süre hesaplamalarını ekle ve durum_kategori oluştur
@@ -90,7 +115,7 @@ class NakilAnalizcisi:
 
             # 2. Ana rapor objesi
             gecerli_vakalar = df_gunluk[df_gunluk["vaka_tipi"].isin(["Yeni Vaka", "Devreden Vaka"])]
-            rapor = {
+            rapor: GunlukRapor = {
                 "analiz_tarihi": gun_tarihi,
                 "analiz_zamani": datetime.now().isoformat(),
                 "toplam_vaka_sayisi": len(gecerli_vakalar),
@@ -106,6 +131,15 @@ class NakilAnalizcisi:
             rapor_dizin = Path("data/reports") / rapor_klasor_adi
             rapor_dizin.mkdir(parents=True, exist_ok=True)
             rapor["rapor_dizin"] = str(rapor_dizin)
+            kayda_yaz(
+                "baslat",
+                kimlik,
+                gun_tarihi,
+                DURUM_ANALIZ,
+                unique_id=unique_id,
+                parquet_yolu=gunluk_dosya.resolve(),
+                rapor_klasoru=rapor_dizin.resolve(),
+            )
             
             # GrafikOlusturucu'ya rapor dizinini set et (tüm grafikler buraya kaydedilecek)
             self.grafik_olusturucu._rapor_dizin_override = rapor_dizin
@@ -120,219 +154,118 @@ class NakilAnalizcisi:
                 rapor["sure_analizleri"] = sure_istatistikleri
 
             # 4. Her il grubu için analiz
-            for il_grup_adi, il_df in il_gruplari.items():
-                if len(il_df) == 0:
-                    continue
+            # Tüm il grubu × vaka tipi metrikleri tek geçişte hesaplanır;
+            # gruplar DataFrame kopyası yerine maske olarak işlenir
+            grup_analizleri = self.grup_analiz_motoru.grup_analizlerini_hesapla(df_gunluk)
+
+            # Grafikler iş olarak toplanır ve sonunda paralel çizilir;
+            # sonuçlar rapora ekleme sırasıyla yazılır
+            zamanlayici = GrafikZamanlayici(rapor_dizin)
 
+            for il_grup_adi, vaka_analizleri in grup_analizleri.items():
                 rapor["il_gruplari"][il_grup_adi] = {}
 
-                # Vaka tiplerine göre grupla
-                vaka_tipleri = ["Yeni Vaka", "Devreden Vaka", "Butun_Vakalar"]
+                for vaka_tipi, metrikler in vaka_analizleri.items():
+                    rapor["il_gruplari"][il_grup_adi][vaka_tipi] = metrikler
+                    durum_analizi = metrikler["vaka_durumu"]
 
-                for vaka_tipi in vaka_tipleri:
-                    if vaka_tipi == "Butun_Vakalar":
-                        # Bütün Vakalar = Yeni Vaka + Devreden Vaka (Analize Dahil Edilmeyecekler hariç)
-                        vaka_df = il_df[
-                            il_df["vaka_tipi"].isin(["Yeni Vaka", "Devreden Vaka"])
-                        ].copy()
-                    else:
-                        vaka_df = il_df[il_df["vaka_tipi"] == vaka_tipi].copy()
+                    # Grafik (vaka durumu)
+                    if durum_analizi and "durum_sayilari" in durum_analizi:
+                        baslik = self.grafik_olusturucu._grafik_baslik_olustur(
+                            "vaka_durumu", grup_adi=il_grup_adi, vaka_tipi=vaka_tipi
+                        )
+                        # Dict'i pandas Series'e çevir (pd zaten global import edilmiş)
+                        durum_series = pd.Series(durum_analizi["durum_sayilari"])
+                        grafik_path = f"vaka_durumu_{il_grup_adi}_{vaka_tipi}_{gun_tarihi}.png"
+                        zamanlayici.ekle(
+                            "pasta_grafik_olustur", durum_series, baslik, grafik_path, gun_tarihi
+                        )
 
-                    if len(vaka_df) == 0:
-                        continue
+                    # Threshold pasta grafiği (Yer Ayarlandı bekleme süreleri)
+                    yer_analizi = metrikler.get("yer_ayarlandi_bekleme_suresi")
+                    if yer_analizi and "threshold_analizi" in yer_analizi:
+                        baslik = self.grafik_olusturucu._grafik_baslik_olustur(
+                            "bekleme_threshold",
+                            grup_adi=il_grup_adi,
+                            vaka_tipi=vaka_tipi,
+                        )
+                        grafik_path = f"bekleme_threshold_{il_grup_adi}_{vaka_tipi}_{gun_tarihi}.png"
+                        zamanlayici.ekle(
+                            "threshold_pasta_grafik",
+                            yer_analizi["threshold_analizi"],
+                            baslik,
+                            grafik_path,
+                        )
 
-                    rapor["il_gruplari"][il_grup_adi][vaka_tipi] = {}
+                    # Klinik grafikleri (hazır analiz sonucu ile)
+                    klinik_analizi = metrikler.get("klinik_analizi")
+                    if klinik_analizi:
+                        zamanlayici.ekle(
+                            "klinik_grafikleri_olustur",
+                            klinik_analizi["filtrelenmis_veri"],
+                            gun_tarihi,
+                            f"{il_grup_adi}_{vaka_tipi}",
+                            analiz=klinik_analizi,
+                            hedef="klinik",
+                        )
 
-                    # 1. Vaka durumu analizi
-                    durum_analizi = self.analiz_motoru.vaka_durumu_analizi(
-                        vaka_df, il_grup_adi, vaka_tipi
-                    )
-                    rapor["il_gruplari"][il_grup_adi][vaka_tipi][
-                        "vaka_durumu"
-                    ] = durum_analizi
-                    
-                    # 1.1. Süre analizi
-                    sure_analizi = self.veri_isleme.sure_istatistiklerini_hesapla(vaka_df)
-                    rapor["il_gruplari"][il_grup_adi][vaka_tipi][
-                        "sure_analizleri"
-                    ] = sure_analizi
-
-                    # Grafik oluştur (vaka durumu)
-                    try:
-                        if durum_analizi and "durum_sayilari" in durum_analizi:
-                            baslik = self.grafik_olusturucu._grafik_baslik_olustur(
-                                "vaka_durumu", grup_adi=il_grup_adi, vaka_tipi=vaka_tipi
-                            )
-                            # Dict'i pandas Series'e çevir (pd zaten global import edilmiş)
-                            durum_series = pd.Series(durum_analizi["durum_sayilari"])
-                            grafik_path = f"vaka_durumu_{il_grup_adi}_{vaka_tipi}_{gun_tarihi}.png"
-                            grafik_path_str = str(self.grafik_olusturucu.pasta_grafik_olustur(
-                                durum_series,
-                                baslik,
-                                grafik_path,
-                                gun_tarihi
-                            ))
-                            if grafik_path_str:
-                                rapor["oluşturulan_grafikler"].append(grafik_path_str)
-                            else:
-                                logger.warning(f"Grafik oluşturulamadı: {grafik_path} (veri: {len(durum_series)})")
-                    except Exception as grafik_hata:
-                        logger.error(f"Vaka durumu grafiği oluşturma hatası: {grafik_hata}")
-
-                    # 2. İptal vakalar için bekleme süresi
-                    iptal_analizi = self.analiz_motoru.bekleme_suresi_analizi(
-                        vaka_df, il_grup_adi, vaka_tipi, "İptal"
-                    )
-                    if iptal_analizi:
-                        rapor["il_gruplari"][il_grup_adi][vaka_tipi][
-                            "iptal_bekleme_suresi"
-                        ] = iptal_analizi
-
-                    # 3. Yer Ayarlandı için bekleme süresi ve threshold analizi
-                    yer_analizi = self.analiz_motoru.bekleme_suresi_analizi(
-                        vaka_df, il_grup_adi, vaka_tipi, "Yer Ayarlandı"
-                    )
-                    if yer_analizi:
-                        rapor["il_gruplari"][il_grup_adi][vaka_tipi][
-                            "yer_ayarlandi_bekleme_suresi"
-                        ] = yer_analizi
-
-                        # Threshold pasta grafiği
-                        try:
-                            if "threshold_analizi" in yer_analizi:
-                                baslik = self.grafik_olusturucu._grafik_baslik_olustur(
-                                    "bekleme_threshold",
-                                    grup_adi=il_grup_adi,
-                                    vaka_tipi=vaka_tipi,
-                                )
-                                grafik_path = f"bekleme_threshold_{il_grup_adi}_{vaka_tipi}_{gun_tarihi}.png"
-                                grafik_path_str = str(self.grafik_olusturucu.threshold_pasta_grafik(
-                                    yer_analizi["threshold_analizi"],
-                                    baslik,
-                                    grafik_path,
-                                ))
-                                if grafik_path_str:
-                                    rapor["oluşturulan_grafikler"].append(grafik_path_str)
-                                else:
-                                    logger.warning(f"Threshold grafik oluşturulamadı: {grafik_path} (veri: {yer_analizi['threshold_analizi']})")
-                        except Exception as grafik_hata:
-                            logger.error(f"Threshold grafiği oluşturma hatası: {grafik_hata}")
-
-                    # 4. Klinik dağılım analizi
-                    klinik_analizi = self.klinik_analizcisi.klinik_dagilim_analizi(
-                        vaka_df, f"{il_grup_adi}_{vaka_tipi}"
-                    )
-                    if klinik_analizi and "hata" not in klinik_analizi:
-                        rapor["il_gruplari"][il_grup_adi][vaka_tipi][
-                            "klinik_analizi"
-                        ] = klinik_analizi
-
-                        # Klinik grafiklerini oluştur
-                        try:
-                            grafik_dosyalari = (
-                                self.klinik_analizcisi.klinik_grafikleri_olustur(
-                                    vaka_df, gun_tarihi, f"{il_grup_adi}_{vaka_tipi}"
-                                )
-                            )
-                            import os
-                            for grafik_path in grafik_dosyalari or []:
-                                if not os.path.exists(grafik_path):
-                                    logger.warning(f"Klinik grafik oluşturulamadı: {grafik_path}")
-                            if grafik_dosyalari:
-                                rapor["oluşturulan_grafikler"].extend(grafik_dosyalari)
-                        except Exception as grafik_hata:
-                            logger.error(f"Klinik grafikleri oluşturma hatası: {grafik_hata}")
+                        # Satır verisi parquet'e ayrılır, rapora yalnızca özet yazılır
+                        metrikler["klinik_analizi"] = self._klinik_analizi_ozeti(
+                            klinik_analizi, rapor_dizin, f"{il_grup_adi}_{vaka_tipi}"
+                        )
 
             # 5. Yeni pasta grafikleri oluştur (her il grubu için)
             from ..core.config import GRAFIK_AYARLARI
 
             # Vaka tipi pasta grafikleri
-            try:
-                if GRAFIK_AYARLARI.get("vaka_tipi_pasta_grafigi", True):
-                    for il_grup_adi, il_df in il_gruplari.items():
-                        if len(il_df) > 0:
-                            vaka_tipi_dosya = (
-                                self.grafik_olusturucu.vaka_tipi_pasta_grafigi(
-                                    il_df, gun_tarihi, il_grup_adi
-                                )
-                            )
-                            if vaka_tipi_dosya:
-                                grafik_dosya_str = str(vaka_tipi_dosya)
-                                grafik_listesi = rapor["oluşturulan_grafikler"]
-                                grafik_listesi.append(grafik_dosya_str)
-            except Exception as grafik_hata:
-                logger.error(f"Vaka tipi pasta grafikleri oluşturma hatası: {grafik_hata}")
+            if GRAFIK_AYARLARI.get("vaka_tipi_pasta_grafigi", True):
+                for il_grup_adi, il_df in il_gruplari.items():
+                    if len(il_df) > 0:
+                        zamanlayici.ekle(
+                            "vaka_tipi_pasta_grafigi", il_df, gun_tarihi, il_grup_adi
+                        )
 
             # İl dağılımı pasta grafiği (genel)
-            try:
-                if GRAFIK_AYARLARI.get("il_dagilim_pasta_grafigi", True):
-                    il_dagilim_dosya = self.grafik_olusturucu.il_dagilim_pasta_grafigi(
-                        il_gruplari, gun_tarihi
-                    )
-                    if il_dagilim_dosya:
-                        grafik_dosya_str = str(il_dagilim_dosya)
-                        grafik_listesi = rapor["oluşturulan_grafikler"]
-                        grafik_listesi.append(grafik_dosya_str)
-            except Exception as grafik_hata:
-                logger.error(f"İl dağılımı pasta grafiği oluşturma hatası: {grafik_hata}")
+            if GRAFIK_AYARLARI.get("il_dagilim_pasta_grafigi", True):
+                zamanlayici.ekle("il_dagilim_pasta_grafigi", il_gruplari, gun_tarihi)
 
             # İptal eden karşılaştırma grafiği (il içi vs il dışı)
-            try:
-                if GRAFIK_AYARLARI.get("iptal_eden_karsilastirma_grafigi", True):
-                    karsilastirma_dosya = (
-                        self.grafik_olusturucu.iptal_eden_karsilastirma_grafigi(
-                            il_gruplari, gun_tarihi
-                        )
-                    )
-                    if karsilastirma_dosya:
-                        grafik_dosya_str = str(karsilastirma_dosya)
-                        grafik_listesi = rapor["oluşturulan_grafikler"]
-                        grafik_listesi.append(grafik_dosya_str)
-            except Exception as grafik_hata:
-                logger.error(f"İptal eden karşılaştırma grafiği oluşturma hatası: {grafik_hata}")
+            if GRAFIK_AYARLARI.get("iptal_eden_karsilastirma_grafigi", True):
+                zamanlayici.ekle(
+                    "iptal_eden_karsilastirma_grafigi", il_gruplari, gun_tarihi
+                )
 
             # Solunum işlemi pasta grafikleri (her il grubu için)
-            try:
-                if GRAFIK_AYARLARI.get("solunum_islemi_pasta_grafigi", True):
-                    solunum_grafik_dosyasi = (
-                        self.grafik_olusturucu.solunum_islemi_pasta_grafigi(
-                            il_gruplari["Butun_Bolgeler"], gun_tarihi, "Butun_Bolgeler"
-                        )
-                    )
-                    if solunum_grafik_dosyasi:
-                        grafik_listesi = rapor["oluşturulan_grafikler"]
-                        grafik_listesi.append(str(solunum_grafik_dosyasi))
-            except Exception as grafik_hata:
-                logger.error(f"Solunum işlemi pasta grafikleri oluşturma hatası: {grafik_hata}")
+            if GRAFIK_AYARLARI.get("solunum_islemi_pasta_grafigi", True):
+                zamanlayici.ekle(
+                    "solunum_islemi_pasta_grafigi",
+                    il_gruplari["Butun_Bolgeler"],
+                    gun_tarihi,
+                    "Butun_Bolgeler",
+                )
 
             # Süre analizi grafikleri
+            if df_gunluk is not None and len(df_gunluk) > 0:
+                # Yer bulma süresi histogramı
+                zamanlayici.ekle("sure_dagilimi_histogram", df_gunluk, gun_tarihi)
+                # Klinik bazında süre karşılaştırması
+                zamanlayici.ekle("klinik_sure_karsilastirma", df_gunluk, gun_tarihi)
+                # Bekleme durumu analizi
+                zamanlayici.ekle("bekleme_durumu_analizi", df_gunluk, gun_tarihi)
+
+            # Tüm grafikleri çiz
             try:
-                if df_gunluk is not None and len(df_gunluk) > 0:
-                    # Yer bulma süresi histogramı 
-                    histogram_dosya = self.grafik_olusturucu.sure_dagilimi_histogram(
-                        df_gunluk, gun_tarihi
-                    )
-                    if histogram_dosya:
-                        grafik_listesi = rapor["oluşturulan_grafikler"]
-                        grafik_listesi.append(histogram_dosya)
-                    
-                    # Klinik bazında süre karşılaştırması
-                    klinik_sure_dosya = self.grafik_olusturucu.klinik_sure_karsilastirma(
-                        df_gunluk, gun_tarihi
-                    )
-                    if klinik_sure_dosya:
-                        grafik_listesi = rapor["oluşturulan_grafikler"] 
-                        grafik_listesi.append(klinik_sure_dosya)
-                    
-                    # Bekleme durumu analizi
-                    bekleme_dosya = self.grafik_olusturucu.bekleme_durumu_analizi(
-                        df_gunluk, gun_tarihi
-                    )
-                    if bekleme_dosya:
-                        grafik_listesi = rapor["oluşturulan_grafikler"]
-                        grafik_listesi.append(bekleme_dosya)
+                for sonuc in zamanlayici.calistir():
+                    if isinstance(sonuc, list):
+                        for grafik_path in sonuc:
+                            if not os.path.exists(grafik_path):
+                                logger.warning(f"Klinik grafik oluşturulamadı: {grafik_path}")
+                        rapor["oluşturulan_grafikler"].extend(sonuc)
+                    elif sonuc:
+                        rapor["oluşturulan_grafikler"].append(sonuc)
             except Exception as grafik_hata:
-                logger.error(f"Süre analizi grafikleri oluşturma hatası: {grafik_hata}")
+                logger.error(f"Grafik oluşturma hatası: {grafik_hata}")
+            rapor["grafik_onbellegi"] = zamanlayici.onbellek_istatistikleri()
 
             # Nakil bekleyen raporu oluştur (txt)
             if GRAFIK_AYARLARI.get("nakil_bekleyen_raporu", True):
@@ -350,58 +283,11 @@ class NakilAnalizcisi:
             # Rapor klasörünü unique_id ile al (önceden oluşturulmuştu)
             tarih_klasor = Path(rapor["rapor_dizin"])
             rapor_dosya = tarih_klasor / f"kapsamli_gunluk_analiz_{gun_tarihi}.json"
-            with open(rapor_dosya, "w", encoding="utf-8") as f:
-                json.dump(rapor, f, ensure_ascii=False, indent=2, default=str)
+            json_yaz(rapor, rapor_dosya)
 
             # 7. PDF raporu oluşturulmadan ÖNCE: Grafiklerin hepsi unique_id klasöründe dursun
             # Böylece PDF içine tüm PNG'ler dahil edilecek
-            try:
-                import shutil
-                from ..core.config import RAPOR_DIZIN
-
-                # Tarih bazlı klasör (standart günlük klasör)
-                tarih_bazli_klasor = RAPOR_DIZIN / gun_tarihi
-                # PDF'in kaydedileceği klasör
-                unique_id_klasor = tarih_klasor
-                
-                # Durumu göster
-                logger.info(f"Tarih klasörü: {tarih_bazli_klasor}, mevcutmu: {tarih_bazli_klasor.exists()}")
-                logger.info(f"PDF klasörü: {unique_id_klasor}, mevcutmu: {unique_id_klasor.exists()}")
-                
-                if tarih_bazli_klasor.exists():
-                    # Tarih bazlı klasördeki PNG sayısını gör
-                    png_listesi = list(tarih_bazli_klasor.glob("*.png"))
-                    logger.info(f"Tarih klasöründe {len(png_listesi)} PNG dosyası mevcut")
-                    
-                    # Klasör farklıysa kopyala, aynı klasörse atla
-                    if tarih_bazli_klasor != unique_id_klasor and unique_id_klasor.exists():
-                        kopya_sayisi = 0
-                        for grafik_dosya in png_listesi:
-                            hedef = unique_id_klasor / grafik_dosya.name
-                            if not hedef.exists():
-                                shutil.copy2(grafik_dosya, hedef)
-                                kopya_sayisi += 1
-                        
-                        if kopya_sayisi > 0:
-                            logger.info(f"📄 PDF öncesi {kopya_sayisi} grafik unique klasöre kopyalandı: {tarih_bazli_klasor} → {unique_id_klasor}")
-                    else:
-                        if tarih_bazli_klasor == unique_id_klasor:
-                            logger.info("Klasörler aynı, kopya işlemi atlanıyor")
-                        else:
-                            logger.info(f"Hedef klasör mevcut değil, oluşturuluyor: {unique_id_klasor}")
-                            unique_id_klasor.mkdir(parents=True, exist_ok=True)
-                            # Grafikleri kopyala
-                            kopya_sayisi = 0
-                            for grafik_dosya in png_listesi:
-                                hedef = unique_id_klasor / grafik_dosya.name
-                                shutil.copy2(grafik_dosya, hedef)
-                                kopya_sayisi += 1
-                            
-                            logger.info(f"📄 PDF öncesi {kopya_sayisi} grafik yeni klasöre kopyalandı: {tarih_bazli_klasor} → {unique_id_klasor}")
-                else:
-                    logger.warning(f"Tarih klasörü mevcut değil, grafik kopyalanamıyor: {tarih_bazli_klasor}")
-            except Exception as pre_copy_err:
-                logger.warning(f"PDF öncesi grafik kopyalama hatası (kritik değil): {pre_copy_err}")
+            self._grafikleri_rapor_klasorune_al(tarih_klasor, gun_tarihi)
 
             # 8. PDF raporu oluştur - unique_id parametresini ekle
             try:
@@ -415,48 +301,147 @@ class NakilAnalizcisi:
             # Grafik oluşturucu override'ını temizle
             self.grafik_olusturucu._rapor_dizin_override = None
 
-            # ÖNEMLİ: Grafikleri unique_id klasörüne kopyala (Rapor Arşivi için) - PDF sonrası yine güvence
-            try:
-                import shutil
-                
-                # Tarih bazlı klasör (grafiklerin olduğu yer)
-                from ..core.config import RAPOR_DIZIN
-                tarih_bazli_klasor = RAPOR_DIZIN / gun_tarihi
-                
-                # unique_id'li klasör (PDF'in olduğu yer)
-                unique_id_klasor = tarih_klasor  # Bu zaten Path objesi
-                
-                if tarih_bazli_klasor.exists() and unique_id_klasor.exists():
-                    grafik_sayisi = 0
-                    for grafik_dosya in tarih_bazli_klasor.glob("*.png"):
-                        hedef = unique_id_klasor / grafik_dosya.name
-                        if not hedef.exists():
-                            shutil.copy2(grafik_dosya, hedef)
-                            grafik_sayisi += 1
-                    
-                    if grafik_sayisi > 0:
-                        logger.info(f"✅ {grafik_sayisi} grafik kopyalandı: {tarih_bazli_klasor} → {unique_id_klasor}")
-                    else:
-                        logger.warning(f"⚠️ Kopyalanacak grafik bulunamadı: {tarih_bazli_klasor}")
-                else:
-                    logger.warning(f"⚠️ Klasörlerden biri mevcut değil. Tarih: {tarih_bazli_klasor.exists()}, Unique: {unique_id_klasor.exists()}")
-            except Exception as copy_error:
-                logger.warning(f"Grafik kopyalama hatası (kritik değil): {copy_error}")
+            # PDF de çıktı deposuna alınır; klasörde bağlantılar ve manifest kalır
+            if CIKTI_DEPOSU_AYARLARI.get("aktif", True):
+                CiktiDeposu().klasoru_kaydet(tarih_klasor)
+
+            if rapor.get("pdf_raporu") and PDF_SAYFA_GORSEL_AYARLARI.get("rapor_olusturulurken"):
+                self._pdf_sayfalarini_hazirla(Path(rapor["pdf_raporu"]))
 
             logger.info(f"Kapsamlı analiz tamamlandı: {rapor_dosya}")
             
             # Başarı durumunu ekle
             rapor["durum"] = "basarili"
             rapor["mesaj"] = "Analiz başarıyla tamamlandı"
+            kayda_yaz(
+                "tamamla",
+                kimlik,
+                pdf_yolu=Path(rapor["pdf_raporu"]).resolve() if rapor.get("pdf_raporu") else None,
+                vaka_sayisi=rapor["toplam_vaka_sayisi"],
+                grafik_sayisi=len(rapor["oluşturulan_grafikler"]),
+                analiz_sn=round(time.perf_counter() - baslangic, 3),
+            )
             
             return rapor
 
         except Exception as e:
             logger.error(f"Kapsamlı günlük analiz hatası: {e}")
+            kayda_yaz("hata", kimlik, f"Kapsamlı günlük analiz hatası: {e}")
             # Hata durumunda da override'ı temizle
             self.grafik_olusturucu._rapor_dizin_override = None
             raise
 
+    @staticmethod
+    def _son_gunluk_parquet(gun_tarihi: str) -> Optional[Path]:
+        """Tarihin en son değiştirilen günlük_ klasöründeki parquet (kayıtta yoksa)"""
+        from ..core.config import ISLENMIŞ_VERI_DIZIN
+
+        tarih_format = gun_tarihi.replace('-', '')  # 20251013
+        tarih_klasorleri = [k for k in ISLENMIŞ_VERI_DIZIN.glob(f"günlük_{tarih_format}*") if k.is_dir()]
+        if not tarih_klasorleri:
+            return None
+        # En son modifiye edilen klasörü al
+        gunluk_klasor = max(tarih_klasorleri, key=lambda x: x.stat().st_mtime)
+        return gunluk_klasor / "veriler.parquet"
+
+    def _grafikleri_rapor_klasorune_al(self, rapor_klasoru: Path, gun_tarihi: str) -> None:
+        """
+        Tarih klasöründeki grafikleri unique_id'li rapor klasörüne alır
+
+        Çıktı deposu açıksa grafikler kopyalanmaz: depodaki tek kopyaya
+        bağlanır ve rapor klasörünün manifesti yazılır. Kapalıysa eksik
+        grafikler kopyalanır.
+        """
+        try:
+            tarih_bazli_klasor = RAPOR_DIZIN / gun_tarihi
+            rapor_klasoru.mkdir(parents=True, exist_ok=True)
+            ayni_klasor = (
+                tarih_bazli_klasor.exists()
+                and tarih_bazli_klasor.resolve() == rapor_klasoru.resolve()
+            )
+
+            if tarih_bazli_klasor.exists() and not ayni_klasor:
+                self._kucuk_gorselleri_bagla(tarih_bazli_klasor, rapor_klasoru)
+
+            if CIKTI_DEPOSU_AYARLARI.get("aktif", True):
+                depo = CiktiDeposu()
+                if tarih_bazli_klasor.exists() and not ayni_klasor:
+                    baglanan = depo.klasore_bagla(tarih_bazli_klasor, rapor_klasoru, ["*.png"])
+                    if baglanan > 0:
+                        logger.info(f"📄 PDF öncesi {baglanan} grafik rapor klasörüne bağlandı: {tarih_bazli_klasor} → {rapor_klasoru}")
+                depo.klasoru_kaydet(rapor_klasoru)
+                return
+
+            if not tarih_bazli_klasor.exists() or ayni_klasor:
+                return
+
+            import shutil
+
+            kopya_sayisi = 0
+            for grafik_dosya in tarih_bazli_klasor.glob("*.png"):
+                hedef = rapor_klasoru / grafik_dosya.name
+                if not hedef.exists():
+                    shutil.copy2(grafik_dosya, hedef)
+                    kopya_sayisi += 1
+            if kopya_sayisi > 0:
+                logger.info(f"📄 PDF öncesi {kopya_sayisi} grafik rapor klasörüne kopyalandı: {tarih_bazli_klasor} → {rapor_klasoru}")
+
+        except Exception as e:
+            logger.warning(f"PDF öncesi grafik aktarma hatası (kritik değil): {e}")
+
+    @staticmethod
+    def _pdf_sayfalarini_hazirla(pdf_yolu: Path) -> None:
+        """PDF görüntüleyicinin sayfa görsellerini önceden oluşturur (kritik değil)"""
+        try:
+            from ..generators.pdf_sayfa_onbellegi import PdfSayfaOnbellegi
+
+            sayfa_sayisi = PdfSayfaOnbellegi(pdf_yolu).tumunu_olustur()
+            logger.info(f"PDF sayfa görselleri hazırlandı: {sayfa_sayisi} sayfa")
+        except Exception as e:
+            logger.warning(f"PDF sayfa görselleri hazırlanamadı: {e}")
+
+    @staticmethod
+    def _kucuk_gorselleri_bagla(kaynak: Path, hedef: Path) -> None:
+        """Grafiklerin küçük önizlemelerini rapor klasörünün önizleme klasörüne bağlar"""
+        dizin_adi = KUCUK_GORSEL_AYARLARI.get("dizin_adi", "kucuk")
+        kaynak_dizin = kaynak / dizin_adi
+        if not kaynak_dizin.is_dir():
+            return
+
+        hedef_dizin = hedef / dizin_adi
+        hedef_dizin.mkdir(exist_ok=True)
+        for onizleme in kaynak_dizin.iterdir():
+            hedef_onizleme = hedef_dizin / onizleme.name
+            if onizleme.is_file() and not hedef_onizleme.exists():
+                baglanti_olustur(onizleme, hedef_onizleme)
+
+    def _klinik_analizi_ozeti(
+        self, klinik_analizi: Dict[str, Any], rapor_dizin: Path, grup_adi: str
+    ) -> KlinikAnaliziOzeti:
+        """
+        Klinik analizindeki filtrelenmiş veriyi rapor klasörüne parquet olarak
+        yazar ve DataFrame içermeyen özeti döndürür (dosya yolu rapor
+        klasörüne göre göreli)
+        """
+        ozet = {
+            anahtar: deger
+            for anahtar, deger in klinik_analizi.items()
+            if anahtar != "filtrelenmis_veri"
+        }
+        df_filtreli = klinik_analizi.get("filtrelenmis_veri")
+        if df_filtreli is None:
+            return ozet
+
+        ozet["filtrelenmis_satir_sayisi"] = len(df_filtreli)
+        try:
+            veri_dosyasi = Path(RAPOR_SATIR_VERISI_DIZIN_ADI) / f"klinik_{grup_adi}.parquet"
+            self.veri_isleme.parquet_yaz(df_filtreli, rapor_dizin / veri_dosyasi)
+            ozet["filtrelenmis_veri_dosyasi"] = veri_dosyasi.as_posix()
+        except Exception as e:
+            logger.error(f"Klinik satır verisi yazma hatası ({grup_adi}): {e}")
+
+        return ozet
+
     def _nakil_bekleyen_raporu_olustur(self, il_gruplari: dict, gun_tarihi: str, rapor_dizin: Path):
         """
         Nakil bekleyen talep raporu oluşturur (txt formatında)
@@ -0,0 +1,288 @@
+"""
+Analiz sunucusu - Modülleri ve fontları önceden yüklenmiş kalıcı analiz süreci
+
+`python main.py --sunucu` ile başlatılan süreç pandas, matplotlib, seaborn,
+reportlab ve analiz modüllerini bir kez yükler, DejaVu fontlarını kaydeder
+ve yerel bir soketten (Windows'ta adlandırılmış borudan) gelen CLI
+komutlarını kendi içinde çalıştırır. CLI ve arayüz önce sunucuya bağlanmayı
+dener; çalışan sunucu yoksa komut eskisi gibi yerelde çalışır. Komutlar
+sunucuda sırayla çalışır, çıktıları (stdout, stderr ve log) istemciye
+döndürülür.
+"""
+
+import contextlib
+import io
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .config import ANALIZ_SUNUCUSU_AYARLARI
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+# Sunucuya iletilen CLI komutları (ağır modül yükleyenler)
+SUNUCU_KOMUTLARI = ("--analiz", "--gunluk-islem")
+
+
+def _adres() -> Tuple[str, str]:
+    """Sunucu adresi ve adres ailesi"""
+    if sys.platform == "win32":
+        return ANALIZ_SUNUCUSU_AYARLARI["windows_boru"], "AF_PIPE"
+    return str(ANALIZ_SUNUCUSU_AYARLARI["soket"]), "AF_UNIX"
+
+
+def _anahtar_oku() -> Optional[bytes]:
+    try:
+        return Path(ANALIZ_SUNUCUSU_AYARLARI["anahtar_dosyasi"]).read_bytes() or None
+    except OSError:
+        return None
+
+
+def _komut_adi(arguman: str) -> str:
+    return arguman.split("=", 1)[0]
+
+
+def sunucuda_calisir(argumanlar: Sequence[str]) -> bool:
+    """CLI argümanları sunucuya iletilebilecek bir komut mu"""
+    return any(_komut_adi(a) in SUNUCU_KOMUTLARI for a in argumanlar)
+
+
+def _yollari_mutlaklastir(argumanlar: Sequence[str]) -> List[str]:
+    """Dosya yolu argümanlarını istemcinin dizinine göre mutlak yola çevirir"""
+    sonuc = list(argumanlar)
+    for i, arguman in enumerate(sonuc):
+        if arguman == "--gunluk-islem" and i + 1 < len(sonuc):
+            sonuc[i + 1] = os.path.abspath(sonuc[i + 1])
+        elif arguman.startswith("--gunluk-islem="):
+            sonuc[i] = "--gunluk-islem=" + os.path.abspath(arguman.split("=", 1)[1])
+    return sonuc
+
+
+def _baglan():
+    """Çalışan sunucuya bağlantı (sunucu yoksa None)"""
+    anahtar = _anahtar_oku()
+    if anahtar is None:
+        return None
+
+    adres, aile = _adres()
+    try:
+        return Client(adres, family=aile, authkey=anahtar)
+    except (OSError, EOFError, AuthenticationError):
+        # Soket yok ya da eski (sunucu kapanmış)
+        return None
+
+
+def sunucu_calisiyor() -> bool:
+    """Bağlantı kabul eden bir analiz sunucusu var mı"""
+    baglanti = _baglan()
+    if baglanti is None:
+        return False
+    with baglanti:
+        try:
+            baglanti.send({"ping": True})
+            return baglanti.recv().get("returncode") == 0
+        except (EOFError, OSError):
+            return False
+
+
+def sunucuya_gonder(
+    argumanlar: Sequence[str], zaman_asimi: Optional[float] = None
+) -> Optional[Dict]:
+    """
+    Komutu çalışan analiz sunucusuna iletir
+
+    Args:
+        argumanlar: main.py argümanları (ör. ["--analiz", "2025-10-05"])
+        zaman_asimi: Sonucun beklenmesi için üst sınır (saniye)
+
+    Returns:
+        {"returncode", "stdout", "stderr"} ya da sunucu yoksa/komutu
+        kabul etmezse None (komut yerelde çalıştırılmalı)
+
+    Raises:
+        TimeoutError: Sonuç zaman_asimi içinde gelmezse (komut sunucuda
+            çalışmaya devam eder)
+    """
+    if not ANALIZ_SUNUCUSU_AYARLARI.get("aktif", True) or not sunucuda_calisir(argumanlar):
+        return None
+
+    baglanti = _baglan()
+    if baglanti is None:
+        return None
+
+    with baglanti:
+        baglanti.send({"argumanlar": _yollari_mutlaklastir(argumanlar), "dizin": os.getcwd()})
+        if zaman_asimi is not None and not baglanti.poll(zaman_asimi):
+            raise TimeoutError(f"Analiz sunucusu {zaman_asimi} saniye içinde yanıt vermedi")
+        try:
+            yanit = baglanti.recv()
+        except (EOFError, OSError):
+            return {
+                "returncode": 1,
+                "stdout": "",
+                "stderr": "Analiz sunucusu bağlantısı komut çalışırken koptu",
+            }
+
+    if yanit.get("reddedildi"):
+        logger.info(f"Analiz sunucusu komutu yerelde çalıştırmayı önerdi: {yanit['reddedildi']}")
+        return None
+    return yanit
+
+
+def cli_sunucuda_calistir(argumanlar: Sequence[str]) -> Optional[int]:
+    """
+    CLI komutunu sunucuda çalıştırıp çıktısını yazar
+
+    Returns:
+        Çıkış kodu ya da sunucu yoksa None
+    """
+    yanit = sunucuya_gonder(argumanlar)
+    if yanit is None:
+        return None
+    sys.stdout.write(yanit["stdout"])
+    sys.stderr.write(yanit["stderr"])
+    return yanit["returncode"]
+
+
+def on_yukle() -> None:
+    """Analizin kullandığı modülleri, matplotlib font önbelleğini ve PDF fontlarını yükler"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import pandas  # noqa: F401
+    import seaborn  # noqa: F401
+    from matplotlib import font_manager
+
+    from ..analyzers.nakil_analyzer import NakilAnalizcisi  # noqa: F401
+    from ..generators.grafik_olusturucu import GrafikOlusturucu  # noqa: F401
+    from ..generators.kapak_sayfasi_olusturucu import KapakSayfasiOlusturucu
+    from ..generators.pdf_olusturucu import PDFOlusturucu
+    from ..processors.veri_isleme import VeriIsleme  # noqa: F401
+
+    # Font listesi ve varsayılan fontun araması önbelleğe alınır
+    font_manager.findfont(font_manager.FontProperties())
+
+    # Kurucular DejaVu fontlarını reportlab'e kaydeder
+    PDFOlusturucu()
+    KapakSayfasiOlusturucu()
+
+
+class AnalizSunucusu:
+    """Yerel soketten gelen CLI komutlarını sırayla çalıştıran kalıcı süreç"""
+
+    def __init__(self, calistir: Callable[[List[str]], None]):
+        """
+        Analiz sunucusu başlatma
+
+        Args:
+            calistir: Argüman listesini işleyen CLI giriş fonksiyonu (main)
+        """
+        self.calistir = calistir
+        self.adres, self.aile = _adres()
+        self.anahtar_dosyasi = Path(ANALIZ_SUNUCUSU_AYARLARI["anahtar_dosyasi"])
+        self._calistirma_kilidi = threading.Lock()
+
+    def baslat(self) -> None:
+        """Modülleri yükler ve bağlantıları kabul etmeye başlar (kapatılana kadar döner)"""
+        if sunucu_calisiyor():
+            raise RuntimeError("Analiz sunucusu zaten çalışıyor")
+
+        baslangic = time.perf_counter()
+        on_yukle()
+        logger.info(f"Analiz sunucusu modülleri yüklendi ({time.perf_counter() - baslangic:.1f} sn)")
+
+        anahtar = os.urandom(32)
+        if self.aile == "AF_UNIX":
+            Path(self.adres).unlink(missing_ok=True)
+        self._anahtari_yaz(anahtar)
+
+        eski_umask = os.umask(0o077)
+        try:
+            dinleyici = Listener(self.adres, family=self.aile, authkey=anahtar)
+        finally:
+            os.umask(eski_umask)
+
+        # kill/systemd ile durdurulunca da soket ve anahtar dosyası silinir
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+        logger.info(f"Analiz sunucusu dinliyor: {self.adres}")
+        try:
+            with dinleyici:
+                while True:
+                    try:
+                        baglanti = dinleyici.accept()
+                    except (AuthenticationError, EOFError, ConnectionError) as e:
+                        logger.warning(f"Analiz sunucusu bağlantısı reddedildi: {e}")
+                        continue
+                    threading.Thread(
+                        target=self._baglantiyi_isle, args=(baglanti,), daemon=True
+                    ).start()
+        finally:
+            self.anahtar_dosyasi.unlink(missing_ok=True)
+            if self.aile == "AF_UNIX":
+                Path(self.adres).unlink(missing_ok=True)
+
+    def _anahtari_yaz(self, anahtar: bytes) -> None:
+        self.anahtar_dosyasi.parent.mkdir(parents=True, exist_ok=True)
+        self.anahtar_dosyasi.unlink(missing_ok=True)
+        fd = os.open(self.anahtar_dosyasi, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(anahtar)
+
+    def _baglantiyi_isle(self, baglanti) -> None:
+        with baglanti:
+            try:
+                istek = baglanti.recv()
+                baglanti.send(self._istegi_calistir(istek))
+            except (EOFError, OSError) as e:
+                logger.warning(f"Analiz sunucusu istemcisi bağlantıyı kapattı: {e}")
+
+    def _istegi_calistir(self, istek: Dict) -> Dict:
+        if istek.get("ping"):
+            return {"returncode": 0, "stdout": "", "stderr": ""}
+        argumanlar = list(istek.get("argumanlar", []))
+        if not sunucuda_calisir(argumanlar):
+            return {"reddedildi": "komut sunucuda çalıştırılmaz"}
+        # main.py göreli veri yolları (data/...) kullandığından dizin aynı olmalı
+        if os.path.realpath(istek.get("dizin", "")) != os.path.realpath(os.getcwd()):
+            return {"reddedildi": f"sunucu farklı dizinde çalışıyor ({os.getcwd()})"}
+
+        # Yönlendirme ve log yakalayıcı süreç genelinde olduğundan komutlar sırayla çalışır
+        with self._calistirma_kilidi:
+            cikti, hata = io.StringIO(), io.StringIO()
+            log_yakalayici = logging.StreamHandler(cikti)
+            kok = logging.getLogger()
+            if kok.handlers:
+                log_yakalayici.setFormatter(kok.handlers[0].formatter)
+            kok.addHandler(log_yakalayici)
+
+            baslangic = time.perf_counter()
+            kod = 0
+            try:
+                with contextlib.redirect_stdout(cikti), contextlib.redirect_stderr(hata):
+                    self.calistir(argumanlar)
+            except SystemExit as e:
+                kod = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                if isinstance(e.code, str):
+                    hata.write(e.code + "\n")
+            except Exception as e:
+                logger.error(f"Analiz sunucusu komut hatası ({argumanlar}): {e}")
+                hata.write(f"❌ Program hatası: {e}\n")
+                kod = 1
+            finally:
+                kok.removeHandler(log_yakalayici)
+
+            logger.info(
+                f"Analiz sunucusu komutu tamamlandı: {' '.join(argumanlar)} "
+                f"(kod {kod}, {time.perf_counter() - baslangic:.1f} sn)"
+            )
+            return {"returncode": kod, "stdout": cikti.getvalue(), "stderr": hata.getvalue()}
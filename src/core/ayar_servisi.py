@@ -0,0 +1,233 @@
+"""
+Ayar servisi - JSON ayar dosyalarını (pdf_config.json, kapak_config.json)
+tek seferde okuyup paylaşan önbellek
+
+Her dosya bir kez okunur, doğrulanır ve süreç içinde paylaşılır; dosyanın
+değişiklik zamanı (mtime) ya da boyutu değişince yeniden okunur. Ayarlardan
+türetilen nesneler (ör. derlenmiş dosya adı desenleri) de dosya başına
+saklanır ve yeniden yüklemede temizlenir.
+"""
+
+import fnmatch
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .config import KAPAK_CONFIG_DOSYA_YOLU, PDF_CONFIG_DOSYA_YOLU
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+# Dosya şemaları: üst düzey anahtar -> beklenen tip (bilinmeyen anahtarlar serbest)
+PDF_CONFIG_SEMASI = {
+    "pdf_olustur": bool,
+    "pdf_dosya_adi": str,
+    "font_ayarlari": dict,
+    "sayfa_ayarlari": dict,
+    "grafik_metin_ayarlari": dict,
+    "grafik_sirasi": list,
+    "giris_sayfasi": dict,
+    "ek_metinler": list,
+}
+
+KAPAK_CONFIG_SEMASI = {
+    "baslik": dict,
+    "alt_baslik": dict,
+    "kurum": dict,
+    "logo": dict,
+    "sayfa_ayarlari": dict,
+    "tarih_goster": bool,
+    "tarih": dict,
+}
+
+
+def sema_dogrula(veri: Any, sema: Dict[str, type]) -> List[str]:
+    """Ayar sözlüğünü şemaya göre denetler; hata mesajlarını döndürür"""
+    if not isinstance(veri, dict):
+        return [f"kök nesne sözlük olmalı, {type(veri).__name__} bulundu"]
+
+    hatalar = []
+    for anahtar, tip in sema.items():
+        if anahtar in veri and not isinstance(veri[anahtar], tip):
+            hatalar.append(
+                f"'{anahtar}' {tip.__name__} olmalı, "
+                f"{type(veri[anahtar]).__name__} bulundu"
+            )
+    return hatalar
+
+
+def pdf_config_dogrula(veri: Any) -> List[str]:
+    """pdf_config.json doğrulaması (şema + grafik_sirasi / ozel_metinler desenleri)"""
+    hatalar = sema_dogrula(veri, PDF_CONFIG_SEMASI)
+    if hatalar:
+        return hatalar
+
+    for sira, grafik in enumerate(veri.get("grafik_sirasi", [])):
+        if not isinstance(grafik, dict) or not isinstance(grafik.get("desen", ""), str):
+            hatalar.append(f"grafik_sirasi[{sira}] 'desen' metni içeren sözlük olmalı")
+
+    ozel_metinler = veri.get("grafik_metin_ayarlari", {}).get("ozel_metinler", {})
+    if not isinstance(ozel_metinler, dict):
+        hatalar.append("grafik_metin_ayarlari.ozel_metinler sözlük olmalı")
+    return hatalar
+
+
+def kapak_config_dogrula(veri: Any) -> List[str]:
+    """kapak_config.json doğrulaması"""
+    return sema_dogrula(veri, KAPAK_CONFIG_SEMASI)
+
+
+def dosya_deseni_derle(desen: str) -> Callable[[str], bool]:
+    """fnmatch deseninden derlenmiş eşleştirici (fnmatch.fnmatch ile aynı sonuç)"""
+    ifade = re.compile(fnmatch.translate(os.path.normcase(desen)))
+    return lambda ad: ifade.match(os.path.normcase(ad)) is not None
+
+
+class AyarDosyasi:
+    """Tek bir JSON ayar dosyasının önbellekli görünümü"""
+
+    def __init__(
+        self,
+        yol: Union[str, Path],
+        varsayilan: Optional[Callable[[], Dict]] = None,
+        dogrulayici: Optional[Callable[[Any], List[str]]] = None,
+    ):
+        """Ayar dosyası başlatma"""
+        self.yol = Path(yol)
+        self._varsayilan = varsayilan or dict
+        self._dogrulayici = dogrulayici
+        self._kilit = threading.Lock()
+        # (imza, veri, türetilenler): tek nesne olarak değiştirilir; kilitsiz
+        # okuyan iş parçacığı eski veriden türetilmiş nesneyi yeni veriyle görmez
+        self._durum: Optional[Tuple[Optional[Tuple[int, int]], Dict, Dict[str, Any]]] = None
+        self.yukleme_sayisi = 0
+
+    def _dosya_imzasi(self) -> Optional[Tuple[int, int]]:
+        try:
+            bilgi = self.yol.stat()
+        except OSError:
+            return None
+        return (bilgi.st_mtime_ns, bilgi.st_size)
+
+    def oku(self) -> Dict:
+        """
+        Ayarları döndürür; dosya değişmişse yeniden okur
+
+        Dönen sözlük paylaşılır, çağıran tarafından değiştirilmemelidir.
+        Dosya yoksa ya da geçersizse son geçerli içerik, o da yoksa
+        varsayılan ayarlar döndürülür.
+        """
+        return self._guncel_durum()[1]
+
+    def _guncel_durum(self) -> Tuple[Optional[Tuple[int, int]], Dict, Dict[str, Any]]:
+        """Güncel (imza, veri, türetilenler) üçlüsü; dosya değiştiyse yeniden okunur"""
+        imza = self._dosya_imzasi()
+        durum = self._durum
+        if durum is not None and durum[0] == imza:
+            return durum
+
+        with self._kilit:
+            durum = self._durum
+            if durum is not None and durum[0] == imza:
+                return durum
+
+            veri = self._yukle(imza)
+            if veri is None:
+                veri = durum[1] if durum is not None else self._varsayilan()
+
+            durum = (imza, veri, {})
+            self._durum = durum
+            return durum
+
+    def _yukle(self, imza: Optional[Tuple[int, int]]) -> Optional[Dict]:
+        """Dosyayı okuyup doğrular; başarısızsa None"""
+        if imza is None:
+            logger.warning(f"Ayar dosyası bulunamadı: {self.yol}")
+            return None
+
+        try:
+            with open(self.yol, "r", encoding="utf-8-sig") as f:
+                veri = json.load(f)
+        except Exception as e:
+            logger.error(f"Ayar dosyası okunamadı ({self.yol}): {e}")
+            return None
+
+        if self._dogrulayici is not None:
+            hatalar = self._dogrulayici(veri)
+            if hatalar:
+                logger.error(f"Ayar dosyası geçersiz ({self.yol}): {'; '.join(hatalar)}")
+                return None
+
+        self.yukleme_sayisi += 1
+        logger.info(f"Ayar dosyası yüklendi: {self.yol}")
+        return veri
+
+    def turet(self, ad: str, fonksiyon: Callable[[Dict], Any]) -> Any:
+        """
+        Ayarlardan türetilen nesneyi (ör. derlenmiş desenler) önbellekten döndürür
+
+        Dosya yeniden yüklendiğinde türetilen nesneler yeniden hesaplanır.
+        """
+        # Türetilenler sözlüğü verisiyle aynı üçlüden alınır
+        _, veri, turetilenler = self._guncel_durum()
+        if ad in turetilenler:
+            return turetilenler[ad]
+
+        deger = fonksiyon(veri)
+        turetilenler[ad] = deger
+        return deger
+
+
+_ayar_dosyalari: Dict[Path, AyarDosyasi] = {}
+_kayit_kilidi = threading.Lock()
+
+
+def ayar_dosyasi(
+    yol: Union[str, Path],
+    varsayilan: Optional[Callable[[], Dict]] = None,
+    dogrulayici: Optional[Callable[[Any], List[str]]] = None,
+) -> AyarDosyasi:
+    """
+    Dosya yolu başına paylaşılan AyarDosyasi örneğini döndürür
+
+    Aynı dosyayı kullanan tüm oluşturucular aynı önbelleği paylaşır;
+    varsayılan ve doğrulayıcı ilk kayıtta belirlenir.
+    """
+    anahtar = Path(yol).resolve()
+    with _kayit_kilidi:
+        if anahtar not in _ayar_dosyalari:
+            _ayar_dosyalari[anahtar] = AyarDosyasi(anahtar, varsayilan, dogrulayici)
+        return _ayar_dosyalari[anahtar]
+
+
+def _pdf_varsayilan_config() -> Dict[str, Any]:
+    """pdf_config.json okunamazsa kullanılan ayarlar"""
+    return {
+        "pdf_olustur": True,
+        "pdf_dosya_adi": "nakil_analiz_raporu_{tarih}.pdf",
+        "font_ayarlari": {
+            "default_font": "Helvetica",
+            "fallback_font": "Helvetica",
+            "encoding": "utf-8",
+        },
+        "sayfa_ayarlari": {"boyut": "A4", "kenar_boslugu": 0.5},
+        "grafik_sirasi": [],
+        "ek_metinler": [],
+    }
+
+
+def pdf_config_dosyasi() -> AyarDosyasi:
+    """Proje kökündeki pdf_config.json (PDF ve grafik oluşturucular paylaşır)"""
+    return ayar_dosyasi(PDF_CONFIG_DOSYA_YOLU, _pdf_varsayilan_config, pdf_config_dogrula)
+
+
+def kapak_config_dosyasi(
+    yol: Union[str, Path, None] = None,
+    varsayilan: Optional[Callable[[], Dict]] = None,
+) -> AyarDosyasi:
+    """Kapak sayfası ayar dosyası (varsayılan: assets/kapak_config.json)"""
+    return ayar_dosyasi(yol or KAPAK_CONFIG_DOSYA_YOLU, varsayilan, kapak_config_dogrula)
@@ -0,0 +1,331 @@
+"""
+Çalıştırma kaydı - İşlenen Excel dosyalarının ve raporların SQLite dizini
+
+Her çalıştırma (unique_id'li yükleme ya da unique_id'siz tarih analizi) tek
+satırdır: ham dosya, günlük parquet, rapor klasörü, PDF, durum, süreler ve
+sayılar. Pipeline her aşamada satırı tek işlemle (transaction) günceller;
+arayüz ve CLI rapor/tarih listelerini klasör taraması yerine indeksli
+sorgularla okur. Dosya yoksa oluşturulur ve mevcut rapor klasörleri bir
+kez içeri aktarılır.
+"""
+
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from .config import (
+    CALISTIRMA_KAYDI_AYARLARI,
+    HAM_VERI_DIZIN,
+    ISLENMIŞ_VERI_DIZIN,
+    RAPOR_DIZIN,
+)
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+SEMA_SURUMU = 1
+
+# Çalıştırma durumları
+DURUM_ISLENIYOR = "isleniyor"  # Excel → parquet
+DURUM_ISLENDI = "islendi"  # Parquet yazıldı, analiz bekleniyor
+DURUM_ANALIZ = "analiz"  # Analiz ve PDF hazırlanıyor
+DURUM_TAMAMLANDI = "tamamlandi"
+DURUM_HATA = "hata"
+
+_SEMA = """
+CREATE TABLE IF NOT EXISTS calistirmalar (
+    kimlik TEXT PRIMARY KEY,        -- rapor klasörü adı: tarih ya da tarih_unique_id
+    unique_id TEXT,
+    tarih TEXT NOT NULL,            -- YYYY-MM-DD
+    ham_dosya TEXT,
+    parquet_yolu TEXT,
+    rapor_klasoru TEXT,
+    pdf_yolu TEXT,
+    durum TEXT NOT NULL,
+    hata_mesaji TEXT,
+    baslangic TEXT NOT NULL,
+    bitis TEXT,
+    isleme_sn REAL,
+    analiz_sn REAL,
+    satir_sayisi INTEGER,
+    vaka_sayisi INTEGER,
+    grafik_sayisi INTEGER,
+    guncelleme TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_calistirmalar_tarih ON calistirmalar (tarih, baslangic);
+CREATE INDEX IF NOT EXISTS ix_calistirmalar_rapor ON calistirmalar (rapor_klasoru);
+"""
+
+# guncelle() ile yazılabilen sütunlar
+GUNCELLENEBILIR_ALANLAR = {
+    "unique_id",
+    "tarih",
+    "ham_dosya",
+    "parquet_yolu",
+    "rapor_klasoru",
+    "pdf_yolu",
+    "durum",
+    "hata_mesaji",
+    "bitis",
+    "isleme_sn",
+    "analiz_sn",
+    "satir_sayisi",
+    "vaka_sayisi",
+    "grafik_sayisi",
+}
+
+
+def kimlik_olustur(gun_tarihi: str, unique_id: Optional[str] = None) -> str:
+    """Çalıştırma kimliği: rapor klasörünün adı (tarih ya da tarih_unique_id)"""
+    return f"{gun_tarihi}_{unique_id}" if unique_id else gun_tarihi
+
+
+def _simdi() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class CalistirmaKaydi:
+    """SQLite tabanlı çalıştırma kaydı"""
+
+    def __init__(self, veritabani: Union[str, Path, None] = None, ayarlar: Optional[Dict] = None):
+        """Çalıştırma kaydı başlatma"""
+        self.ayarlar = ayarlar if ayarlar is not None else CALISTIRMA_KAYDI_AYARLARI
+        self.veritabani = Path(veritabani or self.ayarlar["veritabani"])
+        self.zaman_asimi = self.ayarlar.get("zaman_asimi_sn", 30)
+        self.veritabani.parent.mkdir(parents=True, exist_ok=True)
+        self._sema_hazirla()
+
+    @contextmanager
+    def _baglan(self) -> Iterator[sqlite3.Connection]:
+        """Tek işlemlik bağlantı: blok hatasız biterse commit, yoksa rollback"""
+        baglanti = sqlite3.connect(str(self.veritabani), timeout=self.zaman_asimi)
+        baglanti.row_factory = sqlite3.Row
+        try:
+            with baglanti:
+                yield baglanti
+        finally:
+            baglanti.close()
+
+    def _sema_hazirla(self) -> None:
+        with self._baglan() as baglanti:
+            # WAL: pipeline yazarken arayüz okumaları beklemez
+            baglanti.execute("PRAGMA journal_mode=WAL")
+            surum = baglanti.execute("PRAGMA user_version").fetchone()[0]
+            if surum >= SEMA_SURUMU:
+                return
+            baglanti.executescript(_SEMA)
+            baglanti.execute(f"PRAGMA user_version={SEMA_SURUMU}")
+
+        # Kayıttan önce oluşturulmuş rapor klasörleri bir kez içeri aktarılır
+        aktarilan = self.klasorlerden_aktar()
+        if aktarilan:
+            logger.info(f"Çalıştırma kaydına {aktarilan} mevcut rapor klasörü aktarıldı")
+
+    # --- Yazma ---
+
+    def baslat(
+        self,
+        kimlik: str,
+        tarih: str,
+        durum: str,
+        unique_id: Optional[str] = None,
+        **alanlar: Any,
+    ) -> None:
+        """Çalıştırmayı ekler; varsa durumunu ve verilen alanları günceller"""
+        alanlar = {ad: deger for ad, deger in alanlar.items() if ad in GUNCELLENEBILIR_ALANLAR}
+        simdi = _simdi()
+        with self._baglan() as baglanti:
+            baglanti.execute(
+                """
+                INSERT INTO calistirmalar (kimlik, unique_id, tarih, durum, baslangic, guncelleme)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (kimlik) DO UPDATE SET
+                    durum = excluded.durum,
+                    hata_mesaji = NULL,
+                    bitis = NULL,
+                    guncelleme = excluded.guncelleme
+                """,
+                (kimlik, unique_id, tarih, durum, simdi, simdi),
+            )
+            if alanlar:
+                self._alanlari_yaz(baglanti, kimlik, alanlar)
+
+    def guncelle(self, kimlik: str, **alanlar: Any) -> None:
+        """Çalıştırmanın verilen alanlarını tek işlemle günceller"""
+        alanlar = {ad: deger for ad, deger in alanlar.items() if ad in GUNCELLENEBILIR_ALANLAR}
+        with self._baglan() as baglanti:
+            self._alanlari_yaz(baglanti, kimlik, alanlar)
+
+    def tamamla(self, kimlik: str, **alanlar: Any) -> None:
+        """Çalıştırmayı tamamlandı olarak işaretler"""
+        self.guncelle(kimlik, durum=DURUM_TAMAMLANDI, bitis=_simdi(), **alanlar)
+
+    def hata(self, kimlik: str, mesaj: str) -> None:
+        """Çalıştırmayı hata mesajıyla işaretler"""
+        self.guncelle(kimlik, durum=DURUM_HATA, hata_mesaji=str(mesaj)[:2000], bitis=_simdi())
+
+    @staticmethod
+    def _alanlari_yaz(baglanti: sqlite3.Connection, kimlik: str, alanlar: Dict[str, Any]) -> None:
+        alanlar = {ad: (str(deger) if isinstance(deger, Path) else deger) for ad, deger in alanlar.items()}
+        alanlar["guncelleme"] = _simdi()
+        atamalar = ", ".join(f"{ad} = ?" for ad in alanlar)
+        baglanti.execute(
+            f"UPDATE calistirmalar SET {atamalar} WHERE kimlik = ?",
+            (*alanlar.values(), kimlik),
+        )
+
+    def temizle(self) -> None:
+        """Tüm kayıtları siler (eski veriler temizlendiğinde)"""
+        with self._baglan() as baglanti:
+            baglanti.execute("DELETE FROM calistirmalar")
+
+    # --- Okuma ---
+
+    def getir(self, kimlik: str) -> Optional[Dict[str, Any]]:
+        """Tek çalıştırmanın kaydı"""
+        with self._baglan() as baglanti:
+            satir = baglanti.execute(
+                "SELECT * FROM calistirmalar WHERE kimlik = ?", (kimlik,)
+            ).fetchone()
+        return dict(satir) if satir else None
+
+    def raporlar(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Rapor klasörü olan çalıştırmalar (en yeni önce)"""
+        sorgu = (
+            "SELECT * FROM calistirmalar WHERE rapor_klasoru IS NOT NULL "
+            "ORDER BY tarih DESC, baslangic DESC"
+        )
+        parametreler: tuple = ()
+        if limit is not None:
+            sorgu += " LIMIT ?"
+            parametreler = (limit,)
+        with self._baglan() as baglanti:
+            return [dict(satir) for satir in baglanti.execute(sorgu, parametreler)]
+
+    def tarihler(self) -> List[str]:
+        """Kaydı olan tarihler (en yeni önce)"""
+        with self._baglan() as baglanti:
+            return [
+                satir[0]
+                for satir in baglanti.execute(
+                    "SELECT DISTINCT tarih FROM calistirmalar ORDER BY tarih DESC"
+                )
+            ]
+
+    def son_parquet(self, tarih: str) -> Optional[Path]:
+        """Tarihte en son yazılan günlük parquet (dosya silinmişse bir öncekine bakılır)"""
+        with self._baglan() as baglanti:
+            satirlar = baglanti.execute(
+                "SELECT parquet_yolu FROM calistirmalar "
+                "WHERE tarih = ? AND parquet_yolu IS NOT NULL "
+                "ORDER BY baslangic DESC",
+                (tarih,),
+            ).fetchall()
+        for satir in satirlar:
+            yol = Path(satir[0])
+            if yol.exists():
+                return yol
+        return None
+
+    # --- Eski klasörlerin aktarımı ---
+
+    def klasorlerden_aktar(self) -> int:
+        """
+        Kayıt oluşturulmadan önceki rapor klasörlerini kayda ekler
+
+        Klasör taraması yalnızca kayıt ilk oluşturulduğunda yapılır.
+
+        Returns:
+            Eklenen çalıştırma sayısı
+        """
+        if not RAPOR_DIZIN.exists():
+            return 0
+
+        ham_dosyalar = (
+            sorted(p.name for p in HAM_VERI_DIZIN.iterdir() if p.suffix.lower() in (".xls", ".xlsx"))
+            if HAM_VERI_DIZIN.exists()
+            else []
+        )
+        satirlar = []
+        for klasor in RAPOR_DIZIN.iterdir():
+            if not klasor.is_dir() or not klasor.name.startswith("20"):
+                continue
+            tarih, _, unique_id = klasor.name.partition("_")
+            unique_id = unique_id or None
+
+            ham_dosya = None
+            parquet_yolu = None
+            if unique_id:
+                ham_dosya = next((ad for ad in ham_dosyalar if ad.startswith(unique_id)), None)
+                # Parquet yalnızca aynı gün işlendiyse bu tarihe yazılır
+                # (son_parquet, analizin eski klasör taramasıyla aynı dosyayı bulsun)
+                aday = ISLENMIŞ_VERI_DIZIN / f"günlük_{unique_id}" / "veriler.parquet"
+                if unique_id.startswith(tarih.replace("-", "")) and aday.exists():
+                    parquet_yolu = str(aday)
+            pdf = next(iter(sorted(klasor.glob("*.pdf"))), None)
+            zaman = datetime.fromtimestamp(klasor.stat().st_mtime).isoformat(timespec="seconds")
+            satirlar.append(
+                (
+                    kimlik_olustur(tarih, unique_id),
+                    unique_id,
+                    tarih,
+                    str(HAM_VERI_DIZIN / ham_dosya) if ham_dosya else None,
+                    parquet_yolu,
+                    str(klasor),
+                    str(pdf) if pdf else None,
+                    DURUM_TAMAMLANDI if pdf else DURUM_HATA,
+                    zaman,
+                    zaman,
+                )
+            )
+
+        with self._baglan() as baglanti:
+            baglanti.executemany(
+                """
+                INSERT OR IGNORE INTO calistirmalar (
+                    kimlik, unique_id, tarih, ham_dosya, parquet_yolu, rapor_klasoru,
+                    pdf_yolu, durum, baslangic, guncelleme
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                satirlar,
+            )
+        return len(satirlar)
+
+
+_calistirma_kaydi: Optional[CalistirmaKaydi] = None
+_kayit_kilidi = threading.Lock()
+
+
+def calistirma_kaydi() -> Optional[CalistirmaKaydi]:
+    """Süreç içinde paylaşılan çalıştırma kaydı (kapalıysa ya da açılamazsa None)"""
+    global _calistirma_kaydi
+    if not CALISTIRMA_KAYDI_AYARLARI.get("aktif", True):
+        return None
+    with _kayit_kilidi:
+        if _calistirma_kaydi is None:
+            try:
+                _calistirma_kaydi = CalistirmaKaydi()
+            except Exception as e:
+                logger.warning(f"Çalıştırma kaydı açılamadı: {e}")
+                return None
+        return _calistirma_kaydi
+
+
+def kayda_yaz(islem: str, *args: Any, **kwargs: Any) -> None:
+    """
+    Kayıt yöntemini çağırır; kayıt kapalıysa ya da yazılamazsa yalnızca uyarı verir
+
+    Kayıt hatası pipeline'ı durdurmaz.
+    """
+    kayit = calistirma_kaydi()
+    if kayit is None:
+        return
+    try:
+        getattr(kayit, islem)(*args, **kwargs)
+    except Exception as e:
+        logger.warning(f"Çalıştırma kaydı güncellenemedi ({islem}): {e}")
+
@@ -0,0 +1,259 @@
+"""
+Çıktı deposu - Rapor grafiklerini ve PDF'leri içerik adresli depoda bir kez saklar
+
+Her dosya içerik özetiyle (sha256) depoya bir kez yazılır. Rapor klasörleri
+dosyaların kendisi yerine depodaki nesnelere hardlink (olmazsa symlink, o da
+olmazsa kopya) ve dosya adını içerik özetine eşleyen bir manifest tutar.
+Aynı grafik birden çok klasörde (tarih klasörü, unique_id'li klasör, önceki
+çalıştırmalar) diskte tek kopya olarak durur; arşiv görünümleri ve PDF
+oluşturucu dosyaları manifest üzerinden bulur.
+"""
+
+import fnmatch
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .config import CIKTI_DEPOSU_AYARLARI
+from .icerik_deposu import baglanti_olustur, nesne_yolu, nesneye_al
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+MANIFEST_SURUMU = 1
+
+
+def manifest_oku(klasor: Union[str, Path], ayarlar: Optional[Dict] = None) -> Optional[Dict]:
+    """Rapor klasörünün manifestini döndürür; yoksa ya da okunamıyorsa None"""
+    ayarlar = ayarlar if ayarlar is not None else CIKTI_DEPOSU_AYARLARI
+    manifest_dosyasi = Path(klasor) / ayarlar.get("manifest_adi", "manifest.json")
+    try:
+        with open(manifest_dosyasi, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Manifest okunamadı ({manifest_dosyasi}): {e}")
+        return None
+
+    if manifest.get("surum") != MANIFEST_SURUMU or not isinstance(manifest.get("dosyalar"), dict):
+        return None
+    return manifest
+
+
+class CiktiDeposu:
+    """İçerik adresli rapor çıktısı deposu"""
+
+    def __init__(self, ayarlar: Optional[Dict] = None):
+        """Çıktı deposu başlatma"""
+        self.ayarlar = ayarlar if ayarlar is not None else CIKTI_DEPOSU_AYARLARI
+        self.nesne_dizin = Path(self.ayarlar["dizin"]) / "nesneler"
+        self.desenler = self.ayarlar.get("desenler", ["*.png", "*.pdf"])
+        self.manifest_adi = self.ayarlar.get("manifest_adi", "manifest.json")
+        self.nesne_dizin.mkdir(parents=True, exist_ok=True)
+
+    def _nesne_yolu(self, kayit: Dict) -> Path:
+        return nesne_yolu(self.nesne_dizin, kayit["ozet"], kayit["uzanti"])
+
+    def dosya_ekle(self, dosya: Path) -> Dict:
+        """
+        Dosyayı depoya alır ve yerine depodaki nesnenin bağlantısını koyar
+
+        Dosyanın kendisi depoya hardlink'lenir (veri yeniden yazılmaz); aynı
+        içerik depoda zaten varsa dosya o nesnenin bağlantısıyla değiştirilir.
+
+        Returns:
+            Manifest kaydı (ozet, uzanti, boyut, mtime_ns)
+        """
+        ozet, nesne = nesneye_al(dosya, self.nesne_dizin)
+
+        # Farklı diskte kopyalanmış ya da içerik depoda zaten varsa
+        # klasördeki dosya nesnenin bağlantısıyla değiştirilir
+        if not (dosya.exists() and os.path.samefile(dosya, nesne)):
+            baglanti_olustur(nesne, dosya)
+
+        # Nesne salt okunur yapılmaz (Windows'ta klasör silme ve yeniden
+        # yazma başarısız olur); yazanlar dosyayı yerinde değiştirmek
+        # yerine önce bağlantısını kaldırır
+        bilgi = nesne.stat()
+        return {
+            "ozet": ozet,
+            "uzanti": nesne.suffix,
+            "boyut": bilgi.st_size,
+            "mtime_ns": bilgi.st_mtime_ns,
+        }
+
+    def _eslesir(self, ad: str, desenler: Optional[List[str]] = None) -> bool:
+        if ad == self.manifest_adi:
+            return False
+        return any(fnmatch.fnmatch(ad, desen) for desen in (desenler or self.desenler))
+
+    def _manifest_yaz(self, klasor: Path, dosyalar: Dict[str, Dict]) -> Dict:
+        manifest = {"surum": MANIFEST_SURUMU, "dosyalar": dict(sorted(dosyalar.items()))}
+        hedef = klasor / self.manifest_adi
+        gecici = hedef.with_name(f".{hedef.name}.{os.getpid()}.tmp")
+        with open(gecici, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(gecici, hedef)
+        return manifest
+
+    def klasoru_kaydet(
+        self, klasor: Union[str, Path], desenler: Optional[List[str]] = None
+    ) -> Optional[Dict]:
+        """
+        Rapor klasöründeki çıktıları depoya alır ve manifesti günceller
+
+        Daha önce depoya alınmış ve değişmemiş dosyalar yeniden özetlenmez.
+        Klasörden silinen dosyalar manifestten de çıkarılır.
+
+        Returns:
+            Güncel manifest (hata durumunda None)
+        """
+        klasor = Path(klasor)
+        try:
+            onceki = (manifest_oku(klasor, self.ayarlar) or {}).get("dosyalar", {})
+            dosyalar = {}
+            for dosya in sorted(klasor.iterdir()):
+                if not self._eslesir(dosya.name, desenler) or not dosya.is_file():
+                    continue
+
+                kayit = onceki.get(dosya.name)
+                bilgi = dosya.stat()
+                if (
+                    kayit is not None
+                    and kayit.get("boyut") == bilgi.st_size
+                    and kayit.get("mtime_ns") == bilgi.st_mtime_ns
+                    and self._nesne_yolu(kayit).exists()
+                ):
+                    dosyalar[dosya.name] = kayit
+                    continue
+
+                dosyalar[dosya.name] = self.dosya_ekle(dosya)
+
+            # Bu çağrının desenine girmeyen eski kayıtlar korunur
+            for ad, kayit in onceki.items():
+                if ad not in dosyalar and not self._eslesir(ad, desenler) and (klasor / ad).exists():
+                    dosyalar[ad] = kayit
+
+            manifest = self._manifest_yaz(klasor, dosyalar)
+            logger.info(f"Çıktı deposuna alındı: {klasor} ({len(dosyalar)} dosya)")
+            return manifest
+
+        except Exception as e:
+            logger.warning(f"Klasör çıktı deposuna alınamadı ({klasor}): {e}")
+            return None
+
+    def klasore_bagla(
+        self,
+        kaynak: Union[str, Path],
+        hedef: Union[str, Path],
+        desenler: Optional[List[str]] = None,
+    ) -> int:
+        """
+        Kaynak klasördeki çıktıları kopyalamadan hedef klasöre bağlar
+
+        Hedefte aynı adla bulunan dosyalar korunur.
+
+        Returns:
+            Bağlanan dosya sayısı
+        """
+        kaynak, hedef = Path(kaynak), Path(hedef)
+        try:
+            kaynak_manifest = self.klasoru_kaydet(kaynak, desenler)
+            if kaynak_manifest is None:
+                return 0
+
+            hedef.mkdir(parents=True, exist_ok=True)
+            hedef_dosyalari = (manifest_oku(hedef, self.ayarlar) or {}).get("dosyalar", {})
+            baglanan = 0
+            for ad, kayit in kaynak_manifest["dosyalar"].items():
+                hedef_dosya = hedef / ad
+                if not self._eslesir(ad, desenler) or hedef_dosya.exists():
+                    continue
+                baglanti_olustur(self._nesne_yolu(kayit), hedef_dosya)
+                hedef_dosyalari[ad] = kayit
+                baglanan += 1
+
+            self._manifest_yaz(hedef, hedef_dosyalari)
+            return baglanan
+
+        except Exception as e:
+            logger.warning(f"Çıktılar bağlanamadı ({kaynak} → {hedef}): {e}")
+            return 0
+
+    def dosyalari_coz(self, klasor: Union[str, Path], desen: str = "*.png") -> List[Path]:
+        """
+        Rapor klasöründeki çıktı dosyalarını manifest üzerinden bulur
+
+        Klasördeki bağlantı silinmişse depodaki nesne döndürülür. Manifesti
+        olmayan (eski) klasörlerde doğrudan klasör taranır.
+        """
+        klasor = Path(klasor)
+        manifest = manifest_oku(klasor, self.ayarlar)
+        if manifest is None:
+            return sorted(klasor.glob(desen))
+
+        yollar = []
+        for ad, kayit in manifest["dosyalar"].items():
+            if not fnmatch.fnmatch(ad, desen):
+                continue
+            yol = klasor / ad
+            if not yol.exists():
+                yol = self._nesne_yolu(kayit)
+                if not yol.exists():
+                    logger.warning(f"Manifestteki dosya bulunamadı: {klasor / ad}")
+                    continue
+            yollar.append(yol)
+        return yollar
+
+    def hardlink_destekli(self, klasor: Optional[Union[str, Path]] = None) -> bool:
+        """
+        Depodan klasöre hardlink kurulabiliyor mu (deneme dosyasıyla sınanır)
+
+        Args:
+            klasor: Bağlantıların konacağı klasör (None ise depo klasörü)
+        """
+        klasor = Path(klasor) if klasor is not None else self.nesne_dizin
+        deneme = self.nesne_dizin / f".hardlink_deneme.{os.getpid()}"
+        baglanti = klasor / f".hardlink_deneme.{os.getpid()}.baglanti"
+        try:
+            klasor.mkdir(parents=True, exist_ok=True)
+            deneme.touch()
+            os.link(deneme, baglanti)
+            return True
+        except OSError:
+            return False
+        finally:
+            baglanti.unlink(missing_ok=True)
+            deneme.unlink(missing_ok=True)
+
+    def sahipsizleri_temizle(self) -> int:
+        """
+        Hiçbir rapor klasöründen hardlink'lenmeyen nesneleri siler
+
+        Symlink ile bağlanan nesnelerin bağlantı sayısı artmadığından
+        hardlink kurulamayan depolarda çağrılmamalıdır (bkz. hardlink_destekli).
+
+        Returns:
+            Silinen nesne sayısı
+        """
+        silinen = 0
+        try:
+            for nesne in self.nesne_dizin.glob("*/*"):
+                if nesne.is_file() and nesne.stat().st_nlink == 1:
+                    nesne.unlink(missing_ok=True)
+                    silinen += 1
+            if silinen:
+                logger.info(f"Çıktı deposundan {silinen} sahipsiz nesne silindi")
+        except Exception as e:
+            logger.warning(f"Çıktı deposu temizleme hatası: {e}")
+        return silinen
+
+
+def dosyalari_coz(klasor: Union[str, Path], desen: str = "*.png") -> List[Path]:
+    """Manifest üzerinden dosya çözümlemesi; depo kapalıysa klasör taranır"""
+    if not CIKTI_DEPOSU_AYARLARI.get("aktif", True):
+        return sorted(Path(klasor).glob(desen))
+    return CiktiDeposu().dosyalari_coz(klasor, desen)
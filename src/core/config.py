@@ -13,6 +13,7 @@ VERI_DIZIN = PROJE_KOK / "data"
 HAM_VERI_DIZIN = VERI_DIZIN / "raw"
 ISLENMIŞ_VERI_DIZIN = VERI_DIZIN / "processed"
 RAPOR_DIZIN = VERI_DIZIN / "reports"
+RAPOR_SATIR_VERISI_DIZIN_ADI = "veri"  # Rapor klasöründe satır düzeyi parquet'lerin alt klasörü
 
 # Excel dosya ayarları
 EXCEL_MOTOR = "xlrd"  # xlrd 1.2.0 için
@@ -23,7 +24,17 @@ PARQUET_MOTOR = "pyarrow"
 PARQUET_SIKISTIRMA = "snappy"
 
 # Veri dosya yolu
-VERI_DOSYA_YOLU = ISLENMIŞ_VERI_DIZIN / "ana_veri.parquet"
+VERI_DOSYA_YOLU = ISLENMIŞ_VERI_DIZIN / "ana_veri.parquet"  # Eski tek dosyalı ana veri
+
+# Ana veri deposu (Hive tarzı, "oluşturma tarihi" ayına göre bölümlenmiş parquet dataset)
+ANA_VERI_DATASET_DIZIN = ISLENMIŞ_VERI_DIZIN / "ana_veri"
+ANA_VERI_BOLUM_AYARLARI = {
+    "bolum_sutunu": "olusturma_ay",  # Klasör adındaki bölüm anahtarı (olusturma_ay=2025-10)
+    "tarih_sutunu": "oluşturma tarihi",  # Bölüm anahtarının türetildiği sütun
+    "ay_formati": "%Y-%m",  # Bölüm değeri formatı (sözlük sırası = zaman sırası)
+    "bilinmeyen_bolum": "bilinmiyor",  # Tarihi boş/geçersiz satırların bölümü
+    "dosya_adi": "veriler.parquet",  # Her bölüm klasöründeki dosya adı
+}
 
 # Tarih ayarları
 TARIH_FORMATI = "%Y-%m-%d"
@@ -41,6 +52,30 @@ EXCEL_TARIH_SUTUNLARI = [  # Excel'de tarih formatı uygulanacak sütunlar
     "vakanın ekibe veriliş tarihi",
 ]
 
+# Excel rapor/dönüştürme yazıcısı (AkisliExcelYazici)
+EXCEL_YAZMA_AYARLARI = {
+    "motor": "otomatik",  # "xlsxwriter", "openpyxl" ya da "otomatik" (xlsxwriter yüklüyse o)
+    "tarih_formati": "DD-MM-YYYY HH:MM",  # Tarih sütunlarının sütun düzeyi sayı formatı
+    "max_satir": 1_048_576,  # Excel sayfa satır sınırı (başlık dahil); aşan sayfa _2, _3... olarak bölünür
+    "parca_satir": 50_000,  # DataFrame satırları bu büyüklükte parçalarla diske yazılır
+    "yan_dosyalar": (),  # Rapor sayfalarının ek kopyaları: "csv" ve/veya "parquet"
+    "yan_dosya_dizin_adi": "tablolar",  # Ek kopyaların Excel dosyasının yanındaki alt klasörü
+}
+
+# Ham veride denenecek tarih formatları (sütun başına bir kez, örneklem üzerinden seçilir)
+TARIH_FORMAT_ADAYLARI = [
+    "%d-%m-%Y %H:%M:%S",  # Nakil sistemi dışa aktarım formatı
+    "%d.%m.%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",  # ISO (eski parquet dosyaları)
+    "%d-%m-%Y %H:%M",
+    "%d.%m.%Y %H:%M",
+]
+TARIH_FORMAT_ORNEK_SAYISI = 500  # Format tespiti için bakılan dolu değer sayısı
+
+# Parquet şema metadata anahtarı: tarih sütunları yazılırken zaten parse edilmiş
+PARQUET_TARIH_METADATA_ANAHTARI = "nakil_analizi.tarih_sutunlari"
+
 # Log ayarları
 LOG_SEVIYE = "ERROR"
 LOG_DOSYA = PROJE_KOK / "app.log"
@@ -97,6 +132,23 @@ TARIH_SUTUNLARI = [
 
 SAYISAL_SUTUNLAR = ["Yaş", "Bekleme Süresi"]
 
+# Düşük kardinaliteli sütunlar: parquet'e dictionary, pandas'a category olarak yüklenir
+KATEGORIK_VERI_SUTUNLARI = [
+    "durum",
+    "talep kaynağı",
+    "nakledilmesi i̇stenen klinik",
+    "solunum i̇şlemi",
+    "i̇l",
+    "il",
+    "i̇ptal eden",
+    "i̇ptal nedeni",
+    "iptal nedeni",
+]
+KATEGORIK_MAKS_BENZERSIZ_ORANI = 0.5  # Benzersiz/satır oranı bunu aşarsa sütun object kalır
+
+# "x gün x saat x dakika" metninden bir kez türetilen timedelta64 sütunu
+BEKLEME_SURESI_TD_SUTUNU = "bekleme_suresi_td"
+
 KATEGORIK_SUTUNLAR = [
     "Nakil Tipi",
     "Talep Kaynağı",
@@ -135,6 +187,24 @@ KLINIK_ANALIZ_AYARLARI = {
 # Klinik sütun adı tanımı
 KLINIK_SUTUN_ADI = "nakledilmesi i̇stenen klinik"
 
+# Bekleme süresi eşik (threshold) analizi ayarları
+# Her aralık (etiket, üst sınır saat) çiftidir; aralıklar sağdan kapalıdır:
+# (önceki üst sınır, üst sınır]. Son üst sınır float("inf") olmalıdır.
+BEKLEME_ESIK_AYARLARI = {
+    "varsayilan": [
+        ("0-30 dakika", 0.5),
+        ("30 dakika - 1 saat", 1),
+        ("1-2 saat", 2),
+        ("2-4 saat", 4),
+        ("4-8 saat", 8),
+        ("8-24 saat", 24),
+        ("24+ saat", float("inf")),
+    ],
+    # İl grubu ya da klinik adına özel aralıklar (yoksa varsayılan kullanılır)
+    # Örnek: {"Il_Disi": [("0-2 saat", 2), ("2-12 saat", 12), ("12+ saat", float("inf"))]}
+    "grup_esikleri": {},
+}
+
 # Program başlangıç ayarları
 PROGRAM_AYARLARI = {
     # Eski verileri otomatik silme (processed ve reports klasörleri)
@@ -142,6 +212,30 @@ PROGRAM_AYARLARI = {
     "eski_verileri_sil": True,
 }
 
+# Çalıştırma kaydı (CalistirmaKaydi) - işlenen dosya ve raporların SQLite dizini
+CALISTIRMA_KAYDI_AYARLARI = {
+    "aktif": True,  # Arayüz ve CLI rapor/tarih listelerini klasör taraması yerine buradan okur
+    "veritabani": VERI_DIZIN / "calistirmalar.sqlite3",
+    "zaman_asimi_sn": 30,  # Yazma kilidi için bekleme süresi (arayüz ve pipeline aynı anda erişebilir)
+}
+
+# Arayüzden yüklenen dosyaların arka plan iş kuyruğu (IsKuyrugu)
+IS_KUYRUGU_AYARLARI = {
+    "aktif": True,  # Veri işleme + analiz ayrı süreçte çalışır; kapalıysa arayüz oturumunda çalışır
+    "eszamanli_is": 1,  # Aynı anda çalışan en fazla iş (fazlası sırada bekler; ana veri güncellemesi dosya kilidiyle sırayla yapılır)
+    "baslatma_yontemi": "spawn",  # multiprocessing başlatma yöntemi (arayüz süreci çok iş parçacıklıdır)
+    "iptal_bekleme_sn": 5,  # İptalde SIGTERM sonrası SIGKILL'e kadar beklenen süre
+    "gecmis_boyutu": 50,  # Bellekte tutulan bitmiş iş sayısı
+}
+
+# Modülleri ve fontları önceden yüklenmiş kalıcı analiz süreci (python main.py --sunucu)
+ANALIZ_SUNUCUSU_AYARLARI = {
+    "aktif": True,  # CLI ve arayüz, çalışan bir sunucu varsa komutları ona iletir; yoksa kendisi çalıştırır
+    "soket": VERI_DIZIN / "analiz_sunucusu.sock",  # Unix soketi (Windows'ta adlandırılmış boru kullanılır)
+    "windows_boru": r"\\.\pipe\nakil_analiz_sunucusu",
+    "anahtar_dosyasi": VERI_DIZIN / "analiz_sunucusu.anahtar",  # Bağlantı doğrulama anahtarı (yalnızca sahibi okuyabilir)
+}
+
 # Otomatik analiz ayarları
 OTOMATIK_ANALIZ_AYARLARI = {
     # Günlük işlem sonrası otomatik nakil analizi
@@ -228,6 +322,90 @@ GRAFIK_GORUNUM_AYARLARI = {
     "pasta_etiket_format": "isim_yuzde_sayi_yanli",
 }
 
+# Paralel grafik çizim ayarları (GrafikZamanlayici)
+GRAFIK_PARALEL_AYARLARI = {
+    "aktif": True,  # Grafikleri işçi süreç havuzunda paralel çiz
+    "isci_sayisi": None,  # None: tüm çekirdekler (os.cpu_count())
+    "havuz": "surec",  # "surec" (ProcessPoolExecutor) ya da "is_parcacigi" (ThreadPoolExecutor)
+    "min_is_sayisi": 4,  # Bundan az iş varsa havuz kurulmaz, sırayla çizilir
+}
+
+# Grafik önbelleği ayarları (GrafikOnbellegi)
+GRAFIK_ONBELLEK_AYARLARI = {
+    "aktif": True,  # Girdisi değişmeyen grafikler yeniden çizilmez, önbellekten alınır
+    "dizin": VERI_DIZIN / "grafik_onbellegi",  # İçerik adresli depo (nesneler/, anahtarlar/)
+    "max_boyut_mb": 512,  # Aşılırsa en uzun süredir kullanılmayan dosyalar silinir (LRU)
+}
+
+# Rapor çıktılarının içerik adresli deposu (CiktiDeposu)
+CIKTI_DEPOSU_AYARLARI = {
+    "aktif": True,  # Rapor klasörlerindeki grafik/PDF'ler depoya bir kez yazılır, klasörlerde bağlantı + manifest kalır
+    "dizin": VERI_DIZIN / "cikti_deposu",  # nesneler/<özetin ilk 2 karakteri>/<sha256><uzantı>
+    "desenler": ["*.png", "*.pdf"],  # Depoya alınan dosyalar (rapor klasörünün üst düzeyi)
+    "manifest_adi": "manifest.json",  # Rapor klasöründeki dosya adı -> içerik özeti listesi
+}
+
+# Grafik çıktı ayarları (figur_kaydet)
+GRAFIK_CIKTI_AYARLARI = {
+    "vektor": False,  # True: her grafiğin vektör PDF kopyası da yazılır ve PDF raporuna vektör olarak gömülür
+    "vektor_dizin_adi": "vektor",  # Vektör kopyaların yazıldığı alt klasör (PNG'nin yanında)
+    "png_profili": "varsayilan",  # PNG çözünürlük profili (aşağıdaki png_profilleri'nden)
+    "png_profilleri": {
+        "varsayilan": None,  # Her grafik kendi DPI değeriyle (VARSAYILAN_DPI) kaydedilir
+        # DPI, grafiğin gösterildiği genişlikten hesaplanır:
+        # hedef_dpi * gosterim_genisligi_inc / figür genişliği (min_dpi ile alttan sınırlı)
+        "pdf_izgara": {"gosterim_genisligi_inc": 2.8, "hedef_dpi": 200, "min_dpi": 50},  # PDF 2x2 ızgara hücresi
+        "ekran": {"gosterim_genisligi_inc": 10.0, "hedef_dpi": 96, "min_dpi": 72},  # Streamlit / tarayıcı
+    },
+}
+
+# Rapor Arşivi galerisi için küçük önizleme görselleri (figur_kaydet / app.py show_graphs)
+KUCUK_GORSEL_AYARLARI = {
+    "aktif": True,  # Her grafik kaydedilirken küçük önizlemesi de yazılır; galeri tam boyutu yalnızca açılınca yükler
+    "dizin_adi": "kucuk",  # Önizlemelerin yazıldığı alt klasör (PNG'nin yanında)
+    "max_piksel": (480, 360),  # Önizlemenin sığdırıldığı en büyük boyut (oran korunur)
+    "format": "WEBP",  # Pillow WebP desteği yoksa PNG yazılır
+    "kalite": 80,  # WebP kalite değeri (0-100)
+    "sayfa_boyutu": 12,  # Galeride bir sayfada gösterilen önizleme sayısı
+    "sutun_sayisi": 3,  # Galeri ızgarasının sütun sayısı
+}
+
+# Uygulamadaki PDF görüntüleyici için sayfa görselleri (PdfSayfaOnbellegi)
+PDF_SAYFA_GORSEL_AYARLARI = {
+    "aktif": True,  # Sayfalar bir kez rasterlenip PDF'in yanında saklanır; kapalıysa her gösterimde rasterlenir
+    "dizin_adi": "sayfalar",  # Sayfa görsellerinin yazıldığı alt klasör (PDF'in yanında; her PDF için sayfalar/<pdf adı>/)
+    "zoom": 2.0,  # Rasterleme ölçeği (2.0 = 144 DPI)
+    "komsu_sayisi": 1,  # Gösterilen sayfanın iki yanında arka planda önceden oluşturulan sayfa sayısı
+    "rapor_olusturulurken": False,  # True: tüm sayfalar rapor oluşturulurken rasterlenir (ilk gösterimi beklemeden)
+    "bilgi_onbellek_boyutu": 256,  # İçerik özeti ve sayfa sayısı bellekte tutulan en fazla PDF sayısı (LRU)
+}
+
+# PDF bölümlerinin paralel oluşturulması (PDFOlusturucu)
+PDF_PARALEL_AYARLARI = {
+    "aktif": True,  # İstatistik sayfası ve her grafik ızgarası sayfası işçi süreçlerde ayrı PDF olarak oluşturulur
+    "isci_sayisi": None,  # None: tüm çekirdekler (os.cpu_count())
+    "min_bolum_sayisi": 4,  # Bundan az bölüm varsa havuz kurulmaz, sırayla oluşturulur
+}
+
+# PDF'e gömülecek görsellerin hazırlanması (GorselHazirlayici)
+PDF_GORSEL_AYARLARI = {
+    "aktif": True,  # PNG'ler gömülmeden önce yerleşim boyutuna küçültülür, aynı içerikli olanlar bir kez eklenir
+    "hedef_dpi": 200,  # PDF'teki yerleşim boyutunda (2.8 x 1.8 inç) hedef çözünürlük
+    "palet": True,  # Renk sapması sınırı aşılmıyorsa 256 renkli paletli PNG'ye çevir
+    "max_palet_sapmasi": 1.0,  # İzin verilen ortalama kanal farkı (0-255 ölçeğinde)
+    "dizin": VERI_DIZIN / "pdf_gorsel_onbellegi",  # Hazırlanan görseller (kaynak içerik özetiyle adlandırılır)
+    "max_boyut_mb": 128,  # Aşılırsa en uzun süredir kullanılmayan görseller silinir (LRU)
+}
+
+# Tüm grafiklerin tek sayfada birleştirilmesi (izgara_birlestirici)
+IZGARA_BIRLESTIRME_AYARLARI = {
+    "max_sutun": 4,  # Izgaradaki en fazla sütun sayısı
+    "hucre_orani": 0.75,  # Hücre yüksekliği / genişliği (eski 800x600 küçük resimler)
+    "kenar_boslugu_mm": 10,  # Sayfa kenar boşluğu (A4 yatay)
+    "hedef_dpi": 200,  # Her grafik hücre boyutunda bu çözünürlüğe küçültülerek çözülür
+    "sayfa_raster_dpi": 200,  # PyPDF2 yoksa PDF sayfaları tek tek bu çözünürlükte rasterlenir
+}
+
 # Grafik başlık şablonları
 GRAFIK_BASLIK_SABLONLARI = {
     # Klinik grafikleri
@@ -291,3 +469,5 @@ PASTA_GRAFIK_RENK_PALETI = [
 
 # PDF konfigürasyonu ayrı dosyada tutulmaktadır
 PDF_CONFIG_DOSYA_YOLU = PROJE_KOK / "pdf_config.json"
+KAPAK_CONFIG_DOSYA_YOLU = PROJE_KOK / "assets" / "kapak_config.json"
+KAPAK_PDF_YOLU = PROJE_KOK / "assets" / "kapak.pdf"  # Hazır kapak (yoksa kapak_config.json'dan oluşturulur)
@@ -0,0 +1,125 @@
+"""
+İçerik adresli depo yardımcıları - Dosya özeti, nesne yolu ve bağlantı işlemleri
+
+Çıktı deposu ve grafik önbelleği dosyaları içerik özetleriyle
+``nesneler/<özetin ilk iki karakteri>/<özet><uzantı>`` altında bir kez
+tutar ve klasörlere bağlantı olarak yerleştirir. Boyut sınırlı
+önbellekler en uzun süredir kullanılmayan dosyaları lru_tahliye ile siler.
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable, Tuple, Union
+
+# Özet hesaplanırken dosya bu boyutta bloklarla okunur
+OKUMA_BLOK_BOYUTU = 1 << 20
+
+
+def dosya_ozeti(dosya: Union[str, Path]) -> str:
+    """Dosya içeriğinin sha256 özeti (büyük dosyalar belleğe alınmadan)"""
+    ozet = hashlib.sha256()
+    with open(dosya, "rb") as f:
+        for blok in iter(lambda: f.read(OKUMA_BLOK_BOYUTU), b""):
+            ozet.update(blok)
+    return ozet.hexdigest()
+
+
+def nesne_yolu(nesne_dizin: Path, icerik_ozeti: str, uzanti: str) -> Path:
+    """İçerik özetine karşılık gelen depo nesnesinin yolu"""
+    return nesne_dizin / icerik_ozeti[:2] / f"{icerik_ozeti}{uzanti}"
+
+
+def baglanti_olustur(nesne: Path, hedef: Path, sembolik: bool = True) -> None:
+    """
+    Nesneyi hedefe hardlink ile, olmazsa symlink ya da kopya olarak yerleştirir
+
+    Args:
+        nesne: Depodaki nesne
+        hedef: Yerleştirilecek yol
+        sembolik: False ise symlink denenmez (nesneleri tahliye edilebilen
+            depolarda symlink boşta kalabilir)
+    """
+    # Var olan dosyanın üzerine yazmak yerine bağlantısı kaldırılır;
+    # böylece hardlink'li eski bir kopya depodaki nesneyi bozamaz
+    hedef.unlink(missing_ok=True)
+    try:
+        os.link(nesne, hedef)
+        return
+    except OSError:
+        pass
+    if sembolik:
+        try:
+            os.symlink(nesne.resolve(), hedef)
+            return
+        except OSError:
+            pass
+    shutil.copy2(nesne, hedef)
+
+
+def nesneye_al(dosya: Path, nesne_dizin: Path, tasi: bool = False) -> Tuple[str, Path]:
+    """
+    Dosyayı içerik özetiyle depoya alır
+
+    Args:
+        dosya: Depoya alınacak dosya
+        nesne_dizin: Deponun nesne klasörü
+        tasi: True ise dosya depoya taşınır (nesne zaten varsa silinir);
+            False ise yerinde kalır ve depoya hardlink'lenir (olmazsa kopyalanır)
+
+    Returns:
+        (içerik özeti, nesne yolu)
+    """
+    ozet = dosya_ozeti(dosya)
+    nesne = nesne_yolu(nesne_dizin, ozet, dosya.suffix.lower())
+
+    if nesne.exists():
+        if tasi:
+            dosya.unlink()
+        return ozet, nesne
+
+    nesne.parent.mkdir(parents=True, exist_ok=True)
+    if tasi:
+        os.replace(dosya, nesne)
+        return ozet, nesne
+
+    gecici = nesne.with_name(f"{nesne.name}.{os.getpid()}.tmp")
+    try:
+        os.link(dosya, gecici)
+    except OSError:
+        # Farklı disk: depoya bir kez kopyalanır
+        shutil.copy2(dosya, gecici)
+    os.replace(gecici, nesne)
+    return ozet, nesne
+
+
+def lru_tahliye(dosyalar: Iterable[Path], max_boyut: int) -> int:
+    """
+    Toplam boyut sınırı aşılıyorsa en eski kullanılan dosyaları siler
+
+    Son kullanım zamanı dosya mtime'ıdır; önbellekler isabette os.utime ile
+    günceller.
+
+    Args:
+        dosyalar: Önbellek dosyaları
+        max_boyut: Bayt cinsinden üst sınır
+
+    Returns:
+        Silinen dosya sayısı
+    """
+    kayitlar = []
+    toplam = 0
+    for dosya in dosyalar:
+        bilgi = dosya.stat()
+        kayitlar.append((bilgi.st_mtime, bilgi.st_size, dosya))
+        toplam += bilgi.st_size
+
+    silinen = 0
+    for _, boyut, dosya in sorted(kayitlar, key=lambda k: k[0]):
+        if toplam <= max_boyut:
+            break
+        dosya.unlink(missing_ok=True)
+        toplam -= boyut
+        silinen += 1
+    return silinen
@@ -0,0 +1,375 @@
+"""
+İş kuyruğu - Yüklenen Excel dosyalarının işlenmesini ve analizini arayüzün
+dışında, ayrı süreçlerde çalıştırır
+
+Her iş (Excel → parquet → kapsamlı günlük analiz → PDF) kendi sürecinde
+çalışır; aynı anda en fazla eszamanli_is kadar iş çalışır, fazlası sırada
+bekler. İşlerin ana veri güncellemesi (VeriIsleme) dosya kilidiyle
+sırayla yapılır. Kuyruk süreç içinde paylaşıldığından işler ve ilerlemeleri
+arayüzün tüm oturumlarından görülür. İçeriği (md5) sırada ya da çalışmakta
+olan bir işle aynı olan dosya yeniden kuyruğa alınmaz, o iş döndürülür.
+Çalışan iş iptal edilince süreci (grafik işçileriyle birlikte) sonlandırılır.
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import traceback
+from collections import deque
+from multiprocessing.connection import wait
+from typing import Any, Deque, Dict, List, Optional
+
+from .calistirma_kaydi import kayda_yaz, kimlik_olustur
+from .config import IS_KUYRUGU_AYARLARI
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+# İş durumları
+IS_KUYRUKTA = "kuyrukta"
+IS_CALISIYOR = "calisiyor"
+IS_TAMAMLANDI = "tamamlandi"
+IS_HATA = "hata"
+IS_IPTAL = "iptal"
+
+DEVAM_EDEN_DURUMLAR = (IS_KUYRUKTA, IS_CALISIYOR)
+
+
+def _is_sureci(baglanti, dosya: str, unique_id: str, gun_tarihi: str) -> None:
+    """
+    İş sürecinin gövdesi: veriyi işler, analizi yapar ve sonucu bildirir
+
+    İlerleme ("asama", metin, yüzde) ve sonuç ("sonuc", durum, mesaj)
+    mesajları bağlantı üzerinden kuyruğa gönderilir.
+    """
+    # Süreç kendi grubunu kurar; iptalde grafik işçileriyle birlikte sonlandırılır
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+
+    def bildir(*mesaj: Any) -> None:
+        try:
+            baglanti.send(mesaj)
+        except (BrokenPipeError, OSError):
+            pass
+
+    try:
+        from ..analyzers.nakil_analyzer import NakilAnalizcisi
+        from ..processors.veri_isleme import VeriIsleme
+
+        bildir("asama", "Excel verisi işleniyor", 10)
+        islem = VeriIsleme().gunluk_islem(dosya, unique_id=unique_id)
+        bildir(
+            "asama",
+            f"Veri işlendi ({islem.get('işlenen_satir_sayisi', 0)} satır); "
+            "analiz yapılıyor ve PDF oluşturuluyor",
+            50,
+        )
+
+        rapor = NakilAnalizcisi().kapsamli_gunluk_analiz(
+            gun_tarihi=gun_tarihi, unique_id=unique_id
+        )
+        if rapor and rapor.get("durum") == "basarili":
+            bildir("sonuc", IS_TAMAMLANDI, None)
+        else:
+            rapor = rapor or {}
+            mesaj = rapor.get("hata") or rapor.get("mesaj") or "Analiz başarısız oldu"
+            bildir("sonuc", IS_HATA, mesaj)
+
+    except Exception as e:
+        bildir("sonuc", IS_HATA, f"{e}\n\n{traceback.format_exc()}")
+    finally:
+        baglanti.close()
+
+
+class AnalizIsi:
+    """Kuyruktaki tek bir yükleme işi"""
+
+    def __init__(self, dosya: str, icerik_ozeti: str, unique_id: str, gun_tarihi: str):
+        """İş kaydı oluşturma"""
+        # Rapor klasörü adı; çalıştırma kaydındaki kimlikle aynıdır
+        self.kimlik = kimlik_olustur(gun_tarihi, unique_id)
+        self.dosya = dosya
+        self.icerik_ozeti = icerik_ozeti
+        self.unique_id = unique_id
+        self.gun_tarihi = gun_tarihi
+        self.durum = IS_KUYRUKTA
+        self.asama = "Sırada bekliyor"
+        self.ilerleme = 0
+        self.hata_mesaji: Optional[str] = None
+        self.eklenme = time.time()
+        self.baslangic: Optional[float] = None
+        self.bitis: Optional[float] = None
+        self._surec: Optional[multiprocessing.Process] = None
+        self._baglanti = None
+
+    def sozluk(self) -> Dict[str, Any]:
+        """Arayüzde gösterilecek anlık durum"""
+        bitis = self.bitis or time.time()
+        return {
+            "kimlik": self.kimlik,
+            "dosya": os.path.basename(self.dosya),
+            "icerik_ozeti": self.icerik_ozeti,
+            "unique_id": self.unique_id,
+            "gun_tarihi": self.gun_tarihi,
+            "durum": self.durum,
+            "asama": self.asama,
+            "ilerleme": self.ilerleme,
+            "hata_mesaji": self.hata_mesaji,
+            "eklenme": self.eklenme,
+            "sure_sn": round(bitis - self.baslangic, 1) if self.baslangic else None,
+        }
+
+
+class IsKuyrugu:
+    """Sınırlı sayıda iş sürecini çalıştıran yerel iş kuyruğu"""
+
+    def __init__(self, ayarlar: Optional[Dict] = None):
+        """İş kuyruğu başlatma; dağıtıcı iş parçacığı hemen çalışmaya başlar"""
+        self.ayarlar = ayarlar if ayarlar is not None else IS_KUYRUGU_AYARLARI
+        self.eszamanli_is = max(1, int(self.ayarlar.get("eszamanli_is", 1)))
+        self._baglam = multiprocessing.get_context(self.ayarlar.get("baslatma_yontemi", "spawn"))
+        self._kosul = threading.Condition()
+        self._isler: Dict[str, AnalizIsi] = {}
+        self._bekleyenler: Deque[AnalizIsi] = deque()
+        self._calisanlar: List[AnalizIsi] = []
+        self._kapandi = False
+        self._dagitici = threading.Thread(
+            target=self._dagit, name="is_kuyrugu_dagitici", daemon=True
+        )
+        self._dagitici.start()
+
+    # ------------------------------------------------------------------ #
+    # Arayüz tarafı
+    # ------------------------------------------------------------------ #
+
+    def gonder(
+        self, dosya: str, icerik_ozeti: str, unique_id: str, gun_tarihi: str
+    ) -> Dict[str, Any]:
+        """
+        İşi kuyruğa alır
+
+        Aynı içerikli bir dosya sırada ya da çalışıyorsa yeni iş oluşturulmaz;
+        o işin durumu döndürülür (kimlik farkından anlaşılır).
+
+        Returns:
+            İşin anlık durumu
+        """
+        with self._kosul:
+            mevcut = self._devam_eden(icerik_ozeti)
+            if mevcut is not None:
+                logger.info(f"Aynı dosya zaten işleniyor, yeni iş açılmadı: {mevcut.kimlik}")
+                return mevcut.sozluk()
+
+            is_ = AnalizIsi(dosya, icerik_ozeti, unique_id, gun_tarihi)
+            self._isler[is_.kimlik] = is_
+            self._bekleyenler.append(is_)
+            self._gecmisi_buda()
+            self._kosul.notify_all()
+            logger.info(f"İş kuyruğa alındı: {is_.kimlik}")
+            return is_.sozluk()
+
+    def bul(self, icerik_ozeti: str) -> Optional[Dict[str, Any]]:
+        """Aynı içerikli, sırada ya da çalışmakta olan işin durumu"""
+        with self._kosul:
+            is_ = self._devam_eden(icerik_ozeti)
+            return is_.sozluk() if is_ else None
+
+    def durum(self, kimlik: str) -> Optional[Dict[str, Any]]:
+        """İşin anlık durumu; iş bilinmiyorsa None"""
+        with self._kosul:
+            is_ = self._isler.get(kimlik)
+            return is_.sozluk() if is_ else None
+
+    def isler(self) -> List[Dict[str, Any]]:
+        """Tüm işler (en yenisi başta)"""
+        with self._kosul:
+            return [
+                is_.sozluk()
+                for is_ in sorted(self._isler.values(), key=lambda i: i.eklenme, reverse=True)
+            ]
+
+    def iptal_et(self, kimlik: str) -> bool:
+        """
+        İşi iptal eder: sıradaysa kuyruktan çıkarır, çalışıyorsa sürecini sonlandırır
+
+        Returns:
+            İş iptal edildiyse True (bitmiş ya da bilinmeyen işte False)
+        """
+        with self._kosul:
+            is_ = self._isler.get(kimlik)
+            if is_ is None or is_.durum not in DEVAM_EDEN_DURUMLAR:
+                return False
+
+            calisiyordu = is_.durum == IS_CALISIYOR
+            if not calisiyordu:
+                self._bekleyenler.remove(is_)
+            is_.durum = IS_IPTAL
+            is_.asama = "İptal edildi"
+            is_.bitis = time.time()
+            surec = is_._surec
+
+        if surec is not None:
+            self._sureci_sonlandir(surec)
+        if calisiyordu:
+            kayda_yaz("hata", kimlik, "Kullanıcı tarafından iptal edildi")
+        logger.info(f"İş iptal edildi: {kimlik}")
+        with self._kosul:
+            self._kosul.notify_all()
+        return True
+
+    def kapat(self) -> None:
+        """Çalışan işleri sonlandırır (süreç kapanırken)"""
+        with self._kosul:
+            self._kapandi = True
+            kimlikler = [
+                is_.kimlik for is_ in self._isler.values() if is_.durum in DEVAM_EDEN_DURUMLAR
+            ]
+            self._kosul.notify_all()
+        for kimlik in kimlikler:
+            self.iptal_et(kimlik)
+
+    # ------------------------------------------------------------------ #
+    # Dağıtıcı
+    # ------------------------------------------------------------------ #
+
+    def _devam_eden(self, icerik_ozeti: str) -> Optional[AnalizIsi]:
+        for is_ in self._isler.values():
+            if is_.icerik_ozeti == icerik_ozeti and is_.durum in DEVAM_EDEN_DURUMLAR:
+                return is_
+        return None
+
+    def _gecmisi_buda(self) -> None:
+        """Bitmiş işlerin en eskilerini gecmis_boyutu'nu aşmayacak şekilde unutur"""
+        bitenler = sorted(
+            (is_ for is_ in self._isler.values() if is_.durum not in DEVAM_EDEN_DURUMLAR),
+            key=lambda i: i.eklenme,
+        )
+        fazla = len(bitenler) - self.ayarlar.get("gecmis_boyutu", 50)
+        for is_ in bitenler[:max(0, fazla)]:
+            del self._isler[is_.kimlik]
+
+    def _baslat(self, is_: AnalizIsi) -> None:
+        okuma, yazma = self._baglam.Pipe(duplex=False)
+        # daemon değil: analiz kendi grafik işçi süreçlerini açar
+        surec = self._baglam.Process(
+            target=_is_sureci,
+            args=(yazma, is_.dosya, is_.unique_id, is_.gun_tarihi),
+            name=f"analiz_{is_.kimlik}",
+        )
+        surec.start()
+        yazma.close()
+        is_._surec, is_._baglanti = surec, okuma
+        is_.durum = IS_CALISIYOR
+        is_.asama = "Başlatılıyor"
+        is_.ilerleme = 5
+        is_.baslangic = time.time()
+        self._calisanlar.append(is_)
+        logger.info(f"İş başlatıldı: {is_.kimlik} (pid {surec.pid})")
+
+    def _dagit(self) -> None:
+        """Bekleyen işleri sınıra kadar başlatır, mesajları okur, bitenleri kapatır"""
+        while True:
+            with self._kosul:
+                if self._kapandi:
+                    return
+                while self._bekleyenler and len(self._calisanlar) < self.eszamanli_is:
+                    try:
+                        self._baslat(self._bekleyenler.popleft())
+                    except Exception as e:
+                        logger.error(f"İş süreci başlatılamadı: {e}")
+                if not self._calisanlar:
+                    self._kosul.wait(timeout=1.0)
+                    continue
+                izlenenler = [is_._baglanti for is_ in self._calisanlar]
+                izlenenler += [is_._surec.sentinel for is_ in self._calisanlar]
+
+            wait(izlenenler, timeout=1.0)
+
+            with self._kosul:
+                bitenler = []
+                for is_ in list(self._calisanlar):
+                    self._mesajlari_oku(is_)
+                    if is_._surec.exitcode is None and is_.durum == IS_CALISIYOR:
+                        continue
+                    bitenler.append(is_)
+
+            # Süreçler kilit dışında beklenir; arayüz çağrıları bu sırada bloklanmaz
+            for is_ in bitenler:
+                is_._surec.join(timeout=5)
+
+            with self._kosul:
+                for is_ in bitenler:
+                    self._bitir(is_)
+
+    def _mesajlari_oku(self, is_: AnalizIsi) -> None:
+        try:
+            while is_._baglanti.poll():
+                tur, *veri = is_._baglanti.recv()
+                if is_.durum != IS_CALISIYOR:
+                    continue
+                if tur == "asama":
+                    is_.asama, is_.ilerleme = veri
+                elif tur == "sonuc":
+                    is_.durum, is_.hata_mesaji = veri
+        except (EOFError, OSError):
+            pass
+
+    def _bitir(self, is_: AnalizIsi) -> None:
+        """Süreci biten (ya da iptal edilen) işi çalışanlardan çıkarır (süreç beklenmiş olmalı)"""
+        is_._baglanti.close()
+        self._calisanlar.remove(is_)
+        if is_.durum == IS_CALISIYOR:
+            # Süreç sonuç bildirmeden kapandı (bellek yetersizliği vb.)
+            is_.durum = IS_HATA
+            is_.hata_mesaji = (
+                f"İş süreci beklenmedik şekilde sonlandı (çıkış kodu {is_._surec.exitcode})"
+            )
+            kayda_yaz("hata", is_.kimlik, is_.hata_mesaji)
+        if is_.durum == IS_TAMAMLANDI:
+            is_.asama = "Tamamlandı"
+            is_.ilerleme = 100
+        elif is_.durum == IS_HATA:
+            is_.asama = "Hata"
+        is_.bitis = is_.bitis or time.time()
+        is_._surec = is_._baglanti = None
+        logger.info(f"İş bitti: {is_.kimlik} ({is_.durum})")
+
+    def _sureci_sonlandir(self, surec: multiprocessing.Process) -> None:
+        """Süreci (ve açtığı grafik işçilerini) önce SIGTERM, kapanmazsa SIGKILL ile durdurur"""
+        bekleme = self.ayarlar.get("iptal_bekleme_sn", 5)
+        for sinyal in (signal.SIGTERM, getattr(signal, "SIGKILL", signal.SIGTERM)):
+            try:
+                if hasattr(os, "killpg"):
+                    os.killpg(surec.pid, sinyal)
+                elif sinyal == signal.SIGTERM:
+                    surec.terminate()
+                else:
+                    surec.kill()
+            except (ProcessLookupError, PermissionError):
+                # Süreç kendi grubunu kurmadan önce: yalnızca süreç durdurulur
+                if sinyal == signal.SIGTERM:
+                    surec.terminate()
+                else:
+                    surec.kill()
+            surec.join(timeout=bekleme)
+            if surec.exitcode is not None:
+                return
+        logger.warning(f"İş süreci durdurulamadı (pid {surec.pid})")
+
+
+_is_kuyrugu: Optional[IsKuyrugu] = None
+_is_kuyrugu_kilidi = threading.Lock()
+
+
+def is_kuyrugu() -> IsKuyrugu:
+    """Süreç içinde (arayüzün tüm oturumlarında) paylaşılan iş kuyruğu"""
+    global _is_kuyrugu
+    with _is_kuyrugu_kilidi:
+        if _is_kuyrugu is None:
+            _is_kuyrugu = IsKuyrugu()
+            atexit.register(_is_kuyrugu.kapat)
+        return _is_kuyrugu
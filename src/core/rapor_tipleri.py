@@ -0,0 +1,89 @@
+"""
+Rapor tipleri - Kapsamlı günlük analiz JSON raporunun şeması
+
+Rapor yalnızca toplam değerleri (sayı, yüzde, süre istatistikleri) içerir.
+Satır düzeyindeki veriler rapor klasörüne parquet olarak yazılır ve
+rapor içinde rapor klasörüne göre göreli yol ile referans verilir.
+"""
+
+from typing import Dict, List, TypedDict
+
+
+class VakaDurumuSonucu(TypedDict, total=False):
+    """AnalizMotoru.vaka_durumu_gruplari çıktısı (grup başına)"""
+
+    toplam_vaka: int
+    durum_sayilari: Dict[str, int]
+    durum_yuzdeleri: Dict[str, float]
+
+
+class BeklemeSuresiSonucu(TypedDict, total=False):
+    """AnalizMotoru.bekleme_suresi_gruplari çıktısı (grup başına, saat cinsinden)"""
+
+    vaka_sayisi: int
+    ortalama_saat: float
+    medyan_saat: float
+    min_saat: float
+    max_saat: float
+    threshold_analizi: Dict[str, int]  # Sadece "Yer Ayarlandı" için
+
+
+class SureIstatistikleri(TypedDict, total=False):
+    """VeriIsleme.sure_istatistiklerini_hesapla çıktısı (dakika/saat)"""
+
+    toplam_vaka: int
+    tamamlanan_vaka: int
+    bekleyen_vaka: int
+    yer_bulma_suresi: Dict[str, float]
+    bekleme_suresi: Dict[str, float]
+    klinik_bazinda: Dict[str, Dict[str, float]]
+    hata: str
+
+
+class KlinikAnaliziOzeti(TypedDict, total=False):
+    """Klinik dağılım analizinin rapora yazılan hali (DataFrame içermez)"""
+
+    grup_adi: str
+    toplam_vaka: int
+    toplam_klinik: int
+    klinik_sayimlari: Dict[str, int]
+    klinik_yuzdeleri: Dict[str, float]
+    vaka_durum_analizi: Dict[str, Dict[str, int]]
+    bekleme_analizi: Dict[str, Dict[str, float]]
+    filtrelenmis_veri_dosyasi: str  # Rapor klasörüne göre parquet yolu
+    filtrelenmis_satir_sayisi: int
+
+
+class GrupMetrikleri(TypedDict, total=False):
+    """Bir il grubu × vaka tipi kombinasyonunun metrikleri"""
+
+    vaka_durumu: VakaDurumuSonucu
+    sure_analizleri: SureIstatistikleri
+    iptal_bekleme_suresi: BeklemeSuresiSonucu
+    yer_ayarlandi_bekleme_suresi: BeklemeSuresiSonucu
+    klinik_analizi: KlinikAnaliziOzeti
+
+
+class GrafikOnbellegiSayaclari(TypedDict, total=False):
+    """GrafikZamanlayici.onbellek_istatistikleri çıktısı"""
+
+    aktif: bool
+    isabet: int  # Önbellekten alınan grafik işi
+    iskalama: int  # Yeniden çizilen grafik işi
+    tahliye_edilen: int
+    depo_boyutu_mb: float
+
+
+class GunlukRapor(TypedDict, total=False):
+    """kapsamli_gunluk_analiz_{gun}.json içeriği"""
+
+    analiz_tarihi: str
+    analiz_zamani: str
+    toplam_vaka_sayisi: int
+    il_gruplari: Dict[str, Dict[str, GrupMetrikleri]]
+    genel_istatistikler: Dict[str, float]
+    sure_analizleri: SureIstatistikleri
+    oluşturulan_grafikler: List[str]
+    grafik_onbellegi: GrafikOnbellegiSayaclari
+    rapor_dizin: str
+    pdf_raporu: str
@@ -0,0 +1,148 @@
+"""
+Görsel hazırlayıcı modülü - PDF'e gömülecek grafikleri yerleşim boyutuna küçültür
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image as PILImage
+    from PIL import ImageChops, ImageStat
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+from ..core.config import PDF_GORSEL_AYARLARI
+from ..core.icerik_deposu import dosya_ozeti, lru_tahliye
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+
+class GorselHazirlayici:
+    """
+    PDF'e gömülecek PNG grafikleri hazırlar.
+
+    Aynı içerikli dosyalar (içerik özetine göre) listeye bir kez alınır.
+    Yerleşim boyutundan büyük görseller hedef_dpi'a küçültülür, tamamen
+    opak RGBA görseller RGB'ye çevrilir ve renk sapması sınırın altında
+    kalıyorsa 256 renkli paletli PNG'ye dönüştürülür. Hazırlanan görseller
+    kaynak özeti ve ayarlarla adlandırılarak saklanır; grafik önbelleğinden
+    gelen aynı grafikler sonraki raporlarda yeniden işlenmez.
+    """
+
+    def __init__(self, ayarlar: Optional[Dict] = None):
+        """Görsel hazırlayıcı başlatma"""
+        self.ayarlar = ayarlar if ayarlar is not None else PDF_GORSEL_AYARLARI
+        self.dizin = Path(self.ayarlar["dizin"])
+        self.max_boyut = int(self.ayarlar.get("max_boyut_mb", 128) * 1024 * 1024)
+        self.dizin.mkdir(parents=True, exist_ok=True)
+
+    def tekrarlari_ele(self, yollar: List[str]) -> List[Tuple[str, Optional[str]]]:
+        """
+        Aynı içerikli dosyaları eler
+
+        Returns:
+            (yol, içerik özeti) çiftleri; okunamayan dosyanın özeti None
+            (grid bu dosya için "bulunamadı" notunu gösterir)
+        """
+        sonuc = []
+        gorulenler = set()
+        for yol in yollar:
+            try:
+                ozet = dosya_ozeti(Path(yol))
+            except OSError:
+                sonuc.append((yol, None))
+                continue
+
+            if ozet in gorulenler:
+                logger.info(f"Aynı içerikli grafik atlandı: {Path(yol).name}")
+                continue
+            gorulenler.add(ozet)
+            sonuc.append((yol, ozet))
+        return sonuc
+
+    def hazir_yolu(self, yol: str, ozet: Optional[str], genislik: float, yukseklik: float) -> str:
+        """
+        Görseli PDF yerleşimi için hazırlar
+
+        Args:
+            yol: Orijinal PNG yolu
+            ozet: tekrarlari_ele()'den gelen içerik özeti
+            genislik, yukseklik: PDF'teki yerleşim kutusu (punto)
+
+        Returns:
+            Gömülecek görselin yolu (hazırlanamazsa orijinal yol)
+        """
+        if ozet is None or not PIL_AVAILABLE:
+            return yol
+
+        hedef_dpi = self.ayarlar.get("hedef_dpi", 200)
+        max_piksel = (
+            max(1, round(genislik / 72 * hedef_dpi)),
+            max(1, round(yukseklik / 72 * hedef_dpi)),
+        )
+        try:
+            return str(self._gorsel_hazirla(Path(yol), ozet, max_piksel))
+        except Exception as e:
+            logger.warning(f"Görsel hazırlanamadı, olduğu gibi gömülecek ({yol}): {e}")
+            return yol
+
+    def _gorsel_hazirla(self, kaynak: Path, ozet: str, max_piksel: Tuple[int, int]) -> Path:
+        """Tek görseli küçültür / dönüştürür; hazırlanmışsa saklananı döndürür"""
+        palet = self.ayarlar.get("palet", True)
+        max_sapma = self.ayarlar.get("max_palet_sapmasi", 1.0)
+        anahtar = hashlib.sha256(
+            f"{ozet}:{max_piksel}:{palet}:{max_sapma}".encode()
+        ).hexdigest()
+        hedef = self.dizin / f"{anahtar}.png"
+        if hedef.exists():
+            os.utime(hedef)  # LRU için son kullanım zamanı
+            return hedef
+
+        with PILImage.open(kaynak) as gorsel:
+            gorsel.load()
+            if gorsel.mode in ("RGBA", "LA") or "transparency" in gorsel.info:
+                gorsel = gorsel.convert("RGBA")
+                alfa = gorsel.getchannel("A")
+                if alfa.getextrema() == (255, 255):
+                    gorsel = gorsel.convert("RGB")
+                else:
+                    # Sayfa beyaz olduğundan saydam alanlar beyaza oturtulur
+                    zemin = PILImage.new("RGB", gorsel.size, "white")
+                    zemin.paste(gorsel, mask=alfa)
+                    gorsel = zemin
+            elif gorsel.mode != "RGB":
+                gorsel = gorsel.convert("RGB")
+
+            gorsel.thumbnail(max_piksel, PILImage.LANCZOS, reducing_gap=3.0)
+
+            if palet:
+                paletli = gorsel.quantize(
+                    256, method=PILImage.Quantize.MEDIANCUT, dither=PILImage.Dither.NONE
+                )
+                fark = ImageChops.difference(gorsel, paletli.convert("RGB"))
+                if max(ImageStat.Stat(fark).mean) <= max_sapma:
+                    gorsel = paletli
+
+            gecici = hedef.with_suffix(f".{os.getpid()}.tmp")
+            gorsel.save(gecici, format="PNG")
+            os.replace(gecici, hedef)
+
+        return hedef
+
+    def tahliye_et(self) -> int:
+        """Klasör boyut sınırını aşıyorsa en eski kullanılan görselleri siler"""
+        try:
+            silinen = lru_tahliye(self.dizin.glob("*.png"), self.max_boyut)
+            if silinen:
+                logger.info(f"PDF görsel önbelleğinden {silinen} dosya tahliye edildi")
+            return silinen
+
+        except Exception as e:
+            logger.warning(f"PDF görsel önbelleği tahliye hatası: {e}")
+            return 0
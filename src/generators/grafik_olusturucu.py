@@ -6,12 +6,14 @@ import logging
 import pandas as pd
 import matplotlib
 matplotlib.use('Agg')  # GUI olmayan backend
-import matplotlib.pyplot as plt
+import matplotlib.style
+from matplotlib.figure import Figure
 import seaborn as sns
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any
 
+from ..core.ayar_servisi import pdf_config_dosyasi
 from ..core.config import (
     RAPOR_DIZIN,
     VARSAYILAN_GRAFIK_BOYUTU,
@@ -21,54 +23,32 @@ from ..core.config import (
     PASTA_GRAFIK_RENK_PALETI,
     GRUP_ADI_CEVIRI,
 )
+from ..utils.figur import figur_kaydet, figur_olustur
+from .izgara_birlestirici import grafikleri_izgaraya_yaz, pdf_sayfalarini_yan_yana_yaz
+from ..utils.veri_tipleri import deger_sayimi
 
 # Logger yapılandırması
 logger = logging.getLogger(__name__)
 
 # Grafik ayarları
-plt.style.use("default")
+matplotlib.style.use("default")
 sns.set_palette("husl")
 
 
 class GrafikOlusturucu:
     def pdf_sayfalari_yatay_birlestir(self, pdf_path: str, cikti_pdf: str = None):
         """
-        Mevcut PDF raporundaki tüm sayfaları yatay A4 formatında tek bir sayfada birleştirir.
+        Mevcut PDF raporundaki tüm sayfaları yatay olarak tek bir sayfada birleştirir.
         """
-        from pdf2image import convert_from_path
-        from PIL import Image
-        from fpdf import FPDF
         import os
-        # PDF'i görsellere çevir
-        sayfa_gorselleri = convert_from_path(pdf_path, dpi=200)
-        # Yatay grid için toplam genişlik ve maksimum yükseklik
-        toplam_genislik = sum(img.width for img in sayfa_gorselleri)
-        max_yukseklik = max(img.height for img in sayfa_gorselleri)
-        # Grid görseli oluştur
-        grid_img = Image.new("RGB", (toplam_genislik, max_yukseklik), (255, 255, 255))
-        x_offset = 0
-        for img in sayfa_gorselleri:
-            grid_img.paste(img, (x_offset, 0))
-            x_offset += img.width
-        # Geçici olarak kaydet
-        grid_jpg = os.path.splitext(pdf_path)[0] + "_yatay_grid.jpg"
-        grid_img.save(grid_jpg)
-        # PDF olarak kaydet
         if cikti_pdf is None:
             cikti_pdf = os.path.splitext(pdf_path)[0] + "_yatay.pdf"
-        pdf = FPDF(orientation="L", unit="pt", format=[grid_img.width, grid_img.height])
-        pdf.add_page()
-        pdf.image(grid_jpg, x=0, y=0, w=grid_img.width, h=grid_img.height)
-        pdf.output(cikti_pdf)
-        return cikti_pdf
+        return str(pdf_sayfalarini_yan_yana_yaz(pdf_path, cikti_pdf))
     def tum_grafikleri_pdfde_birlestir(self, gun_tarihi: str, pdf_adi: str = None):
         """
         Belirtilen tarih klasöründeki tüm grafik ve tablo görsellerini yatay bir gridde birleştirip tek sayfa PDF olarak kaydeder.
         """
         import glob
-        from PIL import Image
-        from fpdf import FPDF
-        import math
         # Grafik klasörünü bul
         tarih_klasor = self._tarih_klasoru_olustur(gun_tarihi)
         # PNG dosyalarını topla (alfabetik sıralı)
@@ -76,41 +56,10 @@ class GrafikOlusturucu:
         if not png_listesi:
             logger.warning(f"{gun_tarihi} için grafik bulunamadı.")
             return None
-        # Görselleri aç
-        img_list = [Image.open(png).convert("RGB") for png in png_listesi]
-        # Grid ayarları: 2 satır, n/2 sütun (çok fazla grafik varsa)
-        n = len(img_list)
-        grid_cols = min(n, 4)  # max 4 sütun
-        grid_rows = math.ceil(n / grid_cols)
-        thumb_width = 800
-        thumb_height = 600
-        # Tüm görselleri aynı boyuta getir
-        img_list = [img.resize((thumb_width, thumb_height)) for img in img_list]
-        grid_img = Image.new("RGB", (grid_cols * thumb_width, grid_rows * thumb_height), (255, 255, 255))
-        for idx, img in enumerate(img_list):
-            x = (idx % grid_cols) * thumb_width
-            y = (idx // grid_cols) * thumb_height
-            grid_img.paste(img, (x, y))
-        # Geçici olarak kaydet
-        grid_path = tarih_klasor / "tum_grafikler_grid.jpg"
-        grid_img.save(grid_path)
-        # PDF oluştur (A4 yatay)
+        # Grafikler tek tek küçültülerek doğrudan PDF'e yazılır (A4 yatay, max 4 sütun)
         if pdf_adi is None:
             pdf_adi = f"tum_grafikler_{gun_tarihi}.pdf"
-        pdf_path = tarih_klasor / pdf_adi
-        pdf = FPDF(orientation="L", unit="mm", format="A4")
-        pdf.add_page()
-        # Görseli PDF'e ortala ve sığdır
-        page_w = pdf.w - 20
-        page_h = pdf.h - 20
-        img_w, img_h = grid_img.size
-        scale = min(page_w / img_w, page_h / img_h)
-        w = img_w * scale
-        h = img_h * scale
-        x = (pdf.w - w) / 2
-        y = (pdf.h - h) / 2
-        pdf.image(str(grid_path), x=x, y=y, w=w, h=h)
-        pdf.output(str(pdf_path))
+        pdf_path = grafikleri_izgaraya_yaz(png_listesi, tarih_klasor / pdf_adi)
         logger.info(f"Tüm grafikler ve tablolar tek PDF sayfasında grid olarak birleştirildi: {pdf_path}")
         return pdf_path
     """Tüm grafik oluşturma işlemleri"""
@@ -187,7 +136,7 @@ class GrafikOlusturucu:
                 return None
 
             # İptal eden sayımları (boş değerleri hariç tut)
-            iptal_eden_sayimlari = iptal_vakalar["i̇ptal eden"].dropna().value_counts()
+            iptal_eden_sayimlari = deger_sayimi(iptal_vakalar["i̇ptal eden"].dropna())
 
             if iptal_eden_sayimlari.empty:
                 logger.warning(f"İptal eden verisi bulunamadı: {grup_adi}")
@@ -202,7 +151,8 @@ class GrafikOlusturucu:
             colors = cm.Set3(range(len(top_iptal_eden)))
 
             # Tek çubuk stacked grafik oluştur
-            fig, ax = plt.subplots(figsize=(12, 6))
+            fig = figur_olustur(figsize=(12, 6))
+            ax = fig.subplots()
 
             # Kümülatif değerler için başlangıç
             left = 0
@@ -244,14 +194,13 @@ class GrafikOlusturucu:
             ax.set_axisbelow(True)
 
             # Layout ayarla
-            plt.tight_layout()
+            fig.tight_layout()
 
             # Dosya adını oluştur ve kaydet
             dosya_adi = f"iptal-eden-dagilimi_{bolge_adi}_{gun_tarihi}.png"
             tarih_klasor = self._tarih_klasoru_olustur(gun_tarihi)
             dosya_yolu = tarih_klasor / dosya_adi
-            plt.savefig(dosya_yolu, dpi=300, bbox_inches="tight")
-            plt.close()
+            figur_kaydet(fig, dosya_yolu, dpi=300)
 
             logger.info(f"İptal eden stacked çubuk grafiği oluşturuldu: {dosya_yolu}")
             return dosya_yolu
@@ -286,7 +235,7 @@ class GrafikOlusturucu:
                 return None
 
             # İptal eden sayımları (boş değerleri hariç tut)
-            iptal_eden_sayimlari = iptal_vakalar["i̇ptal eden"].dropna().value_counts()
+            iptal_eden_sayimlari = deger_sayimi(iptal_vakalar["i̇ptal eden"].dropna())
 
             if len(iptal_eden_sayimlari) == 0:
                 logger.warning(f"İptal eden verisi bulunamadı: {grup_adi}")
@@ -300,26 +249,27 @@ class GrafikOlusturucu:
                 )
                 return None
 
-            plt.figure(figsize=VARSAYILAN_GRAFIK_BOYUTU)
+            fig = figur_olustur(figsize=VARSAYILAN_GRAFIK_BOYUTU)
+            ax = fig.add_subplot()
 
             # Yatay çubuk grafiği oluştur
-            bars = plt.barh(
+            bars = ax.barh(
                 range(len(iptal_eden_sayimlari)),
                 iptal_eden_sayimlari.values,
                 color=PASTA_GRAFIK_RENK_PALETI[: len(iptal_eden_sayimlari)],
             )
 
             # Y ekseni etiketlerini ayarla
-            plt.yticks(range(len(iptal_eden_sayimlari)), iptal_eden_sayimlari.index)
+            ax.set_yticks(range(len(iptal_eden_sayimlari)), iptal_eden_sayimlari.index)
 
             # Çubukların üzerine sayıları yaz
             for i, (kurum, sayi) in enumerate(iptal_eden_sayimlari.items()):
-                plt.text(sayi + 0.1, i, str(sayi), va="center", fontweight="bold")
+                ax.text(sayi + 0.1, i, str(sayi), va="center", fontweight="bold")
 
             # Grup adını çevir
             bolge_adi = GRUP_ADI_CEVIRI.get(grup_adi, grup_adi)
 
-            plt.title(
+            ax.set_title(
                 f"İptal Eden Kurumlar - {bolge_adi}\n"
                 f"Toplam: {iptal_eden_sayimlari.sum()} vaka",
                 fontsize=14,
@@ -327,13 +277,13 @@ class GrafikOlusturucu:
                 pad=20,
             )
 
-            plt.xlabel("Vaka Sayısı", fontweight="bold")
-            plt.ylabel("İptal Eden Kurum", fontweight="bold")
-            plt.grid(True, alpha=0.3, axis="x")
-            plt.tight_layout()
+            ax.set_xlabel("Vaka Sayısı", fontweight="bold")
+            ax.set_ylabel("İptal Eden Kurum", fontweight="bold")
+            ax.grid(True, alpha=0.3, axis="x")
+            fig.tight_layout()
 
             # Tarih ekle
-            self._grafige_tarih_ekle(plt, gun_tarihi)
+            self._grafige_tarih_ekle(fig, gun_tarihi)
 
             # Kaydet
             tarih_klasor = self._tarih_klasoru_olustur(gun_tarihi)
@@ -344,10 +294,9 @@ class GrafikOlusturucu:
             )
 
             # Metin ekle (config'den)
-            self._grafige_metin_ekle(plt, str(dosya_adi), gun_tarihi)
+            self._grafige_metin_ekle(fig, str(dosya_adi), gun_tarihi)
 
-            plt.savefig(dosya_adi, dpi=VARSAYILAN_DPI, bbox_inches="tight")
-            plt.close()
+            figur_kaydet(fig, dosya_adi, dpi=VARSAYILAN_DPI)
 
             logger.info(f"İptal eden çubuk grafiği oluşturuldu: {dosya_adi}")
             return dosya_adi
@@ -360,7 +309,8 @@ class GrafikOlusturucu:
         """Pasta grafiği oluşturur - hem sayı hem yüzde gösterir"""
         import os
         try:
-            plt.figure(figsize=VARSAYILAN_GRAFIK_BOYUTU)
+            fig = figur_olustur(figsize=VARSAYILAN_GRAFIK_BOYUTU)
+            ax = fig.add_subplot()
 
             # En çok 10 kategori göster
             if len(veriler) > 10:
@@ -382,7 +332,7 @@ class GrafikOlusturucu:
             # Gelişmiş renk paleti kullan
             colors = PASTA_GRAFIK_RENK_PALETI[: len(veriler)]
 
-            plt.pie(
+            ax.pie(
                 veriler.values,
                 labels=veriler.index,
                 autopct=autopct_format,
@@ -390,8 +340,8 @@ class GrafikOlusturucu:
                 textprops={"fontsize": 9},
                 colors=colors,
             )
-            plt.title(baslik, fontsize=14, fontweight="bold")
-            plt.axis("equal")
+            ax.set_title(baslik, fontsize=14, fontweight="bold")
+            ax.axis("equal")
 
             # Tarih bilgisini parametre veya dosya adından çıkar
             if gun_tarihi is None:
@@ -402,10 +352,9 @@ class GrafikOlusturucu:
             dosya_yolu = tarih_klasor / dosya_adi
 
             # Metin ekle (config'den)
-            self._grafige_metin_ekle(plt, str(dosya_yolu), gun_tarihi)
+            self._grafige_metin_ekle(fig, str(dosya_yolu), gun_tarihi)
 
-            plt.savefig(dosya_yolu, dpi=VARSAYILAN_DPI, bbox_inches="tight")
-            plt.close()
+            figur_kaydet(fig, dosya_yolu, dpi=VARSAYILAN_DPI)
 
             # Dosya gerçekten oluştu mu kontrol et
             if not os.path.exists(dosya_yolu):
@@ -419,7 +368,7 @@ class GrafikOlusturucu:
             logger.error(f"Pasta grafiği oluşturma hatası: {e} (dosya: {dosya_adi}, veri boyutu: {len(veriler)})")
             return None
 
-    def _grafige_tarih_ekle(self, plt_obj, gun_tarihi: str):
+    def _grafige_tarih_ekle(self, fig: Figure, gun_tarihi: str):
         """Grafiklere tarih bilgisi ekler"""
         try:
             if not GRAFIK_GORUNUM_AYARLARI.get("tarih_goster", True):
@@ -446,7 +395,7 @@ class GrafikOlusturucu:
                 x, y = 0.02, 0.98
                 ha, va = "left", "top"
 
-            plt_obj.figtext(
+            fig.text(
                 x,
                 y,
                 f"Tarih: {tarih_text}",
@@ -583,7 +532,7 @@ class GrafikOlusturucu:
                 return None
 
             # Solunum işlemi sayımları (boş değerleri hariç tut)
-            solunum_sayimlari = gecerli_vakalar[solunum_sutun].dropna().value_counts()
+            solunum_sayimlari = deger_sayimi(gecerli_vakalar[solunum_sutun].dropna())
 
             if len(solunum_sayimlari) == 0:
                 logger.warning(f"Solunum işlemi verisi bulunamadı: {grup_adi}")
@@ -643,7 +592,7 @@ class GrafikOlusturucu:
 
             # İptal nedeni sayımları (boş değerleri hariç tut)
             iptal_nedeni_sayimlari = (
-                iptal_vakalar[iptal_nedeni_sutun].dropna().value_counts()
+                deger_sayimi(iptal_vakalar[iptal_nedeni_sutun].dropna())
             )
 
             if len(iptal_nedeni_sayimlari) == 0:
@@ -651,10 +600,11 @@ class GrafikOlusturucu:
                 return None
 
             # Çubuk grafik oluştur
-            plt.figure(figsize=VARSAYILAN_GRAFIK_BOYUTU)
+            fig = figur_olustur(figsize=VARSAYILAN_GRAFIK_BOYUTU)
+            ax = fig.add_subplot()
             renkler = PASTA_GRAFIK_RENK_PALETI[: len(iptal_nedeni_sayimlari)]
 
-            bars = plt.bar(
+            bars = ax.bar(
                 range(len(iptal_nedeni_sayimlari)),
                 iptal_nedeni_sayimlari.values,
                 color=renkler,
@@ -663,7 +613,7 @@ class GrafikOlusturucu:
             # Sayıları çubukların üzerinde göster
             for bar, sayi in zip(bars, iptal_nedeni_sayimlari.values):
                 height = bar.get_height()
-                plt.text(
+                ax.text(
                     bar.get_x() + bar.get_width() / 2.0,
                     height + max(iptal_nedeni_sayimlari.values) * 0.01,
                     f"{sayi}",
@@ -672,20 +622,20 @@ class GrafikOlusturucu:
                     fontweight="bold",
                 )
 
-            plt.xticks(
+            ax.set_xticks(
                 range(len(iptal_nedeni_sayimlari)),
                 iptal_nedeni_sayimlari.index,
                 rotation=45,
                 ha="right",
             )
-            plt.ylabel("Vaka Sayısı", fontsize=12, fontweight="bold")
-            plt.grid(axis="y", alpha=0.3)
+            ax.set_ylabel("Vaka Sayısı", fontsize=12, fontweight="bold")
+            ax.grid(axis="y", alpha=0.3)
 
             # Grup adını Türkçe'ye çevir
             bolge_adi = GRUP_ADI_CEVIRI.get(grup_adi, grup_adi)
             vaka_tipi_adi = GRUP_ADI_CEVIRI.get(vaka_tipi, vaka_tipi)
 
-            plt.title(
+            ax.set_title(
                 f"İptal Nedenleri - {bolge_adi} - {vaka_tipi_adi}\n"
                 f"Toplam: {iptal_nedeni_sayimlari.sum()} vaka",
                 fontsize=14,
@@ -694,7 +644,7 @@ class GrafikOlusturucu:
             )
 
             # Tarih ekle
-            self._grafige_tarih_ekle(plt, gun_tarihi)
+            self._grafige_tarih_ekle(fig, gun_tarihi)
 
             # Kaydet
             tarih_klasor = self._tarih_klasoru_olustur(gun_tarihi)
@@ -706,35 +656,29 @@ class GrafikOlusturucu:
             )
 
             # Metin ekle (config'den)
-            self._grafige_metin_ekle(plt, str(dosya_adi), gun_tarihi)
+            self._grafige_metin_ekle(fig, str(dosya_adi), gun_tarihi)
 
-            plt.savefig(dosya_adi, dpi=VARSAYILAN_DPI, bbox_inches="tight")
-            plt.close()
+            figur_kaydet(fig, dosya_adi, dpi=VARSAYILAN_DPI)
 
             logger.info(f"İptal nedenleri çubuk grafiği oluşturuldu: {dosya_adi}")
             return dosya_adi
 
         except Exception as e:
             logger.error(f"İptal nedenleri çubuk grafiği hatası: {e}")
-            if "plt" in locals():
-                plt.close()
             return None
 
-    def _grafige_metin_ekle(self, plt_obj, dosya_adi: str, gun_tarihi: str):
+    @staticmethod
+    def _ozel_metin_desenleri_derle(config: Dict) -> list:
+        """grafik_metin_ayarlari.ozel_metinler desenlerini (metin parçası, ayar) listesine çevirir"""
+        ozel_metinler = config.get("grafik_metin_ayarlari", {}).get("ozel_metinler", {})
+        return [(desen.replace("*", ""), ayar) for desen, ayar in ozel_metinler.items()]
+
+    def _grafige_metin_ekle(self, fig: Figure, dosya_adi: str, gun_tarihi: str):
         """Grafiklere config'den gelen metinleri ekler"""
         try:
-            # PDF config dosyasını oku
-            import json
-            from pathlib import Path
-
-            config_dosya = Path(__file__).parent / "pdf_config.json"
-            if not config_dosya.exists():
-                return
-
-            with open(config_dosya, "r", encoding="utf-8") as f:
-                config = json.load(f)
-
-            metin_ayarlari = config.get("grafik_metin_ayarlari", {})
+            # PDF config (proje kökündeki pdf_config.json, paylaşılan önbellekten)
+            ayar_dosyasi = pdf_config_dosyasi()
+            metin_ayarlari = ayar_dosyasi.oku().get("grafik_metin_ayarlari", {})
 
             # Metin ekleme aktif mi?
             if not metin_ayarlari.get("metin_ekleme_aktif", False):
@@ -743,13 +687,11 @@ class GrafikOlusturucu:
             # Dosya adından grafik tipini belirle
             dosya_adi_base = Path(dosya_adi).stem
 
-            # Özel metin var mı kontrol et
-            ozel_metinler = metin_ayarlari.get("ozel_metinler", {})
+            # Özel metin var mı kontrol et (basit wildcard: "*" kaldırılıp içerme)
             metin_config = None
-
-            for desen, config_item in ozel_metinler.items():
-                # Basit wildcard eşleşmesi
-                desen_temiz = desen.replace("*", "")
+            for desen_temiz, config_item in ayar_dosyasi.turet(
+                "ozel_metin_desenleri", self._ozel_metin_desenleri_derle
+            ):
                 if desen_temiz in dosya_adi_base:
                     metin_config = config_item
                     break
@@ -780,7 +722,6 @@ class GrafikOlusturucu:
             metin_rengi = metin_ayarlari.get("metin_rengi", "#333333")
 
             # Grafik boyutlarını al
-            fig = plt_obj.gcf()
             fig_width, fig_height = fig.get_size_inches()
 
             # Metin konumunu belirle
@@ -792,7 +733,7 @@ class GrafikOlusturucu:
                 va = "bottom"
 
             # Metni ekle
-            plt_obj.figtext(
+            fig.text(
                 x,
                 y,
                 metin,
@@ -811,11 +752,11 @@ class GrafikOlusturucu:
             )
 
             # Layout'u ayarla ki metin kesilmesin
-            plt_obj.tight_layout()
+            fig.tight_layout()
             if konum == "alt":
-                plt_obj.subplots_adjust(bottom=0.15)
+                fig.subplots_adjust(bottom=0.15)
             else:
-                plt_obj.subplots_adjust(top=0.85)
+                fig.subplots_adjust(top=0.85)
 
         except Exception as e:
             logger.warning(f"Grafik metin ekleme hatası: {e}")
@@ -864,7 +805,7 @@ class GrafikOlusturucu:
 
                 # İptal eden sayımları
                 iptal_eden_sayimlari = (
-                    iptal_vakalar["i̇ptal eden"].dropna().value_counts()
+                    deger_sayimi(iptal_vakalar["i̇ptal eden"].dropna())
                 )
 
                 # KKM ve Gönderen sayılarını hesapla
@@ -888,7 +829,8 @@ class GrafikOlusturucu:
                 return None
 
             # Grafik oluştur
-            fig, ax = plt.subplots(figsize=(14, 10))
+            fig = figur_olustur(figsize=(14, 10))
+            ax = fig.subplots()
 
             # Veri hazırlama - STACKED BAR İÇİN
             il_ici_degerler = [
@@ -1002,14 +944,13 @@ class GrafikOlusturucu:
                 bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.8),
             )
 
-            plt.tight_layout()
+            fig.tight_layout()
 
             # Dosya kayıt
             dosya_adi = f"iptal-eden-kurumlar_{gun_tarihi}.png"
             tarih_klasor = self._tarih_klasoru_olustur(gun_tarihi)
             dosya_yolu = tarih_klasor / dosya_adi
-            plt.savefig(dosya_yolu, dpi=300, bbox_inches="tight")
-            plt.close()
+            figur_kaydet(fig, dosya_yolu, dpi=300)
 
             logger.info(f"İptal eden karşılaştırma grafiği oluşturuldu: {dosya_yolu}")
             return dosya_yolu
@@ -1045,42 +986,42 @@ class GrafikOlusturucu:
                 
             sureler = tamamlanan['yer_bulma_sure_dk']
             
-            plt.figure(figsize=(12, 8))
+            fig = figur_olustur(figsize=(12, 8))
+            ax = fig.add_subplot()
             
             # Histogram oluştur
-            plt.hist(sureler, bins=20, alpha=0.7, color='skyblue', edgecolor='black')
+            ax.hist(sureler, bins=20, alpha=0.7, color='skyblue', edgecolor='black')
             
             # Ortalama çizgisi ekle
             ortalama = sureler.mean()
-            plt.axvline(ortalama, color='red', linestyle='--', linewidth=2, 
+            ax.axvline(ortalama, color='red', linestyle='--', linewidth=2, 
                        label=f'Ortalama: {ortalama:.1f} dk')
             
             # Medyan çizgisi ekle
             medyan = sureler.median()
-            plt.axvline(medyan, color='green', linestyle='--', linewidth=2,
+            ax.axvline(medyan, color='green', linestyle='--', linewidth=2,
                        label=f'Medyan: {medyan:.1f} dk')
             
-            plt.xlabel('Yer Bulma Süresi (Dakika)')
-            plt.ylabel('Vaka Sayısı')
-            plt.title(f'Yer Bulma Süresi Dağılımı - {gun_tarihi}')
-            plt.legend()
-            plt.grid(True, alpha=0.3)
+            ax.set_xlabel('Yer Bulma Süresi (Dakika)')
+            ax.set_ylabel('Vaka Sayısı')
+            ax.set_title(f'Yer Bulma Süresi Dağılımı - {gun_tarihi}')
+            ax.legend()
+            ax.grid(True, alpha=0.3)
             
             # İstatistik bilgisi ekle
             textstr = f'Toplam Vaka: {len(sureler)}\nMin: {sureler.min():.1f} dk\nMax: {sureler.max():.1f} dk'
             props = dict(boxstyle='round', facecolor='wheat', alpha=0.5)
-            plt.text(0.02, 0.98, textstr, transform=plt.gca().transAxes, fontsize=10,
+            ax.text(0.02, 0.98, textstr, transform=ax.transAxes, fontsize=10,
                     verticalalignment='top', bbox=props)
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             # Dosya kayıt
             ek_adi = f"_{grafik_adi}" if grafik_adi else ""
             dosya_adi = f"yer-bulma-sure-histogram{ek_adi}_{gun_tarihi}.png"
             tarih_klasor = self._tarih_klasoru_olustur(gun_tarihi)
             dosya_yolu = tarih_klasor / dosya_adi
-            plt.savefig(dosya_yolu, dpi=300, bbox_inches="tight")
-            plt.close()
+            figur_kaydet(fig, dosya_yolu, dpi=300)
             
             logger.info(f"Yer bulma süresi histogramı oluşturuldu: {dosya_yolu}")
             return str(dosya_yolu)
@@ -1110,7 +1051,7 @@ class GrafikOlusturucu:
                 logger.warning("Klinik karşılaştırma için tamamlanmış vaka bulunamadı")
                 return None
             
-            klinik_sure = tamamlanan.groupby('nakledilmesi i̇stenen klinik')['yer_bulma_sure_dk'].agg([
+            klinik_sure = tamamlanan.groupby('nakledilmesi i̇stenen klinik', observed=True)['yer_bulma_sure_dk'].agg([
                 'mean', 'median', 'count'
             ]).sort_values('mean', ascending=True)
             
@@ -1121,37 +1062,37 @@ class GrafikOlusturucu:
                 logger.warning("Yeterli veri olan klinik bulunamadı")
                 return None
             
-            plt.figure(figsize=(14, 8))
+            fig = figur_olustur(figsize=(14, 8))
+            ax = fig.add_subplot()
             
             # Bar grafik oluştur
             y_pos = range(len(klinik_sure))
-            bars = plt.barh(y_pos, klinik_sure['mean'], alpha=0.7, 
+            bars = ax.barh(y_pos, klinik_sure['mean'], alpha=0.7, 
                            color='lightcoral', label='Ortalama')
             
             # Medyan noktaları ekle
-            plt.scatter(klinik_sure['median'], y_pos, color='darkblue', 
+            ax.scatter(klinik_sure['median'], y_pos, color='darkblue', 
                        s=50, label='Medyan', zorder=5)
             
             # Vaka sayısını bar üzerine yaz
             for i, (bar, count) in enumerate(zip(bars, klinik_sure['count'])):
-                plt.text(bar.get_width() + 5, bar.get_y() + bar.get_height()/2,
+                ax.text(bar.get_width() + 5, bar.get_y() + bar.get_height()/2,
                         f'{int(count)} vaka', va='center', ha='left', fontsize=9)
             
-            plt.yticks(y_pos, klinik_sure.index)
-            plt.xlabel('Ortalama Yer Bulma Süresi (Dakika)')
-            plt.ylabel('Klinik')
-            plt.title(f'Klinik Bazında Yer Bulma Süreleri - {gun_tarihi}')
-            plt.legend()
-            plt.grid(True, alpha=0.3, axis='x')
+            ax.set_yticks(y_pos, klinik_sure.index)
+            ax.set_xlabel('Ortalama Yer Bulma Süresi (Dakika)')
+            ax.set_ylabel('Klinik')
+            ax.set_title(f'Klinik Bazında Yer Bulma Süreleri - {gun_tarihi}')
+            ax.legend()
+            ax.grid(True, alpha=0.3, axis='x')
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             # Dosya kayıt
             dosya_adi = f"klinik-sure-karsilastirma_{gun_tarihi}.png"
             tarih_klasor = self._tarih_klasoru_olustur(gun_tarihi)
             dosya_yolu = tarih_klasor / dosya_adi
-            plt.savefig(dosya_yolu, dpi=300, bbox_inches="tight")
-            plt.close()
+            figur_kaydet(fig, dosya_yolu, dpi=300)
             
             logger.info(f"Klinik süre karşılaştırma grafiği oluşturuldu: {dosya_yolu}")
             return str(dosya_yolu)
@@ -1180,53 +1121,53 @@ class GrafikOlusturucu:
                 logger.warning("Bekleyen vaka bulunamadı")
                 return None
             
-            plt.figure(figsize=(12, 10))
+            fig = figur_olustur(figsize=(12, 10))
             
             # 2x2 subplot oluştur
-            plt.subplot(2, 2, 1)
+            ax = fig.add_subplot(2, 2, 1)
             # Histogram
-            plt.hist(bekleyen['bekleme_sure_dk'], bins=15, alpha=0.7, 
+            ax.hist(bekleyen['bekleme_sure_dk'], bins=15, alpha=0.7, 
                     color='orange', edgecolor='black')
-            plt.xlabel('Bekleme Süresi (Dakika)')
-            plt.ylabel('Vaka Sayısı')
-            plt.title('Bekleme Süresi Dağılımı')
-            plt.grid(True, alpha=0.3)
+            ax.set_xlabel('Bekleme Süresi (Dakika)')
+            ax.set_ylabel('Vaka Sayısı')
+            ax.set_title('Bekleme Süresi Dağılımı')
+            ax.grid(True, alpha=0.3)
             
             # Box plot
-            plt.subplot(2, 2, 2)
-            plt.boxplot(bekleyen['bekleme_sure_dk'])
-            plt.ylabel('Bekleme Süresi (Dakika)')
-            plt.title('Bekleme Süresi Box Plot')
-            plt.grid(True, alpha=0.3)
+            ax = fig.add_subplot(2, 2, 2)
+            ax.boxplot(bekleyen['bekleme_sure_dk'])
+            ax.set_ylabel('Bekleme Süresi (Dakika)')
+            ax.set_title('Bekleme Süresi Box Plot')
+            ax.grid(True, alpha=0.3)
             
             # Klinik bazında bekleme
             if 'nakledilmesi i̇stenen klinik' in bekleyen.columns:
-                klinik_bekleme = bekleyen.groupby('nakledilmesi i̇stenen klinik')['bekleme_sure_dk'].agg([
+                klinik_bekleme = bekleyen.groupby('nakledilmesi i̇stenen klinik', observed=True)['bekleme_sure_dk'].agg([
                     'mean', 'count'
                 ]).sort_values('mean', ascending=False)
                 
                 # En az 1 vaka olan ilk 10 klinik
                 klinik_bekleme = klinik_bekleme[klinik_bekleme['count'] >= 1].head(10)
                 
-                plt.subplot(2, 2, 3)
+                ax = fig.add_subplot(2, 2, 3)
                 if not klinik_bekleme.empty:
-                    bars = plt.bar(range(len(klinik_bekleme)), klinik_bekleme['mean'], 
+                    bars = ax.bar(range(len(klinik_bekleme)), klinik_bekleme['mean'], 
                                   alpha=0.7, color='salmon')
-                    plt.xticks(range(len(klinik_bekleme)), klinik_bekleme.index, 
+                    ax.set_xticks(range(len(klinik_bekleme)), klinik_bekleme.index, 
                               rotation=45, ha='right')
-                    plt.ylabel('Ortalama Bekleme (dk)')
-                    plt.title('Klinik Bazında Bekleme Süreleri')
-                    plt.grid(True, alpha=0.3)
+                    ax.set_ylabel('Ortalama Bekleme (dk)')
+                    ax.set_title('Klinik Bazında Bekleme Süreleri')
+                    ax.grid(True, alpha=0.3)
                     
                     # Vaka sayısını bar üzerine yaz
                     for bar, count in zip(bars, klinik_bekleme['count']):
-                        plt.text(bar.get_x() + bar.get_width()/2, 
+                        ax.text(bar.get_x() + bar.get_width()/2, 
                                 bar.get_height() + 5, f'{int(count)}',
                                 ha='center', va='bottom', fontsize=8)
             
             # Genel istatistikler
-            plt.subplot(2, 2, 4)
-            plt.axis('off')
+            ax = fig.add_subplot(2, 2, 4)
+            ax.axis('off')
             stats_text = f"""Bekleyen Vaka İstatistikleri:
             
 Toplam Bekleyen: {len(bekleyen)}
@@ -1237,19 +1178,18 @@ Max Bekleme: {bekleyen['bekleme_sure_dk'].max():.1f} dk
 
 En Uzun Bekleyen: {bekleyen['bekleme_sure_dk'].max()/60:.1f} saat
 """
-            plt.text(0.1, 0.9, stats_text, transform=plt.gca().transAxes, 
+            ax.text(0.1, 0.9, stats_text, transform=ax.transAxes, 
                     fontsize=11, verticalalignment='top',
                     bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
             
-            plt.suptitle(f'Bekleme Durumu Analizi - {gun_tarihi}', fontsize=14)
-            plt.tight_layout()
+            fig.suptitle(f'Bekleme Durumu Analizi - {gun_tarihi}', fontsize=14)
+            fig.tight_layout()
             
             # Dosya kayıt
             dosya_adi = f"bekleme-durumu-analizi_{gun_tarihi}.png"
             tarih_klasor = self._tarih_klasoru_olustur(gun_tarihi)
             dosya_yolu = tarih_klasor / dosya_adi
-            plt.savefig(dosya_yolu, dpi=300, bbox_inches="tight")
-            plt.close()
+            figur_kaydet(fig, dosya_yolu, dpi=300)
             
             logger.info(f"Bekleme durumu analizi oluşturuldu: {dosya_yolu}")
             return str(dosya_yolu)
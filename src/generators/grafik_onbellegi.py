@@ -0,0 +1,292 @@
+"""
+Grafik önbelleği modülü - Girdisi değişmeyen grafikleri yeniden çizmeden sunar
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import matplotlib
+import numpy as np
+import pandas as pd
+
+from ..core import config
+from ..core.ayar_servisi import pdf_config_dosyasi
+from ..core.config import GRAFIK_ONBELLEK_AYARLARI
+from ..core.icerik_deposu import baglanti_olustur, lru_tahliye, nesne_yolu, nesneye_al
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+# Anahtara giren görünüm ayarları (config'deki adlarıyla)
+STIL_AYAR_ADLARI = [
+    "VARSAYILAN_GRAFIK_BOYUTU",
+    "VARSAYILAN_DPI",
+    "GRAFIK_GORUNUM_AYARLARI",
+    "GRAFIK_BASLIK_SABLONLARI",
+    "PASTA_GRAFIK_RENK_PALETI",
+    "GRUP_ADI_CEVIRI",
+    "GRAFIK_AYARLARI",
+    "KLINIK_ANALIZ_AYARLARI",
+    "GRAFIK_CIKTI_AYARLARI",
+    "KUCUK_GORSEL_AYARLARI",
+]
+
+# Çizim kodu değişince önbellek kendiliğinden geçersiz olsun diye
+# kaynak kodu anahtara giren modüller
+CIZIM_MODULLERI = [
+    Path(__file__).parent / "grafik_olusturucu.py",
+    Path(__file__).parent.parent / "analyzers" / "klinik_analizcisi.py",
+    Path(__file__).parent.parent / "utils" / "figur.py",
+]
+
+
+def _ozet_ekle(ozet: "hashlib._Hash", deger: Any) -> None:
+    """Grafik girdisini (DataFrame, Series, dict, liste, skaler) özete ekler"""
+    if isinstance(deger, pd.DataFrame):
+        ozet.update(b"df")
+        ozet.update(repr(list(deger.columns)).encode())
+        ozet.update(repr([str(tip) for tip in deger.dtypes]).encode())
+        ozet.update(pd.util.hash_pandas_object(deger, index=True).to_numpy().tobytes())
+    elif isinstance(deger, pd.Series):
+        ozet.update(b"seri")
+        ozet.update(repr((deger.name, str(deger.dtype))).encode())
+        ozet.update(pd.util.hash_pandas_object(deger, index=True).to_numpy().tobytes())
+    elif isinstance(deger, np.ndarray):
+        ozet.update(repr((deger.dtype.str, deger.shape)).encode())
+        ozet.update(np.ascontiguousarray(deger).tobytes())
+    elif isinstance(deger, dict):
+        ozet.update(b"{")
+        for anahtar, alt_deger in deger.items():
+            ozet.update(repr(anahtar).encode())
+            _ozet_ekle(ozet, alt_deger)
+        ozet.update(b"}")
+    elif isinstance(deger, (list, tuple)):
+        ozet.update(b"[")
+        for alt_deger in deger:
+            _ozet_ekle(ozet, alt_deger)
+        ozet.update(b"]")
+    else:
+        ozet.update(repr(deger).encode())
+
+
+class GrafikOnbellegi:
+    """
+    İçerik adresli grafik önbelleği.
+
+    Anahtar; çizim yöntemi, girdi verisi, görünüm ayarları (DPI dahil) ve
+    çizim kodunun özetidir. Çizilen dosyalar içerik özetleriyle
+    ``nesneler/`` altında bir kez tutulur; ``anahtarlar/`` altındaki
+    kayıtlar anahtarı dosya adlarına ve içerik özetlerine bağlar. Çizimin
+    yazdığı tüm dosyalar (ör. vektör kopyalar) kayda girer. İsabette
+    dosyalar rapor klasörüne hardlink (olmazsa kopya) ile yerleştirilir.
+    Depo max_boyut_mb'yi aşınca en uzun süredir kullanılmayan nesneler
+    silinir (LRU, dosya mtime'ına göre).
+    """
+
+    def __init__(self, ayarlar: Optional[Dict] = None):
+        """Grafik önbelleği başlatma"""
+        ayarlar = ayarlar if ayarlar is not None else GRAFIK_ONBELLEK_AYARLARI
+        self.dizin = Path(ayarlar["dizin"])
+        self.max_boyut = int(ayarlar.get("max_boyut_mb", 512) * 1024 * 1024)
+        self.nesne_dizin = self.dizin / "nesneler"
+        self.anahtar_dizin = self.dizin / "anahtarlar"
+        self.hazirlik_dizin = self.dizin / "hazirlik"
+        for dizin in (self.nesne_dizin, self.anahtar_dizin, self.hazirlik_dizin):
+            dizin.mkdir(parents=True, exist_ok=True)
+
+        self.isabet = 0
+        self.iskalama = 0
+        self.tahliye_edilen = 0
+        self._ortam_ozeti = self._ortam_ozeti_hesapla()
+
+    @staticmethod
+    def _ortam_ozeti_hesapla() -> bytes:
+        """Görünüm ayarları, grafik metinleri, çizim kodu ve matplotlib sürümünün özeti"""
+        ozet = hashlib.sha256()
+        ozet.update(matplotlib.__version__.encode())
+        for ad in STIL_AYAR_ADLARI:
+            ozet.update(ad.encode())
+            ozet.update(repr(getattr(config, ad, None)).encode())
+        # pdf_config.json'daki grafik üstü metinler de çizime girer
+        ozet.update(
+            repr(pdf_config_dosyasi().oku().get("grafik_metin_ayarlari")).encode()
+        )
+        for modul in CIZIM_MODULLERI:
+            ozet.update(modul.read_bytes() if modul.exists() else b"")
+        return ozet.digest()
+
+    def anahtar_olustur(
+        self, hedef: str, yontem: str, args: Tuple, kwargs: Dict
+    ) -> Optional[str]:
+        """Grafik işinin önbellek anahtarı; özetlenemeyen girdide None"""
+        try:
+            ozet = hashlib.sha256(self._ortam_ozeti)
+            ozet.update(f"{hedef}.{yontem}".encode())
+            _ozet_ekle(ozet, args)
+            _ozet_ekle(ozet, kwargs)
+            return ozet.hexdigest()
+        except Exception as e:
+            logger.debug(f"Grafik önbellek anahtarı oluşturulamadı ({yontem}): {e}")
+            return None
+
+    def hazirlik_dizini_olustur(self) -> Path:
+        """Iskalanan iş için geçici çizim klasörü (depo ile aynı diskte)"""
+        return Path(tempfile.mkdtemp(dir=self.hazirlik_dizin))
+
+    def getir(self, anahtar: Optional[str], hedef_dizin: Path) -> Optional[Any]:
+        """
+        Önbellekteki grafikleri hedef klasöre yerleştirir
+
+        Returns:
+            İsabette çizim yönteminin döndüreceği değer (yol ya da yol
+            listesi), ıskalamada None
+        """
+        if anahtar is None:
+            self.iskalama += 1
+            return None
+
+        kayit_dosyasi = self.anahtar_dizin / f"{anahtar}.json"
+        try:
+            kayit = json.loads(kayit_dosyasi.read_text(encoding="utf-8"))
+            nesneler = [
+                nesne_yolu(self.nesne_dizin, dosya["ozet"], dosya["uzanti"])
+                for dosya in kayit["dosyalar"]
+            ]
+            if not all(nesne.exists() for nesne in nesneler):
+                # Nesnelerden biri tahliye edilmiş; kayıt geçersiz
+                kayit_dosyasi.unlink(missing_ok=True)
+                self.iskalama += 1
+                return None
+
+            for dosya, nesne in zip(kayit["dosyalar"], nesneler):
+                hedef = Path(hedef_dizin) / dosya["ad"]
+                hedef.parent.mkdir(parents=True, exist_ok=True)
+                # Tahliye edilen nesneye symlink boşta kalacağından kopyalanır
+                baglanti_olustur(nesne, hedef, sembolik=False)
+                os.utime(nesne)  # LRU için son kullanım zamanı
+
+            yollar = [
+                str(Path(hedef_dizin) / ad)
+                for ad in kayit.get("sonuc", [d["ad"] for d in kayit["dosyalar"]])
+            ]
+
+        except FileNotFoundError:
+            self.iskalama += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Grafik önbelleği okunamadı, yeniden çizilecek: {e}")
+            self.iskalama += 1
+            return None
+
+        self.isabet += 1
+        return yollar if kayit["liste"] else yollar[0]
+
+    def kaydet(
+        self,
+        anahtar: Optional[str],
+        sonuc: Any,
+        hazirlik_dizin: Path,
+        hedef_dizin: Path,
+    ) -> Any:
+        """
+        Geçici klasörde çizilen grafikleri depoya alır ve hedef klasöre yerleştirir
+
+        Returns:
+            Yolları hedef klasöre çevrilmiş sonuç
+        """
+        liste = isinstance(sonuc, list)
+        yollar = sonuc if liste else ([sonuc] if sonuc else [])
+        hazirlik_dizin = Path(hazirlik_dizin)
+        hedef_dizin = Path(hedef_dizin)
+        onbelleklenebilir = anahtar is not None and bool(yollar)
+
+        sonuc_adlari: List[str] = []
+        hedef_yollar: List[str] = []
+        for yol in yollar:
+            kaynak = Path(yol)
+            try:
+                ad = kaynak.relative_to(hazirlik_dizin).as_posix()
+            except ValueError:
+                # Yöntem rapor klasörü dışına yazmış; olduğu gibi bırak
+                hedef_yollar.append(str(yol))
+                onbelleklenebilir = False
+                continue
+
+            sonuc_adlari.append(ad)
+            hedef_yollar.append(str(hedef_dizin / ad))
+            if not kaynak.exists():
+                onbelleklenebilir = False
+
+        # Dönen yolların yanında yazılan dosyalar (vektör kopyalar vb.) da alınır
+        dosyalar: List[Dict[str, str]] = []
+        for kaynak in sorted(p for p in hazirlik_dizin.rglob("*") if p.is_file()):
+            ad = kaynak.relative_to(hazirlik_dizin).as_posix()
+            hedef = hedef_dizin / ad
+            try:
+                hedef.parent.mkdir(parents=True, exist_ok=True)
+                icerik_ozeti, nesne = nesneye_al(kaynak, self.nesne_dizin, tasi=True)
+                os.utime(nesne)  # LRU için son kullanım zamanı
+                baglanti_olustur(nesne, hedef, sembolik=False)
+                dosyalar.append(
+                    {"ad": ad, "ozet": icerik_ozeti, "uzanti": nesne.suffix}
+                )
+            except OSError as e:
+                logger.warning(f"Grafik önbelleğe alınamadı ({ad}): {e}")
+                if kaynak.exists():
+                    hedef.unlink(missing_ok=True)
+                    shutil.move(str(kaynak), str(hedef))
+                onbelleklenebilir = False
+
+        if onbelleklenebilir:
+            kayit_dosyasi = self.anahtar_dizin / f"{anahtar}.json"
+            gecici = kayit_dosyasi.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                gecici.write_text(
+                    json.dumps(
+                        {"liste": liste, "sonuc": sonuc_adlari, "dosyalar": dosyalar}
+                    ),
+                    encoding="utf-8",
+                )
+                os.replace(gecici, kayit_dosyasi)
+            except OSError as e:
+                logger.warning(f"Grafik önbellek kaydı yazılamadı: {e}")
+
+        shutil.rmtree(hazirlik_dizin, ignore_errors=True)
+
+        if liste:
+            return hedef_yollar
+        return hedef_yollar[0] if hedef_yollar else sonuc
+
+    def tahliye_et(self) -> int:
+        """Depo boyut sınırını aşıyorsa en eski kullanılan nesneleri siler"""
+        try:
+            silinen = lru_tahliye(self.nesne_dizin.glob("*/*"), self.max_boyut)
+
+            # Geçersiz kalan anahtar kayıtları getir() sırasında temizlenir
+            self.tahliye_edilen += silinen
+            if silinen:
+                logger.info(f"Grafik önbelleğinden {silinen} dosya tahliye edildi")
+            return silinen
+
+        except Exception as e:
+            logger.warning(f"Grafik önbelleği tahliye hatası: {e}")
+            return 0
+
+    def istatistikler(self) -> Dict[str, Any]:
+        """Çalıştırma raporuna yazılan isabet/ıskalama sayaçları"""
+        try:
+            boyut = sum(n.stat().st_size for n in self.nesne_dizin.glob("*/*"))
+        except OSError:
+            boyut = 0
+        return {
+            "isabet": self.isabet,
+            "iskalama": self.iskalama,
+            "tahliye_edilen": self.tahliye_edilen,
+            "depo_boyutu_mb": round(boyut / (1024 * 1024), 2),
+        }
@@ -0,0 +1,237 @@
+"""
+Grafik zamanlayıcı modülü - Grafik işlerini toplayıp süreç havuzunda paralel çizer
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from ..core.config import (
+    GRAFIK_ONBELLEK_AYARLARI,
+    GRAFIK_PARALEL_AYARLARI,
+    KLINIK_SUTUN_ADI,
+)
+from .grafik_onbellegi import GrafikOnbellegi
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+# İşçiye gönderilen DataFrame'lerde tutulacak sütunlar (grafiğin okuduğu sütunlar).
+# Listede olmayan yöntemlerin argümanları olduğu gibi gönderilir.
+GRAFIK_GEREKLI_SUTUNLAR = {
+    "vaka_tipi_pasta_grafigi": ["vaka_tipi"],
+    "il_dagilim_pasta_grafigi": ["vaka_tipi"],
+    "iptal_eden_karsilastirma_grafigi": ["vaka_tipi", "durum", "i̇ptal eden"],
+    "solunum_islemi_pasta_grafigi": [
+        "vaka_tipi",
+        "solunum i̇şlemi",
+        "solunum işlemi",
+        "solunum_islemi",
+        "Solunum İşlemi",
+        "solunum durumu",
+    ],
+    "sure_dagilimi_histogram": ["durum_kategori", "yer_bulma_sure_dk"],
+    "klinik_sure_karsilastirma": [
+        "durum_kategori",
+        "yer_bulma_sure_dk",
+        KLINIK_SUTUN_ADI,
+    ],
+    "bekleme_durumu_analizi": ["durum_kategori", "bekleme_sure_dk", KLINIK_SUTUN_ADI],
+    "klinik_grafikleri_olustur": [
+        KLINIK_SUTUN_ADI,
+        "vaka_tipi",
+        "durum",
+        "iptal nedeni",
+        "iptal_nedeni",
+        "İptal Nedeni",
+    ],
+}
+
+# İşçi (süreç ya da iş parçacığı) başına bir kez oluşturulan çiziciler;
+# rapor dizini çizici üzerinde tutulduğundan iş parçacıkları paylaşmaz
+_isci_cizicileri = threading.local()
+
+
+def _sutunlari_sec(deger: Any, sutunlar: List[str]) -> Any:
+    """DataFrame (ya da DataFrame içeren dict) argümanlarını gerekli sütunlara indirger"""
+    if isinstance(deger, pd.DataFrame):
+        return deger[[sutun for sutun in sutunlar if sutun in deger.columns]]
+    if isinstance(deger, dict):
+        return {anahtar: _sutunlari_sec(d, sutunlar) for anahtar, d in deger.items()}
+    return deger
+
+
+def _cizici_getir(hedef: str, rapor_dizin: Optional[str]):
+    """İşçi süreçteki GrafikOlusturucu / KlinikAnalizcisi örneğini döndürür"""
+    from .grafik_olusturucu import GrafikOlusturucu
+    from ..analyzers.klinik_analizcisi import KlinikAnalizcisi
+
+    if not hasattr(_isci_cizicileri, "grafik"):
+        _isci_cizicileri.grafik = GrafikOlusturucu()
+        _isci_cizicileri.klinik = KlinikAnalizcisi(_isci_cizicileri.grafik)
+
+    _isci_cizicileri.grafik._rapor_dizin_override = (
+        Path(rapor_dizin) if rapor_dizin else None
+    )
+    return getattr(_isci_cizicileri, hedef)
+
+
+def _grafik_isini_calistir(is_tanimi: Tuple) -> Any:
+    """Tek bir grafik işini çizer; yol(lar)ı metin olarak döndürür"""
+    hedef, yontem, args, kwargs, rapor_dizin = is_tanimi
+    try:
+        cizici = _cizici_getir(hedef, rapor_dizin)
+        sonuc = getattr(cizici, yontem)(*args, **kwargs)
+        if isinstance(sonuc, list):
+            return [str(yol) for yol in sonuc if yol]
+        return str(sonuc) if sonuc else None
+    except Exception as e:
+        logger.error(f"Grafik işi hatası ({yontem}): {e}")
+        return None
+
+
+class GrafikZamanlayici:
+    """
+    Grafik işlerini toplar ve tek seferde çizer.
+
+    ekle() ile kaydedilen her iş (yöntem adı + argümanlar) çizim anına kadar
+    bekletilir; DataFrame argümanları grafiğin okuduğu sütunlara indirgenerek
+    küçük yükler halinde işçi süreçlere gönderilir. calistir() sonuçları
+    ekleme sırasıyla döndürür; dosya adları çizim yöntemlerinin kendisinden
+    geldiği için değişmez.
+
+    Önbellek açıksa girdisi daha önce çizilmiş işlerin dosyaları
+    GrafikOnbellegi'nden alınır; yalnızca ıskalanan işler çizilir.
+    """
+
+    def __init__(
+        self,
+        rapor_dizin: Optional[Path] = None,
+        isci_sayisi: Optional[int] = None,
+        onbellek: Optional[GrafikOnbellegi] = None,
+    ):
+        """Grafik zamanlayıcı başlatma"""
+        self.rapor_dizin = str(rapor_dizin) if rapor_dizin else None
+        self.isci_sayisi = (
+            isci_sayisi
+            or GRAFIK_PARALEL_AYARLARI.get("isci_sayisi")
+            or os.cpu_count()
+            or 1
+        )
+        self._isler: List[Tuple] = []
+
+        self.onbellek = onbellek
+        if self.onbellek is None and self.rapor_dizin and GRAFIK_ONBELLEK_AYARLARI.get("aktif", True):
+            try:
+                self.onbellek = GrafikOnbellegi()
+            except Exception as e:
+                logger.warning(f"Grafik önbelleği kullanılamıyor: {e}")
+
+    def ekle(self, yontem: str, *args, hedef: str = "grafik", **kwargs) -> int:
+        """
+        Grafik işi ekler
+
+        Args:
+            yontem: GrafikOlusturucu (hedef="grafik") ya da KlinikAnalizcisi
+                (hedef="klinik") yöntem adı
+            *args, **kwargs: Yöntem argümanları
+
+        Returns:
+            int: İşin sıra numarası (calistir() sonucundaki indeksi)
+        """
+        sutunlar = GRAFIK_GEREKLI_SUTUNLAR.get(yontem)
+        if sutunlar is not None:
+            args = tuple(_sutunlari_sec(arg, sutunlar) for arg in args)
+            kwargs = {k: _sutunlari_sec(v, sutunlar) for k, v in kwargs.items()}
+
+        self._isler.append((hedef, yontem, args, kwargs, self.rapor_dizin))
+        return len(self._isler) - 1
+
+    def __len__(self) -> int:
+        return len(self._isler)
+
+    def calistir(self) -> List[Any]:
+        """
+        Bekleyen tüm işleri çizer
+
+        Returns:
+            İş sırasıyla sonuçlar: dosya yolu (str), yol listesi ya da None
+        """
+        isler, self._isler = self._isler, []
+        if not isler:
+            return []
+
+        if self.onbellek is None:
+            return self._ciz(isler)
+
+        # Önbellekte bulunan işler çizilmez; ıskalananlar geçici klasörde
+        # çizilip depoya alındıktan sonra rapor klasörüne yerleştirilir
+        sonuclar: List[Any] = [None] * len(isler)
+        iskalananlar = []
+        for sira, (hedef, yontem, args, kwargs, rapor_dizin) in enumerate(isler):
+            anahtar = self.onbellek.anahtar_olustur(hedef, yontem, args, kwargs)
+            onbellekten = self.onbellek.getir(anahtar, Path(rapor_dizin))
+            if onbellekten is not None:
+                sonuclar[sira] = onbellekten
+                continue
+
+            hazirlik = self.onbellek.hazirlik_dizini_olustur() if anahtar else None
+            cikti_dizin = str(hazirlik) if hazirlik else rapor_dizin
+            iskalananlar.append(
+                (sira, anahtar, hazirlik, (hedef, yontem, args, kwargs, cikti_dizin))
+            )
+
+        cizilenler = self._ciz([is_tanimi for *_, is_tanimi in iskalananlar])
+        for (sira, anahtar, hazirlik, _), sonuc in zip(iskalananlar, cizilenler):
+            if hazirlik is not None:
+                sonuc = self.onbellek.kaydet(
+                    anahtar, sonuc, hazirlik, Path(self.rapor_dizin)
+                )
+            sonuclar[sira] = sonuc
+
+        self.onbellek.tahliye_et()
+        logger.info(
+            f"Grafik önbelleği: {self.onbellek.isabet} isabet, "
+            f"{self.onbellek.iskalama} ıskalama"
+        )
+        return sonuclar
+
+    def onbellek_istatistikleri(self) -> Dict[str, Any]:
+        """Rapora yazılacak önbellek sayaçları"""
+        if self.onbellek is None:
+            return {"aktif": False}
+        return {"aktif": True, **self.onbellek.istatistikler()}
+
+    def _ciz(self, isler: List[Tuple]) -> List[Any]:
+        """İşleri süreç havuzunda (ya da sırayla) çizer"""
+        if not isler:
+            return []
+
+        paralel = (
+            GRAFIK_PARALEL_AYARLARI.get("aktif", True)
+            and self.isci_sayisi > 1
+            and len(isler) >= GRAFIK_PARALEL_AYARLARI.get("min_is_sayisi", 4)
+        )
+
+        if paralel:
+            try:
+                isci_sayisi = min(self.isci_sayisi, len(isler))
+                havuz_sinifi = (
+                    ThreadPoolExecutor
+                    if GRAFIK_PARALEL_AYARLARI.get("havuz") == "is_parcacigi"
+                    else ProcessPoolExecutor
+                )
+                with havuz_sinifi(max_workers=isci_sayisi) as havuz:
+                    sonuclar = list(havuz.map(_grafik_isini_calistir, isler))
+                logger.info(f"{len(isler)} grafik {isci_sayisi} işçi ile çizildi")
+                return sonuclar
+            except Exception as e:
+                # Havuz kurulamazsa (kısıtlı ortam vb.) sırayla çiz
+                logger.warning(f"Paralel grafik çizimi başarısız, sırayla çiziliyor: {e}")
+
+        return [_grafik_isini_calistir(is_tanimi) for is_tanimi in isler]
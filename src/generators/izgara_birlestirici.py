@@ -0,0 +1,228 @@
+"""
+Izgara birleştirici modülü - Grafikleri ve PDF sayfalarını sınırlı bellekle tek
+sayfada birleştirir
+
+Görseller tek tek, yerleşecekleri hücre boyutunda çözülüp PDF'e yazılır ve
+hemen bırakılır; tüm grafikleri içeren büyük bir ızgara görseli ya da ara
+JPEG dosyası oluşturulmaz. Bellek kullanımı grafik sayısından bağımsız olarak
+tek bir görselin boyutuyla sınırlı kalır.
+"""
+
+import logging
+import math
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from PIL import Image
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.units import mm
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas
+
+try:
+    from PyPDF2 import PageObject, PdfReader, PdfWriter, Transformation
+
+    PDF_MERGER_AVAILABLE = True
+except ImportError:
+    PDF_MERGER_AVAILABLE = False
+
+from ..core.config import IZGARA_BIRLESTIRME_AYARLARI
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+
+def _gecici_yol(cikti: Path) -> Path:
+    return cikti.with_name(f".{cikti.name}.{os.getpid()}.tmp")
+
+
+def kucultulmus_ac(yol: Union[str, Path], max_piksel: Tuple[int, int]) -> Image.Image:
+    """
+    Görseli en fazla max_piksel boyutunda (oran korunarak) RGB olarak açar
+
+    JPEG'ler draft ile doğrudan küçük ölçekte çözülür; PNG'ler çözüldükten
+    sonra küçültülür, böylece aynı anda yalnızca bir tam boyutlu görsel
+    bellekte bulunur. RGB'ye dönüşüm küçültmeden önce yapılır (RGBA
+    küçültme, alfa ön çarpımı nedeniyle yaklaşık iki kat yavaştır).
+    """
+    with Image.open(yol) as kaynak:
+        kaynak.draft("RGB", max_piksel)
+        gorsel = kaynak.convert("RGB")
+    gorsel.thumbnail(max_piksel, Image.LANCZOS, reducing_gap=3.0)
+    return gorsel
+
+
+def izgara_yerlesimi(
+    adet: int, sayfa: Tuple[float, float], ayarlar: Dict
+) -> Tuple[int, float, float, float, float]:
+    """
+    Hücre yerleşimini hesaplar
+
+    Returns:
+        (sütun sayısı, hücre genişliği, hücre yüksekliği, sol x, üst y) - punto
+    """
+    sutun = min(adet, ayarlar.get("max_sutun", 4))
+    satir = math.ceil(adet / sutun)
+    oran = ayarlar.get("hucre_orani", 0.75)
+    kenar = ayarlar.get("kenar_boslugu_mm", 10) * mm
+
+    kullanilabilir_genislik = sayfa[0] - 2 * kenar
+    kullanilabilir_yukseklik = sayfa[1] - 2 * kenar
+    hucre_genislik = min(
+        kullanilabilir_genislik / sutun, kullanilabilir_yukseklik / (satir * oran)
+    )
+    hucre_yukseklik = hucre_genislik * oran
+
+    # Izgara sayfaya ortalanır
+    sol = (sayfa[0] - sutun * hucre_genislik) / 2
+    ust = (sayfa[1] + satir * hucre_yukseklik) / 2
+    return sutun, hucre_genislik, hucre_yukseklik, sol, ust
+
+
+def grafikleri_izgaraya_yaz(
+    png_listesi: List[str], cikti_pdf: Union[str, Path], ayarlar: Optional[Dict] = None
+) -> Path:
+    """
+    PNG grafikleri A4 yatay tek sayfada ızgara olarak PDF'e yazar
+
+    Her grafik hücresine oranı korunarak sığdırılır ve ortalanır.
+
+    Args:
+        png_listesi: Yerleştirilecek PNG dosyaları (sırayla, soldan sağa)
+        cikti_pdf: Çıktı PDF yolu
+
+    Returns:
+        Path: Yazılan PDF'in yolu
+    """
+    ayarlar = ayarlar if ayarlar is not None else IZGARA_BIRLESTIRME_AYARLARI
+    cikti_pdf = Path(cikti_pdf)
+    sayfa = landscape(A4)
+    sutun, hucre_genislik, hucre_yukseklik, sol, ust = izgara_yerlesimi(
+        len(png_listesi), sayfa, ayarlar
+    )
+    hedef_dpi = ayarlar.get("hedef_dpi", 200)
+    max_piksel = (
+        max(1, round(hucre_genislik / 72 * hedef_dpi)),
+        max(1, round(hucre_yukseklik / 72 * hedef_dpi)),
+    )
+
+    gecici = _gecici_yol(cikti_pdf)
+    tuval = canvas.Canvas(str(gecici), pagesize=sayfa)
+    try:
+        for sira, png in enumerate(png_listesi):
+            try:
+                gorsel = kucultulmus_ac(png, max_piksel)
+            except Exception as e:
+                logger.warning(f"Grafik ızgaraya eklenemedi ({png}): {e}")
+                continue
+
+            # Görselin punto cinsinden hücreye sığan boyutu
+            olcek = min(hucre_genislik / gorsel.width, hucre_yukseklik / gorsel.height)
+            genislik, yukseklik = gorsel.width * olcek, gorsel.height * olcek
+            hucre_x = sol + (sira % sutun) * hucre_genislik
+            hucre_y = ust - (sira // sutun + 1) * hucre_yukseklik
+            # drawImage veriyi hemen sıkıştırıp saklar; görsel ardından bırakılır
+            tuval.drawImage(
+                ImageReader(gorsel),
+                hucre_x + (hucre_genislik - genislik) / 2,
+                hucre_y + (hucre_yukseklik - yukseklik) / 2,
+                width=genislik,
+                height=yukseklik,
+            )
+            del gorsel
+
+        tuval.showPage()
+        tuval.save()
+        os.replace(gecici, cikti_pdf)
+    finally:
+        if gecici.exists():
+            gecici.unlink()
+
+    return cikti_pdf
+
+
+def pdf_sayfalarini_yan_yana_yaz(
+    pdf_yolu: Union[str, Path], cikti_pdf: Union[str, Path], ayarlar: Optional[Dict] = None
+) -> Path:
+    """
+    PDF'in tüm sayfalarını tek bir geniş sayfada soldan sağa, üstten hizalı yerleştirir
+
+    PyPDF2 varsa sayfalar rasterlenmeden, vektör olarak taşınır. Yoksa
+    sayfalar pdf2image ile tek tek rasterlenip yazılır (her seferinde bir
+    sayfa bellekte tutulur).
+
+    Returns:
+        Path: Yazılan PDF'in yolu
+    """
+    ayarlar = ayarlar if ayarlar is not None else IZGARA_BIRLESTIRME_AYARLARI
+    cikti_pdf = Path(cikti_pdf)
+    gecici = _gecici_yol(cikti_pdf)
+    try:
+        if PDF_MERGER_AVAILABLE:
+            _sayfalari_vektor_yerlestir(Path(pdf_yolu), gecici)
+        else:
+            _sayfalari_raster_yerlestir(Path(pdf_yolu), gecici, ayarlar)
+        os.replace(gecici, cikti_pdf)
+    finally:
+        if gecici.exists():
+            gecici.unlink()
+
+    return cikti_pdf
+
+
+def _sayfalari_vektor_yerlestir(pdf_yolu: Path, cikti: Path) -> None:
+    """Sayfaları dönüşümle kaydırıp boş, geniş bir sayfanın üstüne basar"""
+    okuyucu = PdfReader(str(pdf_yolu))
+    kutular = [sayfa.mediabox for sayfa in okuyucu.pages]
+    toplam_genislik = sum(float(kutu.width) for kutu in kutular)
+    max_yukseklik = max(float(kutu.height) for kutu in kutular)
+
+    # Sayfalar yazıcıya eklenmeden önce birleştirilir (yazıcıdaki sayfaya
+    # başka bir okuyucunun sayfası basılınca kaynakları kopyalanmıyor)
+    hedef = PageObject.create_blank_page(None, toplam_genislik, max_yukseklik)
+    x = 0.0
+    for sayfa, kutu in zip(okuyucu.pages, kutular):
+        sayfa.add_transformation(
+            Transformation()
+            .translate(-float(kutu.left), -float(kutu.bottom))
+            .translate(x, max_yukseklik - float(kutu.height)),
+            # merge_page sayfayı kendi kutusuyla kırptığından kutu da taşınır
+            expand=True,
+        )
+        hedef.merge_page(sayfa)
+        x += float(kutu.width)
+
+    yazici = PdfWriter()
+    yazici.add_page(hedef)
+    with open(cikti, "wb") as f:
+        yazici.write(f)
+
+
+def _sayfalari_raster_yerlestir(pdf_yolu: Path, cikti: Path, ayarlar: Dict) -> None:
+    """Sayfaları tek tek rasterleyip geniş sayfaya yazar"""
+    from pdf2image import convert_from_path, pdfinfo_from_path
+
+    dpi = ayarlar.get("sayfa_raster_dpi", 200)
+    sayfa_sayisi = pdfinfo_from_path(str(pdf_yolu))["Pages"]
+
+    # Önce sayfa boyutları bulunur: 72 DPI'da piksel = punto
+    boyutlar = []
+    for no in range(1, sayfa_sayisi + 1):
+        gorsel = convert_from_path(str(pdf_yolu), dpi=72, first_page=no, last_page=no)[0]
+        boyutlar.append(gorsel.size)
+        del gorsel
+
+    toplam_genislik = sum(genislik for genislik, _ in boyutlar)
+    max_yukseklik = max(yukseklik for _, yukseklik in boyutlar)
+    tuval = canvas.Canvas(str(cikti), pagesize=(toplam_genislik, max_yukseklik))
+    x = 0.0
+    for no, (genislik, yukseklik) in enumerate(boyutlar, start=1):
+        gorsel = convert_from_path(str(pdf_yolu), dpi=dpi, first_page=no, last_page=no)[0]
+        tuval.drawImage(
+            ImageReader(gorsel), x, max_yukseklik - yukseklik, width=genislik, height=yukseklik
+        )
+        del gorsel
+        x += genislik
+    tuval.showPage()
+    tuval.save()
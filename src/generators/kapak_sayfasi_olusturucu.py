@@ -3,11 +3,12 @@ Nakil Analizi - Kapak Sayfası Oluşturucu
 Türkçe karakter desteği ile tek sayfa kapak sayfaları oluşturur
 """
 
-import json
+import io
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union, BinaryIO
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import inch
@@ -17,37 +18,48 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
+
+try:
+    from PyPDF2 import PdfReader, PdfWriter
+
+    PDF_MERGER_AVAILABLE = True
+except ImportError:
+    PDF_MERGER_AVAILABLE = False
+
+from ..core.ayar_servisi import kapak_config_dosyasi
+from ..core.config import KAPAK_CONFIG_DOSYA_YOLU, KAPAK_PDF_YOLU, PROJE_KOK
 
 logger = logging.getLogger(__name__)
 
+# Kapakta kullanılan DejaVu Sans fontları (ad, proje köküne göre yol)
+FONT_DOSYALARI = [
+    ("DejaVuSans", "fonts/DejaVuSans.ttf"),
+    ("DejaVuSans-Bold", "fonts/DejaVuSans-Bold.ttf"),
+    ("DejaVuSans-Oblique", "fonts/DejaVuSans-Oblique.ttf"),
+]
+
 
 class KapakSayfasiOlusturucu:
     """Kapak sayfası oluşturucu sınıfı"""
 
-    def __init__(self, config_dosyasi: str = "assets/kapak_config.json"):
+    def __init__(self, config_dosyasi: Optional[str] = None):
         """Kapak sayfası oluşturucu başlatır"""
         self.styles = getSampleStyleSheet()
-        self.config = self._config_yukle(config_dosyasi)
+        self._ayar_dosyasi = kapak_config_dosyasi(
+            config_dosyasi, varsayilan=self._varsayilan_config
+        )
+        self._stil_config = self.config
         self._turkce_font_ekle()
         self._ozel_stiller_olustur()
 
-    def _config_yukle(self, config_dosyasi: str) -> Dict[str, Any]:
-        """Kapak konfigürasyon dosyasını yükler"""
-        try:
-            config_path = Path(config_dosyasi)
-            if config_path.exists():
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                logger.info(f"Kapak config dosyası yüklendi: {config_path}")
-                return config
-            else:
-                logger.warning(f"Config dosyası bulunamadı: {config_path}")
-                return self._varsayilan_config()
-        except Exception as e:
-            logger.error(f"Config dosyası yükleme hatası: {e}")
-            return self._varsayilan_config()
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Kapak ayarları (paylaşılan önbellekten, dosya değişince yeniden okunur)"""
+        return self._ayar_dosyasi.oku()
 
-    def _varsayilan_config(self) -> Dict[str, Any]:
+    @staticmethod
+    def _varsayilan_config() -> Dict[str, Any]:
         """Varsayılan konfigürasyon döndürür"""
         return {
             "baslik": {
@@ -85,19 +97,14 @@ class KapakSayfasiOlusturucu:
     def _turkce_font_ekle(self):
         """Türkçe karakter desteği için font ekler"""
         try:
-            proje_kok = Path(__file__).parent.parent.parent
-
             # DejaVu Sans fontlarını kaydet
-            font_dosyalari = [
-                ("DejaVuSans", "fonts/DejaVuSans.ttf"),
-                ("DejaVuSans-Bold", "fonts/DejaVuSans-Bold.ttf"),
-                ("DejaVuSans-Oblique", "fonts/DejaVuSans-Oblique.ttf"),
-            ]
-
             fonts_registered = False
-            for font_name, font_path in font_dosyalari:
-                font_full_path = proje_kok / font_path
-                if font_full_path.exists():
+            for font_name, font_path in FONT_DOSYALARI:
+                font_full_path = PROJE_KOK / font_path
+                if font_name in pdfmetrics.getRegisteredFontNames():
+                    # Aynı süreçte daha önce kaydedildi (analiz sunucusu, tekrar eden raporlar)
+                    fonts_registered = True
+                elif font_full_path.exists():
                     try:
                         pdfmetrics.registerFont(TTFont(font_name, str(font_full_path)))
                         fonts_registered = True
@@ -235,7 +242,7 @@ class KapakSayfasiOlusturucu:
         alt_baslik: Optional[str] = None,
         kurum: Optional[str] = None,
         logo_yolu: Optional[str] = None,
-        cikti_dosyasi: str = "assets/kapak.pdf",
+        cikti_dosyasi: Union[str, BinaryIO] = "assets/kapak.pdf",
     ) -> bool:
         """
         Kapak sayfası oluşturur - Config dosyasından ayarları alır
@@ -245,12 +252,17 @@ class KapakSayfasiOlusturucu:
             alt_baslik: Alt başlık (None ise config'den alınır)
             kurum: Kurum adı (None ise config'den alınır)
             logo_yolu: Logo dosya yolu (None ise config'den alınır)
-            cikti_dosyasi: Çıktı PDF dosyası
+            cikti_dosyasi: Çıktı PDF dosyası (ya da yazılabilir bellek tamponu)
 
         Returns:
             bool: Başarı durumu
         """
         try:
+            # Config dosyası değiştiyse stilleri yeniden oluştur
+            if self.config is not self._stil_config:
+                self._stil_config = self.config
+                self._ozel_stiller_olustur()
+
             # Config'den ayarları al
             baslik = baslik or self.config.get("baslik", {}).get(
                 "metin", "NAKİL ANALİZ RAPORU"
@@ -269,8 +281,10 @@ class KapakSayfasiOlusturucu:
                 logo_yolu = f"assets/{logo_dosya_adi}"
 
             # Çıktı klasörünü oluştur
-            cikti_path = Path(cikti_dosyasi)
-            cikti_path.parent.mkdir(parents=True, exist_ok=True)
+            if isinstance(cikti_dosyasi, (str, Path)):
+                cikti_path = Path(cikti_dosyasi)
+                cikti_path.parent.mkdir(parents=True, exist_ok=True)
+                cikti_dosyasi = str(cikti_path)
 
             # Sayfa ayarları
             sayfa_config = self.config.get("sayfa_ayarlari", {})
@@ -278,7 +292,7 @@ class KapakSayfasiOlusturucu:
 
             # PDF dökümanı oluştur
             doc = SimpleDocTemplate(
-                str(cikti_path),
+                cikti_dosyasi,
                 pagesize=A4,
                 rightMargin=kenar_boslugu,
                 leftMargin=kenar_boslugu,
@@ -326,13 +340,177 @@ class KapakSayfasiOlusturucu:
             # PDF'i oluştur
             doc.build(story)
 
-            logger.info(f"Kapak sayfası başarıyla oluşturuldu: {cikti_path}")
+            logger.info(f"Kapak sayfası başarıyla oluşturuldu: {cikti_dosyasi}")
             return True
 
         except Exception as e:
             logger.error(f"Kapak sayfası oluşturma hatası: {e}")
             return False
 
+    def tarih_katmani_olustur(
+        self, gun_tarihi: str, genislik: float, yukseklik: float
+    ) -> Optional[bytes]:
+        """
+        Kapak üstüne basılacak tarih katmanını (tek sayfalık saydam PDF) oluşturur
+
+        Args:
+            gun_tarihi: Rapor günü (YYYY-MM-DD)
+            genislik, yukseklik: Kapak sayfasının boyutu (punto)
+
+        Returns:
+            PDF baytları; tarih_goster kapalıysa None
+        """
+        if not self.config.get("tarih_goster", False):
+            return None
+
+        tarih_config = self.config.get("tarih", {})
+        try:
+            tarih = datetime.strptime(gun_tarihi, "%Y-%m-%d")
+            tarih_metni = tarih.strftime(tarih_config.get("format", "%d.%m.%Y"))
+        except (TypeError, ValueError):
+            tarih_metni = str(gun_tarihi)
+        metin = f"{tarih_config.get('prefix', '')}{tarih_metni}"
+
+        tampon = io.BytesIO()
+        tuval = canvas.Canvas(tampon, pagesize=(genislik, yukseklik))
+        tuval.setFont(self.default_font, tarih_config.get("font_boyutu", 14))
+        tuval.setFillColor(HexColor(tarih_config.get("renk", "#7f8c8d")))
+
+        kenar = self.config.get("sayfa_ayarlari", {}).get("kenar_boslugu", 1.0) * inch
+        y = tarih_config.get("y_konumu", 1.5) * inch
+        konum = tarih_config.get("konum", "merkez")
+        if konum == "sol":
+            tuval.drawString(kenar, y, metin)
+        elif konum == "sag":
+            tuval.drawRightString(genislik - kenar, y, metin)
+        else:
+            tuval.drawCentredString(genislik / 2, y, metin)
+
+        tuval.showPage()
+        tuval.save()
+        return tampon.getvalue()
+
+
+class KapakOnbellegi:
+    """
+    Süreç içinde bir kez derlenen kapak sayfası.
+
+    assets/kapak.pdf varsa o, yoksa kapak_config.json'dan oluşturulan kapak
+    ayrıştırılmış sayfa nesneleri olarak bellekte tutulur. Kaynak dosyaların
+    (kapak PDF'i; yoksa ayar dosyası, logo ve fontlar) değişiklik zamanı ya
+    da boyutu değişince yeniden derlenir. Rapora özgü tarih, her raporda
+    ilk sayfanın ayrı bir kopyasına küçük bir katman olarak basılır.
+    """
+
+    def __init__(self, kapak_pdf: Union[str, Path] = KAPAK_PDF_YOLU):
+        """Kapak önbelleği başlatma"""
+        self.kapak_pdf = Path(kapak_pdf)
+        self._kilit = threading.Lock()
+        # (imza, sayfalar, veri): tek nesne olarak değiştirilir; kilitsiz
+        # okuyan iş parçacığı birbirine ait olmayan sayfa ve veri görmez
+        self._derleme: Optional[Tuple[Tuple, List, bytes]] = None
+        self._olusturucu: Optional[KapakSayfasiOlusturucu] = None
+        self.derleme_sayisi = 0
+
+    def _olusturucu_getir(self) -> KapakSayfasiOlusturucu:
+        """Font kayıtları ve stiller süreç başına bir kez hazırlanır"""
+        if self._olusturucu is None:
+            self._olusturucu = KapakSayfasiOlusturucu()
+        return self._olusturucu
+
+    def _logo_yolu(self) -> Path:
+        logo_config = self._olusturucu_getir().config.get("logo", {})
+        return PROJE_KOK / "assets" / logo_config.get("dosya_adi", "logo.png")
+
+    def _kaynak_imzasi(self) -> Tuple:
+        """Kapağın derlendiği dosyaların (yol, mtime, boyut) imzası"""
+        if self.kapak_pdf.exists():
+            dosyalar = [self.kapak_pdf]
+        else:
+            dosyalar = [KAPAK_CONFIG_DOSYA_YOLU, self._logo_yolu()]
+            dosyalar += [PROJE_KOK / yol for _, yol in FONT_DOSYALARI]
+
+        imza = []
+        for dosya in dosyalar:
+            try:
+                bilgi = dosya.stat()
+                imza.append((str(dosya), bilgi.st_mtime_ns, bilgi.st_size))
+            except OSError:
+                imza.append((str(dosya), None, None))
+        return tuple(imza)
+
+    def _derlenmis(self) -> Tuple[Tuple, List, bytes]:
+        """Güncel (imza, sayfalar, veri) üçlüsü; kaynak değiştiyse yeniden derlenir"""
+        imza = self._kaynak_imzasi()
+        derleme = self._derleme
+        if derleme is not None and derleme[0] == imza:
+            return derleme
+
+        with self._kilit:
+            derleme = self._derleme
+            if derleme is not None and derleme[0] == imza:
+                return derleme
+
+            if self.kapak_pdf.exists():
+                veri = self.kapak_pdf.read_bytes()
+            else:
+                logger.warning(
+                    f"Kapak dosyası bulunamadı, kapak_config.json'dan oluşturuluyor: {self.kapak_pdf}"
+                )
+                tampon = io.BytesIO()
+                if not self._olusturucu_getir().kapak_olustur(
+                    logo_yolu=str(self._logo_yolu()), cikti_dosyasi=tampon
+                ):
+                    raise RuntimeError("Kapak sayfası oluşturulamadı")
+                veri = tampon.getvalue()
+
+            derleme = (imza, list(PdfReader(io.BytesIO(veri)).pages), veri)
+            self._derleme = derleme
+            self.derleme_sayisi += 1
+            logger.info(f"Kapak sayfası derlendi ({self.derleme_sayisi}. kez)")
+            return derleme
+
+    def sayfalar(self) -> List:
+        """Derlenmiş kapak sayfaları (paylaşılır, değiştirilmemelidir)"""
+        return self._derlenmis()[1]
+
+    def yaziciya_ekle(self, yazici: "PdfWriter", gun_tarihi: Optional[str] = None) -> None:
+        """Kapak sayfalarını yazıcıya ekler; açıksa tarihi ilk sayfaya basar"""
+        # Sayfalar ve ham veri aynı derlemeden alınır
+        _, sayfalar, veri = self._derlenmis()
+        if not sayfalar:
+            return
+
+        katman = None
+        if gun_tarihi:
+            ilk = sayfalar[0]
+            katman = self._olusturucu_getir().tarih_katmani_olustur(
+                gun_tarihi, float(ilk.mediabox.width), float(ilk.mediabox.height)
+            )
+
+        if katman is not None:
+            # Paylaşılan sayfa değiştirilmez: ilk sayfanın taze bir kopyası
+            # ayrıştırılıp tarih katmanı onun üstüne basılır
+            ilk = PdfReader(io.BytesIO(veri)).pages[0]
+            ilk.merge_page(PdfReader(io.BytesIO(katman)).pages[0])
+            sayfalar = [ilk] + sayfalar[1:]
+
+        for sayfa in sayfalar:
+            yazici.add_page(sayfa)
+
+
+_kapak_onbellegi: Optional[KapakOnbellegi] = None
+_kapak_kilidi = threading.Lock()
+
+
+def kapak_onbellegi() -> KapakOnbellegi:
+    """Süreç içinde paylaşılan kapak önbelleği"""
+    global _kapak_onbellegi
+    with _kapak_kilidi:
+        if _kapak_onbellegi is None:
+            _kapak_onbellegi = KapakOnbellegi()
+        return _kapak_onbellegi
+
 
 def main():
     """Ana fonksiyon - Test amaçlı"""
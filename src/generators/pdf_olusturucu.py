@@ -2,15 +2,17 @@
 PDF raporu oluşturucu modülü
 """
 
-import fnmatch
-import json
 import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 
 from reportlab.lib.pagesizes import A4, A3, letter
-from reportlab.platypus import SimpleDocTemplate, Image, Spacer, Paragraph, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Image, Spacer, Paragraph, PageBreak, Flowable
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor
@@ -19,47 +21,88 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
 try:
-    from PyPDF2 import PdfMerger, PdfReader
+    from PyPDF2 import PdfReader, PdfWriter, Transformation
 
     PDF_MERGER_AVAILABLE = True
 except ImportError:
     PDF_MERGER_AVAILABLE = False
 
-from ..core.config import PDF_CONFIG_DOSYA_YOLU
+from ..core.ayar_servisi import dosya_deseni_derle, pdf_config_dosyasi
+from ..core.cikti_deposu import dosyalari_coz
+from ..core.config import (
+    GRAFIK_CIKTI_AYARLARI,
+    PDF_GORSEL_AYARLARI,
+    PDF_PARALEL_AYARLARI,
+)
+from ..utils.figur import vektor_yolu
+from ..utils.json_yardimci import json_oku
+from .gorsel_hazirlayici import GorselHazirlayici
+from .kapak_sayfasi_olusturucu import kapak_onbellegi
 
 logger = logging.getLogger(__name__)
 
+# Grid hücresindeki grafik kutusu (A4 dikey, 2x2 yerleşim)
+IZGARA_GRAFIK_GENISLIK = 2.8 * inch
+IZGARA_GRAFIK_YUKSEKLIK = 1.8 * inch
+
+
+class _VektorGrafik(Flowable):
+    """
+    Grafiğin vektör PDF kopyası için yer tutucu.
+
+    Image(kind='proportional') ile aynı boyutu kaplar; çizildiği sayfa ve
+    mutlak konum yerlesimler listesine eklenir, grafik sayfası doc.build()
+    sonrasında bu konuma vektör olarak damgalanır.
+    """
+
+    def __init__(self, vektor_pdf: Path, genislik: float, yukseklik: float, yerlesimler: List):
+        super().__init__()
+        kutu = PdfReader(str(vektor_pdf)).pages[0].mediabox
+        self.olcek = min(genislik / float(kutu.width), yukseklik / float(kutu.height))
+        self.width = float(kutu.width) * self.olcek
+        self.height = float(kutu.height) * self.olcek
+        self.vektor_pdf = str(vektor_pdf)
+        self._yerlesimler = yerlesimler
+
+    def wrap(self, *args):
+        return self.width, self.height
+
+    def draw(self):
+        x, y = self.canv.absolutePosition(0, 0)
+        self._yerlesimler.append(
+            (self.canv.getPageNumber(), self.vektor_pdf, x, y, self.olcek)
+        )
+
 
 class PDFOlusturucu:
     """PDF rapor oluşturucu sınıfı"""
 
     def __init__(self):
         """PDF oluşturucu başlatır ve konfigürasyonu yükler"""
-        self.config = self._config_yukle()
+        self._ayar_dosyasi = pdf_config_dosyasi()
+        # Vektör grafiklerin sayfa konumları (None: grafikler PNG olarak gömülür)
+        self._vektor_yerlesimleri: Optional[List] = None
+        self._hazirlayici: Optional[GorselHazirlayici] = None
         self.styles = getSampleStyleSheet()
         self._turkce_font_ekle()
         self._ozel_stiller_olustur()
 
-    def _config_yukle(self) -> Dict:
-        """JSON config dosyasından PDF ayarlarını yükler"""
-        try:
-            with open(PDF_CONFIG_DOSYA_YOLU, "r", encoding="utf-8-sig") as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"PDF config dosyası okunamadı: {e}")
-            # Varsayılan config döndür
-            return {
-                "pdf_olustur": True,
-                "pdf_dosya_adi": "nakil_analiz_raporu_{tarih}.pdf",
-                "font_ayarlari": {
-                    "default_font": "Helvetica",
-                    "fallback_font": "Helvetica",
-                    "encoding": "utf-8",
-                },
-                "sayfa_ayarlari": {"boyut": "A4", "kenar_boslugu": 0.5},
-                "grafik_sirasi": [],
-                "ek_metinler": [],
-            }
+    @property
+    def config(self) -> Dict:
+        """pdf_config.json içeriği (paylaşılan önbellekten, dosya değişince yeniden okunur)"""
+        return self._ayar_dosyasi.oku()
+
+    @staticmethod
+    def _grafik_sirasi_derle(config: Dict) -> List[Tuple[Callable[[str], bool], str, str]]:
+        """grafik_sirasi desenlerini (eşleştirici, başlık, desen) olarak derler"""
+        return [
+            (
+                dosya_deseni_derle(grafik_config.get("desen", "")),
+                grafik_config.get("baslik", ""),
+                grafik_config.get("desen", ""),
+            )
+            for grafik_config in config.get("grafik_sirasi", [])
+        ]
 
     def _turkce_font_ekle(self):
         """Türkçe karakter desteği için font ekler"""
@@ -78,7 +121,10 @@ class PDFOlusturucu:
             fonts_registered = False
             for font_name, font_path in font_dosyalari:
                 font_full_path = proje_kok / font_path
-                if font_full_path.exists():
+                if font_name in pdfmetrics.getRegisteredFontNames():
+                    # Aynı süreçte daha önce kaydedildi (analiz sunucusu, tekrar eden raporlar)
+                    fonts_registered = True
+                elif font_full_path.exists():
                     try:
                         pdfmetrics.registerFont(TTFont(font_name, str(font_full_path)))
                         fonts_registered = True
@@ -174,7 +220,6 @@ class PDFOlusturucu:
             # PDF oluşturma ayarını her zaman aktif et
             if not self.config.get("pdf_olustur", True):
                 logger.info("PDF oluşturma config'de kapalı, ancak zorla aktifleştiriliyor")
-                self.config["pdf_olustur"] = True
 
             # PDF dosya adına unique_id ekle
             pdf_dosya_sablonu = self.config.get(
@@ -187,56 +232,197 @@ class PDFOlusturucu:
             else:
                 pdf_dosya_adi = pdf_dosya_sablonu.format(tarih=gun_tarihi)
 
-            temp_pdf_dosyasi = grafik_dizini / f"temp_{pdf_dosya_adi}"
             cikti_dosyasi = grafik_dizini / pdf_dosya_adi
+            bolumler = self._bolumleri_hazirla(grafik_dizini, gun_tarihi, analiz_verisi)
 
-            doc = self._pdf_dokument_olustur(temp_pdf_dosyasi)
-            story = []
-
-            # Giriş sayfası (istatistikler)
-            story.extend(self._istatistik_sayfasi_olustur(gun_tarihi, analiz_verisi))
-            story.append(PageBreak())
-
-            # Grafikleri bul ve sırala
-            grafik_dosyalari = self._grafikleri_bul_ve_sirala(grafik_dizini)
-
-            if not grafik_dosyalari:
-                logger.warning("Hiç grafik dosyası bulunamadı")
-                story.append(Paragraph("Analiz için uygun grafik bulunamadı.", self.metin_stili))
-            else:
-                # Sadece dosya yollarını al - GÜVENLİ TUPLE ÇÖZME
-                grafik_yollari = []
-                for item in grafik_dosyalari:
-                    if isinstance(item, tuple):
-                        grafik_yollari.append(str(item[0]))
-                    else:
-                        grafik_yollari.append(str(item))
-                # Özet bilgi: kaç grafik eklenecek
-                try:
-                    story.append(Paragraph(f"Toplam {len(grafik_yollari)} grafik eklendi.", self.metin_stili))
-                    story.append(Spacer(1, 0.1 * inch))
-                except Exception:
-                    pass
-                story.extend(self._grafikleri_grid_olarak_ekle(grafik_yollari, gun_tarihi))
-
-            doc.build(story)
-            logger.info(f"İçerik PDF'i oluşturuldu: {temp_pdf_dosyasi}")
-
-            if PDF_MERGER_AVAILABLE:
-                self._kapak_ile_birlestir(temp_pdf_dosyasi, cikti_dosyasi, gun_tarihi)
-                if temp_pdf_dosyasi.exists():
-                    temp_pdf_dosyasi.unlink()
-                return str(cikti_dosyasi)
-            else:
+            if not PDF_MERGER_AVAILABLE:
+                # Bölümler birleştirilemediğinden tek geçişte oluşturulur
                 logger.warning("PyPDF2 kütüphanesi bulunamadı, kapak eklenemiyor")
-                if temp_pdf_dosyasi.exists():
-                    temp_pdf_dosyasi.rename(cikti_dosyasi)
+                story = []
+                for sira, (tur, veri) in enumerate(bolumler):
+                    if sira > 0:
+                        story.append(PageBreak())
+                    story.extend(self._bolum_story_olustur(tur, veri))
+                self._vektor_yerlesimleri = None
+                # Eski rapor yerinde yazılmaz: çıktı deposuna hardlink'li olabilir
+                cikti_dosyasi.unlink(missing_ok=True)
+                self._pdf_dokument_olustur(cikti_dosyasi).build(story)
                 return str(cikti_dosyasi)
 
+            bolum_dizini = Path(tempfile.mkdtemp(prefix=".pdf_bolumleri_", dir=grafik_dizini))
+            try:
+                bolum_dosyalari = self._bolumleri_ciz(bolumler, bolum_dizini)
+                if not all(bolum_dosyalari):
+                    raise RuntimeError("PDF bölümlerinden bazıları oluşturulamadı")
+                logger.info(f"{len(bolum_dosyalari)} PDF bölümü oluşturuldu")
+                self._bolumleri_birlestir(bolum_dosyalari, cikti_dosyasi, gun_tarihi)
+            finally:
+                shutil.rmtree(bolum_dizini, ignore_errors=True)
+                if self._hazirlayici is not None:
+                    self._hazirlayici.tahliye_et()
+
+            return str(cikti_dosyasi)
+
         except Exception as e:
             logger.error(f"PDF oluşturma hatası: {e}", exc_info=True)
             return ""
 
+    def _bolumleri_hazirla(self, grafik_dizini: Path, gun_tarihi: str, analiz_verisi: Dict) -> List[Tuple[str, Dict]]:
+        """
+        Raporu birbirinden bağımsız bölümlere ayırır
+
+        Bölümler: istatistik sayfası ve her 2x2 grafik ızgarası sayfası.
+        Her bölüm (tür, veri) çiftidir; veri işçi süreçlere gönderilebilir.
+        """
+        bolumler = [("istatistik", {"gun_tarihi": gun_tarihi, "analiz_verisi": analiz_verisi})]
+
+        # Grafikleri bul ve sırala
+        grafik_dosyalari = self._grafikleri_bul_ve_sirala(grafik_dizini)
+
+        if not grafik_dosyalari:
+            logger.warning("Hiç grafik dosyası bulunamadı")
+            bolumler.append(("izgara", {"gun_tarihi": gun_tarihi, "grafikler": [], "toplam": 0}))
+            return bolumler
+
+        # Sadece dosya yollarını al - GÜVENLİ TUPLE ÇÖZME
+        grafik_yollari = []
+        for item in grafik_dosyalari:
+            if isinstance(item, tuple):
+                grafik_yollari.append(str(item[0]))
+            else:
+                grafik_yollari.append(str(item))
+        # Tekrarlar burada elenir; küçültme her bölümde (işçi süreçte) yapılır
+        grafikler = self._tekrarlari_ele(grafik_yollari)
+
+        logger.info(f"Grid için toplam {len(grafikler)} grafik dosyası var")
+        for i in range(0, len(grafikler), 4):
+            bolumler.append((
+                "izgara",
+                {
+                    "gun_tarihi": gun_tarihi,
+                    "grafikler": grafikler[i:i + 4],
+                    "sayfa_no": i // 4 + 1,
+                    # Özet bilgi (kaç grafik eklendi) ilk ızgara sayfasında
+                    "toplam": len(grafikler) if i == 0 else None,
+                },
+            ))
+        return bolumler
+
+    def _bolum_story_olustur(self, tur: str, veri: Dict) -> List:
+        """Tek bir bölümün story'sini oluşturur"""
+        if tur == "istatistik":
+            return self._istatistik_sayfasi_olustur(veri["gun_tarihi"], veri["analiz_verisi"])
+
+        story = []
+        if veri["toplam"] == 0:
+            story.append(Paragraph("Analiz için uygun grafik bulunamadı.", self.metin_stili))
+            return story
+        if veri["toplam"]:
+            story.append(Paragraph(f"Toplam {veri['toplam']} grafik eklendi.", self.metin_stili))
+            story.append(Spacer(1, 0.1 * inch))
+        story.extend(self._izgara_sayfasi_olustur(veri["grafikler"], veri["gun_tarihi"], veri["sayfa_no"]))
+        return story
+
+    def _bolum_pdf_olustur(self, tur: str, veri: Dict, dosya: Path) -> str:
+        """Bölümü kendi PDF dosyasına yazar (vektör modunda grafikleri damgalar)"""
+        self._vektor_yerlesimleri = [] if GRAFIK_CIKTI_AYARLARI.get("vektor") else None
+        self._pdf_dokument_olustur(dosya).build(self._bolum_story_olustur(tur, veri))
+
+        if self._vektor_yerlesimleri and not self._vektor_grafikleri_damgala(dosya):
+            logger.warning("Vektör grafikler gömülemedi, bölüm PNG grafiklerle yeniden oluşturuluyor")
+            self._vektor_yerlesimleri = None
+            self._pdf_dokument_olustur(dosya).build(self._bolum_story_olustur(tur, veri))
+
+        return str(dosya)
+
+    def _bolumleri_ciz(self, bolumler: List[Tuple[str, Dict]], bolum_dizini: Path) -> List[Optional[str]]:
+        """Bölümleri işçi süreç havuzunda (ya da sırayla) PDF'e dönüştürür"""
+        isler = [
+            (tur, veri, str(bolum_dizini / f"{sira:03d}_{tur}.pdf"))
+            for sira, (tur, veri) in enumerate(bolumler)
+        ]
+        isci_sayisi = PDF_PARALEL_AYARLARI.get("isci_sayisi") or os.cpu_count() or 1
+        paralel = (
+            PDF_PARALEL_AYARLARI.get("aktif", True)
+            and isci_sayisi > 1
+            and len(isler) >= PDF_PARALEL_AYARLARI.get("min_bolum_sayisi", 4)
+        )
+
+        if paralel:
+            try:
+                isci_sayisi = min(isci_sayisi, len(isler))
+                with ProcessPoolExecutor(max_workers=isci_sayisi) as havuz:
+                    sonuclar = list(havuz.map(_bolum_isini_calistir, isler))
+                logger.info(f"{len(isler)} PDF bölümü {isci_sayisi} işçi ile oluşturuldu")
+                return sonuclar
+            except Exception as e:
+                # Havuz kurulamazsa (kısıtlı ortam vb.) sırayla oluştur
+                logger.warning(f"Paralel PDF oluşturma başarısız, sırayla oluşturuluyor: {e}")
+
+        return [_bolum_isini_calistir(is_tanimi, self) for is_tanimi in isler]
+
+    def _gorsel_hazirlayici(self) -> GorselHazirlayici:
+        if self._hazirlayici is None:
+            self._hazirlayici = GorselHazirlayici()
+        return self._hazirlayici
+
+    def _tekrarlari_ele(self, grafik_yollari: List[str]) -> List[Tuple[str, Optional[str]]]:
+        """Aynı içerikli grafikleri eler; (yol, içerik özeti) çiftlerini döndürür"""
+        if not PDF_GORSEL_AYARLARI.get("aktif", True):
+            return [(yol, None) for yol in grafik_yollari]
+
+        try:
+            return self._gorsel_hazirlayici().tekrarlari_ele(grafik_yollari)
+        except Exception as e:
+            logger.warning(f"Görsel hazırlama başarısız, orijinal PNG'ler gömülecek: {e}")
+            return [(yol, None) for yol in grafik_yollari]
+
+    def _gomulecek_gorsel(self, grafik_path: str, ozet: Optional[str]) -> str:
+        """PNG'nin grid boyutuna küçültülmüş kopyası (hazırlama kapalıysa orijinali)"""
+        if ozet is None:
+            return grafik_path
+        return self._gorsel_hazirlayici().hazir_yolu(
+            grafik_path, ozet, IZGARA_GRAFIK_GENISLIK, IZGARA_GRAFIK_YUKSEKLIK
+        )
+
+    def _vektor_grafikleri_damgala(self, pdf_dosyasi: Path) -> bool:
+        """
+        Yer tutucuların konumlarına grafiklerin vektör PDF sayfalarını yerleştirir
+
+        Returns:
+            bool: Başarılıysa True (başarısızsa dosya değiştirilmez)
+        """
+        try:
+            okuyucu = PdfReader(str(pdf_dosyasi))
+            for sayfa_no, vektor_pdf, x, y, olcek in self._vektor_yerlesimleri:
+                # Dönüşüm sayfanın içeriğine uygulandığından her yerleşim için yeniden okunur
+                grafik = PdfReader(vektor_pdf).pages[0]
+                kutu = grafik.mediabox
+                grafik.add_transformation(
+                    Transformation()
+                    .translate(-float(kutu.left), -float(kutu.bottom))
+                    .scale(olcek, olcek)
+                    .translate(x, y),
+                    # merge_page grafiği kendi kutusuyla kırptığından kutu da taşınır
+                    expand=True,
+                )
+                okuyucu.pages[sayfa_no - 1].merge_page(grafik)
+
+            yazici = PdfWriter()
+            for sayfa in okuyucu.pages:
+                yazici.add_page(sayfa)
+            gecici = pdf_dosyasi.with_suffix(".vektor.tmp")
+            with open(gecici, "wb") as f:
+                yazici.write(f)
+            gecici.replace(pdf_dosyasi)
+
+            logger.info(f"{len(self._vektor_yerlesimleri)} grafik vektör olarak gömüldü")
+            return True
+
+        except Exception as e:
+            logger.error(f"Vektör grafik gömme hatası: {e}")
+            return False
+
     def _istatistik_sayfasi_olustur(self, gun_tarihi: str, analiz_verisi: Dict) -> List:
         """PDF'in ilk sayfasına genel istatistikleri ekler."""
         elements = []
@@ -291,73 +477,66 @@ class PDFOlusturucu:
 
         return elements
 
-    def _grafikleri_grid_olarak_ekle(self, grafik_dosyalari: List[str], gun_tarihi: str) -> List:
-        """Grafikleri 2x2'lik bir grid düzeninde PDF'e ekler ve başlık ekler.
+    def _izgara_sayfasi_olustur(self, grafikler: List[Tuple[str, str]], gun_tarihi: str, sayfa_no: int) -> List:
+        """En fazla 4 grafiği 2x2'lik bir grid sayfası olarak ekler ve başlık ekler.
 
         A4 dikey içerik alanı (~7.27 inç) dikkate alınarak sütun genişlikleri 3.0 inç,
-        resim genişliği ise 2.8 inç olarak belirlenmiştir.
+        resim genişliği ise 2.8 inç olarak belirlenmiştir. grafikler (yol, içerik
+        özeti) çiftleridir; başlık orijinal dosya adından üretilir.
         """
         from reportlab.platypus import Table, TableStyle
-        from reportlab.lib import colors
 
         story = []
-        
-        logger.info(f"Grid için toplam {len(grafik_dosyalari)} grafik dosyası var")
-        
-        for i in range(0, len(grafik_dosyalari), 4):
-            grafik_grubu = grafik_dosyalari[i:i+4]
-            
-            if i > 0:
-                story.append(PageBreak())
-            
-            story.append(Paragraph(f"Günlük Analiz Grafikleri - {gun_tarihi} (Sayfa {i//4 + 1})", self.alt_baslik_stili))
-            story.append(Spacer(1, 0.2 * inch))
-
-            data = []
-            for j in range(0, len(grafik_grubu), 2):
-                row_items = []
-                for k in range(j, j + 2):
-                    if k < len(grafik_grubu):
-                        grafik_path = grafik_grubu[k]
-                        
-                        # Eğer tuple ise ilk elemanı al
-                        if isinstance(grafik_path, tuple):
-                            grafik_path = grafik_path[0]
-                        
-                        # Dosya adını daha okunaklı hale getir
-                        dosya_adi = Path(grafik_path).stem
-                        baslik_str = dosya_adi.replace("_", " ").replace("-", " ").title()
-                        baslik_style = ParagraphStyle('GrafikBaslik', parent=self.styles['Normal'], fontName=self.default_font, fontSize=8, alignment=TA_CENTER)
-                        baslik = Paragraph(baslik_str, baslik_style)
-                        
-                        if not Path(grafik_path).exists():
-                            logger.warning(f"Grafik bulunamadı: {Path(grafik_path)}")
-                            img = Paragraph(f"Grafik bulunamadı:<br/>{Path(grafik_path).name}", self.metin_stili)
-                        else:
-                            try:
-                                logger.info(f"Grafik yükleniyor: {Path(grafik_path).name}")
-                                img = Image(grafik_path, width=2.8*inch, height=1.8*inch, kind='proportional')
-                            except Exception as e:
-                                logger.warning(f"Grafik yüklenemedi: {grafik_path} - {e}")
-                                img = Paragraph(f"Grafik yüklenemedi:<br/>{Path(grafik_path).name}", self.metin_stili)
-                        
-                        item_table = Table([[img], [baslik]], rowHeights=[2.0*inch, 0.4*inch])
-                        item_table.setStyle(TableStyle([
-                            ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-                            ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                            ('BOTTOMPADDING', (0,1), (0,1), 6),
-                        ]))
-                        row_items.append(item_table)
+
+        story.append(Paragraph(f"Günlük Analiz Grafikleri - {gun_tarihi} (Sayfa {sayfa_no})", self.alt_baslik_stili))
+        story.append(Spacer(1, 0.2 * inch))
+
+        data = []
+        for j in range(0, len(grafikler), 2):
+            row_items = []
+            for k in range(j, j + 2):
+                if k < len(grafikler):
+                    grafik_path, ozet = grafikler[k]
+
+                    # Dosya adını daha okunaklı hale getir
+                    dosya_adi = Path(grafik_path).stem
+                    baslik_str = dosya_adi.replace("_", " ").replace("-", " ").title()
+                    baslik_style = ParagraphStyle('GrafikBaslik', parent=self.styles['Normal'], fontName=self.default_font, fontSize=8, alignment=TA_CENTER)
+                    baslik = Paragraph(baslik_str, baslik_style)
+
+                    if not Path(grafik_path).exists():
+                        logger.warning(f"Grafik bulunamadı: {Path(grafik_path)}")
+                        img = Paragraph(f"Grafik bulunamadı:<br/>{Path(grafik_path).name}", self.metin_stili)
                     else:
-                        row_items.append(Spacer(0,0))
-                data.append(row_items)
+                        try:
+                            logger.info(f"Grafik yükleniyor: {Path(grafik_path).name}")
+                            vektor = vektor_yolu(grafik_path)
+                            if self._vektor_yerlesimleri is not None and vektor.exists():
+                                img = _VektorGrafik(vektor, IZGARA_GRAFIK_GENISLIK, IZGARA_GRAFIK_YUKSEKLIK, self._vektor_yerlesimleri)
+                            else:
+                                gorsel = self._gomulecek_gorsel(grafik_path, ozet)
+                                img = Image(gorsel, width=IZGARA_GRAFIK_GENISLIK, height=IZGARA_GRAFIK_YUKSEKLIK, kind='proportional')
+                        except Exception as e:
+                            logger.warning(f"Grafik yüklenemedi: {grafik_path} - {e}")
+                            img = Paragraph(f"Grafik yüklenemedi:<br/>{Path(grafik_path).name}", self.metin_stili)
+                    
+                    item_table = Table([[img], [baslik]], rowHeights=[2.0*inch, 0.4*inch])
+                    item_table.setStyle(TableStyle([
+                        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+                        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+                        ('BOTTOMPADDING', (0,1), (0,1), 6),
+                    ]))
+                    row_items.append(item_table)
+                else:
+                    row_items.append(Spacer(0,0))
+            data.append(row_items)
 
-            table = Table(data, colWidths=[3.0*inch, 3.0*inch])
-            table.setStyle(TableStyle([
-                ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-            ]))
-            story.append(table)
+        table = Table(data, colWidths=[3.0*inch, 3.0*inch])
+        table.setStyle(TableStyle([
+            ('VALIGN', (0,0), (-1,-1), 'TOP'),
+            ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+        ]))
+        story.append(table)
 
         return story
 
@@ -423,58 +602,34 @@ class PDFOlusturucu:
 
         return elements
 
-    def _kapak_ile_birlestir(self, icerik_pdf: Path, cikti_pdf: Path, gun_tarihi: str = None) -> str:
-        """Kapak PDF'i ile içerik PDF'ini birleştirir"""
-        try:
-            proje_kok = Path(__file__).parent.parent.parent
-            kapak_dosyasi = proje_kok / "assets" / "kapak.pdf"
-
-            if not kapak_dosyasi.exists():
-                logger.warning(f"Kapak dosyası bulunamadı: {kapak_dosyasi}")
-                # Kapak yoksa sadece içerik dosyasını kopyala
-                import shutil
-
-                shutil.copy2(icerik_pdf, cikti_pdf)
-                return str(cikti_pdf)
-
-            if not PDF_MERGER_AVAILABLE:
-                logger.warning("PyPDF2 bulunamadı, kapak birleştirilemedi")
-                import shutil
-
-                shutil.copy2(icerik_pdf, cikti_pdf)
-                return str(cikti_pdf)
-
-            # PDF birleştirme işlemi
-            merger = PdfMerger()
-
-            # Önce kapak sayfasını ekle
-            with open(kapak_dosyasi, "rb") as kapak_file:
-                merger.append(kapak_file)
-
-            # Sonra içerik sayfalarını ekle
-            with open(icerik_pdf, "rb") as icerik_file:
-                merger.append(icerik_file)
-
-            # Birleştirilmiş PDF'yi kaydet
-            with open(cikti_pdf, "wb") as output_file:
-                merger.write(output_file)
+    def _bolumleri_birlestir(self, bolum_dosyalari: List[str], cikti_pdf: Path, gun_tarihi: str = None) -> str:
+        """
+        Kapak ve bölüm PDF'lerinin sayfalarını sırayla tek dosyaya ekler
 
-            merger.close()
+        Kapak süreç içinde derlenmiş sayfa olarak önbellekten gelir, tarih
+        üzerine katman olarak basılır. PdfMerger'ın yer imi / bağlantı
+        işlemesi yapılmaz; bölümlerde bunlar olmadığından sayfaların
+        eklenmesi yeterlidir.
+        """
+        yazici = PdfWriter()
+        try:
+            kapak_onbellegi().yaziciya_ekle(yazici, gun_tarihi)
+        except Exception as e:
+            # Kapak okunamıyorsa sadece içerik bölümlerini kullan
+            logger.error(f"Kapak eklenemedi: {e}")
+            yazici = PdfWriter()
 
-            logger.info(f"Kapak ve içerik başarıyla birleştirildi: {cikti_pdf}")
-            return str(cikti_pdf)
+        for dosya in bolum_dosyalari:
+            for sayfa in PdfReader(str(dosya)).pages:
+                yazici.add_page(sayfa)
 
-        except Exception as e:
-            logger.error(f"PDF birleştirme hatası: {e}")
-            # Hata durumunda sadece içerik dosyasını kullan
-            try:
-                import shutil
+        gecici = cikti_pdf.with_suffix(".birlestirme.tmp")
+        with open(gecici, "wb") as f:
+            yazici.write(f)
+        os.replace(gecici, cikti_pdf)
 
-                shutil.copy2(icerik_pdf, cikti_pdf)
-                return str(cikti_pdf)
-            except Exception as copy_error:
-                logger.error(f"İçerik kopyalama hatası: {copy_error}")
-                return ""
+        logger.info(f"Kapak ve içerik başarıyla birleştirildi: {cikti_pdf}")
+        return str(cikti_pdf)
 
     def _grafikleri_bul_ve_sirala(self, grafik_dizini: Path) -> List[Tuple[Path, str]]:
         """Grafik dosyalarını bulur ve config'e göre sıralar.
@@ -484,8 +639,8 @@ class PDFOlusturucu:
         - Eşleşmeyen tüm PNG'ler de her durumda sona eklenir.
         """
         try:
-            # Tüm PNG dosyalarını bul
-            tum_grafikler = list(grafik_dizini.glob("*.png"))
+            # Tüm PNG dosyalarını bul (klasörün manifesti varsa onun üzerinden)
+            tum_grafikler = dosyalari_coz(grafik_dizini, "*.png")
             
             logger.info(f"PDF için grafik dizininde {len(tum_grafikler)} PNG dosyası bulundu: {grafik_dizini}")
             if len(tum_grafikler) > 0:
@@ -498,17 +653,14 @@ class PDFOlusturucu:
                 return []
 
             sirali_grafikler = []
-            grafik_sirasi = self.config.get("grafik_sirasi", [])
+            grafik_sirasi = self._ayar_dosyasi.turet(
+                "grafik_sirasi", self._grafik_sirasi_derle
+            )
 
             # Config'deki sıraya göre grafikleri ekle
-            for grafik_config in grafik_sirasi:
-                pattern = grafik_config.get("desen", "")
-                baslik = grafik_config.get("baslik", "")
-
+            for eslestirici, baslik, pattern in grafik_sirasi:
                 # Pattern'e uyan grafikleri bul
-                eslesen_grafikler = [
-                    g for g in tum_grafikler if fnmatch.fnmatch(g.name, pattern)
-                ]
+                eslesen_grafikler = [g for g in tum_grafikler if eslestirici(g.name)]
                 
                 # Eşleşen grafik sayısını göster
                 if eslesen_grafikler:
@@ -748,8 +900,7 @@ class PDFOlusturucu:
                 
             json_dosya = json_dosyalari[0]  # İlk bulunan dosyayı al
             
-            with open(json_dosya, 'r', encoding='utf-8') as f:
-                analiz_data = json.load(f)
+            analiz_data = json_oku(json_dosya)
             
             # Süre analizleri var mı kontrol et
             if 'sure_analizleri' not in analiz_data:
@@ -890,3 +1041,22 @@ class PDFOlusturucu:
             elements.append(Spacer(1, 8))
         
         return elements
+
+
+# İşçi süreç başına bir kez oluşturulan PDF oluşturucu (font kayıtları dahil)
+_isci_olusturucusu: Optional[PDFOlusturucu] = None
+
+
+def _bolum_isini_calistir(is_tanimi: Tuple, olusturucu: Optional[PDFOlusturucu] = None) -> Optional[str]:
+    """Tek bir PDF bölümünü oluşturur; dosya yolunu (hatada None) döndürür"""
+    global _isci_olusturucusu
+    tur, veri, dosya = is_tanimi
+    try:
+        if olusturucu is None:
+            if _isci_olusturucusu is None:
+                _isci_olusturucusu = PDFOlusturucu()
+            olusturucu = _isci_olusturucusu
+        return olusturucu._bolum_pdf_olustur(tur, veri, Path(dosya))
+    except Exception as e:
+        logger.error(f"PDF bölümü oluşturulamadı ({tur}): {e}")
+        return None
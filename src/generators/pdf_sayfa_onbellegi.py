@@ -0,0 +1,197 @@
+"""
+PDF sayfa önbelleği - Uygulamadaki PDF görüntüleyici için sayfa görsellerini
+bir kez oluşturur
+
+Sayfa görselleri PDF'in yanındaki alt klasörde her PDF'e ayrılmış klasöre
+(sayfalar/<pdf adı>/) PDF'in içerik özeti ve sayfa numarasıyla
+adlandırılarak yazılır. Aynı sayfa sonraki gösterimlerde yeniden
+rasterlenmez; PDF yeniden oluşturulunca özeti değiştiğinden eski görseller
+kullanılmaz ve yenileri yazılırken silinir (aynı klasördeki başka PDF'lerin
+görsellerine dokunulmaz). Komşu sayfalar arka
+plandaki tek bir iş parçacığında önceden oluşturulur.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple, Union
+
+try:
+    import fitz  # PyMuPDF
+
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+from ..core.cikti_deposu import manifest_oku
+from ..core.config import PDF_SAYFA_GORSEL_AYARLARI
+from ..core.icerik_deposu import dosya_ozeti
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+# PyMuPDF iş parçacıkları arasında güvenli olmadığından tüm rasterleme
+# (ön yükleme dahil) tek kilit altında yapılır
+_fitz_kilidi = threading.Lock()
+
+# (yol, boyut, mtime_ns) -> (içerik özeti, sayfa sayısı); en son kullanılan sonda.
+# Yeniden oluşturulan PDF'ler yeni anahtar açtığından boyutu sınırlanır (LRU)
+_pdf_bilgileri: "OrderedDict[Tuple[str, int, int], Tuple[str, int]]" = OrderedDict()
+_pdf_bilgileri_kilidi = threading.Lock()
+
+
+class PdfSayfaOnbellegi:
+    """Tek bir PDF'in sayfa görsellerinin önbelleği"""
+
+    def __init__(self, pdf_yolu: Union[str, Path], ayarlar: Optional[Dict] = None):
+        """
+        PDF sayfa önbelleği başlatma
+
+        Raises:
+            ImportError: PyMuPDF yüklü değilse
+        """
+        if not PYMUPDF_AVAILABLE:
+            raise ImportError("PyMuPDF (fitz) yüklü değil")
+
+        self.ayarlar = ayarlar if ayarlar is not None else PDF_SAYFA_GORSEL_AYARLARI
+        self.pdf_yolu = Path(pdf_yolu)
+        # Her PDF'in kendi klasörü: eski sürüm temizliği diğer PDF'leri silmez
+        self.dizin = (
+            self.pdf_yolu.parent / self.ayarlar.get("dizin_adi", "sayfalar") / self.pdf_yolu.stem
+        )
+        self.ozet, self.sayfa_sayisi = self._pdf_bilgisi()
+
+    def _pdf_bilgisi(self) -> Tuple[str, int]:
+        """PDF'in içerik özeti ve sayfa sayısı (dosya değişmedikçe bir kez hesaplanır)"""
+        bilgi = self.pdf_yolu.stat()
+        anahtar = (str(self.pdf_yolu.resolve()), bilgi.st_size, bilgi.st_mtime_ns)
+        with _pdf_bilgileri_kilidi:
+            if anahtar in _pdf_bilgileri:
+                _pdf_bilgileri.move_to_end(anahtar)
+                return _pdf_bilgileri[anahtar]
+
+        # Çıktı deposuna alınmış PDF'in özeti manifestte hazır bulunur
+        kayit = (manifest_oku(self.pdf_yolu.parent) or {}).get("dosyalar", {}).get(
+            self.pdf_yolu.name
+        )
+        if (
+            kayit
+            and kayit.get("boyut") == bilgi.st_size
+            and kayit.get("mtime_ns") == bilgi.st_mtime_ns
+        ):
+            ozet = kayit["ozet"]
+        else:
+            ozet = dosya_ozeti(self.pdf_yolu)
+
+        with _fitz_kilidi:
+            with fitz.open(self.pdf_yolu) as belge:
+                sayfa_sayisi = len(belge)
+
+        with _pdf_bilgileri_kilidi:
+            _pdf_bilgileri[anahtar] = (ozet, sayfa_sayisi)
+            _pdf_bilgileri.move_to_end(anahtar)
+            while len(_pdf_bilgileri) > self.ayarlar.get("bilgi_onbellek_boyutu", 256):
+                _pdf_bilgileri.popitem(last=False)
+        return ozet, sayfa_sayisi
+
+    def _gorsel_yolu(self, sayfa_no: int) -> Path:
+        zoom = self.ayarlar.get("zoom", 2.0)
+        return self.dizin / f"{self.ozet[:16]}_{zoom:g}x_{sayfa_no:03d}.png"
+
+    def _eskileri_temizle(self) -> None:
+        """Bu PDF'in önceki sürümlerine ait sayfa görsellerini siler"""
+        for gorsel in self.dizin.glob("*.png"):
+            if not gorsel.name.startswith(self.ozet[:16]):
+                gorsel.unlink(missing_ok=True)
+
+    def sayfa_gorseli(self, sayfa_no: int) -> Path:
+        """
+        Sayfanın görselini döndürür; yoksa oluşturup kaydeder
+
+        Args:
+            sayfa_no: 1'den başlayan sayfa numarası
+        """
+        if not 1 <= sayfa_no <= self.sayfa_sayisi:
+            raise ValueError(
+                f"Geçersiz sayfa numarası: {sayfa_no} (1-{self.sayfa_sayisi})"
+            )
+
+        hedef = self._gorsel_yolu(sayfa_no)
+        if hedef.exists():
+            return hedef
+
+        with _fitz_kilidi:
+            # Kilit beklenirken ön yükleme aynı sayfayı yazmış olabilir
+            if hedef.exists():
+                return hedef
+
+            if not self.dizin.exists():
+                self.dizin.mkdir(parents=True)
+            else:
+                self._eskileri_temizle()
+
+            zoom = self.ayarlar.get("zoom", 2.0)
+            with fitz.open(self.pdf_yolu) as belge:
+                sayfa = belge[sayfa_no - 1]
+                piksel = sayfa.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+                gecici = hedef.with_name(f".{hedef.name}.{os.getpid()}.tmp")
+                piksel.save(str(gecici), output="png")
+            os.replace(gecici, hedef)
+
+        return hedef
+
+    def on_yukle(self, sayfa_nolari: Iterable[int]) -> None:
+        """Verilen sayfaların görsellerini arka planda oluşturur"""
+        for sayfa_no in sayfa_nolari:
+            if 1 <= sayfa_no <= self.sayfa_sayisi and not self._gorsel_yolu(sayfa_no).exists():
+                _on_yukleyici().ekle(self, sayfa_no)
+
+    def tumunu_olustur(self) -> int:
+        """Tüm sayfaların görsellerini oluşturur (rapor oluşturulurken)"""
+        for sayfa_no in range(1, self.sayfa_sayisi + 1):
+            self.sayfa_gorseli(sayfa_no)
+        return self.sayfa_sayisi
+
+
+class _OnYukleyici:
+    """Komşu sayfaları tek iş parçacığında sırayla oluşturan arka plan kuyruğu"""
+
+    def __init__(self):
+        self._havuz = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf_sayfa")
+        self._kilit = threading.Lock()
+        self._bekleyenler: Set[Path] = set()
+
+    def ekle(self, onbellek: PdfSayfaOnbellegi, sayfa_no: int) -> None:
+        hedef = onbellek._gorsel_yolu(sayfa_no)
+        with self._kilit:
+            if hedef in self._bekleyenler:
+                return
+            self._bekleyenler.add(hedef)
+        self._havuz.submit(self._olustur, onbellek, sayfa_no, hedef)
+
+    def _olustur(self, onbellek: PdfSayfaOnbellegi, sayfa_no: int, hedef: Path) -> None:
+        try:
+            onbellek.sayfa_gorseli(sayfa_no)
+        except Exception as e:
+            logger.warning(
+                f"PDF sayfası önceden oluşturulamadı ({onbellek.pdf_yolu}, {sayfa_no}): {e}"
+            )
+        finally:
+            with self._kilit:
+                self._bekleyenler.discard(hedef)
+
+
+_on_yukleyici_ornegi: Optional[_OnYukleyici] = None
+_on_yukleyici_kilidi = threading.Lock()
+
+
+def _on_yukleyici() -> _OnYukleyici:
+    """Süreç içinde paylaşılan ön yükleme kuyruğu"""
+    global _on_yukleyici_ornegi
+    with _on_yukleyici_kilidi:
+        if _on_yukleyici_ornegi is None:
+            _on_yukleyici_ornegi = _OnYukleyici()
+        return _on_yukleyici_ornegi
@@ -2,33 +2,88 @@
 Veri işleme modülü - Veri okuma, filtreleme ve sınıflandırma
 """
 
+import json
 import logging
+import os
+import re
+import time
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
+from ..core.calistirma_kaydi import (
+    DURUM_ISLENDI,
+    DURUM_ISLENIYOR,
+    kayda_yaz,
+    kimlik_olustur,
+)
 from ..core.config import (
     ISLENMIŞ_VERI_DIZIN,
     TARIH_SUTUNLARI,
+    ANA_VERI_DATASET_DIZIN,
+    ANA_VERI_BOLUM_AYARLARI,
+    PARQUET_MOTOR,
+    PARQUET_SIKISTIRMA,
+    BEKLEME_SURESI_TD_SUTUNU,
+    EXCEL_TARIH_SUTUNLARI,
+    TARIH_FORMAT_ADAYLARI,
+    TARIH_FORMAT_ORNEK_SAYISI,
+    PARQUET_TARIH_METADATA_ANAHTARI,
+    KLINIK_SUTUN_ADI,
 )
+from ..utils.dosya_kilidi import dosya_kilidi
+from ..utils.gruplama import gruplu_diziler, tek_grup
+from ..utils.veri_tipleri import kategorik_sutunlara_cevir, kategorik_deger_ata
 
 # Logger yapılandırması
 logger = logging.getLogger(__name__)
 
+# "x gün x saat x dakika" parçaları (sayı, birimden önceki bağımsız kelime olmalı)
+_BEKLEME_BIRIM_DESENLERI = {
+    "days": re.compile(r"(?:^|\s)([+-]?\d+)\s*gün"),
+    "hours": re.compile(r"(?:^|\s)([+-]?\d+)\s*saat"),
+    "minutes": re.compile(r"(?:^|\s)([+-]?\d+)\s*dakika"),
+}
+_BIRIM_SANIYE = {"days": 86400, "hours": 3600, "minutes": 60}
+
+
+def _bitis_ust_siniri(bitis_tarihi: Any) -> pd.Timestamp:
+    """Bitiş tarihinin dışlayıcı üst sınırı.
+
+    Saatsiz tarih (ör. "2025-10-05") günün tamamını kapsar; saat verilmişse
+    o an dahil edilir.
+    """
+    bitis = pd.Timestamp(bitis_tarihi)
+    if bitis == bitis.normalize():
+        return bitis + pd.Timedelta(days=1)
+    return bitis + pd.Timedelta(1, unit="ns")
+
 
 class VeriIsleme:
     """Veri okuma, filtreleme ve sınıflandırma işlemleri"""
 
     def __init__(self):
         """Veri işleme sınıfı başlatma"""
-        self.ana_veri_dosya = ISLENMIŞ_VERI_DIZIN / "ana_veri.parquet"
+        self.ana_veri_dosya = ISLENMIŞ_VERI_DIZIN / "ana_veri.parquet"  # Eski tek dosya
+        self.ana_veri_dizin = ANA_VERI_DATASET_DIZIN
 
     def gunluk_islem(self, excel_dosya: str, unique_id: str = None) -> Dict[str, Any]:
         """Günlük Excel dosyasını işler ve hem günlük hem de ana parquet dosyalarını günceller"""
+        baslangic = time.perf_counter()
+        kimlik = kimlik_olustur(datetime.now().strftime("%Y-%m-%d"), unique_id)
+        kayda_yaz(
+            "baslat",
+            kimlik,
+            datetime.now().strftime("%Y-%m-%d"),
+            DURUM_ISLENIYOR,
+            unique_id=unique_id,
+            ham_dosya=Path(excel_dosya).resolve(),
+        )
         try:
-            from pathlib import Path
             excel_path = Path(excel_dosya)
             if excel_path.suffix.lower() == ".xls":
                 try:
@@ -44,7 +99,11 @@ class VeriIsleme:
                 df = pd.read_excel(excel_dosya, engine="openpyxl")
             islenen_satir = len(df)
 
-            # Tarih sütunlarını güvenli şekilde datetime'a çevir
+            # Sütun adlarını standartlaştır (küçük harf, boşlukları temizle)
+            # Tarih ve düzenleme adımları küçük harfli adlarla çalıştığı için önce yapılır
+            df.columns = [str(col).strip().lower() for col in df.columns]
+
+            # Tarih sütunlarını bir kez parse et; parquet'e timestamp olarak yazılır
             df = self.ensure_datetime_columns(df)
 
             # Veri düzenleme ayarlarını uygula (klinik/durum dönüşümleri vb.)
@@ -53,8 +112,8 @@ class VeriIsleme:
             except Exception as _:
                 logger.warning("Günlük veri düzenleme uygulanamadı, ham veri ile devam ediliyor")
 
-            # Sütun adlarını standartlaştır (küçük harf, boşlukları temizle)
-            df.columns = [str(col).strip().lower() for col in df.columns]
+            # Düşük kardinaliteli sütunlar category (parquet'te dictionary) olarak saklanır
+            df = kategorik_sutunlara_cevir(df)
 
             if unique_id:
                 # unique_id zaten tarih içeriyor (20251005_143022_abc12345)
@@ -66,21 +125,24 @@ class VeriIsleme:
             gunluk_dizin.mkdir(parents=True, exist_ok=True)
 
             gunluk_parquet = gunluk_dizin / "veriler.parquet"
-            df.to_parquet(gunluk_parquet, index=False)
-
-            # Ana veri dosyasını da güncelle
-            if self.ana_veri_dosya.exists():
-                mevcut_df = pd.read_parquet(self.ana_veri_dosya)
-                mevcut_df.columns = [str(col).strip().lower() for col in mevcut_df.columns]
-                birlesik_df = pd.concat([mevcut_df, df])
-                if 'vaka no' in birlesik_df.columns:
-                    birlesik_df = birlesik_df.drop_duplicates(subset=['vaka no'], keep='last')
-                birlesik_df.to_parquet(self.ana_veri_dosya, index=False)
-                logger.info(f"Ana veri dosyası güncellendi: {self.ana_veri_dosya}")
-            else:
-                df.to_parquet(self.ana_veri_dosya, index=False)
-                logger.info(f"Ana veri dosyası oluşturuldu: {self.ana_veri_dosya}")
-
+            self.parquet_yaz(df, gunluk_parquet)
+
+            # Ana veri deposunu güncelle (sadece etkilenen ay bölümleri yeniden yazılır).
+            # Bölümler oku-birleştir-yaz ile güncellendiğinden eşzamanlı işler
+            # (iş kuyruğu, CLI) kilitle sırayla yazar; yoksa biri diğerinin
+            # eklediği vakaları siler
+            with dosya_kilidi(self.ana_veri_dizin.parent / ".ana_veri.kilit"):
+                self._eski_ana_veriyi_tasi()
+                self._ana_veriyi_guncelle(df)
+
+            kayda_yaz(
+                "guncelle",
+                kimlik,
+                durum=DURUM_ISLENDI,
+                parquet_yolu=gunluk_parquet,
+                satir_sayisi=islenen_satir,
+                isleme_sn=round(time.perf_counter() - baslangic, 3),
+            )
             return {
                 "işlenen_satir_sayisi": islenen_satir,
                 "gunluk_parquet": gunluk_parquet
@@ -88,33 +150,241 @@ class VeriIsleme:
 
         except Exception as e:
             logger.error(f"Veri işleme hatası: {e}", exc_info=True)
+            kayda_yaz("hata", kimlik, f"Veri işleme hatası: {e}")
             raise
 
+    def _bolum_anahtari_hesapla(self, df: pd.DataFrame) -> pd.Series:
+        """Her satır için ay bölüm anahtarını (YYYY-MM) hesaplar"""
+        tarih_sutunu = ANA_VERI_BOLUM_AYARLARI["tarih_sutunu"]
+        bilinmeyen = ANA_VERI_BOLUM_AYARLARI["bilinmeyen_bolum"]
+
+        if tarih_sutunu not in df.columns:
+            return pd.Series(bilinmeyen, index=df.index, dtype=object)
+
+        tarihler = df[tarih_sutunu]
+        if not pd.api.types.is_datetime64_any_dtype(tarihler):
+            tarihler = self.ensure_datetime_columns(df[[tarih_sutunu]].copy())[tarih_sutunu]
+            if not pd.api.types.is_datetime64_any_dtype(tarihler):
+                tarihler = pd.to_datetime(tarihler, errors="coerce")
+
+        anahtar = tarihler.dt.strftime(ANA_VERI_BOLUM_AYARLARI["ay_formati"])
+        return anahtar.astype(object).where(tarihler.notna(), bilinmeyen)
+
+    def _bolum_dosyasi(self, bolum: str) -> Path:
+        """Bölüm anahtarına karşılık gelen parquet dosya yolunu döndürür"""
+        bolum_sutunu = ANA_VERI_BOLUM_AYARLARI["bolum_sutunu"]
+        return (
+            self.ana_veri_dizin
+            / f"{bolum_sutunu}={bolum}"
+            / ANA_VERI_BOLUM_AYARLARI["dosya_adi"]
+        )
+
+    def _ana_veri_bolumlerini_listele(
+        self,
+        baslangic_tarihi: Optional[Any] = None,
+        bitis_tarihi: Optional[Any] = None,
+    ) -> List[Path]:
+        """Tarih aralığına düşen bölüm dosyalarını listeler (bölüm budama).
+
+        Tarih aralığı verilirse tarihi bilinmeyen bölüm okunmaz.
+        """
+        if not self.ana_veri_dizin.exists():
+            return []
+
+        bolum_sutunu = ANA_VERI_BOLUM_AYARLARI["bolum_sutunu"]
+        ay_formati = ANA_VERI_BOLUM_AYARLARI["ay_formati"]
+        bilinmeyen = ANA_VERI_BOLUM_AYARLARI["bilinmeyen_bolum"]
+        filtre_var = baslangic_tarihi is not None or bitis_tarihi is not None
+
+        alt_sinir = (
+            pd.Timestamp(baslangic_tarihi).strftime(ay_formati)
+            if baslangic_tarihi is not None
+            else None
+        )
+        ust_sinir = (
+            (_bitis_ust_siniri(bitis_tarihi) - pd.Timedelta(1, unit="ns")).strftime(ay_formati)
+            if bitis_tarihi is not None
+            else None
+        )
+
+        dosyalar = []
+        for bolum_dizin in sorted(self.ana_veri_dizin.glob(f"{bolum_sutunu}=*")):
+            bolum = bolum_dizin.name.split("=", 1)[1]
+            if bolum == bilinmeyen:
+                if filtre_var:
+                    continue
+            else:
+                if alt_sinir is not None and bolum < alt_sinir:
+                    continue
+                if ust_sinir is not None and bolum > ust_sinir:
+                    continue
+
+            dosya = bolum_dizin / ANA_VERI_BOLUM_AYARLARI["dosya_adi"]
+            if dosya.exists():
+                dosyalar.append(dosya)
+
+        return dosyalar
+
+    def _bolum_yaz(self, df: pd.DataFrame, dosya: Path) -> None:
+        """Bölüm dosyasını yazar"""
+        self.parquet_yaz(df, dosya)
+
+    def parquet_yaz(self, df: pd.DataFrame, dosya: Path) -> None:
+        """
+        DataFrame'i parquet olarak yazar (geçici dosya + atomik yer değiştirme).
+
+        Tarih sütunları timestamp olarak saklanır ve hangilerinin parse edilmiş
+        olduğu şema metadata'sına yazılır; okuyucular dönüşümü atlar.
+        """
+        dosya = Path(dosya)
+        dosya.parent.mkdir(parents=True, exist_ok=True)
+
+        # Birleştirme sonrası object'e dönen sütunlar tekrar dictionary olarak yazılır
+        df = kategorik_sutunlara_cevir(df)
+        tablo = pa.Table.from_pandas(df, preserve_index=False)
+        islenmis_tarihler = [
+            col for col in EXCEL_TARIH_SUTUNLARI
+            if col in df.columns and pd.api.types.is_datetime64_any_dtype(df[col])
+        ]
+        metadata = dict(tablo.schema.metadata or {})
+        metadata[PARQUET_TARIH_METADATA_ANAHTARI.encode()] = json.dumps(
+            islenmis_tarihler, ensure_ascii=False
+        ).encode("utf-8")
+        tablo = tablo.replace_schema_metadata(metadata)
+
+        gecici = dosya.with_suffix(".parquet.tmp")
+        pq.write_table(tablo, gecici, compression=PARQUET_SIKISTIRMA)
+        os.replace(gecici, dosya)
+
+    def _parquet_tarihleri_islenmis_mi(self, dosya: Path) -> bool:
+        """Parquet dosyasının tarih sütunları yazılırken parse edilmiş mi?"""
+        try:
+            metadata = pq.read_schema(dosya).metadata or {}
+            return PARQUET_TARIH_METADATA_ANAHTARI.encode() in metadata
+        except Exception:
+            return False
+
+    def parquet_oku(self, dosya: Path, columns=None) -> pd.DataFrame:
+        """
+        Parquet dosyasını okur. Metadata'sı işlenmiş tarih içeren dosyalarda
+        tarih dönüşümü yapılmaz; eski (string tarihli) dosyalar dönüştürülür.
+        """
+        df = pd.read_parquet(dosya, columns=columns)
+        df.columns = [str(col).strip().lower() for col in df.columns]
+        df = kategorik_sutunlara_cevir(df)
+        if self._parquet_tarihleri_islenmis_mi(dosya):
+            df.attrs["tarihler_islenmis"] = True
+            return df
+        return self.ensure_datetime_columns(df)
+
+    def parquet_tarih_gocu(self) -> int:
+        """
+        İşlenmiş veri klasöründeki string tarihli eski parquet dosyalarını
+        timestamp sütunlu ve metadata'lı biçime dönüştürür.
+        Dönüştürülen dosya sayısını döndürür.
+        """
+        donusturulen = 0
+        for dosya in sorted(ISLENMIŞ_VERI_DIZIN.rglob("*.parquet")):
+            if self._parquet_tarihleri_islenmis_mi(dosya):
+                continue
+            try:
+                df = pd.read_parquet(dosya)
+                df.columns = [str(col).strip().lower() for col in df.columns]
+                df = self.ensure_datetime_columns(df)
+                self.parquet_yaz(df, dosya)
+                donusturulen += 1
+                logger.info(f"Tarih sütunları dönüştürüldü: {dosya}")
+            except Exception as e:
+                logger.error(f"Parquet tarih göçü hatası ({dosya}): {e}")
+        return donusturulen
+
+    def _ana_veriyi_guncelle(self, df: pd.DataFrame) -> None:
+        """Yeni günlük veriyi ana veri deposuna ekler.
+
+        Sadece yeni verinin düştüğü ay bölümleri okunur ve yeniden yazılır.
+        Aynı 'vaka no' etkilenen bölümlerin hepsinden çıkarılır, son gelen kayıt
+        kalır. Bir vakanın oluşturma tarihi değişmediği sürece vaka tek bir
+        bölümde bulunur; etkilenmeyen bölümler taranmaz.
+        """
+        if df.empty:
+            return
+
+        bolumler = self._bolum_anahtari_hesapla(df)
+        yeni_vaka_nolari = (
+            set(df["vaka no"].dropna()) if "vaka no" in df.columns else set()
+        )
+
+        for bolum, yeni_df in df.groupby(bolumler, sort=True):
+            dosya = self._bolum_dosyasi(bolum)
+
+            if dosya.exists():
+                mevcut_df = self.parquet_oku(dosya)
+                if yeni_vaka_nolari and "vaka no" in mevcut_df.columns:
+                    # Aynı çalıştırmada bölüm değiştiren vakaların eski kayıtlarını da çıkar
+                    mevcut_df = mevcut_df[~mevcut_df["vaka no"].isin(yeni_vaka_nolari)]
+                birlesik_df = pd.concat([mevcut_df, yeni_df])
+            else:
+                birlesik_df = yeni_df
+
+            if "vaka no" in birlesik_df.columns:
+                birlesik_df = birlesik_df.drop_duplicates(subset=["vaka no"], keep="last")
+
+            self._bolum_yaz(birlesik_df, dosya)
+            logger.info(f"Ana veri bölümü güncellendi: {dosya} ({len(birlesik_df)} satır)")
+
+    def _eski_ana_veriyi_tasi(self) -> None:
+        """Eski tek dosyalı ana_veri.parquet'i bölümlenmiş depoya bir kez taşır"""
+        try:
+            if not self.ana_veri_dosya.exists() or self._ana_veri_bolumlerini_listele():
+                return
+
+            eski_df = self.parquet_oku(self.ana_veri_dosya)
+            bolumler = self._bolum_anahtari_hesapla(eski_df)
+            for bolum, bolum_df in eski_df.groupby(bolumler, sort=True):
+                self._bolum_yaz(bolum_df, self._bolum_dosyasi(bolum))
+
+            yedek = self.ana_veri_dosya.with_suffix(".parquet.eski")
+            os.replace(self.ana_veri_dosya, yedek)
+            logger.info(
+                f"Eski ana veri dosyası bölümlenmiş depoya taşındı: {self.ana_veri_dizin} "
+                f"(yedek: {yedek.name})"
+            )
+        except Exception as e:
+            logger.error(f"Eski ana veri taşıma hatası: {e}")
+
+    def _tarih_formati_bul(self, seri: pd.Series) -> Optional[str]:
+        """Dolu değerlerden bir örneklem üzerinde sütunun tarih formatını tespit eder"""
+        ornek = seri.dropna().astype(str).head(TARIH_FORMAT_ORNEK_SAYISI)
+        if ornek.empty:
+            return None
+        for format_ in TARIH_FORMAT_ADAYLARI:
+            parsed = pd.to_datetime(ornek, format=format_, errors="coerce")
+            if parsed.notna().sum() >= len(ornek) * 0.5:
+                return format_
+        return None
+
     def ensure_datetime_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Verideki ana tarih sütunlarını güvenli biçimde datetime'a çevirir.
 
-        Hem Excel'den gelen ham veri hem de parquet'ten okunan veri için kullanılır.
+        Format sütun başına bir kez tespit edilir. Metadata'sı işlenmiş tarih
+        içeren parquet'ten okunan veri (df.attrs) ve zaten datetime olan
+        sütunlar atlanır.
         """
         try:
-            if df is None or df.empty:
+            if df is None or df.empty or df.attrs.get("tarihler_islenmis"):
                 return df
 
-            tarih_sutunlari_gercek = [
-                "talep tarihi",
-                "oluşturma tarihi",
-                "yer aramaya başlama tarihi",
-                "yer bulunma tarihi",
-                "ekip talep tarihi",
-                "ekip belirlenme tarihi",
-                "vakanın ekibe veriliş tarihi",
-            ]
-            for col in tarih_sutunlari_gercek:
+            for col in EXCEL_TARIH_SUTUNLARI:
                 if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
-                    # str'e çevir ve iki aşamalı parse et
-                    seri = df[col].astype(str)
-                    parsed = pd.to_datetime(seri, format="%d-%m-%Y %H:%M:%S", errors="coerce")
-                    # Yetersizse genel parse
-                    if parsed.isna().sum() > len(parsed) * 0.5:
+                    seri = df[col].where(df[col].notna(), None)
+                    format_ = self._tarih_formati_bul(seri)
+                    if format_ is not None:
+                        parsed = pd.to_datetime(
+                            seri.astype(str), format=format_, errors="coerce"
+                        )
+                    else:
+                        # Bilinen format yoksa genel parse
+                        logger.warning(f"'{col}' için bilinen tarih formatı bulunamadı, genel parse kullanılıyor")
                         parsed = pd.to_datetime(seri, errors="coerce")
                     df[col] = parsed
             return df
@@ -122,51 +392,61 @@ class VeriIsleme:
             logger.warning(f"Datetime dönüştürme hatası: {e}")
             return df
 
-    def veriyi_oku(self, columns=None) -> pd.DataFrame:
-        """Ana veri dosyasını okur. HAFIZA OPTİMİZASYONU: Sadece gerekli kolonları yükle"""
+    def veriyi_oku(
+        self,
+        columns=None,
+        baslangic_tarihi: Optional[Any] = None,
+        bitis_tarihi: Optional[Any] = None,
+    ) -> pd.DataFrame:
+        """Ana veri deposunu okur. HAFIZA OPTİMİZASYONU: Sadece gerekli kolonları yükle
+
+        baslangic_tarihi / bitis_tarihi verilirse (oluşturma tarihi, her iki uç dahil;
+        saatsiz bitiş tarihi günün sonuna kadar) yalnızca bu aralığa düşen ay
+        bölümleri diskten okunur.
+        """
         try:
-            if not self.ana_veri_dosya.exists():
-                logger.warning(f"Ana veri dosyası bulunamadı: {self.ana_veri_dosya}. Boş DataFrame döndürülüyor.")
+            tarih_sutunu = ANA_VERI_BOLUM_AYARLARI["tarih_sutunu"]
+            filtre_var = baslangic_tarihi is not None or bitis_tarihi is not None
+
+            okunacak_sutunlar = columns
+            if filtre_var and columns is not None and tarih_sutunu not in columns:
+                okunacak_sutunlar = list(columns) + [tarih_sutunu]
+
+            bolum_dosyalari = self._ana_veri_bolumlerini_listele(
+                baslangic_tarihi, bitis_tarihi
+            )
+            if bolum_dosyalari:
+                # HAFIZA OPTİMİZASYONU: Belirtilen kolonları oku (None ise hepsini)
+                parcalar = [self.parquet_oku(d, columns=okunacak_sutunlar) for d in bolum_dosyalari]
+                df = pd.concat(parcalar, ignore_index=True)
+                # Kategori listeleri farklı bölümler birleşince object'e döner
+                df = kategorik_sutunlara_cevir(df)
+                df.attrs["tarihler_islenmis"] = all(
+                    p.attrs.get("tarihler_islenmis", False) for p in parcalar
+                )
+            elif self.ana_veri_dosya.exists():
+                # Henüz taşınmamış eski tek dosyalı ana veri
+                df = self.parquet_oku(self.ana_veri_dosya, columns=okunacak_sutunlar)
+            elif self.ana_veri_dizin.exists() and filtre_var:
+                logger.info("Tarih aralığına düşen ana veri bölümü yok. Boş DataFrame döndürülüyor.")
+                return pd.DataFrame()
+            else:
+                logger.warning(f"Ana veri bulunamadı: {self.ana_veri_dizin}. Boş DataFrame döndürülüyor.")
                 return pd.DataFrame()
 
-            # HAFIZA OPTİMİZASYONU: Belirtilen kolonları oku (None ise hepsini)
-            df = pd.read_parquet(self.ana_veri_dosya, columns=columns)
-
-            # Gerçek sütun adlarını kullan (küçük harf)
-            tarih_sutunlari_gercek = [
-                "talep tarihi",
-                "oluşturma tarihi",
-                "yer aramaya başlama tarihi",
-                "yer bulunma tarihi",
-                "ekip talep tarihi",
-                "ekip belirlenme tarihi",
-                "vakanın ekibe veriliş tarihi",
-            ]
-
-            # Tarih sütunlarını datetime'a çevir
-            for col in tarih_sutunlari_gercek:
-                if col in df.columns:
-                    # Önce zaten datetime ise olduğu gibi bırak
-                    if pd.api.types.is_datetime64_any_dtype(df[col]):
-                        logger.info(f"'{col}' zaten datetime tipinde, atlanıyor")
-                        continue
-                        
-                    # Önce NaN olmayan değerleri string'e çevir
-                    df[col] = df[col].astype(str)
-                    # Hem Türkçe tarih formatını hem de ISO formatını dene
-                    df[col] = pd.to_datetime(
-                        df[col], format="%d-%m-%Y %H:%M:%S", errors="coerce"
-                    )
-                    
-                    # Eğer hala çok fazla NaT varsa, ISO format dene
-                    nat_count = df[col].isna().sum()
-                    total_count = len(df[col])
-                    if nat_count > total_count * 0.5:  # %50'den fazla NaT varsa
-                        logger.warning(f"'{col}' Türkçe format parse başarısız ({nat_count}/{total_count} NaT), ISO format deneniyor")
-                        df_backup = df[col].astype(str)
-                        df[col] = pd.to_datetime(df_backup, errors="coerce")
-                        new_nat_count = df[col].isna().sum()
-                        logger.info(f"'{col}' ISO format parse sonucu: {new_nat_count}/{total_count} NaT")
+            # Tarih sütunları: metadata'lı dosyalarda dönüşüm atlanır
+            df = self.ensure_datetime_columns(df)
+
+            # Bölüm içindeki satırları tam tarih aralığına göre süz
+            if filtre_var and tarih_sutunu in df.columns:
+                mask = df[tarih_sutunu].notna()
+                if baslangic_tarihi is not None:
+                    mask &= df[tarih_sutunu] >= pd.Timestamp(baslangic_tarihi)
+                if bitis_tarihi is not None:
+                    mask &= df[tarih_sutunu] < _bitis_ust_siniri(bitis_tarihi)
+                df = df[mask].reset_index(drop=True)
+                if columns is not None and tarih_sutunu not in columns:
+                    df = df.drop(columns=[tarih_sutunu])
 
             # Veri düzenleme ayarlarını uygula
             df = self._veri_duzenleme_uygula(df)
@@ -198,7 +478,7 @@ class VeriIsleme:
                         mask = df[klinik_sutun] == eski_ad
                         donusum_sayisi = mask.sum()
                         if donusum_sayisi > 0:
-                            df.loc[mask, klinik_sutun] = yeni_ad
+                            kategorik_deger_ata(df, mask, klinik_sutun, yeni_ad)
                             toplam_donusum += donusum_sayisi
                             logger.info(
                                 f"Klinik dönüştürme: {donusum_sayisi} "
@@ -221,7 +501,7 @@ class VeriIsleme:
                         mask = df[solunum_sutun] == eski_ad
                         donusum_sayisi = mask.sum()
                         if donusum_sayisi > 0:
-                            df.loc[mask, solunum_sutun] = yeni_ad
+                            kategorik_deger_ata(df, mask, solunum_sutun, yeni_ad)
                             toplam_donusum += donusum_sayisi
                             logger.info(
                                 f"Solunum dönüştürme: {donusum_sayisi} "
@@ -240,7 +520,7 @@ class VeriIsleme:
             if yeni_talep_donusum:
                 if "durum" in df.columns:
                     onceki_sayisi = (df["durum"] == "Yeni Talep").sum()
-                    df.loc[df["durum"] == "Yeni Talep", "durum"] = "Yer Aranıyor"
+                    kategorik_deger_ata(df, df["durum"] == "Yeni Talep", "durum", "Yer Aranıyor")
                     if onceki_sayisi > 0:
                         logger.info(
                             f"Veri düzenleme: {onceki_sayisi} "
@@ -296,9 +576,9 @@ class VeriIsleme:
                 )
 
                 # Eski tarihli + yer bulunma tarihi analiz aralığında = devreden ama tamamlanmış
-                yer_bulunma_dt = pd.to_datetime(
-                    df["yer bulunma tarihi"], errors="coerce"
-                )
+                yer_bulunma_dt = df["yer bulunma tarihi"]
+                if not pd.api.types.is_datetime64_any_dtype(yer_bulunma_dt):
+                    yer_bulunma_dt = pd.to_datetime(yer_bulunma_dt, errors="coerce")
                 eski_tamamlanmis_mask = (
                     (df["oluşturma tarihi"] < dun_08)
                     & (yer_bulunma_dt >= dun_08)
@@ -345,51 +625,71 @@ class VeriIsleme:
         try:
             if pd.isna(bekleme_str) or not isinstance(bekleme_str, str):
                 return timedelta(0)
-
-            gun = 0
-            saat = 0
-            dakika = 0
-
-            # "gün" kelimesini ara
-            if "gün" in bekleme_str:
-                gun_part = bekleme_str.split("gün")[0].strip()
-                try:
-                    gun = int(gun_part.split()[-1])
-                except:
-                    gun = 0
-
-            # "saat" kelimesini ara
-            if "saat" in bekleme_str:
-                saat_part = bekleme_str.split("saat")[0]
-                if "gün" in saat_part:
-                    saat_part = saat_part.split("gün")[1]
-                saat_part = saat_part.strip()
-                try:
-                    saat = int(saat_part.split()[-1])
-                except:
-                    saat = 0
-
-            # "dakika" kelimesini ara
-            if "dakika" in bekleme_str:
-                dakika_part = bekleme_str.split("dakika")[0]
-                if "saat" in dakika_part:
-                    dakika_part = dakika_part.split("saat")[1]
-                elif "gün" in dakika_part:
-                    dakika_part = dakika_part.split("gün")[1]
-                    if "saat" in dakika_part:
-                        dakika_part = dakika_part.split("saat")[1]
-                dakika_part = dakika_part.strip()
-                try:
-                    dakika = int(dakika_part.split()[-1])
-                except:
-                    dakika = 0
-
-            return timedelta(days=gun, hours=saat, minutes=dakika)
+            sure = self.bekleme_suresi_serisi(pd.Series([bekleme_str])).iloc[0]
+            if pd.isna(sure):
+                raise OverflowError("süre timedelta sınırını aşıyor")
+            return sure.to_pytimedelta()
 
         except Exception as e:
             logger.warning(f"Bekleme süresi parse hatası: {bekleme_str} -> {e}")
             return timedelta(0)
 
+    def bekleme_suresi_saniye(self, bekleme: pd.Series) -> pd.Series:
+        """
+        "x gün x saat x dakika" sütununu tek geçişte saniye (float) serisine çevirir.
+
+        Aynı metinler çok tekrarlandığı için regex yalnızca benzersiz değerlere
+        uygulanır. Eksik birimler 0 sayılır, okunamayan metin 0 süre olur,
+        boş değerler NaN kalır. Float toplamda taşma olmaz; çok büyük
+        süreler (ör. "999999 gün") de hesaplanır.
+        """
+        dolu = bekleme.notna()
+        metin = bekleme[dolu].astype(str)
+        benzersiz = pd.Series(metin.unique(), dtype=object)
+
+        toplam = pd.Series(0.0, index=benzersiz.index)
+        for birim, desen in _BEKLEME_BIRIM_DESENLERI.items():
+            deger = pd.to_numeric(
+                benzersiz.str.extract(desen, expand=False), errors="coerce"
+            ).fillna(0)
+            toplam += deger * _BIRIM_SANIYE[birim]
+
+        donusum = pd.Series(toplam.values, index=benzersiz.values)
+        sonuc = pd.Series(np.nan, index=bekleme.index)
+        sonuc[dolu] = metin.map(donusum).to_numpy(dtype=float)
+        return sonuc
+
+    def bekleme_suresi_serisi(self, bekleme: pd.Series) -> pd.Series:
+        """
+        "x gün x saat x dakika" sütununu timedelta64[ns] serisine çevirir.
+
+        Boş değerler NaT kalır. timedelta64[ns] sınırını aşan süreler
+        yalnızca kendi satırında NaT olur; sütunun geri kalanı etkilenmez.
+        """
+        saniye = self.bekleme_suresi_saniye(bekleme)
+        saniye = saniye.where(saniye.abs() < pd.Timedelta.max.total_seconds())
+        return pd.to_timedelta(saniye.round(), unit="s").astype("timedelta64[ns]")
+
+    def bekleme_suresi_sutunu_ekle(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Parse edilmiş bekleme süresini sütun olarak ekler (varsa tekrar parse etmez)"""
+        if (
+            "bekleme süresi" in df.columns
+            and BEKLEME_SURESI_TD_SUTUNU not in df.columns
+        ):
+            df[BEKLEME_SURESI_TD_SUTUNU] = self.bekleme_suresi_serisi(df["bekleme süresi"])
+        return df
+
+    def _bekleme_saniye_sutunu(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Bekleme süresini saniye olarak döndürür. timedelta sütununda NaT
+        kalan taşan satırlar float olarak yeniden hesaplanır.
+        """
+        saniye = df[BEKLEME_SURESI_TD_SUTUNU].dt.total_seconds()
+        tasan = df["bekleme süresi"].notna() & saniye.isna()
+        if tasan.any():
+            saniye[tasan] = self.bekleme_suresi_saniye(df.loc[tasan, "bekleme süresi"])
+        return saniye
+
     def vaka_tipi_belirle(
         self, df: pd.DataFrame, gun_tarihi: Optional[str] = None
     ) -> pd.DataFrame:
@@ -431,7 +731,7 @@ class VeriIsleme:
                 logger.info(f"Manuel tarih aralığı kontrolü: {len(tarih_araligi_vakalar)} vaka bulundu")
             
             # 1a. Yer Bulunma Tarihi filtrelemesi - Sadece çok eski tamamlanmış vakaları çıkar
-            yer_bulunma_filtre = pd.Series([True] * len(df), index=df.index)
+            yer_bulunma_filtre = pd.Series(True, index=df.index)
             if "yer bulunma tarihi" in df.columns:
                 # Analiz başlangıcından 1 gün önce tamamlanmış vakaları çıkar
                 cok_eski_tamamlanmis = df["yer bulunma tarihi"].notna() & (
@@ -454,27 +754,22 @@ class VeriIsleme:
                 )
 
             # 1b. İptal edilmiş vakalar filtrelemesi
-            iptal_filtre = pd.Series([True] * len(df), index=df.index)
+            iptal_filtre = pd.Series(True, index=df.index)
+            bekleme_saniye = None
             if (
                 "durum" in df.columns
                 and "oluşturma tarihi" in df.columns
                 and "bekleme süresi" in df.columns
             ):
                 iptal_mask = df["durum"] == "Nakil Talebi İptal Edildi"
+                df = self.bekleme_suresi_sutunu_ekle(df)
+                bekleme_saniye = self._bekleme_saniye_sutunu(df)
+                # dün 08:00'e kalan süre; oluşturma + bekleme taşmasın diye
+                # karşılaştırmalar saniye cinsinden yapılır
+                kalan_saniye = (dun_08 - df["oluşturma tarihi"]).dt.total_seconds()
 
-                for idx in df[iptal_mask].index:
-                    try:
-                        olusturma = df.loc[idx, "oluşturma tarihi"]
-                        bekleme_str = df.loc[idx, "bekleme süresi"]
-
-                        if pd.notna(olusturma) and pd.notna(bekleme_str):
-                            bekleme_delta = self._bekleme_suresi_parse(str(bekleme_str))
-                            iptal_zamani = pd.to_datetime(olusturma) + bekleme_delta
-
-                            if iptal_zamani < dun_08:
-                                iptal_filtre.loc[idx] = False
-                    except Exception as e:
-                        logger.warning(f"İptal vakası işleme hatası (idx={idx}): {e}")
+                # İptal zamanı = oluşturma + bekleme (ikisi de dolu olmalı)
+                iptal_filtre = ~(iptal_mask & (bekleme_saniye < kalan_saniye))
 
                 filtrelenen_iptal = (~iptal_filtre & iptal_mask).sum()
                 logger.info(
@@ -487,6 +782,7 @@ class VeriIsleme:
             # 2. SINIFLANDIRMA AŞAMASI (Filtreyi geçenler için)
             if "oluşturma tarihi" in df.columns:
                 olusturma_mask = df["oluşturma tarihi"].notna()
+                eski_mask = genel_filtre & olusturma_mask & (df["oluşturma tarihi"] < dun_08)
 
                 # Yeni vakalar: Oluşturma tarihi dün 08:00'den sonra
                 yeni_vaka_mask = (
@@ -496,65 +792,35 @@ class VeriIsleme:
                 # Devreden vakalar: Oluşturma tarihi dün 08:00'den önce
                 # ANCAK oluşturma_tarihi + bekleme_süresi > dün 08:00 olanlar
                 # VEYA yer bulma tarihi dün 08:00 - bugün 08:00 arasında olanlar
-                devreden_vaka_mask = pd.Series([False] * len(df), index=df.index)
 
                 # Bugün 08:00 (bitiş noktası)
                 bugun_08 = pd.to_datetime(f"{gun_tarihi} 08:00:00")
 
                 if "bekleme süresi" in df.columns:
-                    for idx in df[
-                        genel_filtre
-                        & olusturma_mask
-                        & (df["oluşturma tarihi"] < dun_08)
-                    ].index:
-                        try:
-                            olusturma = df.loc[idx, "oluşturma tarihi"]
-                            bekleme_str = df.loc[idx, "bekleme süresi"]
-                            durum = (
-                                df.loc[idx, "durum"] if "durum" in df.columns else ""
-                            )
-                            yer_bulunma = (
-                                df.loc[idx, "yer bulunma tarihi"]
-                                if "yer bulunma tarihi" in df.columns
-                                else None
-                            )
+                    if bekleme_saniye is None:
+                        df = self.bekleme_suresi_sutunu_ekle(df)
+                        bekleme_saniye = self._bekleme_saniye_sutunu(df)
+
+                    # Kontrol 1: oluşturma + bekleme > dün 08:00 (NaN karşılaştırmaları False)
+                    kalan_saniye = (dun_08 - df["oluşturma tarihi"]).dt.total_seconds()
+                    bekleme_kontrol = bekleme_saniye > kalan_saniye
+
+                    # Kontrol 2: Yer Ayarlandı vakaları için özel kontrol
+                    yer_kontrol = pd.Series(False, index=df.index)
+                    if "durum" in df.columns and "yer bulunma tarihi" in df.columns:
+                        yer_bulma_dt = df["yer bulunma tarihi"]
+                        if not pd.api.types.is_datetime64_any_dtype(yer_bulma_dt):
+                            yer_bulma_dt = pd.to_datetime(yer_bulma_dt, errors="coerce")
+                        yer_kontrol = (
+                            (df["durum"] == "Yer Ayarlandı")
+                            & (yer_bulma_dt >= dun_08)
+                            & (yer_bulma_dt < bugun_08)
+                        )
 
-                            is_devreden = False
-
-                            # Kontrol 1: Bekleme süresi bazlı kontrol
-                            if pd.notna(olusturma) and pd.notna(bekleme_str):
-                                bekleme_delta = self._bekleme_suresi_parse(
-                                    str(bekleme_str)
-                                )
-                                vaka_bitis_zamani = (
-                                    pd.to_datetime(olusturma) + bekleme_delta
-                                )
-
-                                # Eğer vaka bitiş zamanı dün 08:00'dan sonraysa, devreden vaka olabilir
-                                if vaka_bitis_zamani > dun_08:
-                                    is_devreden = True
-
-                            # Kontrol 2: Yer Ayarlandı vakaları için özel kontrol
-                            if durum == "Yer Ayarlandı" and pd.notna(yer_bulunma):
-                                yer_bulma_dt = pd.to_datetime(yer_bulunma)
-                                # Yer bulma tarihi analiz aralığında mı? (dün 08:00 - bugün 08:00)
-                                if dun_08 <= yer_bulma_dt < bugun_08:
-                                    is_devreden = True
-
-                            if is_devreden:
-                                devreden_vaka_mask.loc[idx] = True
-
-                        except Exception as e:
-                            logger.warning(
-                                f"Devreden vaka kontrolü hatası (idx={idx}): {e}"
-                            )
+                    devreden_vaka_mask = eski_mask & (bekleme_kontrol | yer_kontrol)
                 else:
                     # Bekleme süresi yoksa eski mantık (oluşturma tarihi bazlı)
-                    devreden_vaka_mask = (
-                        genel_filtre
-                        & olusturma_mask
-                        & (df["oluşturma tarihi"] < dun_08)
-                    )
+                    devreden_vaka_mask = eski_mask
 
                 # Sınıflandırma uygula
                 df.loc[yeni_vaka_mask, "vaka_tipi"] = "Yeni Vaka"
@@ -562,12 +828,7 @@ class VeriIsleme:
 
                 # AKTİF VAKALAR İÇİN ÖZEL KONTROL
                 # Yer Aranıyor durumundaki vakalar devam eden vakalardır
-                aktif_vaka_mask = (
-                    genel_filtre
-                    & olusturma_mask
-                    & (df["oluşturma tarihi"] < dun_08)
-                    & (df["durum"] == "Yer Aranıyor")
-                )
+                aktif_vaka_mask = eski_mask & (df["durum"] == "Yer Aranıyor")
                 df.loc[aktif_vaka_mask, "vaka_tipi"] = "Devreden Vaka"
 
                 # İstatistikleri logla
@@ -597,28 +858,40 @@ class VeriIsleme:
             df["vaka_tipi"] = "Hata"
             return df
 
+    def il_maskeleri(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        İl içi, il dışı ve bütün bölgeler için satır maskelerini döndürür
+        İl dışı: Talep Kaynağı != "İl İçi"
+        """
+        if "talep kaynağı" in df.columns:
+            # İl dışı: Talep Kaynağı sütunu "İl İçi" olmayan vakalar
+            il_disi_mask = (
+                (df["talep kaynağı"] != "İl İçi") & df["talep kaynağı"].notna()
+            ).to_numpy()
+            maskeler = {"Il_Disi": il_disi_mask, "Il_Ici": ~il_disi_mask}
+        else:
+            # Talep Kaynağı sütunu yoksa tümü il içi sayılır
+            maskeler = {
+                "Il_Ici": np.ones(len(df), dtype=bool),
+                "Il_Disi": np.zeros(len(df), dtype=bool),
+            }
+
+        maskeler["Butun_Bolgeler"] = np.ones(len(df), dtype=bool)
+        return maskeler
+
     def il_bazinda_grupla(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         """
         Verileri il içi, il dışı ve bütün bölgeler olarak gruplar
         İl dışı: Talep Kaynağı != "İl İçi"
+
+        Gruplar kopya değil, salt okunur alt kümelerdir (Butun_Bolgeler
+        doğrudan df'dir); değiştirilecekse çağıran taraf kopyalamalıdır.
         """
         try:
             gruplar = {}
 
-            if "talep kaynağı" in df.columns:
-                # İl dışı: Talep Kaynağı sütunu "İl İçi" olmayan vakalar
-                il_disi_mask = (df["talep kaynağı"] != "İl İçi") & df[
-                    "talep kaynağı"
-                ].notna()
-
-                gruplar["Il_Disi"] = df[il_disi_mask].copy()
-                gruplar["Il_Ici"] = df[~il_disi_mask].copy()
-            else:
-                # Talep Kaynağı sütunu yoksa tümü il içi sayılır
-                gruplar["Il_Ici"] = df.copy()
-                gruplar["Il_Disi"] = pd.DataFrame()
-
-            gruplar["Butun_Bolgeler"] = df.copy()
+            for grup_adi, maske in self.il_maskeleri(df).items():
+                gruplar[grup_adi] = df if grup_adi == "Butun_Bolgeler" else df[maske]
 
             # İstatistikleri logla
             for grup_adi, grup_df in gruplar.items():
@@ -702,77 +975,124 @@ class VeriIsleme:
         Returns:
             İstatistik sözlüğü
         """
-        try:
-            istatistikler = {
-                'toplam_vaka': len(df),
-                'tamamlanan_vaka': 0,
-                'bekleyen_vaka': 0,
-                'yer_bulma_suresi': {},
-                'bekleme_suresi': {},
-                'klinik_bazinda': {}
-            }
-            
-            # Tamamlanmış vakalar
-            tamamlanan = df[df['durum_kategori'] == 'Tamamlandı']
-            if not tamamlanan.empty:
-                yer_bulma_sureler = tamamlanan['yer_bulma_sure_dk'].dropna()
-                if not yer_bulma_sureler.empty:
-                    istatistikler['tamamlanan_vaka'] = len(tamamlanan)
-                    istatistikler['yer_bulma_suresi'] = {
-                        'ortalama_dk': round(yer_bulma_sureler.mean(), 1),
-                        'medyan_dk': round(yer_bulma_sureler.median(), 1),
-                        'min_dk': round(yer_bulma_sureler.min(), 1),
-                        'max_dk': round(yer_bulma_sureler.max(), 1),
-                        'ortalama_saat': round(yer_bulma_sureler.mean() / 60, 1),
-                    }
-            
-            # Bekleyen vakalar
-            bekleyen = df[df['durum_kategori'] == 'Bekliyor']
-            if not bekleyen.empty:
-                bekleme_sureler = bekleyen['bekleme_sure_dk'].dropna()
-                if not bekleme_sureler.empty:
-                    istatistikler['bekleyen_vaka'] = len(bekleyen)
-                    istatistikler['bekleme_suresi'] = {
-                        'ortalama_dk': round(bekleme_sureler.mean(), 1),
-                        'medyan_dk': round(bekleme_sureler.median(), 1),
-                        'min_dk': round(bekleme_sureler.min(), 1),
-                        'max_dk': round(bekleme_sureler.max(), 1),
-                        'ortalama_saat': round(bekleme_sureler.mean() / 60, 1),
-                    }
+        return self.sure_istatistikleri_gruplari(df, *tek_grup(len(df)), 1)[0]
+
+    def sure_istatistikleri_gruplari(
+        self,
+        df: pd.DataFrame,
+        grup_kodu: np.ndarray,
+        satir_indeksi: np.ndarray,
+        grup_sayisi: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Süre istatistiklerini her grup için tek geçişte hesaplar
+        
+        Args:
+            df: Süre bilgileri içeren veri çerçevesi
+            grup_kodu: Uzun biçimde her satırın grup kodu
+            satir_indeksi: Uzun biçimde her satırın df içindeki konumu
+            grup_sayisi: Grup sayısı
             
-            # Klinik bazında analiz
-            if 'nakledilmesi i̇stenen klinik' in df.columns:
-                for klinik in df['nakledilmesi i̇stenen klinik'].unique():
-                    if pd.isna(klinik):
-                        continue
-                        
-                    klinik_df = df[df['nakledilmesi i̇stenen klinik'] == klinik]
-                    klinik_istat = {
-                        'toplam': len(klinik_df),
-                        'tamamlanan': len(klinik_df[klinik_df['durum_kategori'] == 'Tamamlandı']),
-                        'bekleyen': len(klinik_df[klinik_df['durum_kategori'] == 'Bekliyor'])
-                    }
-                    
-                    # Klinik bazında yer bulma süresi
-                    klinik_tamamlanan = klinik_df[klinik_df['durum_kategori'] == 'Tamamlandı']
-                    if not klinik_tamamlanan.empty:
-                        sureler = klinik_tamamlanan['yer_bulma_sure_dk'].dropna()
-                        if not sureler.empty:
-                            klinik_istat['yer_bulma_ort_dk'] = round(sureler.mean(), 1)
-                            klinik_istat['yer_bulma_ort_saat'] = round(sureler.mean() / 60, 1)
-                    
-                    # Klinik bazında bekleme süresi
-                    klinik_bekleyen = klinik_df[klinik_df['durum_kategori'] == 'Bekliyor']
-                    if not klinik_bekleyen.empty:
-                        bek_sureler = klinik_bekleyen['bekleme_sure_dk'].dropna()
-                        if not bek_sureler.empty:
-                            klinik_istat['bekleme_ort_dk'] = round(bek_sureler.mean(), 1)
-                            klinik_istat['bekleme_ort_saat'] = round(bek_sureler.mean() / 60, 1)
-                    
-                    istatistikler['klinik_bazinda'][str(klinik)] = klinik_istat
+        Returns:
+            Grup koduna göre sıralı istatistik sözlükleri
+        """
+        try:
+            toplamlar = np.bincount(grup_kodu, minlength=grup_sayisi)
+            kategori = df['durum_kategori'].to_numpy()[satir_indeksi]
+            tamamlandi = kategori == 'Tamamlandı'
+            bekliyor = kategori == 'Bekliyor'
+            yer_bulma = df['yer_bulma_sure_dk'].to_numpy(dtype=float)[satir_indeksi]
+            bekleme = df['bekleme_sure_dk'].to_numpy(dtype=float)[satir_indeksi]
+
+            tamamlanan_sayilari = np.bincount(grup_kodu[tamamlandi], minlength=grup_sayisi)
+            bekleyen_sayilari = np.bincount(grup_kodu[bekliyor], minlength=grup_sayisi)
+            yer_bulma_gruplari = gruplu_diziler(
+                grup_kodu, yer_bulma, tamamlandi & ~np.isnan(yer_bulma)
+            )
+            bekleme_gruplari = gruplu_diziler(
+                grup_kodu, bekleme, bekliyor & ~np.isnan(bekleme)
+            )
+
+            def _ozet(sureler: np.ndarray) -> Dict[str, float]:
+                seri = pd.Series(sureler)
+                return {
+                    'ortalama_dk': round(seri.mean(), 1),
+                    'medyan_dk': round(seri.median(), 1),
+                    'min_dk': round(seri.min(), 1),
+                    'max_dk': round(seri.max(), 1),
+                    'ortalama_saat': round(seri.mean() / 60, 1),
+                }
+
+            sonuc = []
+            for kod in range(grup_sayisi):
+                istatistikler = {
+                    'toplam_vaka': int(toplamlar[kod]),
+                    'tamamlanan_vaka': 0,
+                    'bekleyen_vaka': 0,
+                    'yer_bulma_suresi': {},
+                    'bekleme_suresi': {},
+                    'klinik_bazinda': {}
+                }
+                # Tamamlanmış vakalar
+                if kod in yer_bulma_gruplari:
+                    istatistikler['tamamlanan_vaka'] = int(tamamlanan_sayilari[kod])
+                    istatistikler['yer_bulma_suresi'] = _ozet(yer_bulma_gruplari[kod])
+                # Bekleyen vakalar
+                if kod in bekleme_gruplari:
+                    istatistikler['bekleyen_vaka'] = int(bekleyen_sayilari[kod])
+                    istatistikler['bekleme_suresi'] = _ozet(bekleme_gruplari[kod])
+                sonuc.append(istatistikler)
+
+            if KLINIK_SUTUN_ADI not in df.columns:
+                return sonuc
+
+            # Klinik bazında: (grup, klinik) çiftleri tek anahtar olarak kodlanır;
+            # klinikler grup içinde ilk görülme sırasıyla raporlanır
+            klinik_kodlari, klinikler = pd.factorize(
+                df[KLINIK_SUTUN_ADI].take(satir_indeksi).to_numpy()
+            )
+            klinik_var = klinik_kodlari >= 0
+            anahtar = grup_kodu * len(klinikler) + klinik_kodlari
+            anahtar_sayisi = grup_sayisi * len(klinikler)
+
+            toplam_klinik = np.bincount(anahtar[klinik_var], minlength=anahtar_sayisi)
+            tamamlanan_klinik = np.bincount(
+                anahtar[klinik_var & tamamlandi], minlength=anahtar_sayisi
+            )
+            bekleyen_klinik = np.bincount(
+                anahtar[klinik_var & bekliyor], minlength=anahtar_sayisi
+            )
+            yer_bulma_klinik = gruplu_diziler(
+                anahtar, yer_bulma, klinik_var & tamamlandi & ~np.isnan(yer_bulma)
+            )
+            bekleme_klinik = gruplu_diziler(
+                anahtar, bekleme, klinik_var & bekliyor & ~np.isnan(bekleme)
+            )
+
+            for deger in pd.unique(anahtar[klinik_var]):
+                kod, klinik_sira = divmod(int(deger), len(klinikler))
+                klinik_istat = {
+                    'toplam': int(toplam_klinik[deger]),
+                    'tamamlanan': int(tamamlanan_klinik[deger]),
+                    'bekleyen': int(bekleyen_klinik[deger])
+                }
+                
+                # Klinik bazında yer bulma süresi
+                if deger in yer_bulma_klinik:
+                    ortalama = pd.Series(yer_bulma_klinik[deger]).mean()
+                    klinik_istat['yer_bulma_ort_dk'] = round(ortalama, 1)
+                    klinik_istat['yer_bulma_ort_saat'] = round(ortalama / 60, 1)
+                
+                # Klinik bazında bekleme süresi
+                if deger in bekleme_klinik:
+                    ortalama = pd.Series(bekleme_klinik[deger]).mean()
+                    klinik_istat['bekleme_ort_dk'] = round(ortalama, 1)
+                    klinik_istat['bekleme_ort_saat'] = round(ortalama / 60, 1)
+                
+                sonuc[kod]['klinik_bazinda'][str(klinikler[klinik_sira])] = klinik_istat
             
-            return istatistikler
+            return sonuc
             
         except Exception as e:
             logger.error(f"İstatistik hesaplama hatası: {e}")
-            return {'hata': str(e)}
+            return [{'hata': str(e)} for _ in range(grup_sayisi)]
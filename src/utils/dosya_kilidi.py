@@ -0,0 +1,63 @@
+"""Süreçler arası özel dosya kilidi (POSIX'te fcntl, Windows'ta msvcrt)."""
+
+import logging
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+try:
+    import msvcrt
+
+    MSVCRT_AVAILABLE = True
+except ImportError:
+    MSVCRT_AVAILABLE = False
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def dosya_kilidi(yol: Union[str, Path]) -> Iterator[None]:
+    """Kilit dosyası üzerinde özel kilit alır; başka süreç tutuyorsa bekler.
+
+    Kilit, süreç çökse bile işletim sistemi tarafından bırakılır. Kilit
+    mekanizması olmayan platformlarda kilitsiz devam edilir.
+
+    Args:
+        yol: Kilit dosyasının yolu (yoksa oluşturulur)
+    """
+    yol = Path(yol)
+    yol.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(yol, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if FCNTL_AVAILABLE:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        elif MSVCRT_AVAILABLE:
+            # LK_LOCK en fazla ~10 sn dener; kilit alınana kadar yinelenir
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            logger.warning(f"Dosya kilidi desteklenmiyor, kilitsiz devam ediliyor: {yol}")
+        yield
+    finally:
+        if FCNTL_AVAILABLE:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        elif MSVCRT_AVAILABLE:
+            try:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            except OSError:
+                pass
+        os.close(fd)
@@ -0,0 +1,306 @@
+"""Büyük tabloları sabit bellekle Excel'e yazan akışlı yazıcı."""
+
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+try:
+    import xlsxwriter
+
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+from ..core.config import (
+    EXCEL_TARIH_SUTUNLARI,
+    EXCEL_YAZMA_AYARLARI,
+    PARQUET_MOTOR,
+    PARQUET_SIKISTIRMA,
+)
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+# Excel sayfa adı uzunluk sınırı
+_SAYFA_ADI_SINIRI = 31
+
+
+def _gecici_yol(hedef: Path) -> Path:
+    return hedef.with_name(f".{hedef.stem}.{os.getpid()}.tmp{hedef.suffix}")
+
+
+class AkisliExcelYazici:
+    """Sayfaları parça parça diske yazan sabit bellekli Excel yazıcısı.
+
+    xlsxwriter varsa constant_memory modunda, yoksa openpyxl write-only
+    modunda çalışır; satırlar yazıldıkça diske aktarılır, çalışma kitabı
+    bellekte tutulmaz. Tarih sütunlarının formatı sütun düzeyinde verilir.
+    Satır sınırını aşan sayfa Ad, Ad_2, Ad_3... sayfalarına bölünür. Dosya
+    geçici adla yazılıp kapatılınca yerine taşınır (çıktı deposuna bağlı
+    eski dosya yerinde değiştirilmez).
+
+    Kullanım:
+        with AkisliExcelYazici(yol) as yazici:
+            yazici.sayfa_yaz(df, "Ham_Veri")
+    """
+
+    def __init__(
+        self,
+        dosya_yolu: Union[str, Path],
+        ayarlar: Optional[Dict] = None,
+        tarih_sutunlari: Optional[Sequence[str]] = None,
+    ):
+        """
+        Akışlı Excel yazıcısı başlatma
+
+        Args:
+            dosya_yolu: Hedef .xlsx dosyası
+            ayarlar: Yazma ayarları (varsayılan EXCEL_YAZMA_AYARLARI)
+            tarih_sutunlari: Tarih formatı verilecek sütun adları; datetime
+                tipli sütunlar her zaman formatlanır
+        """
+        self.ayarlar = ayarlar if ayarlar is not None else EXCEL_YAZMA_AYARLARI
+        self.dosya_yolu = Path(dosya_yolu)
+        self.tarih_sutunlari = {
+            str(s).lower()
+            for s in (tarih_sutunlari if tarih_sutunlari is not None else EXCEL_TARIH_SUTUNLARI)
+        }
+        self.max_veri_satiri = max(1, int(self.ayarlar.get("max_satir", 1_048_576)) - 1)
+        self.parca_satir = int(self.ayarlar.get("parca_satir", 50_000))
+        self.tarih_formati = self.ayarlar.get("tarih_formati", "DD-MM-YYYY HH:MM")
+
+        istenen = self.ayarlar.get("motor", "otomatik")
+        if istenen == "xlsxwriter" and not XLSXWRITER_AVAILABLE:
+            logger.warning("xlsxwriter yüklü değil; openpyxl write-only modu kullanılıyor")
+        self.motor = (
+            "xlsxwriter" if XLSXWRITER_AVAILABLE and istenen in ("xlsxwriter", "otomatik") else "openpyxl"
+        )
+
+        self.dosya_yolu.parent.mkdir(parents=True, exist_ok=True)
+        self._gecici = _gecici_yol(self.dosya_yolu)
+        self._sayfa_adlari: List[str] = []
+
+        if self.motor == "xlsxwriter":
+            self._kitap = xlsxwriter.Workbook(
+                str(self._gecici),
+                {
+                    "constant_memory": True,
+                    "remove_timezone": True,
+                    "nan_inf_to_errors": True,
+                    # Hücre metinleri olduğu gibi yazılır ("=..." formül, adres bağlantı olmaz)
+                    "strings_to_formulas": False,
+                    "strings_to_urls": False,
+                },
+            )
+            self._baslik_bicimi = self._kitap.add_format({"bold": True})
+            self._tarih_bicimi = self._kitap.add_format({"num_format": self.tarih_formati})
+        else:
+            self._kitap = Workbook(write_only=True)
+
+    def __enter__(self) -> "AkisliExcelYazici":
+        return self
+
+    def __exit__(self, hata_tipi, hata, iz) -> None:
+        if hata_tipi is None:
+            self.kapat()
+        else:
+            self.iptal()
+
+    @property
+    def sayfa_adlari(self) -> List[str]:
+        """Yazılan sayfaların adları (bölünen sayfalar dahil)"""
+        return list(self._sayfa_adlari)
+
+    def _sayfa_adi(self, temel: str, parca_no: int) -> str:
+        if parca_no == 1:
+            return temel[:_SAYFA_ADI_SINIRI]
+        ek = f"_{parca_no}"
+        return temel[: _SAYFA_ADI_SINIRI - len(ek)] + ek
+
+    def _tarih_indeksleri(self, df: pd.DataFrame) -> List[int]:
+        return [
+            i
+            for i, (sutun, tip) in enumerate(df.dtypes.items())
+            if pd.api.types.is_datetime64_any_dtype(tip) or str(sutun).lower() in self.tarih_sutunlari
+        ]
+
+    @staticmethod
+    def _satirlar(df: pd.DataFrame) -> Iterable[tuple]:
+        """Parçanın satırlarını boş değerleri None olarak döndürür"""
+        for sutun, tip in df.dtypes.items():
+            if isinstance(tip, pd.DatetimeTZDtype):
+                df = df.assign(**{sutun: df[sutun].dt.tz_localize(None)})
+        nesne = df.astype(object)
+        return nesne.where(nesne.notna(), None).itertuples(index=False, name=None)
+
+    def _yeni_sayfa(self, ad: str, sutunlar: List, tarih_indeksleri: List[int], baslik: bool):
+        self._sayfa_adlari.append(ad)
+        if self.motor == "xlsxwriter":
+            sayfa = self._kitap.add_worksheet(ad)
+            # Sütun formatı satırlardan önce verilir; biçimsiz tarih hücreleri onu alır
+            for i in tarih_indeksleri:
+                sayfa.set_column(i, i, 17, self._tarih_bicimi)
+            if baslik:
+                sayfa.write_row(0, 0, [str(s) for s in sutunlar], self._baslik_bicimi)
+        else:
+            sayfa = self._kitap.create_sheet(ad)
+            for i in tarih_indeksleri:
+                sayfa.column_dimensions[get_column_letter(i + 1)].width = 17
+            if baslik:
+                hucreler = []
+                for s in sutunlar:
+                    hucre = WriteOnlyCell(sayfa, value=str(s))
+                    hucre.font = Font(bold=True)
+                    hucreler.append(hucre)
+                sayfa.append(hucreler)
+        return sayfa
+
+    def _satir_yaz(self, sayfa, satir_no: int, satir: tuple, tarih_indeksleri: List[int]) -> None:
+        if self.motor == "xlsxwriter":
+            sayfa.write_row(satir_no, 0, satir)
+            return
+
+        satir = list(satir)
+        # write-only modda sütun formatı yok; tarih hücreleri formatıyla yazılır
+        for i in tarih_indeksleri:
+            if isinstance(satir[i], datetime):
+                hucre = WriteOnlyCell(sayfa, value=satir[i])
+                hucre.number_format = self.tarih_formati
+                satir[i] = hucre
+        # "=" ile başlayan metin formül değil metin olarak yazılır (xlsxwriter ile aynı)
+        for i, deger in enumerate(satir):
+            if isinstance(deger, str) and deger.startswith("="):
+                hucre = WriteOnlyCell(sayfa, value=deger)
+                hucre.data_type = "s"
+                satir[i] = hucre
+        sayfa.append(satir)
+
+    def sayfa_yaz(
+        self,
+        veri: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+        sayfa_adi: str,
+        baslik: bool = True,
+    ) -> List[str]:
+        """
+        Tabloyu sayfaya (satır sınırını aşarsa birden çok sayfaya) yazar
+
+        Args:
+            veri: DataFrame ya da aynı sütunlu DataFrame parçaları
+                (ör. parquet satır grupları)
+            sayfa_adi: Sayfa adı (bölünen sayfalara _2, _3... eklenir)
+            baslik: Sütun adları ilk satıra yazılsın mı
+
+        Returns:
+            Yazılan sayfaların adları
+        """
+        if isinstance(veri, pd.DataFrame):
+            parcalar = (
+                veri.iloc[i : i + self.parca_satir]
+                for i in range(0, max(len(veri), 1), self.parca_satir)
+            )
+        else:
+            parcalar = iter(veri)
+
+        yazilan: List[str] = []
+        sayfa = None
+        parca_no = 0
+        satir_no = sayfa_satiri = 0
+        sutunlar: List = []
+        tarih_indeksleri: List[int] = []
+
+        for parca in parcalar:
+            if sayfa is None:
+                sutunlar = list(parca.columns)
+                tarih_indeksleri = self._tarih_indeksleri(parca)
+            for satir in self._satirlar(parca):
+                if sayfa is None or sayfa_satiri >= self.max_veri_satiri:
+                    parca_no += 1
+                    ad = self._sayfa_adi(sayfa_adi, parca_no)
+                    sayfa = self._yeni_sayfa(ad, sutunlar, tarih_indeksleri, baslik)
+                    yazilan.append(ad)
+                    satir_no = 1 if baslik else 0
+                    sayfa_satiri = 0
+                self._satir_yaz(sayfa, satir_no, satir, tarih_indeksleri)
+                satir_no += 1
+                sayfa_satiri += 1
+
+        # Satırı olmayan tablo yalnızca başlıkla yazılır
+        if sayfa is None:
+            ad = self._sayfa_adi(sayfa_adi, 1)
+            self._yeni_sayfa(ad, sutunlar, tarih_indeksleri, baslik)
+            yazilan.append(ad)
+
+        if len(yazilan) > 1:
+            logger.info(f"{sayfa_adi} sayfası satır sınırı nedeniyle {len(yazilan)} sayfaya bölündü")
+        return yazilan
+
+    def kapat(self) -> Path:
+        """Çalışma kitabını tamamlar ve hedef dosyaya taşır"""
+        if self.motor == "xlsxwriter":
+            self._kitap.close()
+        else:
+            self._kitap.save(self._gecici)
+        os.replace(self._gecici, self.dosya_yolu)
+        return self.dosya_yolu
+
+    def iptal(self) -> None:
+        """Yarım kalan geçici dosyayı siler; hedef dosyaya dokunulmaz"""
+        try:
+            if self.motor == "xlsxwriter":
+                self._kitap.close()
+        except Exception:
+            pass
+        self._gecici.unlink(missing_ok=True)
+
+
+def yan_dosyalari_yaz(
+    df: pd.DataFrame,
+    dizin: Union[str, Path],
+    ad: str,
+    bicimler: Optional[Sequence[str]] = None,
+) -> List[Path]:
+    """
+    Tablonun CSV ve/veya parquet kopyasını yazar (satır sınırı yoktur)
+
+    Args:
+        df: Yazılacak tablo
+        dizin: Hedef klasör
+        ad: Dosya adı (uzantısız)
+        bicimler: "csv" ve/veya "parquet" (varsayılan EXCEL_YAZMA_AYARLARI["yan_dosyalar"])
+
+    Returns:
+        Yazılan dosyaların yolları
+    """
+    bicimler = EXCEL_YAZMA_AYARLARI.get("yan_dosyalar", ()) if bicimler is None else bicimler
+    yazilanlar: List[Path] = []
+    if not bicimler:
+        return yazilanlar
+
+    dizin = Path(dizin)
+    dizin.mkdir(parents=True, exist_ok=True)
+    for bicim in bicimler:
+        hedef = dizin / f"{ad}.{bicim}"
+        gecici = _gecici_yol(hedef)
+        try:
+            if bicim == "csv":
+                # utf-8-sig: Excel Türkçe karakterleri doğru açar
+                df.to_csv(gecici, index=False, encoding="utf-8-sig")
+            elif bicim == "parquet":
+                df.to_parquet(gecici, engine=PARQUET_MOTOR, compression=PARQUET_SIKISTIRMA, index=False)
+            else:
+                logger.warning(f"Bilinmeyen yan dosya biçimi: {bicim}")
+                continue
+            os.replace(gecici, hedef)
+            yazilanlar.append(hedef)
+        except Exception as e:
+            gecici.unlink(missing_ok=True)
+            logger.warning(f"{hedef.name} yazılamadı: {e}")
+    return yazilanlar
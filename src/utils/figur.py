@@ -0,0 +1,155 @@
+"""Pyplot durum makinesi kullanmadan grafik figürü oluşturma yardımcıları."""
+
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+try:
+    from PIL import Image, features
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+from ..core.config import GRAFIK_CIKTI_AYARLARI, KUCUK_GORSEL_AYARLARI, VARSAYILAN_DPI
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+
+def figur_olustur(figsize: Tuple[float, float]) -> Figure:
+    """Agg tuvaline bağlı, pyplot'a kaydedilmeyen yeni bir figür döndürür.
+
+    Figür pyplot'un figür listesine girmediği için kapatılması gerekmez;
+    referansı bırakıldığında (hata durumunda da) bellekten silinir. Her
+    çizim kendi figürünü kullandığından grafikler aynı süreçteki farklı
+    iş parçacıklarında eşzamanlı çizilebilir.
+
+    Args:
+        figsize: Figür boyutu (inç)
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def png_dpi_hesapla(fig: Figure, dpi: int = VARSAYILAN_DPI) -> int:
+    """Etkin PNG profiline göre kayıt DPI'ını döndürür.
+
+    Profil tanımlıysa DPI, grafiğin gösterildiği genişlikte hedef_dpi
+    yoğunluğunu verecek şekilde figür genişliğinden hesaplanır; çizimin
+    istediği DPI'ın üstüne çıkılmaz.
+    """
+    profil = GRAFIK_CIKTI_AYARLARI.get("png_profilleri", {}).get(
+        GRAFIK_CIKTI_AYARLARI.get("png_profili")
+    )
+    if not profil:
+        return dpi
+
+    hesaplanan = profil["hedef_dpi"] * profil["gosterim_genisligi_inc"] / fig.get_figwidth()
+    return int(min(dpi, max(profil.get("min_dpi", 72), round(hesaplanan))))
+
+
+def vektor_yolu(png_yolu: Union[str, Path]) -> Path:
+    """PNG grafiğin vektör (PDF) kopyasının yolu"""
+    png_yolu = Path(png_yolu)
+    dizin_adi = GRAFIK_CIKTI_AYARLARI.get("vektor_dizin_adi", "vektor")
+    return png_yolu.parent / dizin_adi / f"{png_yolu.stem}.pdf"
+
+
+def _kucuk_gorsel_formati() -> str:
+    istenen = KUCUK_GORSEL_AYARLARI.get("format", "WEBP").upper()
+    if istenen == "WEBP" and not features.check("webp"):
+        return "PNG"
+    return istenen
+
+
+def kucuk_gorsel_yolu(png_yolu: Union[str, Path]) -> Path:
+    """PNG grafiğin küçük önizlemesinin yolu"""
+    png_yolu = Path(png_yolu)
+    dizin_adi = KUCUK_GORSEL_AYARLARI.get("dizin_adi", "kucuk")
+    uzanti = ".webp" if PIL_AVAILABLE and _kucuk_gorsel_formati() == "WEBP" else ".png"
+    return png_yolu.parent / dizin_adi / f"{png_yolu.stem}{uzanti}"
+
+
+def kucuk_gorsel_olustur(png_yolu: Union[str, Path], yenile: bool = False) -> Optional[Path]:
+    """PNG grafiğin küçük önizlemesini yazar; önizleme varsa onu döndürür.
+
+    Grafik figur_kaydet ile her yeniden çizildiğinde önizleme yenile=True
+    ile yeniden yazılır. Dosya geçici adla yazılıp yerine taşınır; başka
+    bir rapor klasörüne ya da grafik önbelleğine bağlanmış önizleme
+    yerinde değiştirilmez.
+
+    Returns:
+        Önizlemenin yolu (Pillow yoksa ya da oluşturulamazsa None)
+    """
+    if not PIL_AVAILABLE:
+        return None
+
+    png_yolu = Path(png_yolu)
+    hedef = kucuk_gorsel_yolu(png_yolu)
+    try:
+        if hedef.exists() and not yenile:
+            return hedef
+
+        hedef.parent.mkdir(exist_ok=True)
+        max_piksel = tuple(KUCUK_GORSEL_AYARLARI.get("max_piksel", (480, 360)))
+        with Image.open(png_yolu) as kaynak:
+            # Tam boyutlu görsel önce tam sayı katıyla (kutu ortalaması)
+            # küçültülür; RGB dönüşümü ve LANCZOS küçük görsele uygulanır
+            kat = min(kaynak.width // (2 * max_piksel[0]), kaynak.height // (2 * max_piksel[1]))
+            gorsel = kaynak.reduce(kat) if kat > 1 else kaynak.copy()
+        gorsel = gorsel.convert("RGB")
+        gorsel.thumbnail(max_piksel, Image.LANCZOS)
+
+        gecici = hedef.with_name(f".{hedef.name}.{os.getpid()}.tmp")
+        bicim = _kucuk_gorsel_formati()
+        if bicim == "WEBP":
+            gorsel.save(
+                gecici, format="WEBP", quality=KUCUK_GORSEL_AYARLARI.get("kalite", 80), method=4
+            )
+        else:
+            gorsel.save(gecici, format="PNG", optimize=True)
+        os.replace(gecici, hedef)
+        return hedef
+
+    except Exception as e:
+        logger.warning(f"Küçük önizleme oluşturulamadı ({png_yolu}): {e}")
+        return None
+
+
+def figur_kaydet(
+    fig: Figure, dosya_yolu: Union[str, Path], dpi: int = VARSAYILAN_DPI
+) -> Optional[Path]:
+    """Figürü PNG olarak, vektör modunda ayrıca PDF olarak kaydeder.
+
+    PNG her zaman yazılır (Streamlit ve grafik klasörü onu kullanır);
+    çözünürlüğü GRAFIK_CIKTI_AYARLARI["png_profili"] belirler. Vektör
+    kopya aynı kırpma ile PNG'nin yanındaki alt klasöre yazılır. Küçük
+    önizleme açıksa PNG'den üretilip yanındaki alt klasöre yazılır.
+
+    Returns:
+        Vektör kopyanın yolu (vektör modu kapalıysa None)
+    """
+    # Eski dosya yerinde yazılmaz: çıktı deposuna hardlink'li olabilir
+    Path(dosya_yolu).unlink(missing_ok=True)
+    fig.savefig(dosya_yolu, dpi=png_dpi_hesapla(fig, dpi), bbox_inches="tight")
+
+    if KUCUK_GORSEL_AYARLARI.get("aktif", True):
+        kucuk_gorsel_olustur(dosya_yolu, yenile=True)
+    else:
+        # Önceki çizimden kalan önizleme artık grafiği göstermez
+        kucuk_gorsel_yolu(dosya_yolu).unlink(missing_ok=True)
+
+    if not GRAFIK_CIKTI_AYARLARI.get("vektor"):
+        return None
+
+    vektor = vektor_yolu(dosya_yolu)
+    vektor.parent.mkdir(exist_ok=True)
+    Path(vektor).unlink(missing_ok=True)
+    fig.savefig(vektor, format="pdf", bbox_inches="tight")
+    return vektor
@@ -0,0 +1,113 @@
+"""Grup kodlarına göre dizi bölme yardımcıları."""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def grup_dilimleri(kodlar: np.ndarray) -> Dict[int, slice]:
+    """Sıralı grup kodu dizisinde her kodun kapladığı dilimi döndürür.
+
+    Args:
+        kodlar: Artan sırada sıralanmış tamsayı grup kodları
+
+    Returns:
+        Dict[int, slice]: {grup_kodu: dilim}
+    """
+    if len(kodlar) == 0:
+        return {}
+    degisim = np.flatnonzero(np.diff(kodlar)) + 1
+    baslangiclar = np.concatenate([[0], degisim])
+    bitisler = np.concatenate([degisim, [len(kodlar)]])
+    return {
+        int(kodlar[b]): slice(int(b), int(s))
+        for b, s in zip(baslangiclar, bitisler)
+    }
+
+
+def gruplu_diziler(
+    kodlar: np.ndarray, degerler: np.ndarray, gecerli: Optional[np.ndarray] = None
+) -> Dict[int, np.ndarray]:
+    """Değerleri grup koduna göre ayırır; grup içi satır sırası korunur.
+
+    Tek bir kararlı sıralama ile tüm gruplar çıkarılır. Dilimler, grup
+    başına maske ile seçilen dizilerle aynı sırada olduğundan ortalama,
+    medyan vb. istatistikler birebir aynı sonucu verir.
+
+    Args:
+        kodlar: Her satırın tamsayı grup kodu
+        degerler: Satır değerleri
+        gecerli: Dahil edilecek satırlar (None ise hepsi)
+
+    Returns:
+        Dict[int, np.ndarray]: {grup_kodu: değerler}
+    """
+    if gecerli is not None:
+        kodlar = kodlar[gecerli]
+        degerler = degerler[gecerli]
+    sira = np.argsort(kodlar, kind="stable")
+    kodlar, degerler = kodlar[sira], degerler[sira]
+    return {kod: degerler[dilim] for kod, dilim in grup_dilimleri(kodlar).items()}
+
+
+def tek_grup(satir_sayisi: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Tüm satırları tek grup (kod 0) yapan grup kodu ve satır indeksi dizileri.
+
+    Gruplu hesaplama fonksiyonlarını tek bir veri çerçevesine uygulamak için
+    kullanılır.
+    """
+    return np.zeros(satir_sayisi, dtype=int), np.arange(satir_sayisi)
+
+
+def sayim_sirala(sayimlar: pd.Series) -> pd.Series:
+    """value_counts ile aynı sıralama (sayıya göre azalan, eşitlikte sıra korunur)"""
+    return sayimlar.sort_values(ascending=False, kind="stable")
+
+
+def grup_deger_sayimlari(
+    seri: pd.Series, grup_kodu: np.ndarray, satir_indeksi: np.ndarray
+) -> Dict[int, pd.Series]:
+    """Her grup için seri.value_counts() karşılığını tek groupby ile hesaplar.
+
+    Eşit sayımlı değerler, kategorik sütunlarda da object value_counts gibi
+    ilk görülme sırasında kalır.
+
+    Args:
+        seri: Sayılacak sütun
+        grup_kodu: Uzun biçimde her satırın grup kodu
+        satir_indeksi: Uzun biçimde her satırın seri içindeki konumu
+
+    Returns:
+        Dict[int, pd.Series]: {grup_kodu: sayımlar}
+    """
+    uzun = pd.DataFrame(
+        {"grup": grup_kodu, "deger": seri.take(satir_indeksi).to_numpy()}
+    )
+    if isinstance(seri.dtype, pd.CategoricalDtype):
+        uzun["deger"] = pd.Categorical(
+            uzun["deger"], categories=seri.cat.categories
+        )
+        uzun["ilk"] = np.arange(len(uzun))
+        ozet = uzun.groupby(["grup", "deger"], observed=True, sort=True)["ilk"].agg(
+            ["size", "min"]
+        )
+        # Kategori (alfabetik) sırası yerine grup içinde ilk görülme sırası
+        ozet = ozet.sort_values("min", kind="stable").sort_index(
+            level=0, kind="stable", sort_remaining=False
+        )
+        boyutlar = ozet["size"]
+    else:
+        boyutlar = uzun.dropna(subset=["deger"]).groupby(
+            ["grup", "deger"], sort=False
+        ).size()
+        # sort=False: gruplar karışık sırada gelir, grup kodlarını sırala
+        boyutlar = boyutlar.sort_index(level=0, kind="stable", sort_remaining=False)
+
+    sonuc = {}
+    for kod, grup_sayimlari in boyutlar.groupby(level=0, sort=False):
+        sayimlar = grup_sayimlari.droplevel(0)
+        sayimlar = sayimlar[sayimlar > 0]
+        sayimlar.index = sayimlar.index.astype(object)
+        sonuc[int(kod)] = sayim_sirala(sayimlar)
+    return sonuc
@@ -0,0 +1,60 @@
+"""Rapor JSON dosyaları için hızlı okuma/yazma yardımcıları."""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+import numpy as np
+
+try:
+    import orjson
+
+    ORJSON_MEVCUT = True
+except ImportError:
+    ORJSON_MEVCUT = False
+
+
+def _json_varsayilan(deger: Any) -> Any:
+    """Standart json modülünün tanımadığı tipleri dönüştürür."""
+    if isinstance(deger, np.generic):
+        return deger.item()
+    return str(deger)
+
+
+def json_yaz(veri: Any, dosya: Union[str, Path], girintili: bool = True) -> None:
+    """Sözlüğü JSON olarak yazar; orjson varsa onu kullanır.
+
+    numpy sayıları sayı olarak, tanınmayan tipler (Timestamp vb.) metin
+    olarak yazılır.
+
+    Args:
+        veri: Yazılacak veri
+        dosya: Hedef dosya yolu
+        girintili: True ise 2 boşluk girintili yazar
+    """
+    if ORJSON_MEVCUT:
+        secenekler = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if girintili:
+            secenekler |= orjson.OPT_INDENT_2
+        Path(dosya).write_bytes(
+            orjson.dumps(veri, default=_json_varsayilan, option=secenekler)
+        )
+        return
+
+    with open(dosya, "w", encoding="utf-8") as f:
+        json.dump(
+            veri,
+            f,
+            ensure_ascii=False,
+            indent=2 if girintili else None,
+            default=_json_varsayilan,
+        )
+
+
+def json_oku(dosya: Union[str, Path]) -> Any:
+    """JSON dosyasını okur; orjson varsa onu kullanır."""
+    if ORJSON_MEVCUT:
+        return orjson.loads(Path(dosya).read_bytes())
+
+    with open(dosya, "r", encoding="utf-8") as f:
+        return json.load(f)
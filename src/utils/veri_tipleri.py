@@ -0,0 +1,72 @@
+"""Düşük kardinaliteli sütunlar için kategorik veri tipi yardımcıları."""
+
+import pandas as pd
+
+from ..core.config import KATEGORIK_VERI_SUTUNLARI, KATEGORIK_MAKS_BENZERSIZ_ORANI
+from .gruplama import sayim_sirala
+
+
+def kategorik_sutunlara_cevir(df: pd.DataFrame) -> pd.DataFrame:
+    """Config'deki düşük kardinaliteli sütunları pandas category tipine çevirir.
+
+    Parquet'e dictionary-encoded yazılırlar; karşılaştırmalar (==, isin,
+    str.contains) satırlar yerine kategori kodları üzerinde çalışır.
+
+    Args:
+        df: Veri çerçevesi (yerinde güncellenir)
+
+    Returns:
+        pd.DataFrame: Aynı veri çerçevesi
+    """
+    if df is None or df.empty:
+        return df
+
+    for sutun in KATEGORIK_VERI_SUTUNLARI:
+        if sutun not in df.columns or isinstance(df[sutun].dtype, pd.CategoricalDtype):
+            continue
+        if df[sutun].nunique(dropna=True) > len(df) * KATEGORIK_MAKS_BENZERSIZ_ORANI:
+            continue
+        df[sutun] = df[sutun].astype("category")
+    return df
+
+
+def deger_sayimi(seri: pd.Series, normalize: bool = False) -> pd.Series:
+    """value_counts karşılığı; kategorik sütunlarda gözlenmeyen kategorileri atar.
+
+    Filtrelenmiş alt kümelerde kategori listesi tüm veriden gelir; sıfır
+    sayımlı kategoriler grafik ve rapor çıktısına girmesin diye çıkarılır.
+    Eşit sayımlar object sütundaki gibi ilk görülme sırasında kalır.
+
+    Args:
+        seri: Sayılacak seri
+        normalize: True ise oran döndürür
+
+    Returns:
+        pd.Series: Değer sayımları (index object tipinde)
+    """
+    sayimlar = seri.value_counts(normalize=normalize)
+    if isinstance(seri.dtype, pd.CategoricalDtype):
+        # Gözlenen kategoriler, ilk görülme sırasıyla
+        kodlar = seri.cat.codes.to_numpy()
+        gozlenen = seri.cat.categories[pd.unique(kodlar[kodlar >= 0])]
+        isim = sayimlar.index.name
+        sayimlar = sayimlar.reindex(gozlenen)
+        sayimlar.index = sayimlar.index.astype(object).rename(isim)
+        sayimlar = sayim_sirala(sayimlar)
+    return sayimlar
+
+
+def kategorik_deger_ata(df: pd.DataFrame, mask: pd.Series, sutun: str, deger) -> None:
+    """Maskelenen satırlara değer atar; kategorik sütunda kategori yoksa önce ekler.
+
+    Args:
+        df: Veri çerçevesi (yerinde güncellenir)
+        mask: Atama yapılacak satırlar
+        sutun: Sütun adı
+        deger: Atanacak değer
+    """
+    if isinstance(df[sutun].dtype, pd.CategoricalDtype) and deger not in df[sutun].cat.categories:
+        df[sutun] = df[sutun].cat.add_categories([deger])
+    df.loc[mask, sutun] = deger
+    if isinstance(df[sutun].dtype, pd.CategoricalDtype):
+        df[sutun] = df[sutun].cat.remove_unused_categories()
@@ -159,8 +159,25 @@ def get_raw_files():
     
     return excel_files
 
+def _sunucuda_calistir(command):
+    """main.py komutunu çalışan analiz sunucusunda çalıştır (sunucu yoksa None)"""
+    if len(command) < 2 or Path(command[1]).name != "main.py":
+        return None
+    try:
+        from src.core.analiz_sunucusu import sunucuya_gonder
+    except ImportError:
+        return None
+    yanit = sunucuya_gonder(command[2:])
+    if yanit is None:
+        return None
+    return subprocess.CompletedProcess(command, yanit["returncode"], yanit["stdout"], yanit["stderr"])
+
 def run_command(command):
     """Terminal komutu çalıştır ve çıktıyı döndür"""
+    # Analiz sunucusu çalışıyorsa modüller yeniden yüklenmez
+    result = _sunucuda_calistir(command)
+    if result is not None:
+        return result
     result = subprocess.run(
         command,
         capture_output=True,
@@ -205,8 +222,9 @@ def show_graphs(report_folder_path, num_graphs=6):
         st.info("💡 Lütfen 'Nakil Analizi' sekmesinden yeni bir rapor oluşturun.")
         return
     
-    # PNG dosyalarını bul
-    png_files = list(report_folder_path.glob("*.png"))
+    # PNG dosyalarını bul (klasörün manifesti varsa onun üzerinden)
+    from src.core.cikti_deposu import dosyalari_coz
+    png_files = dosyalari_coz(report_folder_path, "*.png")
 
     # Eğer png bulunamazsa, tarih klasöründe ara
     if not png_files:
@@ -214,7 +232,7 @@ def show_graphs(report_folder_path, num_graphs=6):
         date_part = report_folder_path.name.split('_')[0]
         alt_path = DATA_REPORTS_DIR / date_part
         # Tarih klasöründe png var mı?
-        alt_png = list(alt_path.glob("*.png"))
+        alt_png = dosyalari_coz(alt_path, "*.png")
         if alt_png:
             png_files = alt_png
             report_folder_path = alt_path
@@ -223,7 +241,7 @@ def show_graphs(report_folder_path, num_graphs=6):
         st.warning(f"⚠️ Bu klasörde hiç grafik bulunamadı: {report_folder_path.name}")
         
         # PDF kontrolü
-        pdf_files = list(report_folder_path.glob("*.pdf"))
+        pdf_files = dosyalari_coz(report_folder_path, "*.pdf")
         if pdf_files:
             st.info("📄 PDF raporu mevcut. 'PDF Raporu' sekmesinden görüntüleyebilirsiniz.")
         else:
@@ -233,9 +251,6 @@ def show_graphs(report_folder_path, num_graphs=6):
     # Grafik sayısı bilgisi
     st.info(f"📊 Toplam {len(png_files)} grafik bulundu.")
     
-    # Kategori filtresi (eğer çok grafik varsa)
-    display_graphs = png_files
-    
     # Grafikler için filtre ekle
     if len(png_files) > 6:
         # Filtre seçenekleri oluştur
@@ -256,95 +271,42 @@ def show_graphs(report_folder_path, num_graphs=6):
             filter_term = graph_categories[selected_category]
             png_files = [f for f in png_files if filter_term.lower() in f.name.lower()]
     
-    # Kaç grafik gösterileceğini seç
-    total_graphs = len(png_files)
-    if total_graphs > num_graphs:
-        show_all = st.checkbox("Tüm grafikleri göster", value=False)
-        if show_all:
-            display_graphs = png_files
-        else:
-            display_graphs = png_files[:num_graphs]
-            st.caption(f"İlk {num_graphs} grafik gösteriliyor (toplam {total_graphs})")
-    else:
-        display_graphs = png_files
-    
-    # Grafikler için düzen oluştur
-    if not display_graphs:
+    if not png_files:
         st.warning("Seçilen filtre için grafik bulunamadı.")
         return
-    
-    # İnteraktif grafik görüntüleyici
-    tabs = []
-    tab_titles = []
-    
-    # Daha açıklayıcı tab başlıkları oluştur
+
+    # Sayfalı önizleme galerisi: sayfada yalnızca küçük önizlemeler gönderilir,
+    # tam çözünürlüklü grafik seçilince yüklenir
+    from src.utils.figur import kucuk_gorsel_olustur
+
+    total_pages = (len(png_files) + num_graphs - 1) // num_graphs
+    page = 1
+    if total_pages > 1:
+        page = st.selectbox("Sayfa:", range(1, total_pages + 1),
+                            format_func=lambda no: f"{no} / {total_pages}")
+    display_graphs = png_files[(page - 1) * num_graphs:page * num_graphs]
+
+    cols = st.columns(3)
     for i, png_file in enumerate(display_graphs):
-        name = png_file.stem
-        # Uzun ismi kısalt
-        if len(name) > 25:
-            parts = name.split('_')
-            if len(parts) > 3:
-                short_name = f"{parts[0]}...{parts[-1]}"
-            else:
-                short_name = name[:25] + "..."
-        else:
-            short_name = name
-            
-        tab_titles.append(f"Grafik {i+1}")
-    
-    # Tab grubu oluştur
-    if len(display_graphs) > 1:
-        tabs = st.tabs(tab_titles)
-    
-        # Her tab içinde bir grafik göster
-        for i, (tab, png_file) in enumerate(zip(tabs, display_graphs)):
-            with tab:
-                # Başlık oluştur
-                title = png_file.stem.replace("_", " ").replace("-", " ").title()
-                st.markdown(f"**{title}**")
-                
-                # Grafiği göster
-                st.image(str(png_file), use_container_width=True)
-                
-                # Grafik detayları ve indirme butonu
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.caption(f"Dosya: {png_file.name}")
-                with col2:
-                    with open(png_file, "rb") as img_file:
-                        btn = st.download_button(
-                            label="İndir",
-                            data=img_file,
-                            file_name=png_file.name,
-                            mime="image/png",
-                            key=f"download_graph_{i}"
-                        )
-    else:
-        # Tek grafik varsa direk göster
-        for png_file in display_graphs:
-            title = png_file.stem.replace("_", " ").replace("-", " ").title()
-            st.markdown(f"**{title}**")
-            st.image(str(png_file), use_container_width=True)
-            
-    # Grid görünüm seçeneği
-    if len(display_graphs) > 3 and st.checkbox("Grafikleri grid olarak göster", value=False):
-        st.markdown("### Grafik Özeti")
-        
-        # Grafikler için 3 kolonlu bir grid oluştur
-        cols = st.columns(3)
-        
-        for i, png_file in enumerate(display_graphs):
-            # Görüntülenecek başlık oluştur
-            title = png_file.stem.replace("_", " ").replace("-", " ").title()
-            if len(title) > 40:
-                title = title[:40] + "..."
-            
-            with cols[i % 3]:
-                st.image(str(png_file), caption=title, width=250)
-                
-                # Her sıra sonrası (3 grafik) yeni bir satıra geç
-                if (i + 1) % 3 == 0 and i < len(display_graphs) - 1:
-                    cols = st.columns(3)
+        title = png_file.stem.replace("_", " ").replace("-", " ").title()
+        if len(title) > 40:
+            title = title[:40] + "..."
+        with cols[i % 3]:
+            thumbnail = kucuk_gorsel_olustur(png_file) or png_file
+            st.image(str(thumbnail), caption=title, use_container_width=True)
+
+    selected = st.selectbox("Tam boyutta açılacak grafik:", [None] + display_graphs,
+                            format_func=lambda f: "—" if f is None else f.stem)
+    if selected is not None:
+        st.image(str(selected), use_container_width=True)
+        with open(selected, "rb") as img_file:
+            st.download_button(
+                label="İndir",
+                data=img_file.read(),
+                file_name=selected.name,
+                mime="image/png",
+                key=f"download_graph_{selected.name}"
+            )
 
 def show_statistics(date):
     """İstatistikleri göster"""
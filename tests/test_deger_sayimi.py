@@ -0,0 +1,40 @@
+"""Kategorik sütunlarda eşit sayımların object sütunla aynı sırada kalması"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.gruplama import grup_deger_sayimlari
+from src.utils.veri_tipleri import deger_sayimi
+
+# Eşit sayımlı klinikler; alfabetik sıra ile ilk görülme sırası farklı
+KLINIKLER = ["Nöroloji", "Kardiyoloji", "Dahiliye", "Nöroloji", "Kardiyoloji", "Dahiliye", "Üroloji"]
+
+
+@pytest.mark.parametrize("normalize", [False, True])
+def test_deger_sayimi_esitlikte_ilk_gorulme_sirasi(normalize):
+    seri = pd.Series(KLINIKLER + [None], name="klinik")
+
+    beklenen = deger_sayimi(seri, normalize=normalize)
+    sonuc = deger_sayimi(seri.astype("category"), normalize=normalize)
+
+    assert list(beklenen.index) == ["Nöroloji", "Kardiyoloji", "Dahiliye", "Üroloji"]
+    pd.testing.assert_series_equal(sonuc, beklenen, check_index_type=False)
+
+
+def test_grup_deger_sayimlari_esitlikte_ilk_gorulme_sirasi():
+    seri = pd.Series(KLINIKLER + ["Dahiliye", "Kardiyoloji"])
+    # Grup 0: tüm satırlar, grup 1: son üç satır (Üroloji, Dahiliye, Kardiyoloji)
+    grup_kodu = np.array([0] * len(seri) + [1] * 3)
+    satir_indeksi = np.concatenate([np.arange(len(seri)), np.arange(len(seri) - 3, len(seri))])
+
+    beklenen = grup_deger_sayimlari(seri, grup_kodu, satir_indeksi)
+    sonuc = grup_deger_sayimlari(seri.astype("category"), grup_kodu, satir_indeksi)
+
+    assert list(beklenen[0].index) == ["Kardiyoloji", "Dahiliye", "Nöroloji", "Üroloji"]
+    assert list(beklenen[1].index) == ["Üroloji", "Dahiliye", "Kardiyoloji"]
+    assert beklenen.keys() == sonuc.keys()
+    for kod in beklenen:
+        pd.testing.assert_series_equal(
+            sonuc[kod], beklenen[kod], check_index_type=False, check_names=False
+        )
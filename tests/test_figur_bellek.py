@@ -0,0 +1,60 @@
+"""figur_olustur / figur_kaydet ile çizilen grafiklerin bellekte birikmediğinin testi"""
+
+import gc
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import pandas as pd
+from matplotlib.figure import Figure
+
+from src.generators.grafik_olusturucu import GrafikOlusturucu
+from src.utils.figur import figur_kaydet, figur_olustur
+
+GRAFIK_SAYISI = 1000
+# Döngüde aynı anda canlı kalabilecek figür sayısı üst sınırı
+MAX_CANLI_FIGUR = 5
+
+
+def _canli_figur_sayisi() -> int:
+    gc.collect()
+    return sum(1 for nesne in gc.get_objects() if isinstance(nesne, Figure))
+
+
+def test_bin_grafik_figur_birakmaz(tmp_path):
+    baslangic = _canli_figur_sayisi()
+    en_fazla = 0
+
+    for i in range(GRAFIK_SAYISI):
+        fig = figur_olustur(figsize=(2, 1.5))
+        ax = fig.add_subplot()
+        ax.plot([0, 1, 2], [i, i + 1, i % 3])
+        ax.set_title(f"Grafik {i}")
+        figur_kaydet(fig, tmp_path / f"grafik_{i}.png", dpi=30)
+        del fig, ax
+
+        if i % 100 == 99:
+            en_fazla = max(en_fazla, _canli_figur_sayisi() - baslangic)
+
+    assert len(plt.get_fignums()) == 0
+    assert en_fazla <= MAX_CANLI_FIGUR
+    assert _canli_figur_sayisi() - baslangic <= MAX_CANLI_FIGUR
+    assert len(list(tmp_path.glob("grafik_*.png"))) == GRAFIK_SAYISI
+
+
+def test_grafik_olusturucu_figur_birakmaz(tmp_path):
+    olusturucu = GrafikOlusturucu()
+    olusturucu._rapor_dizin_override = tmp_path
+    veriler = pd.Series({"Yeni Vaka": 12, "Devreden Vaka": 7, "Analiz_Disi": 3})
+    baslangic = _canli_figur_sayisi()
+
+    for i in range(20):
+        yol = olusturucu.pasta_grafik_olustur(
+            veriler, "Vaka Tipi", f"pasta_{i}_2026-10-17.png", "2026-10-17"
+        )
+        assert yol is not None
+
+    assert len(plt.get_fignums()) == 0
+    assert _canli_figur_sayisi() - baslangic <= MAX_CANLI_FIGUR
@@ -0,0 +1,51 @@
+"""veriyi_oku tarih aralığı süzmesi ve ay bölümü budaması"""
+
+import pandas as pd
+
+from src.processors.veri_isleme import VeriIsleme
+
+
+def _veri_isleme(tmp_path) -> VeriIsleme:
+    vi = VeriIsleme()
+    vi.ana_veri_dizin = tmp_path / "ana_veri"
+    vi.ana_veri_dosya = tmp_path / "ana_veri.parquet"
+    df = pd.DataFrame(
+        {
+            "vaka no": [1, 2, 3, 4, 5],
+            "oluşturma tarihi": pd.to_datetime(
+                [
+                    "2026-09-30 23:59",
+                    "2026-10-01 00:00",
+                    "2026-10-31 00:00",
+                    "2026-10-31 17:45",
+                    "2026-11-01 00:00",
+                ]
+            ),
+        }
+    )
+    vi._ana_veriyi_guncelle(df)
+    return vi
+
+
+def test_saatsiz_bitis_tarihi_gunun_tamamini_kapsar(tmp_path):
+    vi = _veri_isleme(tmp_path)
+
+    df = vi.veriyi_oku(baslangic_tarihi="2026-10-01", bitis_tarihi="2026-10-31")
+
+    assert sorted(df["vaka no"]) == [2, 3, 4]
+
+
+def test_saatli_bitis_tarihi_o_ana_kadar_kapsar(tmp_path):
+    vi = _veri_isleme(tmp_path)
+
+    df = vi.veriyi_oku(bitis_tarihi="2026-10-31 12:00")
+
+    assert sorted(df["vaka no"]) == [1, 2, 3]
+
+
+def test_bitis_ay_sonuysa_sonraki_ay_bolumu_okunmaz(tmp_path):
+    vi = _veri_isleme(tmp_path)
+
+    dosyalar = vi._ana_veri_bolumlerini_listele("2026-10-01", "2026-10-31")
+
+    assert [d.parent.name for d in dosyalar] == ["olusturma_ay=2026-10"]